@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_or_create_user, get_session
+from app.core.database import db as database
 from app.models.users import Users
 from app.utils.llm_client import LLMClient
-from app.core.prompts import SYSTEM_PROMPTS, EVENT_EXPLAIN_PROMPTS, get_recommend_question_prompt
+from app.core.prompts import SYSTEM_PROMPTS
 from app.constants import UserLevel, ChatMessageRole
-from app.crud.crud_events import crud_events
+from app.core.config import settings
+from app.crud.crud_events import crud_events, crud_event_explanations
 from app.crud.crud_chat import crud_chat_sessions
 from app.schemas.chatbot import *
 from app.schemas.chat import *
@@ -22,47 +25,64 @@ from app.services.mem0_client import mem0_client
 from app.core.langfuse_factory import LangfuseFactory
 from app.utils.session import resolve_session_id
 from app.services.level_chain import LevelChainService
+from app.services.pre_generation import ClientDisconnectedError, PreGenerationStage, run_pre_generation_stages
+from app.services.write_behind import write_behind_queue
+from app.services.response_cache import event_explain_cache
+from app.services.event_explanation import build_explain_messages, explain_prompt_hash, resolve_safety_level
+from app.services.history_compaction import history_compactor
+from app.services.recommend_question import generate_recommend_questions, generate_recommend_questions_batch
 
 logger = logging.getLogger(__name__)
 
-# Langfuse observe 데코레이터 임포트
-try:
-    from langfuse import observe
-
-    LANGFUSE_OBSERVE_AVAILABLE = True
-except ImportError:
-    LANGFUSE_OBSERVE_AVAILABLE = False
-    observe = None
+# Langfuse 추적 데코레이터 (샘플링 적용)
+from app.core.tracing import traced
 
 chatbot_router = APIRouter()
 
+# 캐시된 응답 전송 시 청크 크기
+EXPLAIN_CHUNK_SIZE = 50
+
 
 def _build_messages(
-    level: UserLevel, history: List[ChatMessage], question: str, memory_context: str = None
+    level: UserLevel,
+    history: List[dict],
+    question: str,
+    memory_context: str = None,
+    history_summary: str = None,
 ) -> List[dict]:
     """대화 메시지 구성
 
     Args:
         level: 사용자 레벨
-        history: 이전 대화 내역
+        history: 이전 대화 내역 (토큰 예산 적용 후 원문 유지 대화)
         question: 새로운 질문
+        history_summary: 예산을 넘어 요약으로 대체된 이전 대화
 
     Returns:
-        LLM에 전달할 메시지 리스트
+        LLM에 전달할 메시지 리스트 (요청 토큰 상한 적용)
     """
     system_prompt = SYSTEM_PROMPTS.get(level, SYSTEM_PROMPTS[UserLevel.BEGINNER])
     if memory_context:
         system_prompt += f"\n\n[이전 대화 기억]\n{memory_context}"
+    if history_summary:
+        system_prompt += f"\n\n[이전 대화 요약]\n{history_summary}"
     messages = [{"role": "system", "content": system_prompt}]
-    messages += [msg.dict() for msg in history]
+    messages += history
     messages.append({"role": "user", "content": question})
-    return messages
+    return history_compactor.cap_request(messages)
+
+
+async def _stream_text(text: str, chunk_size: int = EXPLAIN_CHUNK_SIZE):
+    """저장된 응답(캐시/사전 생성)을 청크 단위로 전송"""
+    for i in range(0, len(text), chunk_size):
+        yield text[i : i + chunk_size]
 
 
-@ observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
 @chatbot_router.post("/conversation")
+@traced("conversation")
 async def conversation(
     req: ConversationRequest,
+    request: Request,
     use_filter: bool = Query(True, description="필터링 사용 여부"),
     use_level_chain: bool = Query(True, description="레벨별 체인 사용 여부"),
     is_mem0_api: bool = True,
@@ -83,68 +103,141 @@ async def conversation(
         chunk_size: 응답 Chunk Size
         db_user: 현재 사용자 정보
         session: DB session
+
+    세션 조회, 메모리 검색, 검색 필요성 판단은 단계별 제한 시간 안에서 동시에 실행되며,
+    그 사이 클라이언트 연결이 끊기면 모두 취소됩니다.
     """
     try:
-        # 세션 처리 (새 세션이면 생성, 기존 세션이면 조회)
         user_uid = db_user.uid
+        user_id = db_user.id
         user_level = db_user.level
         session_id = resolve_session_id(req.session_id)
+        mem0_provider = mem0_client if is_mem0_api else mem0_service
 
-        chat_session = crud_chat_sessions.get(session=session, session_id=session_id)
-        if not chat_session:
-            # 새로운 세션 생성
-            chat_session = crud_chat_sessions.create(
-                session=session,
-                obj_in=ChatSessionCreate(
-                    user_id=db_user.id,
-                    session_id=session_id,
-                ),
-            )
-            session.commit()
-            req.session_id = chat_session.session_id
+        langfuse_manager = LangfuseFactory.create_app_manager(user=db_user, session_id=session_id)
+        level_chain_service = (
+            LevelChainService(user=db_user, langfuse_manager=langfuse_manager) if use_level_chain else None
+        )
 
-        # mem0에서 관련 메모리 검색 (use_memory가 True인 경우)
-        mem0_provider = mem0_client if is_mem0_api else mem0_service
-        memory_context = None
+        def _resolve_chat_session():
+            # 세션 처리 (새 세션이면 생성, 기존 세션이면 조회)
+            # 스레드에서 실행되므로 요청 DB 세션 대신 전용 세션 사용 (시간 초과/연결 종료 후에도 안전하게 정리)
+            with database.session as thread_session:
+                chat_session = crud_chat_sessions.get(session=thread_session, session_id=session_id)
+                if not chat_session:
+                    # 새로운 세션 생성
+                    chat_session = crud_chat_sessions.create(
+                        session=thread_session,
+                        obj_in=ChatSessionCreate(
+                            user_id=user_id,
+                            session_id=session_id,
+                        ),
+                    )
+                    thread_session.commit()
+                return chat_session.session_id
+
+        async def _search_memory():
+            # mem0에서 관련 메모리 검색
+            relevant_memories = await mem0_provider.search_relevant_memories(user_id=user_uid, query=req.question)
+            if not relevant_memories:
+                return None
+            logger.debug(f"🧠 관련 메모리 {len(relevant_memories)}개 발견")
+            return mem0_provider.build_memory_context(relevant_memories)
+
+        # 세션 조회, 메모리 검색, 검색 필요성 판단(실전러)을 동시에 실행
+        stages = [
+            PreGenerationStage(
+                name="session",
+                run=lambda: asyncio.to_thread(_resolve_chat_session),
+                timeout=settings.PRE_GENERATION_SESSION_TIMEOUT,
+                required=True,
+            )
+        ]
         if req.use_memory:
-            relevant_memories = await mem0_provider.search_relevant_memories(user_id=db_user.uid, query=req.question)
+            stages.append(
+                PreGenerationStage(
+                    name="memory", run=_search_memory, timeout=settings.PRE_GENERATION_MEMORY_TIMEOUT
+                )
+            )
+        history = [msg.dict() for msg in req.history]
+        if settings.HISTORY_COMPACTION_ENABLED and history:
+            # 토큰 예산 초과 시 오래된 대화를 세션별 누적 요약으로 대체 (시간 초과 시 캐시된 요약 사용)
+            stages.append(
+                PreGenerationStage(
+                    name="history",
+                    run=lambda: history_compactor.compact(session_id, history),
+                    timeout=settings.PRE_GENERATION_HISTORY_TIMEOUT,
+                    default_factory=lambda: history_compactor.compact_cached(session_id, history),
+                )
+            )
+        if level_chain_service and user_level == UserLevel.ADVANCED:
+            stages.append(
+                PreGenerationStage(
+                    name="search",
+                    run=lambda: level_chain_service.prefetch_search(user_level, req.question),
+                    timeout=settings.PRE_GENERATION_SEARCH_TIMEOUT,
+                    default={"needs_search": False, "search_results": "", "tools_used": []},  # 시간 초과 시 검색 생략
+                )
+            )
 
-            if relevant_memories:
-                memory_context = mem0_provider.build_memory_context(relevant_memories)
-                logger.debug(f"🧠 관련 메모리 {len(relevant_memories)}개 발견")
-
-        langfuse_manager = LangfuseFactory.create_app_manager(user=db_user, session_id=session_id)
+        try:
+            pre_generation = await run_pre_generation_stages(stages, is_disconnected=request.is_disconnected)
+        except ClientDisconnectedError:
+            return Response(status_code=499)
+        except asyncio.TimeoutError:
+            logger.error(f"❌ 세션 조회 시간 초과 ({settings.PRE_GENERATION_SESSION_TIMEOUT}초)")
+            raise HTTPException(status_code=504, detail="대화 세션 조회 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.")
+
+        req.session_id = pre_generation["session"]
+        memory_context = pre_generation.get("memory")
+        prefetched_search = pre_generation.get("search")
+        compacted_history = pre_generation.get("history")
+        history_summary = compacted_history.summary if compacted_history else None
+        if compacted_history:
+            history = compacted_history.messages
 
         async def stream():
             full_response = ""
             try:
                 # 레벨별 체인 사용 여부에 따른 분기
                 if use_level_chain:
-                    level_chain_service = LevelChainService(user=db_user, langfuse_manager=langfuse_manager)
-                    final_response = await level_chain_service.run(
+                    token_stream = level_chain_service.stream(
                         user_level=user_level,
                         user_query=req.question,
-                        conversation_history=[msg.dict() for msg in req.history],
+                        conversation_history=history,
                         memory_context=memory_context,
+                        prefetched_search=prefetched_search,
+                        history_summary=history_summary,
                     )
 
-                    # 필터링 적용
-                    if use_filter:
+                    if use_filter and settings.FILTER_STREAMING_ENABLED:
+                        # 필터링 적용 (문장 윈도우 단위로 검사하며 즉시 전송)
+                        filter_service = FilterService(user=db_user, langfuse_manager=langfuse_manager)
+                        async for chunk in filter_service.filter_stream(token_stream, req.safety_level):
+                            full_response += chunk
+                            yield chunk
+                    elif use_filter:
+                        # 필터링 적용 (전체 응답 기준으로 검사 후 청크 단위 전송)
+                        final_response = "".join([token async for token in token_stream])
                         filter_service = FilterService(user=db_user, langfuse_manager=langfuse_manager)
                         filter_result = await filter_service.filter_response(final_response, req.safety_level)
                         final_response = filter_result["content"]
 
-                    full_response = final_response
+                        full_response = final_response
 
-                    # 스트리밍으로 응답 전송 (청크 단위)
-                    for i in range(0, len(final_response), chunk_size):
-                        chunk = final_response[i : i + chunk_size]
-                        yield chunk
+                        for i in range(0, len(final_response), chunk_size):
+                            chunk = final_response[i : i + chunk_size]
+                            yield chunk
+                    else:
+                        # 필터링 없이 토큰 단위로 즉시 전송
+                        async for token in token_stream:
+                            full_response += token
+                            yield token
 
                 else:
                     # 기존 방식
                     llm_client = LLMClient(user=db_user, langfuse_manager=langfuse_manager)
-                    messages = _build_messages(user_level, req.history, req.question, memory_context)
+                    messages = _build_messages(user_level, history, req.question, memory_context, history_summary)
                     if use_filter:
                         async for chunk in llm_client.stream_chat_with_filter(
                             messages, safety_level=req.safety_level, chunk_size=chunk_size
@@ -158,22 +251,17 @@ async def conversation(
 
                 logger.debug(f"🎯 스트리밍 완료: {len(full_response)}글자")
 
-                # 세션 메시지 카운트 업데이트 (user + assistant = 2)
-                crud_chat_sessions.increment_message_count(session=session, session_id=session_id, count=2)
-
-                # mem0에 대화 내용 추가
+                # 세션 메시지 카운트 및 mem0 저장은 write-behind 큐에서 처리 (user + assistant = 2)
+                # 마지막 마커 전송 후 클라이언트가 연결을 끊으면 스트림이 취소되므로 마커보다 먼저 등록
+                await write_behind_queue.enqueue_message_count(session_id=session_id, count=2)
                 if req.use_memory:
-                    # 사용자 메시지 추가
                     messages = [
                         {"role": ChatMessageRole.user, "content": req.question},
                         {"role": ChatMessageRole.assistant, "content": full_response},
                     ]
-                    await mem0_provider.add_conversation_message(
-                        user_id=user_uid, messages=messages, session_id=session_id
+                    await write_behind_queue.enqueue_memory(
+                        mem0_provider, user_id=user_uid, messages=messages, session_id=session_id
                     )
-                    logger.debug("🧠 mem0에 대화 내용 저장 완료")
-
-                session.commit()
 
                 # 추가 메타데이터를 헤더로 전송
                 yield f"\n\n<!-- SESSION_ID: {session_id} -->"
@@ -185,12 +273,14 @@ async def conversation(
 
         return StreamingResponse(stream(), media_type="text/plain")
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="대화 처리 중 오류가 발생했습니다.")
 
 
-@ observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
 @chatbot_router.post("/event/explain")
+@traced("explain_event")
 async def explain_event(
     req: EventExplainRequest,
     use_filter: bool = Query(True, description="필터링 사용 여부"),
@@ -217,36 +307,55 @@ async def explain_event(
         if not event:
             raise HTTPException(status_code=404, detail=f"Event with id '{req.id}' not found")
 
-        # 이벤트 정보를 포맷팅하여 LLM에게 전달
-        event_context = f"""이벤트 정보:
-- 제목: {event.title}
-- 설명: {event.description}
-- 날짜: {event.date}
-- 영향도: {event.impact}
-- 출처: {event.source}
-- Release ID: {event.release_id}
-
-위 경제 지표/이벤트에 대해 설명해주세요."""
-
-        system_prompt = EVENT_EXPLAIN_PROMPTS.get(db_user.level, EVENT_EXPLAIN_PROMPTS[UserLevel.BEGINNER])
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": event_context},
-        ]
+        # 같은 이벤트/레벨/프롬프트의 설명은 캐시 재사용 (이벤트 수정 시 updated_at으로 무효화)
+        prompt_hash = explain_prompt_hash(db_user.level)
+        safety_level = resolve_safety_level(req.safety_level)
+        cache_key = event_explain_cache.make_key(
+            event.id, db_user.level, safety_level, use_filter, prompt_hash, event.updated_at
+        )
+        cached_explanation = event_explain_cache.get(cache_key)
+        if cached_explanation is not None:
+            logger.debug(f"📦 이벤트 설명 캐시 사용: event_id={event.id}")
+            return StreamingResponse(_stream_text(cached_explanation), media_type="text/plain")
+
+        # ETL에서 사전 생성된 설명 사용 (필터링 완료된 텍스트)
+        precomputed = None
+        if use_filter:
+            precomputed = crud_event_explanations.get_current(
+                db,
+                event=event,
+                level=db_user.level,
+                safety_level=safety_level,
+                prompt_hash=prompt_hash,
+            )
+        if precomputed is not None:
+            logger.debug(f"📦 사전 생성된 이벤트 설명 사용: event_id={event.id}")
+            event_explain_cache.set(cache_key, precomputed.content)
+            return StreamingResponse(_stream_text(precomputed.content), media_type="text/plain")
 
+        # 이벤트 정보를 포맷팅하여 LLM에게 전달
+        messages = build_explain_messages(event, db_user.level)
         langfuse_manager = LangfuseFactory.create_app_manager(user=db_user, session_id=session_id)
         llm_client = LLMClient(user=db_user, langfuse_manager=langfuse_manager)
 
         async def stream():
+            chunks = []
             if use_filter:
                 # 필터링 적용된 스트리밍
-                async for chunk in llm_client.stream_chat_with_filter(messages, safety_level=req.safety_level):
+                async for chunk in llm_client.stream_chat_with_filter(messages, safety_level=safety_level):
+                    chunks.append(chunk)
                     yield chunk
             else:
                 # 기존 방식 (필터링 없음)
                 async for chunk in llm_client.stream_chat(messages):
+                    chunks.append(chunk)
                     yield chunk
 
+            # 끝까지 정상 생성되고 필터링 오류가 없었던 설명만 캐시
+            explanation = "".join(chunks)
+            if explanation and not (use_filter and llm_client.filter_service.last_error):
+                event_explain_cache.set(cache_key, explanation)
+
         return StreamingResponse(stream(), media_type="text/plain")
 
     except HTTPException:
@@ -255,8 +364,8 @@ async def explain_event(
         raise HTTPException(status_code=500, detail="이벤트 설명 처리 중 오류가 발생했습니다.")
 
 
-@ observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
 @chatbot_router.post("/safety/check")
+@traced("check_content_safety")
 async def check_content_safety(req: SafetyCheckRequest, db_user: Users = Depends(get_or_create_user)):
     """컨텐츠 안전성 검사
 
@@ -287,6 +396,41 @@ async def check_content_safety(req: SafetyCheckRequest, db_user: Users = Depends
         raise HTTPException(status_code=500, detail="안전성 검사 처리 중 오류가 발생했습니다.")
 
 
+@chatbot_router.post("/safety/check/batch", response_model=SafetyCheckBatchResponse)
+@traced("check_content_safety_batch")
+async def check_content_safety_batch(req: SafetyCheckBatchRequest, db_user: Users = Depends(get_or_create_user)):
+    """컨텐츠 안전성 일괄 검사
+
+    저장된 답변 등 여러 컨텐츠의 안전성을 한 번에 검사합니다.
+    중복 컨텐츠는 한 번만 분석하고, 여러 컨텐츠를 하나의 LLM 호출로 묶어 동시에 처리합니다.
+
+    Args:
+        req: 안전성 일괄 검사 요청 (최대 FILTER_BATCH_MAX_CONTENTS건)
+        db_user: 현재 사용자 정보
+
+    Returns:
+        SafetyCheckBatchResponse: 요청 순서와 같은 순서의 분석 결과
+    """
+    if len(req.contents) > settings.FILTER_BATCH_MAX_CONTENTS:
+        raise HTTPException(
+            status_code=400, detail=f"한 번에 최대 {settings.FILTER_BATCH_MAX_CONTENTS}건까지 검사할 수 있습니다."
+        )
+
+    try:
+        filter_service = FilterService(user=db_user)
+        results = await filter_service.check_safety_batch(req.contents, user_id=db_user.id)
+
+        return SafetyCheckBatchResponse(
+            results=[SafetyCheckResult(**result) for result in results],
+            total_count=len(req.contents),
+            unique_count=len(set(req.contents)),
+        )
+
+    except Exception as e:
+        logger.error(f"❌ 안전성 일괄 검사 실패: {e}")
+        raise HTTPException(status_code=500, detail="안전성 일괄 검사 처리 중 오류가 발생했습니다.")
+
+
 @chatbot_router.get("/filter/status")
 async def get_filter_status(db_user: Users = Depends(get_or_create_user)):
     """필터링 시스템 상태 조회
@@ -366,48 +510,20 @@ async def generate_recommend_question(request: RecommendQuestionRequest, db_user
     try:
         user_level = UserLevel(db_user.level)
 
-        # 추천 질문 생성 프롬프트 구성
-        prompt = get_recommend_question_prompt(
+        langfuse_manager = LangfuseFactory.create_app_manager(user=db_user, session_id=request.session_id)
+        llm_client = LLMClient(user=db_user, langfuse_manager=langfuse_manager)
+
+        # 같은 레벨/이벤트 설명/개수/길이 조합은 캐시된 질문 사용
+        final_questions = await generate_recommend_questions(
+            llm_client,
             level=user_level,
             event_description=request.event_description,
             question_count=request.question_count,
             string_length=request.string_length,
         )
-
-        langfuse_manager = LangfuseFactory.create_app_manager(user=db_user, session_id=request.session_id)
-        llm_client = LLMClient(user=db_user, langfuse_manager=langfuse_manager)
-
-        # system 메시지와 user 메시지를 모두 포함
-        messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": "위 이벤트에 대한 추천 질문을 생성해주세요."}
-        ]
-
-        response = await llm_client.chat(messages=messages)
-
-        if not response:
-            logger.warning("LLM 응답이 비어있음")
+        if not final_questions:
             raise HTTPException(status_code=500, detail="추천 질문 생성에 실패했습니다.")
 
-        # 생성된 질문들을 줄바꿈으로 분리
-        questions = [q.strip() for q in response.strip().split("\n") if q.strip()]
-
-        # 질문 길이 제한 적용
-        filtered_questions = []
-        for question in questions:
-            if len(question) <= request.string_length:
-                filtered_questions.append(question)
-            else:
-                # 길이 초과 시 자르기
-                truncated = question[: request.string_length - 1]
-                if not truncated.endswith("?"):
-                    truncated += "?"
-                filtered_questions.append(truncated)
-                logger.debug(f"질문 길이 초과로 자름: {question} → {truncated}")
-
-        # 요청된 개수만큼만 반환
-        final_questions = filtered_questions[: request.question_count]
-
         logger.info(f"추천 질문 생성 완료: {len(final_questions)}개")
 
         return RecommendQuestionResponse(
@@ -419,3 +535,47 @@ async def generate_recommend_question(request: RecommendQuestionRequest, db_user
     except Exception as e:
         logger.error(f"추천 질문 생성 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="추천 질문 생성 중 오류가 발생했습니다.")
+
+
+@chatbot_router.post("/recommend/batch", response_model=RecommendQuestionBatchResponse)
+async def generate_recommend_question_batch(
+    request: RecommendQuestionBatchRequest, db_user: Users = Depends(get_or_create_user)
+):
+    """추천 질문 일괄 생성 API
+
+    여러 이벤트와 레벨의 추천 질문을 한 번의 구조화된 LLM 호출로 생성하여 캐시를 채웁니다.
+    캘린더에 보이는 기간의 이벤트를 미리 요청해두면 이후 /recommend 요청은 캐시에서 바로 응답합니다.
+
+    Args:
+        request: 추천 질문 일괄 생성 요청 (이벤트 설명 목록, 대상 레벨, 질문 개수, 길이 제한)
+        db_user: 현재 로그인한 사용자
+
+    Returns:
+        RecommendQuestionBatchResponse: 이벤트/레벨별 추천 질문 목록
+    """
+    try:
+        levels = [UserLevel(level) for level in request.levels] if request.levels else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="지원하지 않는 사용자 레벨입니다.")
+
+    try:
+        langfuse_manager = LangfuseFactory.create_app_manager(user=db_user)
+        llm_client = LLMClient(user=db_user, langfuse_manager=langfuse_manager)
+
+        results = await generate_recommend_questions_batch(
+            llm_client,
+            event_descriptions=request.event_descriptions,
+            levels=levels,
+            question_count=request.question_count,
+            string_length=request.string_length,
+        )
+
+        items = [
+            RecommendQuestionBatchItem(event_description=description, user_level=level.value, questions=questions)
+            for (description, level), questions in results.items()
+        ]
+        return RecommendQuestionBatchResponse(items=items, total_count=len(items))
+
+    except Exception as e:
+        logger.error(f"추천 질문 일괄 생성 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="추천 질문 일괄 생성 중 오류가 발생했습니다.")
@@ -105,6 +105,19 @@ class Settings(BaseSettings):
     # Redis 설정 (Celery용)
     REDIS_URL: str = environ.get("REDIS_URL", "redis://localhost:6379/0")
 
+    # LLM 응답 캐시 설정
+    RESPONSE_CACHE_BACKEND: str = "memory"  # memory, redis
+    EXPLAIN_CACHE_ENABLED: bool = True
+    EXPLAIN_CACHE_MAX_SIZE: int = 512  # 메모리 캐시 최대 항목 수 (LRU)
+    EXPLAIN_CACHE_TTL: int = 6 * 3600  # 초
+    RECOMMEND_CACHE_ENABLED: bool = True
+    RECOMMEND_CACHE_MAX_SIZE: int = 1024
+    RECOMMEND_CACHE_TTL: int = 24 * 3600  # 초 (이벤트 설명에 오늘 날짜가 포함되므로 하루 단위)
+    RECOMMEND_BATCH_MAX_EVENTS: int = 10  # 일괄 생성 시 LLM 호출 한 번에 포함할 이벤트 수
+    FILTER_VERDICT_CACHE_ENABLED: bool = True  # 동일 컨텐츠의 필터링 판정 재사용
+    FILTER_VERDICT_CACHE_MAX_SIZE: int = 4096
+    FILTER_VERDICT_CACHE_TTL: int = 24 * 3600  # 초
+
     # Firebase 설정 (선택적)
     FIREBASE_SECRET_FILE_PATH: str = path.join(media_secret_dir, "firebase-key.json")
     FIREBASE_SECRET_FILE: Optional[Dict] = None
@@ -169,21 +182,92 @@ class Settings(BaseSettings):
     ACTIVE_LLM_MODEL: str = "gpt-4-turbo"
     OPENAI_API_KEY: str = ""
     ANTHROPIC_API_KEY: str = ""  # Claude API 키
+    LLM_POOL_ENABLED: bool = True  # 동일 설정의 LLM 인스턴스(HTTP 커넥션 풀 포함) 재사용
+    LLM_POOL_MAX_SIZE: int = 16  # 풀에 유지할 최대 인스턴스 수 (LRU)
+    LLM_POOL_MAX_FAILURES: int = 3  # 연속 실패 시 인스턴스 교체 기준
+    LLM_ROUTER_ENABLED: bool = False  # 채팅 호출에 대체 프로바이더 장애 전환(429/5xx) + 지연 헤징 적용
+    LLM_FALLBACK_PROVIDER: str = "anthropic"  # 대체 프로바이더
+    LLM_FALLBACK_MODEL: str = "claude-3-5-sonnet-latest"  # 대체 모델 (빈 문자열이면 라우터 비활성화)
+    LLM_HEDGE_ENABLED: bool = True  # 기본 프로바이더가 헤지 지연 안에 응답하지 않으면 대체 프로바이더에 동시 요청
+    LLM_HEDGE_PERCENTILE: float = 95.0  # 헤지 지연 = 기본 프로바이더 최근 지연시간의 이 백분위수
+    LLM_HEDGE_DEFAULT_DELAY: float = 10.0  # 지연시간 표본이 부족할 때의 헤지 지연 (초)
+    LLM_HEDGE_MIN_DELAY: float = 1.0  # 헤지 지연 하한 (초, 대체 프로바이더 요청 남발 방지)
+    LLM_LATENCY_WINDOW: int = 200  # 프로바이더/모델별 지연시간 집계에 사용할 최근 호출 수
+    LLM_LATENCY_MIN_SAMPLES: int = 20  # 백분위수 기반 헤지 지연을 사용하기 위한 최소 표본 수
+
+    # 대화 이력 토큰 예산
+    HISTORY_COMPACTION_ENABLED: bool = True  # 이력이 예산을 넘으면 오래된 대화를 세션별 누적 요약으로 대체
+    HISTORY_MAX_TOKENS: int = 6000  # 프롬프트에 넣을 대화 이력(요약 포함) 최대 토큰 수
+    HISTORY_KEEP_TURNS: int = 4  # 요약하지 않고 원문으로 유지할 최근 턴 수 (user + assistant = 1턴)
+    HISTORY_SUMMARY_MAX_TOKENS: int = 800  # 누적 요약 최대 토큰 수
+    HISTORY_MAX_REQUEST_TOKENS: int = 24000  # 시스템 프롬프트 + 이력 + 질문 전체 상한
+    HISTORY_TOKENIZER_ENCODING: str = "cl100k_base"  # 토큰 수 계산용 tiktoken 인코딩 (로드 실패 시 추정치)
+    HISTORY_SUMMARY_PROVIDER: str = "openai"  # 요약 전용 LLM (ACTIVE_LLM_PROVIDER와 무관하게 HISTORY_SUMMARY_MODEL과 맞춤)
+    HISTORY_SUMMARY_MODEL: str = "gpt-4o-mini"
+    HISTORY_SUMMARY_CACHE_MAX_SIZE: int = 2048  # 세션별 요약 메모리 캐시 최대 항목 수 (LRU)
+    HISTORY_SUMMARY_CACHE_TTL: int = 24 * 3600  # 초
+
+    # 레벨별 체인 설정
+    LEVEL_CHAIN_FAST_PATH_ENABLED: bool = True  # 직선 그래프(주린이/관심러)는 LangGraph 없이 직접 실행
+
+    # 응답 생성 전 단계(세션/메모리/검색 판단) 동시 실행 제한 시간 (초)
+    PRE_GENERATION_SESSION_TIMEOUT: float = 5.0
+    PRE_GENERATION_MEMORY_TIMEOUT: float = 2.0  # 초과 시 메모리 없이 응답
+    PRE_GENERATION_SEARCH_TIMEOUT: float = 10.0  # 초과 시 검색 없이 응답
+    PRE_GENERATION_HISTORY_TIMEOUT: float = 5.0  # 초과 시 캐시된 요약 + 예산 안의 최근 대화로 응답
+
+    # 응답 후 부수 작업(세션 메시지 카운트, mem0 저장) write-behind 설정
+    WRITE_BEHIND_ENABLED: bool = True
+    WRITE_BEHIND_BATCH_SIZE: int = 50  # 한 번에 처리할 최대 작업 수
+    WRITE_BEHIND_FLUSH_INTERVAL: float = 0.5  # 작업을 모으는 시간 (초)
+    WRITE_BEHIND_MAX_RETRIES: int = 3
+    WRITE_BEHIND_MAX_QUEUE_SIZE: int = 1000  # 초과 시 즉시 처리
+    WRITE_BEHIND_RETRY_BACKOFF: float = 0.5  # 재시도 대기 시간 기준값 (초, 시도마다 2배)
 
     # 컨텐츠 필터링 설정
     FILTER_ENABLED: bool = True
     FILTER_SAFETY_LEVEL: str = "strict"  # strict, moderate, permissive
     FILTER_MAX_RETRIES: int = 3
-    FILTER_LLM_PROVIDER: str = ""  # 필터링 전용 LLM (빈 문자열이면 기본 LLM 사용)
+    FILTER_LLM_PROVIDER: str = "openai"  # 필터링 전용 LLM 프로바이더 (아래 모델명과 같은 프로바이더로 지정)
     FILTER_LLM_MODEL: str = "gpt-4"  # 필터링용 모델 (정확성을 위해 고성능 모델 사용)
+    FILTER_LLM_FAST_MODEL: str = "gpt-4o-mini"  # 1차 분석용 경량 모델 (빈 문자열이면 FILTER_LLM_MODEL만 사용)
+    FILTER_ESCALATION_BAND: float = 0.1  # 경량 모델 점수가 임계값 ± 이 범위 안이면 고성능 모델로 재분석
+    FILTER_SPECULATIVE_REPLACEMENT_ENABLED: bool = False  # 경계 점수면 고성능 모델 재분석과 병렬로 대체 컨텐츠 선행 생성
+    FILTER_SPECULATIVE_BAND: float = 0.1  # 경량 모델 점수가 임계값 - 이 범위 이상, 임계값 미만이면 선행 생성
+    FILTER_LLM_POOL_MAX_SIZE: int = 4  # 필터링 전용 LLM 인스턴스 풀 크기
+    FILTER_TIER_COST_PER_1K_CHARS: Dict[str, float] = {"fast": 0.0003, "strong": 0.03}  # 티어별 추정 비용 (USD)
+    FILTER_STREAMING_ENABLED: bool = False  # 토큰 스트림을 윈도우 단위로 검사하며 전달 (윈도우마다 필터링 호출)
+    FILTER_STREAM_WINDOW_MIN_CHARS: int = 80  # 윈도우 최소 길이 (문장 경계 기준)
+    FILTER_STREAM_WINDOW_MAX_CHARS: int = 500  # 경계가 없을 때 강제 분할 길이
+    FILTER_STREAM_MAX_CONCURRENCY: int = 4  # 동시에 분석할 윈도우 수
+    FILTER_BATCH_MAX_CONTENTS: int = 500  # 일괄 안전성 검사 요청당 최대 컨텐츠 수
+    FILTER_BATCH_ITEMS_PER_PROMPT: int = 10  # LLM 호출 한 번에 분석할 컨텐츠 수
+    FILTER_BATCH_MAX_CONCURRENCY: int = 4  # 동시에 실행할 일괄 분석 호출 수
+    FILTER_METRICS_WINDOW_SECONDS: int = 300  # 필터링 메트릭의 최근 요청률/필터링률/오류율 집계 구간 (초)
+    FILTER_NATIVE_EXECUTOR_ENABLED: bool = False  # 필터링 FSM을 LangGraph 없이 직접 실행 (결과 동일, 오버헤드 감소)
+    FILTER_LOCAL_REWRITE_ENABLED: bool = True  # 문구 단위 위반은 대체 표현 사전으로 먼저 재작성 (LLM 대체 생성만 생략, 재검토는 수행)
+    FILTER_STRUCTURED_OUTPUT_ENABLED: bool = True  # 분석/재검토 응답을 provider 네이티브 구조화 출력(tool calling)으로 요청
+    FILTER_PRECLASSIFIER_ENABLED: bool = False  # 위험 표현이 있는 컨텐츠는 경량 모델 없이 고성능 모델로 분석 (자동 승인 없음)
+    FILTER_PRECLASSIFIER_EXTRA_PHRASES: List[str] = []  # 사전 분류기에 추가할 애매한 표현
 
     # Langfuse 설정
     LANGFUSE_PUBLIC_KEY: str = ""
     LANGFUSE_SECRET_KEY: str = ""
     LANGFUSE_HOST: str = "https://us.cloud.langfuse.com"
+    LANGFUSE_SAMPLE_RATE: float = 1.0  # 요청 단위 추적 샘플링 비율 (헤드 기반)
+    LANGFUSE_ROUTE_SAMPLE_RATES: Dict[str, float] = {}  # 경로별 샘플링 비율 (예: {"conversation": 0.1})
+    LANGFUSE_SLOW_TRACE_SECONDS: float = 10.0  # 샘플링되지 않아도 이 시간 이상 걸린 호출은 이벤트로 기록
+
+    # 로깅 설정
+    LOG_QUEUE_ENABLED: bool = True  # 로그 출력을 백그라운드 스레드(QueueListener)에서 처리 (이벤트 루프에서 I/O 제외)
+    LOG_PAYLOAD_PREVIEW_CHARS: int = 200  # 프롬프트/응답 로그의 미리보기 길이 (전체는 길이+해시로 기록)
+    LOG_SAMPLE_RATES: Dict[str, float] = {}  # 로거별 INFO 이하 로그 샘플링 비율 (예: {"app.utils.llm_client": 0.1})
 
     # Mem0 설정
     MEM0_RELEVANT_MEMORY_LIMIT: int = 10
+    MEM0_MAX_CONCURRENCY: int = 8  # mem0 SDK 호출용 스레드 수 (동시 호출 제한)
+    MEM0_READ_TIMEOUT: float = 5.0  # search/get_all 제한 시간 (초)
+    MEM0_WRITE_TIMEOUT: float = 30.0  # add/update/delete 제한 시간 (초, add는 LLM 추출 포함)
     # Mem0 플랫폼 API
     MEM0_API_KEY: str = environ.get("MEM0_API_KEY", "")
     # Mem0 OOS 설정
@@ -8,6 +8,10 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from functools import wraps
 
+from app.core.config import settings
+from app.core.streaming_metrics import LinearHistogram, LogHistogram, WindowedCounter
+from app.core.structured_logging import attach_log_sink
+
 # 전용 로거 생성
 filter_logger = logging.getLogger("filter_system")
 
@@ -20,29 +24,26 @@ class FilterLogger:
         self._setup_logger()
 
         # 메트릭 저장소 (실제로는 Redis나 DB에 저장)
-        self.metrics = {
+        self.metrics = self._new_metrics()
+
+    @staticmethod
+    def _new_metrics() -> Dict[str, Any]:
+        """고정 메모리 메트릭 저장소 생성 (요청 수와 무관하게 크기 일정)"""
+        window = settings.FILTER_METRICS_WINDOW_SECONDS
+        return {
             "total_requests": 0,
             "filtered_requests": 0,
-            "processing_times": [],
+            "processing_times": LogHistogram(min_value=0.001, max_value=600.0),  # 1ms~10분, 상대 오차 1%
             "error_count": 0,
-            "safety_scores": [],
+            "safety_scores": LinearHistogram(min_value=0.0, max_value=1.0),  # 0.01 단위
+            "recent_requests": WindowedCounter(window),
+            "recent_filtered": WindowedCounter(window),
+            "recent_errors": WindowedCounter(window),
         }
 
     def _setup_logger(self):
-        """로거 설정"""
-        if not self.logger.handlers:
-            # 콘솔 핸들러
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-
-            # 포맷터 설정
-            formatter = logging.Formatter(
-                "%(asctime)s - [FILTER] - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-            )
-            console_handler.setFormatter(formatter)
-
-            self.logger.addHandler(console_handler)
-            self.logger.setLevel(logging.INFO)
+        """로거 설정 (공용 큐 싱크에 연결하여 출력 I/O는 백그라운드 스레드에서 처리)"""
+        attach_log_sink(self.logger, "FILTER", level=logging.INFO)
 
     def log_filter_request(self, content_length: int, user_id: Optional[int] = None, safety_level: str = "strict"):
         """필터링 요청 로깅"""
@@ -50,6 +51,7 @@ class FilterLogger:
             f"🔍 필터링 요청 | " f"사용자: {user_id or 'anonymous'} | " f"컨텐츠 길이: {content_length}자 | " f"안전 수준: {safety_level}"
         )
         self.metrics["total_requests"] += 1
+        self.metrics["recent_requests"].add()
 
     def log_filter_result(self, result: Dict[str, Any], processing_time: float, user_id: Optional[int] = None):
         """필터링 결과 로깅"""
@@ -62,6 +64,7 @@ class FilterLogger:
             log_level = logging.WARNING
             status_emoji = "⚠️"
             self.metrics["filtered_requests"] += 1
+            self.metrics["recent_filtered"].add()
         else:
             log_level = logging.INFO
             status_emoji = "✅"
@@ -78,8 +81,8 @@ class FilterLogger:
         )
 
         # 메트릭 업데이트
-        self.metrics["processing_times"].append(processing_time)
-        self.metrics["safety_scores"].append(safety_score)
+        self.metrics["processing_times"].record(processing_time)
+        self.metrics["safety_scores"].record(safety_score)
 
         # 처리시간이 너무 긴 경우 경고
         if processing_time > 5.0:
@@ -101,6 +104,7 @@ class FilterLogger:
             f"컨텍스트: {json.dumps(context or {}, ensure_ascii=False)}"
         )
         self.metrics["error_count"] += 1
+        self.metrics["recent_errors"].add()
 
     def log_safety_analysis(self, original_score: float, final_score: float, analysis_details: Dict[str, Any]):
         """안전성 분석 상세 로깅"""
@@ -121,11 +125,7 @@ class FilterLogger:
 
         # 통계 계산
         processing_times = self.metrics["processing_times"]
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-        max_processing_time = max(processing_times) if processing_times else 0
-
-        safety_scores = self.metrics["safety_scores"]
-        avg_safety_score = sum(safety_scores) / len(safety_scores) if safety_scores else 0
+        percentiles = processing_times.percentiles()
 
         filter_rate = (self.metrics["filtered_requests"] / self.metrics["total_requests"]) * 100
         error_rate = (self.metrics["error_count"] / self.metrics["total_requests"]) * 100
@@ -135,15 +135,17 @@ class FilterLogger:
             f"총 요청: {self.metrics['total_requests']} | "
             f"필터링률: {filter_rate:.1f}% | "
             f"오류율: {error_rate:.1f}% | "
-            f"평균 처리시간: {avg_processing_time:.3f}초 | "
-            f"최대 처리시간: {max_processing_time:.3f}초 | "
-            f"평균 안전도: {avg_safety_score:.2f}"
+            f"평균 처리시간: {processing_times.mean:.3f}초 | "
+            f"처리시간 p50/p90/p99: {percentiles['p50']:.3f}/{percentiles['p90']:.3f}/{percentiles['p99']:.3f}초 | "
+            f"최대 처리시간: {(processing_times.max if processing_times.count else 0):.3f}초 | "
+            f"평균 안전도: {self.metrics['safety_scores'].mean:.2f}"
         )
 
     def get_metrics_summary(self) -> Dict[str, Any]:
         """메트릭 요약 반환"""
         processing_times = self.metrics["processing_times"]
         safety_scores = self.metrics["safety_scores"]
+        recent_requests = self.metrics["recent_requests"].total()
 
         return {
             "total_requests": self.metrics["total_requests"],
@@ -151,22 +153,26 @@ class FilterLogger:
             "filter_rate": (self.metrics["filtered_requests"] / max(self.metrics["total_requests"], 1)) * 100,
             "error_count": self.metrics["error_count"],
             "error_rate": (self.metrics["error_count"] / max(self.metrics["total_requests"], 1)) * 100,
-            "avg_processing_time": sum(processing_times) / len(processing_times) if processing_times else 0,
-            "max_processing_time": max(processing_times) if processing_times else 0,
-            "avg_safety_score": sum(safety_scores) / len(safety_scores) if safety_scores else 0,
-            "min_safety_score": min(safety_scores) if safety_scores else 0,
+            "avg_processing_time": processing_times.mean,
+            "max_processing_time": processing_times.max if processing_times.count else 0,
+            "processing_time_percentiles": processing_times.percentiles(),
+            "avg_safety_score": safety_scores.mean,
+            "min_safety_score": safety_scores.min if safety_scores.count else 0,
+            "safety_score_percentiles": safety_scores.percentiles((1, 10, 50)),  # 낮은 점수 꼬리 위주
+            # 최근 윈도우 기준 비율 (누적 비율은 오래된 요청에 희석됨)
+            "window": {
+                "seconds": self.metrics["recent_requests"].window_seconds,
+                "requests": recent_requests,
+                "requests_per_second": self.metrics["recent_requests"].rate(),
+                "filter_rate": (self.metrics["recent_filtered"].total() / max(recent_requests, 1)) * 100,
+                "error_rate": (self.metrics["recent_errors"].total() / max(recent_requests, 1)) * 100,
+            },
             "timestamp": datetime.now().isoformat(),
         }
 
     def reset_metrics(self):
         """메트릭 초기화"""
-        self.metrics = {
-            "total_requests": 0,
-            "filtered_requests": 0,
-            "processing_times": [],
-            "error_count": 0,
-            "safety_scores": [],
-        }
+        self.metrics = self._new_metrics()
         self.logger.info("📊 필터링 메트릭 초기화됨")
 
 
@@ -50,6 +50,40 @@ SAFETY_ANALYSIS_PROMPT = """
 - 0.0~0.5: 위험 (필터링 또는 대체 필요)
 """
 
+# 여러 컨텐츠 일괄 안전성 분석 프롬프트
+SAFETY_BATCH_ANALYSIS_PROMPT = """
+당신은 금융 조언 컨텐츠의 안전성을 평가하는 전문가입니다.
+
+다음 JSON 객체의 각 컨텐츠(키: 컨텐츠 ID)를 서로 독립적으로 분석하여 법적/윤리적 위험도를 평가하세요:
+
+{items}
+
+평가 기준:
+1. 투자 권유 여부 (구체적인 종목/상품 추천, 매매 행위 유도, 매매 타이밍 지시)
+2. 과도한 수익 보장 표현 (확실한 수익, 구체적인 수익률 약속, 무위험 투자)
+3. 리스크 경고 누락
+4. 미확인 정보 제공 (루머, 추측성 정보, 출처 불분명한 데이터)
+5. 법적 책임 관련 (책임 전가, 면책 조항 누락)
+
+응답은 반드시 모든 컨텐츠 ID를 포함한 다음 JSON 형식으로만 제공하세요:
+{{
+  "verdicts": [
+    {{
+      "id": "컨텐츠 ID",
+      "is_safe": true 또는 false,
+      "safety_score": 0.0~1.0 사이의 점수,
+      "risk_categories": ["위험 카테고리1", "위험 카테고리2"],
+      "filter_reason": "필터링 이유 상세 설명"
+    }}
+  ]
+}}
+
+안전 점수 기준:
+- 0.8~1.0: 안전 (그대로 출력 가능)
+- 0.5~0.8: 주의 (일부 수정 필요)
+- 0.0~0.5: 위험 (필터링 또는 대체 필요)
+"""
+
 # 컨텐츠 대체 생성 프롬프트
 CONTENT_REPLACEMENT_PROMPT = """
 다음 컨텐츠가 금융 법적 가이드라인에 위배되어 필터링되었습니다.
@@ -70,6 +104,15 @@ CONTENT_REPLACEMENT_PROMPT = """
 대체 컨텐츠:
 """
 
+# 스트리밍 필터 앞 윈도우 문맥 (분석 프롬프트 앞에 추가, 판정은 분석 대상 컨텐츠에 대해서만)
+SAFETY_ANALYSIS_CONTEXT_PROMPT = """
+아래 컨텐츠는 긴 답변의 일부이며, 바로 앞부분은 다음과 같습니다 (이미 검사된 내용이므로 평가 대상이 아닙니다):
+
+앞부분: "{context}"
+
+앞부분과 이어져야 의미가 완성되는 표현(예: 앞부분의 종목 언급 + 이 컨텐츠의 수익 보장)은 이 컨텐츠의 위험으로 평가하세요.
+"""
+
 # 안전성 재검토 프롬프트
 SAFETY_RECHECK_PROMPT = """
 다음은 필터링 후 수정된 컨텐츠입니다.
@@ -123,6 +166,32 @@ SAFE_ALTERNATIVES = {
     "100% 상승": "상승 가능성",
 }
 
+# 사전 분류기용 위험 표현 사전 (카테고리 → 표현, 매칭 시 LLM 분석으로 전달)
+RISK_PHRASE_LEXICON = {
+    "investment_advice": [
+        "사세요", "사십시오", "매수하세요", "매도하세요", "파세요", "팔아야", "담으세요", "투자하세요",
+        "추천 종목", "종목 추천", "매수 추천", "매도 추천", "지금 당장", "놓치지 마세요",
+        "you should buy", "you should sell", "buy now", "sell now", "strong buy",
+    ],
+    "guaranteed_profit": [
+        "확실한 수익", "수익 보장", "보장된 수익", "보장합니다", "보장됩니다", "원금 보장", "손실 없는", "무위험",
+        "guaranteed", "risk-free", "risk free", "sure profit",
+    ],
+    "excessive_confidence": [
+        "무조건", "반드시 오릅니다", "반드시 상승", "100%", "틀림없이", "확실히 오릅니다",
+        "can't lose", "cannot lose", "definitely rise",
+    ],
+    "market_manipulation": ["내부자 정보", "내부 정보", "작전주", "세력", "pump and dump", "insider"],
+    "unverified_information": ["찌라시", "루머", "카더라", "rumor"],
+    "legal_liability": ["대출받아", "빚내서", "영끌", "전 재산", "all-in", "all in"],
+}
+
+# 사전 분류기용 애매한 표현 (투자 행위 관련 용어, 매칭 시 LLM 분석으로 전달)
+AMBIGUOUS_PHRASE_LEXICON = [
+    "매수", "매도", "종목", "목표가", "목표 주가", "수익률", "급등", "폭등", "레버리지", "추천", "타이밍",
+    "buy", "sell", "target price", "leverage",
+]
+
 # 필수 면책 조항
 DISCLAIMER_TEMPLATE = """
 
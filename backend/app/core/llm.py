@@ -2,17 +2,21 @@
 LLM 공통 모듈 - Provider Factory와 기본 인터페이스
 """
 import os
+import json
 import logging
 import os
+import threading
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Optional, Dict
+from typing import Any, Callable, Optional, Dict, Tuple
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 
 from .config import settings
+from .tracing import is_trace_sampled
 
 # Langfuse 임포트 (선택적)
 try:
@@ -27,6 +31,59 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 Langfuse CallbackHandler (요청별 사용자/세션 정보는 callback config의 metadata로만 전달)
+_shared_langfuse_lock = threading.Lock()
+_shared_langfuse_initialized = False
+_shared_langfuse_handler: Optional["CallbackHandler"] = None
+
+
+def _create_langfuse_handler() -> Optional["CallbackHandler"]:
+    """Langfuse CallbackHandler 생성 (키 미설정/실패 시 None)"""
+    if not LANGFUSE_AVAILABLE:
+        logger.info("Langfuse가 설치되지 않음, 모니터링 비활성화")
+        return None
+
+    try:
+        # 필수 설정이 있는 경우에만 Langfuse handler 생성
+        if not (settings.LANGFUSE_PUBLIC_KEY and settings.LANGFUSE_SECRET_KEY):
+            logger.info("Langfuse 키가 설정되지 않음, 모니터링 비활성화")
+            return None
+
+        # Settings에서 읽은 값을 환경변수로 설정 (Langfuse가 읽을 수 있도록)
+        os.environ['LANGFUSE_PUBLIC_KEY'] = settings.LANGFUSE_PUBLIC_KEY
+        os.environ['LANGFUSE_SECRET_KEY'] = settings.LANGFUSE_SECRET_KEY
+        os.environ['LANGFUSE_HOST'] = settings.LANGFUSE_HOST
+        logger.info(f"✅ Langfuse 환경변수 설정 완료: {settings.LANGFUSE_HOST}")
+        logger.info(f"🔑 Public Key: {settings.LANGFUSE_PUBLIC_KEY[:15]}...")
+
+        handler = CallbackHandler()
+        logger.info(f"✅ Langfuse 공유 CallbackHandler 생성 성공: {type(handler)}")
+        return handler
+    except Exception as e:
+        logger.warning(f"Langfuse 초기화 실패: {e}")
+        import traceback
+        logger.warning(f"상세 오류: {traceback.format_exc()}")
+        return None
+
+
+def get_shared_langfuse_handler() -> Optional["CallbackHandler"]:
+    """프로세스 전역 CallbackHandler 반환 (최초 호출 시 한 번만 생성, 실패 결과도 재사용)"""
+    global _shared_langfuse_initialized, _shared_langfuse_handler
+    if not _shared_langfuse_initialized:
+        with _shared_langfuse_lock:
+            if not _shared_langfuse_initialized:
+                _shared_langfuse_handler = _create_langfuse_handler()
+                _shared_langfuse_initialized = True
+    return _shared_langfuse_handler
+
+
+def reset_shared_langfuse_handler() -> None:
+    """공유 CallbackHandler 초기화 (설정 변경 후 재생성/테스트용)"""
+    global _shared_langfuse_initialized, _shared_langfuse_handler
+    with _shared_langfuse_lock:
+        _shared_langfuse_initialized = False
+        _shared_langfuse_handler = None
+
 
 class LangfuseManager:
     """Langfuse 관련 공통 유틸리티 (Single Responsibility)"""
@@ -111,41 +168,14 @@ class LangfuseManager:
         )
     
     def _initialize_handler(self) -> None:
-        """Langfuse CallbackHandler 초기화"""
-        if not LANGFUSE_AVAILABLE:
-            logger.info(f"[{self.service_name}] Langfuse가 설치되지 않음, 모니터링 비활성화")
-            return
-        
-        try:
-            # 필수 설정이 있는 경우에만 Langfuse handler 생성
-            if settings.LANGFUSE_PUBLIC_KEY and settings.LANGFUSE_SECRET_KEY:
-                # Settings에서 읽은 값을 환경변수로 설정 (Langfuse가 읽을 수 있도록)
-                self._set_environment_variables()
-                
-                # CallbackHandler 생성 및 테스트
-                self.handler = CallbackHandler()
-                logger.info(f"✅ [{self.service_name}] Langfuse CallbackHandler 생성 성공: {type(self.handler)}")
-                
-            else:
-                logger.info(f"[{self.service_name}] Langfuse 키가 설정되지 않음, 모니터링 비활성화")
-        except Exception as e:
-            logger.warning(f"[{self.service_name}] Langfuse 초기화 실패: {e}")
-            import traceback
-            logger.warning(f"[{self.service_name}] 상세 오류: {traceback.format_exc()}")
-    
-    def _set_environment_variables(self) -> None:
-        """Langfuse 환경변수 설정"""
-        os.environ['LANGFUSE_PUBLIC_KEY'] = settings.LANGFUSE_PUBLIC_KEY
-        os.environ['LANGFUSE_SECRET_KEY'] = settings.LANGFUSE_SECRET_KEY
-        os.environ['LANGFUSE_HOST'] = settings.LANGFUSE_HOST
-        
-        logger.info(f"✅ [{self.service_name}] Langfuse 환경변수 설정 완료: {settings.LANGFUSE_HOST}")
-        logger.info(f"🔑 [{self.service_name}] Public Key: {settings.LANGFUSE_PUBLIC_KEY[:15]}...")
-    
+        """프로세스 전역 Langfuse CallbackHandler 연결 (요청마다 새로 생성하지 않음)"""
+        self.handler = get_shared_langfuse_handler()
+
     def get_callback_config(self, metadata: Optional[Dict[str, Any]] = None) -> dict:
         """LLM 호출에 사용할 callback config 반환"""
         config = {}
-        if self.handler:
+        # 샘플링되지 않은 요청은 LangChain callback 연결 생략
+        if self.handler and is_trace_sampled():
             # 기본 메타데이터 구성
             base_metadata = {
                 "service": self.service_name,
@@ -164,14 +194,14 @@ class LangfuseManager:
             config["callbacks"] = [self.handler]
             config["metadata"] = base_metadata
             
-            logger.info(f"🎯 [{self.service_name}] Langfuse callback 설정됨: session_id={self.session_id}, user_id={self.user_id}")
+            logger.debug(f"🎯 [{self.service_name}] Langfuse callback 설정됨: session_id={self.session_id}, user_id={self.user_id}")
         else:
-            logger.warning(f"⚠️ [{self.service_name}] Langfuse handler가 없음 - 모니터링 불가")
+            logger.debug(f"⚠️ [{self.service_name}] Langfuse handler가 없음 - 모니터링 불가")
         return config
     
     def update_current_trace(self, name: str = None, input_data: Dict = None, output_data: Dict = None) -> None:
         """현재 trace를 업데이트 (올바른 방식)"""
-        if not LANGFUSE_AVAILABLE or not get_client:
+        if not LANGFUSE_AVAILABLE or not get_client or not is_trace_sampled():
             return
             
         try:
@@ -270,6 +300,101 @@ class AnthropicProvider(BaseLLMProvider):
         )
 
 
+class LLMProviderPool:
+    """LLM 인스턴스 풀 - (provider, model, temperature, kwargs) 별로 인스턴스와 HTTP 커넥션 풀 재사용"""
+
+    def __init__(self, max_size: int = 16, max_failures: int = 3):
+        self.max_size = max_size
+        self.max_failures = max_failures
+        self._instances: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._failures: Dict[Tuple, int] = {}
+        self._keys_by_instance: Dict[int, Tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(provider_name: str, model: str, temperature: float, kwargs: Dict[str, Any]) -> Tuple:
+        """풀 키 생성 (kwargs는 정렬된 JSON 문자열로 고정)"""
+        return provider_name, model, temperature, json.dumps(kwargs, sort_keys=True, default=str)
+
+    def get_or_create(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """key에 해당하는 LLM 인스턴스 반환 (없으면 factory로 생성, 최대 크기 초과 시 LRU 제거)"""
+        with self._lock:
+            llm = self._instances.get(key)
+            if llm is not None:
+                self._instances.move_to_end(key)
+                self.hits += 1
+                return llm
+
+            self.misses += 1
+            llm = factory()
+            self._instances[key] = llm
+            self._keys_by_instance[id(llm)] = key
+
+            while len(self._instances) > self.max_size:
+                oldest_key = next(iter(self._instances))
+                self._evict(oldest_key)
+
+            logger.info(f"LLM 인스턴스 생성 및 풀 등록: {key[0]}/{key[1]} (pool size={len(self._instances)})")
+            return llm
+
+    def report_success(self, llm: Any) -> None:
+        """호출 성공 - 연속 실패 횟수 초기화"""
+        key = self._keys_by_instance.get(id(llm))
+        if key is not None and self._failures.get(key):
+            with self._lock:
+                self._failures.pop(key, None)
+
+    def report_failure(self, llm: Any) -> None:
+        """호출 실패 - 연속 실패가 max_failures에 도달하면 풀에서 제거 (다음 요청에서 새로 생성)"""
+        key = self._keys_by_instance.get(id(llm))
+        if key is None:
+            return
+
+        with self._lock:
+            if key not in self._instances:
+                return
+            self._failures[key] = self._failures.get(key, 0) + 1
+            if self._failures[key] >= self.max_failures:
+                logger.warning(f"⚠️ LLM 인스턴스 연속 {self._failures[key]}회 실패, 풀에서 제거: {key[0]}/{key[1]}")
+                self._evict(key)
+
+    def _evict(self, key: Tuple) -> None:
+        llm = self._instances.pop(key, None)
+        self._failures.pop(key, None)
+        if llm is not None:
+            self._keys_by_instance.pop(id(llm), None)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """풀 초기화 (개발/테스트용)"""
+        with self._lock:
+            self._instances.clear()
+            self._failures.clear()
+            self._keys_by_instance.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 반환"""
+        return {
+            "size": len(self._instances),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# 전역 LLM 인스턴스 풀
+llm_provider_pool = LLMProviderPool(max_size=settings.LLM_POOL_MAX_SIZE, max_failures=settings.LLM_POOL_MAX_FAILURES)
+
+# 컨텐츠 필터링 전용 LLM 인스턴스 풀 (채팅 모델과 용량/장애 격리)
+filter_llm_pool = LLMProviderPool(
+    max_size=settings.FILTER_LLM_POOL_MAX_SIZE, max_failures=settings.LLM_POOL_MAX_FAILURES
+)
+
+
 class LLMFactory:
     """LLM 팩토리 클래스 - 공통 LLM 생성 로직"""
     
@@ -277,6 +402,8 @@ class LLMFactory:
         LLMProviderType.OPENAI: OpenAIProvider,
         LLMProviderType.ANTHROPIC: AnthropicProvider,
     }
+
+    pool = llm_provider_pool
     
     @classmethod
     def create_provider(
@@ -314,11 +441,16 @@ class LLMFactory:
         provider_type: str = None,
         model: str = None, 
         temperature: float = 0,
+        pool: Optional[LLMProviderPool] = None,
         **kwargs
     ) -> Any:
-        """LLM 인스턴스 직접 생성 (편의 메서드)"""
+        """LLM 인스턴스 반환 (편의 메서드) - 풀이 활성화된 경우 동일 설정의 인스턴스 재사용 (기본: 전역 풀)"""
         provider_type = provider_type or settings.ACTIVE_LLM_PROVIDER or "openai"
         model = model or settings.ACTIVE_LLM_MODEL
         
         provider = cls.create_provider(provider_type, model, temperature, **kwargs)
-        return provider.create_llm() 
\ No newline at end of file
+        if not settings.LLM_POOL_ENABLED:
+            return provider.create_llm()
+
+        key = LLMProviderPool.make_key(type(provider).__name__, provider.model, provider.temperature, provider.kwargs)
+        return (pool or cls.pool).get_or_create(key, provider.create_llm)
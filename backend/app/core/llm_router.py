@@ -0,0 +1,379 @@
+"""
+LLM 프로바이더 라우팅 - 장애 전환(failover)과 지연 헤징(hedged request)
+
+- 기본 프로바이더 호출이 429/5xx/연결 오류로 실패하면 대체 프로바이더로 재요청
+- 기본 프로바이더 응답이 헤지 지연(최근 지연시간의 p95) 안에 오지 않으면 대체 프로바이더에 같은 요청을 보내고
+  먼저 도착한 응답을 사용 (나머지 요청은 취소)
+- 스트리밍은 첫 청크 도착 시간 기준으로 헤징/전환하며, 첫 청크 이후에는 선택된 스트림을 그대로 전달
+- 호출 성공/실패는 실제로 호출한 경로의 풀 인스턴스에 기록 (헤지에서 져서 취소된 호출은 기록하지 않음)
+
+HedgedLLMRouter는 Runnable이므로 `prompt | router` 체인에서 LLM 대신 그대로 사용할 수 있습니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import ValidationError
+
+from app.core.config import settings
+
+# 프로바이더 SDK 예외 (선택적 - 상태 코드가 없는 연결/타임아웃 오류 판별용)
+_CONNECTION_ERRORS: Tuple[type, ...] = (ConnectionError, TimeoutError, asyncio.TimeoutError)
+try:
+    import openai
+
+    _CONNECTION_ERRORS += (openai.APIConnectionError,)
+except ImportError:
+    pass
+try:
+    import anthropic
+
+    _CONNECTION_ERRORS += (anthropic.APIConnectionError,)
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """다른 프로바이더로 전환할 오류인지 여부 (429/5xx, 연결/타임아웃 오류)"""
+    if isinstance(error, _CONNECTION_ERRORS):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(status_code, int) and (status_code in RETRYABLE_STATUS_CODES or status_code >= 500)
+
+
+def is_pool_failure(error: BaseException) -> bool:
+    """풀 인스턴스 실패로 집계할 오류인지 여부 (응답 형식 오류는 호출 자체는 성공)"""
+    return not isinstance(error, (OutputParserException, ValidationError))
+
+
+def describe_llm(llm: Any) -> str:
+    """지연시간 집계용 LLM 이름 ("ChatOpenAI/gpt-4o")"""
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or "unknown"
+    return f"{type(llm).__name__}/{model}"
+
+
+class ProviderLatencyTracker:
+    """프로바이더/모델별 최근 N개 호출 지연시간 (전체 응답 시간과 스트리밍 첫 청크 시간 별도 집계)"""
+
+    def __init__(self, window: Optional[int] = None):
+        self.window = window or settings.LLM_LATENCY_WINDOW
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, kind: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get((name, kind))
+            if samples is None:
+                samples = self._samples[(name, kind)] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, name: str, kind: str, q: float) -> Optional[float]:
+        """최근 지연시간의 q 백분위수 (표본이 LLM_LATENCY_MIN_SAMPLES 미만이면 None)"""
+        with self._lock:
+            samples = sorted(self._samples.get((name, kind), ()))
+        if len(samples) < settings.LLM_LATENCY_MIN_SAMPLES:
+            return None
+        return samples[min(int(q / 100 * len(samples)), len(samples) - 1)]
+
+    def reset(self) -> None:
+        """지연시간 초기화 (개발/테스트용)"""
+        with self._lock:
+            self._samples.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = {key: sorted(samples) for key, samples in self._samples.items()}
+        return {
+            f"{name}:{kind}": {
+                "samples": len(samples),
+                "p50": round(samples[len(samples) // 2], 3),
+                "p95": round(samples[min(int(0.95 * len(samples)), len(samples) - 1)], 3),
+            }
+            for (name, kind), samples in snapshot.items()
+            if samples
+        }
+
+
+class RouterMetrics:
+    """라우터 동작 통계 (헤지 발생/승리, 장애 전환)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = {"requests": 0, "hedged": 0, "hedge_wins": 0, "failovers": 0, "failures": 0}
+
+    def record(self, event: str) -> None:
+        with self._lock:
+            self.counts[event] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.counts)
+
+
+# 전역 지연시간/통계 (요청별 라우터 인스턴스가 공유)
+llm_latency_tracker = ProviderLatencyTracker()
+llm_router_metrics = RouterMetrics()
+
+
+@dataclass
+class LLMRoute:
+    """라우팅 대상 (지연시간 집계 이름 + LLM Runnable + 호출 결과를 기록할 풀)"""
+
+    name: str
+    llm: Any
+    pool: Optional[Any] = None  # LLMProviderPool (None이면 기록 안 함)
+    pooled_llm: Optional[Any] = None  # 풀에 기록할 인스턴스 (구조화 출력 등으로 감싼 경우 원본, None이면 llm)
+
+    def report(self, error: Optional[BaseException] = None) -> None:
+        """호출 결과를 풀 인스턴스 상태에 기록 (연속 실패 시 풀에서 교체)"""
+        if self.pool is None:
+            return
+        llm = self.llm if self.pooled_llm is None else self.pooled_llm
+        if error is not None and is_pool_failure(error):
+            self.pool.report_failure(llm)
+        else:
+            self.pool.report_success(llm)
+
+    def with_llm(self, llm: Any) -> "LLMRoute":
+        """같은 이름/풀 인스턴스로 기록하는 다른 Runnable 경로"""
+        return LLMRoute(self.name, llm, self.pool, self.llm if self.pooled_llm is None else self.pooled_llm)
+
+
+class HedgedLLMRouter(Runnable):
+    """기본/대체 프로바이더 사이의 장애 전환 + 지연 헤징 Runnable"""
+
+    def __init__(
+        self,
+        primary: LLMRoute,
+        alternate: LLMRoute,
+        hedge_enabled: Optional[bool] = None,
+        tracker: Optional[ProviderLatencyTracker] = None,
+        metrics: Optional[RouterMetrics] = None,
+    ):
+        self.primary = primary
+        self.alternate = alternate
+        self.hedge_enabled = settings.LLM_HEDGE_ENABLED if hedge_enabled is None else hedge_enabled
+        self.tracker = tracker or llm_latency_tracker
+        self.metrics = metrics or llm_router_metrics
+
+    @classmethod
+    def from_settings(cls, primary_llm: Any, pool=None) -> Optional["HedgedLLMRouter"]:
+        """LLM_ROUTER_ENABLED이고 대체 프로바이더가 기본과 다를 때만 라우터 생성"""
+        if not settings.LLM_ROUTER_ENABLED or not settings.LLM_FALLBACK_MODEL:
+            return None
+        from app.core.llm import LLMFactory  # 순환 참조 방지
+
+        alternate_llm = LLMFactory.create_llm(settings.LLM_FALLBACK_PROVIDER, settings.LLM_FALLBACK_MODEL, pool=pool)
+        primary = LLMRoute(describe_llm(primary_llm), primary_llm, pool)
+        alternate = LLMRoute(describe_llm(alternate_llm), alternate_llm, pool)
+        if primary.name == alternate.name:
+            return None
+        return cls(primary, alternate)
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "HedgedLLMRouter":
+        """두 프로바이더 모두 구조화 출력으로 감싼 라우터 (지연시간/통계는 공유)"""
+        return HedgedLLMRouter(
+            self.primary.with_llm(self.primary.llm.with_structured_output(schema, **kwargs)),
+            self.alternate.with_llm(self.alternate.llm.with_structured_output(schema, **kwargs)),
+            hedge_enabled=self.hedge_enabled,
+            tracker=self.tracker,
+            metrics=self.metrics,
+        )
+
+    def hedge_delay(self, kind: str) -> Optional[float]:
+        """대체 프로바이더에 헤지 요청을 보낼 때까지 기다릴 시간 (None이면 헤징 안 함)"""
+        if not self.hedge_enabled:
+            return None
+        observed = self.tracker.percentile(self.primary.name, kind, settings.LLM_HEDGE_PERCENTILE)
+        if observed is None:
+            return settings.LLM_HEDGE_DEFAULT_DELAY
+        return max(observed, settings.LLM_HEDGE_MIN_DELAY)
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        """동기 호출 - 헤징 없이 장애 전환만 적용"""
+        self.metrics.record("requests")
+        try:
+            return self._timed_invoke_sync(self.primary, input, config, **kwargs)
+        except Exception as e:
+            if not is_retryable_error(e):
+                raise
+            self._log_failover(e)
+            return self._timed_invoke_sync(self.alternate, input, config, **kwargs)
+
+    def _timed_invoke_sync(self, route: LLMRoute, input: Any, config: Optional[RunnableConfig], **kwargs: Any) -> Any:
+        start_time = time.perf_counter()
+        try:
+            result = route.llm.invoke(input, config, **kwargs)
+        except Exception as e:
+            route.report(e)
+            raise
+        self.tracker.record(route.name, "invoke", time.perf_counter() - start_time)
+        route.report()
+        return result
+
+    async def _timed_invoke(self, route: LLMRoute, input: Any, config: Optional[RunnableConfig], **kwargs: Any) -> Any:
+        start_time = time.perf_counter()
+        try:
+            result = await route.llm.ainvoke(input, config, **kwargs)
+        except asyncio.CancelledError:
+            # 헤지에서 져서 취소된 호출도 경과 시간을 하한값으로 기록 (느린 호출이 표본에서 빠지면 p95가 낮게 추정됨)
+            self.tracker.record(route.name, "invoke", time.perf_counter() - start_time)
+            raise
+        except Exception as e:
+            route.report(e)
+            raise
+        self.tracker.record(route.name, "invoke", time.perf_counter() - start_time)
+        route.report()
+        return result
+
+    def _log_failover(self, error: BaseException) -> None:
+        self.metrics.record("failovers")
+        logger.warning(f"⚠️ {self.primary.name} 호출 실패, {self.alternate.name}로 전환: {error}")
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        """비동기 호출 - 헤지 지연 초과 시 대체 프로바이더 동시 요청, 재시도 가능한 오류 시 전환"""
+        self.metrics.record("requests")
+        primary_task = asyncio.ensure_future(self._timed_invoke(self.primary, input, config, **kwargs))
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_delay("invoke"))
+        except BaseException:
+            primary_task.cancel()
+            raise
+
+        if done:
+            error = primary_task.exception()
+            if error is None:
+                return primary_task.result()
+            if not is_retryable_error(error):
+                raise error
+            self._log_failover(error)
+            return await self._timed_invoke(self.alternate, input, config, **kwargs)
+
+        self.metrics.record("hedged")
+        alternate_task = asyncio.ensure_future(self._timed_invoke(self.alternate, input, config, **kwargs))
+        return (await self._race(primary_task, alternate_task)).result()
+
+    async def _race(self, primary_task: asyncio.Future, alternate_task: asyncio.Future) -> asyncio.Future:
+        """먼저 성공한 작업 반환 (나머지 취소), 모두 실패하면 기본 프로바이더 오류 전달"""
+        pending = {primary_task, alternate_task}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is alternate_task:
+                            self.metrics.record("hedge_wins")
+                        return task
+            self.metrics.record("failures")
+            raise primary_task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def astream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """
+        스트리밍 - 첫 청크 기준으로 헤징/전환
+
+        첫 청크가 헤지 지연 안에 오지 않으면 대체 프로바이더 스트림을 함께 시작하고 먼저 청크를 보낸 쪽을 사용합니다.
+        첫 청크 이후의 오류는 이미 전달된 내용과 섞이지 않도록 그대로 전파합니다.
+        """
+        self.metrics.record("requests")
+        streams: Dict[asyncio.Future, Tuple[LLMRoute, AsyncIterator[Any]]] = {}
+        winner = None
+        try:
+            primary_task = self._start_stream(self.primary, streams, input, config, **kwargs)
+            done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_delay("first_chunk"))
+            if not done:
+                self.metrics.record("hedged")
+                alternate_task = self._start_stream(self.alternate, streams, input, config, **kwargs)
+                winner = await self._race(primary_task, alternate_task)
+            elif primary_task.exception() is None:
+                winner = primary_task
+            else:
+                error = primary_task.exception()
+                if not is_retryable_error(error):
+                    raise error
+                self._log_failover(error)
+                winner = self._start_stream(self.alternate, streams, input, config, **kwargs)
+                await winner
+        finally:
+            # 선택되지 않은 스트림 정리 (연결 반환)
+            for task, (_, stream) in streams.items():
+                if task is not winner:
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    await _close_stream(stream)
+
+        route, stream = streams[winner]
+        try:
+            started, chunk = winner.result()
+            if started:
+                yield chunk
+                async for chunk in stream:
+                    yield chunk
+        except Exception as e:
+            route.report(e)
+            raise
+        else:
+            route.report()
+        finally:
+            await _close_stream(stream)
+
+    def _start_stream(
+        self,
+        route: LLMRoute,
+        streams: Dict[asyncio.Future, Tuple[LLMRoute, AsyncIterator[Any]]],
+        input: Any,
+        config: Optional[RunnableConfig],
+        **kwargs: Any,
+    ) -> asyncio.Future:
+        """스트림을 시작하고 첫 청크 대기 작업 등록"""
+        stream = route.llm.astream(input, config, **kwargs)
+        task = asyncio.ensure_future(self._first_chunk(route, stream))
+        streams[task] = (route, stream)
+        return task
+
+    async def _first_chunk(self, route: LLMRoute, stream: AsyncIterator[Any]) -> Tuple[bool, Any]:
+        """스트림의 첫 청크 대기 ((False, None): 빈 스트림, 성공 기록은 스트림 종료 시)"""
+        start_time = time.perf_counter()
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            return False, None
+        except asyncio.CancelledError:
+            # 취소된 대기도 경과 시간을 하한값으로 기록
+            self.tracker.record(route.name, "first_chunk", time.perf_counter() - start_time)
+            raise
+        except Exception as e:
+            route.report(e)
+            raise
+        self.tracker.record(route.name, "first_chunk", time.perf_counter() - start_time)
+        return True, chunk
+
+
+async def _close_stream(stream: AsyncIterator[Any]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception as e:
+        logger.debug(f"스트림 정리 중 오류 무시: {e}")
@@ -1,3 +1,4 @@
+import json
 from app.constants import UserLevel
 from typing import Literal, Dict, Tuple
 
@@ -229,22 +230,26 @@ SEARCH_DECISION_PROMPT = """당신은 AI 투자 교육 서비스 '캐피(Capi)'
 - 불필요하면: NO"""
 
 # 추천 질문 생성 프롬프트
+RECOMMEND_LEVEL_DESCRIPTIONS = {
+    UserLevel.BEGINNER: "주린이(입문자) - 투자 기초 개념과 용어 학습 단계",
+    UserLevel.INTERMEDIATE: "관심러(활용자) - 시장 영향과 지표 이해 단계",
+    UserLevel.ADVANCED: "실전러(전문가 준비) - 복합 분석과 전략 수립 단계",
+}
+
+RECOMMEND_LEVEL_EXAMPLES = {
+    UserLevel.BEGINNER: ["FOMC가 뭐예요?", "금리 인상 의미는?", "달러 강세란?"],
+    UserLevel.INTERMEDIATE: ["FOMC 결과 영향은?", "금리변화 섹터별 차이", "통화정책 시장 반응"],
+    UserLevel.ADVANCED: ["FOMC 시나리오 분석", "금리 차등화 전략", "Fed 정책 포지셔닝"],
+}
+
+
 def get_recommend_question_prompt(
     level: UserLevel, event_description: str, question_count: int = 3, string_length: int = 15
 ) -> str:
     """사용자 레벨에 따른 추천 질문 생성 프롬프트를 반환합니다."""
 
-    level_descriptions = {
-        UserLevel.BEGINNER: "주린이(입문자) - 투자 기초 개념과 용어 학습 단계",
-        UserLevel.INTERMEDIATE: "관심러(활용자) - 시장 영향과 지표 이해 단계",
-        UserLevel.ADVANCED: "실전러(전문가 준비) - 복합 분석과 전략 수립 단계",
-    }
-
-    level_examples = {
-        UserLevel.BEGINNER: ["FOMC가 뭐예요?", "금리 인상 의미는?", "달러 강세란?"],
-        UserLevel.INTERMEDIATE: ["FOMC 결과 영향은?", "금리변화 섹터별 차이", "통화정책 시장 반응"],
-        UserLevel.ADVANCED: ["FOMC 시나리오 분석", "금리 차등화 전략", "Fed 정책 포지셔닝"],
-    }
+    level_descriptions = RECOMMEND_LEVEL_DESCRIPTIONS
+    level_examples = RECOMMEND_LEVEL_EXAMPLES
 
     return f"""당신은 추천 질문 생성기입니다. 주어진 이벤트에 대한 사용자 질문을 생성하세요.
 
@@ -274,3 +279,41 @@ def get_recommend_question_prompt(
 {level_examples[level]}
 
 위 예시처럼 간단하고 명확한 질문을 생성하세요."""
+
+
+def get_recommend_question_batch_prompt(
+    events: dict[str, str], levels: list[UserLevel], question_count: int = 3, string_length: int = 15
+) -> str:
+    """여러 이벤트 x 여러 레벨의 추천 질문을 한 번에 생성하는 JSON 출력 프롬프트를 반환합니다."""
+
+    event_lines = "\n\n".join(f"[{event_id}]\n{description}" for event_id, description in events.items())
+    level_lines = "\n".join(
+        f"- {level.value}: {RECOMMEND_LEVEL_DESCRIPTIONS[level]} (예: {', '.join(RECOMMEND_LEVEL_EXAMPLES[level])})"
+        for level in levels
+    )
+    output_example = json.dumps(
+        {event_id: {level.value: ["질문1", "질문2"] for level in levels} for event_id in list(events)[:1]},
+        ensure_ascii=False,
+    )
+
+    return f"""당신은 추천 질문 생성기입니다. 여러 이벤트에 대해 사용자 레벨별 질문을 한 번에 생성하세요.
+
+[작업]
+각 이벤트와 각 사용자 레벨마다 사용자가 궁금해할 만한 질문 {question_count}개를 생성하세요.
+
+[이벤트 목록]
+{event_lines}
+
+[사용자 레벨]
+{level_lines}
+
+[생성 규칙]
+1. 각 질문은 {string_length}자 이내
+2. 한글로만 작성
+3. 질문 끝에 물음표(?) 포함
+4. 투자 교육 목적의 학습형 질문
+5. 실제 투자 권유 금지
+
+[출력 형식]
+다른 설명 없이 이벤트 ID → 레벨 → 질문 목록 구조의 JSON만 출력:
+{output_example}"""
@@ -0,0 +1,144 @@
+"""
+고정 메모리 스트리밍 메트릭
+
+요청마다 값을 리스트에 쌓지 않고 고정된 버킷에 집계하여 장시간 실행되는 워커에서도
+메모리 사용량이 일정하게 유지되며, 기록은 O(1), 백분위수 조회는 버킷 수에 비례합니다.
+"""
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Sequence
+
+
+class StreamingHistogram(ABC):
+    """고정 버킷 스트리밍 히스토그램 (합계/최소/최대는 정확값, 백분위수는 버킷 근사값)"""
+
+    def __init__(self, bucket_count: int):
+        self._buckets: List[int] = [0] * bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @abstractmethod
+    def _index(self, value: float) -> int:
+        """값이 속한 버킷 인덱스"""
+        pass
+
+    @abstractmethod
+    def _value(self, index: int) -> float:
+        """버킷의 대표값"""
+        pass
+
+    def record(self, value: float) -> None:
+        """값 기록 (범위를 벗어난 값은 양 끝 버킷에 집계)"""
+        index = min(max(self._index(value), 0), len(self._buckets) - 1)
+        self._buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """q 백분위수 근사값 (0 ≤ q ≤ 100, 관측된 최소/최대 범위로 제한)"""
+        if not self.count:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 100:
+            return self.max
+        rank = q / 100 * (self.count - 1)
+        cumulative = 0
+        for index, bucket in enumerate(self._buckets):
+            cumulative += bucket
+            if cumulative > rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def percentiles(self, qs: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+        """여러 백분위수 조회 ({"p50": ..., "p90": ..., "p99": ...})"""
+        return {f"p{q:g}": self.percentile(q) for q in qs}
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        self._buckets = [0] * len(self._buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class LogHistogram(StreamingHistogram):
+    """
+    로그 스케일 히스토그램 (처리 시간 등 범위가 넓은 양수 값)
+
+    버킷 경계가 gamma = (1 + e) / (1 - e) 배씩 증가하여 범위 안의 값은 상대 오차 e 이내로 근사됩니다.
+    """
+
+    def __init__(self, min_value: float, max_value: float, relative_error: float = 0.01):
+        self.min_value = min_value
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        super().__init__(int(math.ceil(math.log(max_value / min_value) / self._log_gamma)) + 1)
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return int(math.ceil(math.log(value / self.min_value) / self._log_gamma))
+
+    def _value(self, index: int) -> float:
+        # 버킷 (min·γ^(i-1), min·γ^i] 의 대표값
+        return self.min_value * self._gamma ** index * 2 / (self._gamma + 1)
+
+
+class LinearHistogram(StreamingHistogram):
+    """선형 스케일 히스토그램 (안전 점수 등 범위가 정해진 값)"""
+
+    def __init__(self, min_value: float, max_value: float, bucket_count: int = 100):
+        self.min_value = min_value
+        self._width = (max_value - min_value) / bucket_count
+        super().__init__(bucket_count)
+
+    def _index(self, value: float) -> int:
+        return int((value - self.min_value) / self._width)
+
+    def _value(self, index: int) -> float:
+        return self.min_value + (index + 0.5) * self._width
+
+
+class WindowedCounter:
+    """최근 window_seconds 동안의 발생 횟수 (슬롯 링 버퍼, 기록 O(1))"""
+
+    def __init__(self, window_seconds: float, slots: int = 60, clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self._slot_seconds = window_seconds / slots
+        self._clock = clock
+        self._counts: List[int] = [0] * slots
+        self._slot_ids: List[int] = [-1] * slots
+
+    def add(self, amount: int = 1) -> None:
+        """현재 시각 슬롯에 기록 (오래된 슬롯은 재사용 시 초기화)"""
+        slot_id = int(self._clock() // self._slot_seconds)
+        position = slot_id % len(self._counts)
+        if self._slot_ids[position] != slot_id:
+            self._slot_ids[position] = slot_id
+            self._counts[position] = 0
+        self._counts[position] += amount
+
+    def total(self) -> int:
+        """윈도우 안의 합계"""
+        oldest = int(self._clock() // self._slot_seconds) - len(self._counts)
+        return sum(count for count, slot_id in zip(self._counts, self._slot_ids) if slot_id > oldest)
+
+    def rate(self) -> float:
+        """윈도우 안의 초당 발생 횟수"""
+        return self.total() / self.window_seconds
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        self._counts = [0] * len(self._counts)
+        self._slot_ids = [-1] * len(self._slot_ids)
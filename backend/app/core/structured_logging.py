@@ -0,0 +1,113 @@
+"""
+구조화 로깅 유틸리티
+
+- PayloadSummary: 프롬프트/대화 이력 같은 큰 값을 로그 출력 시점에만 길이+해시+미리보기로 요약 (지연 포맷팅)
+- SamplingFilter: 로거별 INFO 이하 로그 샘플링 (WARNING 이상은 항상 기록)
+- attach_log_sink: 프로세스 공용 큐 싱크에 로거 연결 (실제 출력은 QueueListener 스레드에서 처리)
+"""
+import atexit
+import hashlib
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 공용 로그 큐와 출력 스레드 (첫 사용 시 시작)
+_log_queue: Optional[queue.SimpleQueue] = None
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class PayloadSummary:
+    """출력될 때만 계산되는 페이로드 요약 (길이, sha256 앞 12자리, 미리보기)"""
+
+    __slots__ = ("value", "preview_chars")
+
+    def __init__(self, value: Any, preview_chars: Optional[int] = None):
+        self.value = value
+        self.preview_chars = settings.LOG_PAYLOAD_PREVIEW_CHARS if preview_chars is None else preview_chars
+
+    def __str__(self) -> str:
+        text = self.value if isinstance(self.value, str) else json.dumps(self.value, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+        preview = text[: self.preview_chars]
+        suffix = "…" if len(text) > self.preview_chars else ""
+        return f"{len(text)}자, sha256={digest}, {preview!r}{suffix}"
+
+
+class SamplingFilter(logging.Filter):
+    """INFO 이하 로그를 비율만큼만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, rate: float, rng: Callable[[], float] = random.random):
+        super().__init__()
+        self.rate = rate
+        self._rng = rng
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return self.rate > 0.0 and self._rng() < self.rate
+
+
+def _get_log_queue() -> queue.SimpleQueue:
+    """공용 로그 큐 반환 (출력 스레드가 없으면 시작)"""
+    global _log_queue, _listener
+    with _listener_lock:
+        if _listener is None:
+            _log_queue = queue.SimpleQueue()
+            # QueueHandler가 메시지를 미리 포맷하므로 출력 스레드는 그대로 기록
+            output_handler = logging.StreamHandler(sys.stderr)
+            output_handler.setFormatter(logging.Formatter("%(message)s"))
+            _listener = QueueListener(_log_queue, output_handler, respect_handler_level=False)
+            _listener.start()
+        return _log_queue
+
+
+def stop_log_listener() -> None:
+    """출력 스레드 종료 (남은 로그 기록 후 종료, 다음 사용 시 다시 시작)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(stop_log_listener)
+
+
+def attach_log_sink(logger: logging.Logger, tag: str, level: Optional[int] = None) -> logging.Logger:
+    """
+    로거를 공용 로그 싱크에 연결
+
+    - 루트 로거에 핸들러가 있으면(앱/운영 로깅 설정) 핸들러를 추가하지 않고 전파로 그 설정을 따름
+    - 없으면 공용 싱크 핸들러 추가 - 포맷 "시간 - [tag] - 레벨 - 메시지",
+      LOG_QUEUE_ENABLED면 큐에 넣고 출력은 백그라운드 스레드에서 처리 (호출 스레드에서 I/O 없음)
+    - 전파는 끄지 않음 (루트에 나중에 추가된 핸들러도 기록을 받음)
+    - level: 로거 레벨이 설정되지 않은 경우에만 적용 (None이면 상위 로거 레벨 사용)
+    - LOG_SAMPLE_RATES[logger.name] < 1.0: INFO 이하 로그 샘플링
+    - 이미 핸들러가 있는 로거는 외부 설정으로 보고 변경하지 않음
+    """
+    if logger.handlers:
+        return logger
+
+    if not logging.getLogger().handlers:
+        handler = QueueHandler(_get_log_queue()) if settings.LOG_QUEUE_ENABLED else logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter(f"%(asctime)s - [{tag}] - %(levelname)s - %(message)s", datefmt=DATE_FORMAT)
+        )
+        logger.addHandler(handler)
+    if level is not None and logger.level == logging.NOTSET:
+        logger.setLevel(level)
+
+    rate = settings.LOG_SAMPLE_RATES.get(logger.name, 1.0)
+    if rate < 1.0:
+        logger.addFilter(SamplingFilter(rate))
+    return logger
@@ -0,0 +1,187 @@
+"""
+Langfuse 추적 샘플링
+
+요청의 첫 추적 지점에서 경로별 비율로 샘플링 여부를 한 번 결정하고(헤드 기반),
+같은 요청 컨텍스트의 하위 호출(@traced 함수, trace 업데이트, LangChain callback)은 그 결정을 따릅니다.
+샘플링되지 않은 요청은 observe 래핑 없이 원본 함수를 실행하며,
+오류가 발생하거나 느린 요청만 최소 이벤트로 기록합니다.
+"""
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+# Langfuse 임포트 (선택적)
+try:
+    from langfuse import get_client, observe
+
+    LANGFUSE_OBSERVE_AVAILABLE = True
+except ImportError:
+    LANGFUSE_OBSERVE_AVAILABLE = False
+    get_client = None
+    observe = None
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 샘플링 결정 (None: 아직 결정 전)
+_trace_sampled: ContextVar[Optional[bool]] = ContextVar("langfuse_trace_sampled", default=None)
+# 샘플링되지 않은 @traced 호출 중첩 깊이 (가장 바깥 호출만 오류/지연 이벤트 기록)
+_unsampled_depth: ContextVar[int] = ContextVar("langfuse_unsampled_depth", default=0)
+
+
+class TraceSampler:
+    """경로별 헤드 기반 샘플러 + 샘플링되지 않은 오류/지연 요청 기록"""
+
+    def __init__(
+        self,
+        default_rate: Optional[float] = None,
+        route_rates: Optional[Dict[str, float]] = None,
+        slow_seconds: Optional[float] = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.default_rate = settings.LANGFUSE_SAMPLE_RATE if default_rate is None else default_rate
+        self.route_rates = settings.LANGFUSE_ROUTE_SAMPLE_RATES if route_rates is None else route_rates
+        self.slow_seconds = settings.LANGFUSE_SLOW_TRACE_SECONDS if slow_seconds is None else slow_seconds
+        self._rng = rng
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """통계 초기화 (개발/테스트용)"""
+        with self._lock:
+            self.counts = {"sampled": 0, "dropped": 0, "forced_errors": 0, "forced_slow": 0}
+
+    def decide(self, route: Optional[str] = None) -> bool:
+        """현재 요청의 샘플링 여부 (결정 전이면 route 비율로 결정하여 요청 컨텍스트에 고정)"""
+        sampled = _trace_sampled.get()
+        if sampled is not None:
+            return sampled
+
+        rate = self.route_rates.get(route, self.default_rate) if route else self.default_rate
+        sampled = rate >= 1.0 or (rate > 0.0 and self._rng() < rate)
+        _trace_sampled.set(sampled)
+        with self._lock:
+            self.counts["sampled" if sampled else "dropped"] += 1
+        return sampled
+
+    def record_unsampled(self, route: str, duration: float, error: Optional[BaseException] = None) -> None:
+        """샘플링되지 않은 호출 중 오류/지연만 최소 이벤트로 기록"""
+        if error is None and duration < self.slow_seconds:
+            return
+
+        with self._lock:
+            self.counts["forced_errors" if error is not None else "forced_slow"] += 1
+        if get_client is None:
+            return
+        try:
+            get_client().create_event(
+                name=route,
+                metadata={"sampled": False, "duration": round(duration, 3)},
+                level="ERROR" if error is not None else "WARNING",
+                status_message=str(error) if error is not None else f"slow request: {duration:.3f}s",
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Langfuse 이벤트 기록 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """샘플링 통계"""
+        with self._lock:
+            decided = self.counts["sampled"] + self.counts["dropped"]
+            return {
+                "default_rate": self.default_rate,
+                "route_rates": dict(self.route_rates),
+                **self.counts,
+                "sample_ratio": round(self.counts["sampled"] / decided, 4) if decided else 0.0,
+            }
+
+
+# 전역 추적 샘플러
+trace_sampler = TraceSampler()
+
+
+def is_trace_sampled(route: Optional[str] = None) -> bool:
+    """현재 요청이 추적 대상인지 여부 (trace 업데이트, LangChain callback 연결 전에 확인)"""
+    return trace_sampler.decide(route)
+
+
+@contextmanager
+def _unsampled_call(route: str):
+    """
+    샘플링되지 않은 @traced 호출 구간
+
+    중첩된 호출(conversation → level_chain_run → llm_chat)이 각각 이벤트를 보내지 않도록
+    가장 바깥 호출에서만 오류/지연 이벤트를 기록합니다.
+    """
+    depth = _unsampled_depth.get()
+    _unsampled_depth.set(depth + 1)
+    start_time = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        if depth == 0:
+            trace_sampler.record_unsampled(route, time.perf_counter() - start_time, e)
+        raise
+    else:
+        if depth == 0:
+            trace_sampler.record_unsampled(route, time.perf_counter() - start_time)
+    finally:
+        # 비동기 제너레이터는 다른 컨텍스트에서 종료될 수 있어 reset(token) 대신 이전 값으로 복원
+        _unsampled_depth.set(depth)
+
+
+def traced(route: str) -> Callable:
+    """
+    샘플링 적용 @observe() 대체 데코레이터
+
+    - Langfuse 미설치: 원본 함수 그대로 반환
+    - 샘플링된 요청: observe()로 감싼 함수 실행
+    - 샘플링되지 않은 요청: 원본 함수 실행 (오류/지연 시에만 최소 이벤트 기록)
+    """
+    if not LANGFUSE_OBSERVE_AVAILABLE:
+        return lambda func: func
+
+    def decorator(func: Callable) -> Callable:
+        observed = observe()(func)
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                if trace_sampler.decide(route):
+                    async for item in observed(*args, **kwargs):
+                        yield item
+                    return
+                with _unsampled_call(route):
+                    async for item in func(*args, **kwargs):
+                        yield item
+
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if trace_sampler.decide(route):
+                    return await observed(*args, **kwargs)
+                with _unsampled_call(route):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if trace_sampler.decide(route):
+                return observed(*args, **kwargs)
+            with _unsampled_call(route):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,8 +1,8 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
-from app.models.events import Events
+from app.models.events import Events, EventExplanations
 from app.models.users import UserEventSubscription
 from app.schemas.events import EventResponse, EventCreate
 from app.constants import UserLevel
@@ -121,4 +121,45 @@ class CRUDEvents(CRUDBase[Events, EventCreate, None]):
         return events
 
 
+class CRUDEventExplanations(CRUDBase[EventExplanations, None, None]):
+    """사전 생성된 이벤트 설명 CRUD 클래스"""
+
+    def get_current(
+        self, session: Session, event: Events, level: UserLevel, safety_level: str, prompt_hash: str
+    ) -> EventExplanations | None:
+        """
+        현재 이벤트/프롬프트 기준으로 유효한 설명 반환 (이벤트가 생성 이후 수정되었으면 None)
+        """
+        explanation = self.get(
+            session=session, event_id=event.id, level=level, safety_level=safety_level, prompt_hash=prompt_hash
+        )
+        if explanation is None:
+            return None
+        if event.updated_at and explanation.event_updated_at and explanation.event_updated_at < event.updated_at:
+            return None
+        return explanation
+
+    def upsert(
+        self, session: Session, event: Events, level: UserLevel, safety_level: str, prompt_hash: str, content: str
+    ) -> EventExplanations:
+        """
+        설명 저장 (같은 이벤트/레벨/안전 수준/프롬프트 조합이 있으면 갱신)
+        """
+        explanation = self.get(
+            session=session, event_id=event.id, level=level, safety_level=safety_level, prompt_hash=prompt_hash
+        )
+        if explanation is None:
+            explanation = EventExplanations(
+                event_id=event.id, level=level, safety_level=safety_level, prompt_hash=prompt_hash
+            )
+            session.add(explanation)
+
+        explanation.content = content
+        explanation.event_updated_at = event.updated_at
+        explanation.updated_at = datetime.now()
+        session.flush()
+        return explanation
+
+
 crud_events = CRUDEvents(Events)
+crud_event_explanations = CRUDEventExplanations(EventExplanations)
@@ -10,6 +10,7 @@ from starlette.staticfiles import StaticFiles
 
 from app.core.config import settings
 from app.core.database import db
+from app.services.write_behind import write_behind_queue
 # 모델들을 import해야 SQLAlchemy가 테이블을 인식할 수 있음
 from app.models import *
 
@@ -20,13 +21,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         logger.info("애플리케이션 시작 완료")
         db.startup()
+        write_behind_queue.start()
         yield
 
     except Exception as e:
         logger.error("애플리케이션 시작 실패: {str(e)}")
         raise
     finally:
-        # 정리 작업
+        # 정리 작업 (남은 write-behind 작업을 먼저 반영)
+        await write_behind_queue.shutdown()
         db.shutdown()
 
 
@@ -6,7 +6,7 @@ from .base import Base, BaseModel
 
 # 독립적인 모델들 먼저 import (외래키 관계 없는 것들)
 from .users import Users, LevelFeature
-from .events import Events, EventWebhook
+from .events import Events, EventWebhook, EventExplanations
 
 # 관계형 모델들을 마지막에 import (외래키 관계 있는 것들)
 from .users import UserEventSubscription, UserGoogleCalendar
@@ -19,6 +19,7 @@ __all__ = [
     "LevelFeature", 
     "Events", 
     "EventWebhook", 
+    "EventExplanations",
     "UserEventSubscription", 
     "UserGoogleCalendar",
     "ChatSessions",
@@ -1,7 +1,7 @@
 """
 Event 모델 정의
 """
-from sqlalchemy import Column, String, Date, Text, Integer, ForeignKey, Index, Enum, TIMESTAMP
+from sqlalchemy import Column, String, Date, Text, Integer, ForeignKey, Index, Enum, TIMESTAMP, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from ..models.base import BaseModel
@@ -42,3 +42,25 @@ class EventWebhook(BaseModel):
         Enum(EventStatus, native_enum=False, validate_strings=True), nullable=False, default=EventStatus.PENDING
     )
     processed_at = Column(TIMESTAMP, nullable=True)
+
+
+class EventExplanations(BaseModel):
+    """레벨별 이벤트 설명 (ETL에서 사전 생성, 필터링 완료된 텍스트)"""
+
+    __tablename__ = "event_explanations"
+    __table_args__ = (
+        UniqueConstraint(
+            "event_id", "level", "safety_level", "prompt_hash", name="uq_event_explanations_event_level_prompt"
+        ),
+        {"extend_existing": True},
+    )
+
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True)
+    level = Column(Enum(UserLevel, native_enum=False, validate_strings=True), nullable=False)
+    safety_level = Column(String(20), nullable=False, comment="필터링 안전 수준")
+    prompt_hash = Column(String(32), nullable=False, comment="EVENT_EXPLAIN_PROMPTS 버전 해시")
+    content = Column(Text, nullable=False)
+    event_updated_at = Column(TIMESTAMP, nullable=True, comment="생성 당시 이벤트 updated_at")
+
+    def __repr__(self):
+        return f"<EventExplanations(id={self.id}, event_id={self.event_id}, level={self.level})>"
@@ -40,6 +40,29 @@ class SafetyCheckRequest(BaseModel):
     content: str  # 검사할 컨텐츠
 
 
+class SafetyCheckBatchRequest(BaseModel):
+    """컨텐츠 안전성 일괄 검사 요청"""
+
+    contents: list[str]  # 검사할 컨텐츠 목록
+
+
+class SafetyCheckResult(BaseModel):
+    """컨텐츠 안전성 검사 결과"""
+
+    is_safe: bool
+    safety_score: float
+    risk_categories: list[str]
+    filter_reason: str = ""
+
+
+class SafetyCheckBatchResponse(BaseModel):
+    """컨텐츠 안전성 일괄 검사 응답 (결과 순서는 요청 순서와 동일)"""
+
+    results: list[SafetyCheckResult]
+    total_count: int  # 요청 컨텐츠 수
+    unique_count: int  # 중복 제거 후 분석한 컨텐츠 수
+
+
 class RecommendQuestionRequest(BaseModel):
     """추천 질문 생성 요청"""
 
@@ -55,3 +78,27 @@ class RecommendQuestionResponse(BaseModel):
     questions: list[str]  # 생성된 추천 질문 목록
     user_level: str  # 사용자 레벨
     total_count: int  # 생성된 질문 개수
+
+
+class RecommendQuestionBatchRequest(BaseModel):
+    """추천 질문 일괄 생성 요청 (캐시 미리 채우기용)"""
+
+    event_descriptions: list[str]  # 이벤트 설명 목록
+    levels: list[str] | None = None  # 대상 레벨 (None이면 전체 레벨)
+    question_count: int = 3  # 생성할 질문 개수 (기본값: 3)
+    string_length: int = 15  # 질문 길이 제한 (기본값: 15자)
+
+
+class RecommendQuestionBatchItem(BaseModel):
+    """이벤트/레벨별 추천 질문"""
+
+    event_description: str
+    user_level: str
+    questions: list[str]
+
+
+class RecommendQuestionBatchResponse(BaseModel):
+    """추천 질문 일괄 생성 응답"""
+
+    items: list[RecommendQuestionBatchItem]
+    total_count: int  # 생성(또는 캐시 조회)된 조합 수
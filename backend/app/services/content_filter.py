@@ -1,12 +1,33 @@
+import asyncio
+import hashlib
+import inspect
 import json
 import logging
-from typing import TypedDict, List, Dict, Any
+from contextvars import ContextVar
+from typing import TypedDict, List, Dict, Any, Optional, Set
+from langchain_core.exceptions import OutputParserException
+from langgraph.errors import ErrorCode, GraphRecursionError, create_error_message
 from langgraph.graph import StateGraph, START, END
 
 from app.utils.llm_client import LLMClient
 from app.core.config import settings
+from app.core.llm import LLMProviderPool, filter_llm_pool
+from app.services.filter_output import (
+    MODE_STRUCTURED,
+    MODE_TEXT,
+    SafetyAnalysisOutput,
+    SafetyRecheckOutput,
+    filter_parse_metrics,
+)
+from app.services.filter_tiers import TIER_FAST, TIER_STRONG, filter_tier_metrics, needs_escalation, timed_chat
+from app.services.graph_registry import compiled_graph_registry, graph_key, graph_node, graph_route, runner_config
+from app.services.response_cache import filter_verdict_cache, hash_text
+from app.services.local_rewrite import local_rewriter
+from app.services.safety_classifier import VERDICT_SAFE, normalize_text, safety_preclassifier
+from pydantic import ValidationError
 from app.core.filter_prompts import (
     SAFETY_ANALYSIS_PROMPT,
+    SAFETY_ANALYSIS_CONTEXT_PROMPT,
     CONTENT_REPLACEMENT_PROMPT,
     SAFETY_RECHECK_PROMPT,
     SAFETY_THRESHOLDS,
@@ -17,11 +38,26 @@ from app.core.filter_prompts import (
 
 logger = logging.getLogger(__name__)
 
+# 문구 대체 + 면책 조항으로 해결 가능한 위험 카테고리 (그 외 카테고리는 LLM 대체 필요)
+LOCAL_REWRITE_CATEGORIES = {"investment_advice", "guaranteed_profit", "excessive_confidence", "missing_risk_warning"}
+
+# 필터링 자체가 실패한 경우의 카테고리 (판정 결과가 아니므로 캐시/저장 대상에서 제외)
+ERROR_RISK_CATEGORIES = {"system_error", "service_error"}
+
+# 현재 process 호출에서 시작된 선행 대체 생성 작업 (취소/오류로 상태를 잃어도 종료 시 정리)
+_pending_speculations: ContextVar[Optional[Set[asyncio.Task]]] = ContextVar("filter_pending_speculations", default=None)
+
+# 필터링 프롬프트 버전 (프롬프트 변경 시 판정 캐시 무효화)
+FILTER_PROMPT_VERSION = hash_text(
+    SAFETY_ANALYSIS_PROMPT + SAFETY_ANALYSIS_CONTEXT_PROMPT + CONTENT_REPLACEMENT_PROMPT + SAFETY_RECHECK_PROMPT + DISCLAIMER_TEMPLATE
+)
+
 
 class FilterState(TypedDict):
     """필터링 프로세스의 상태를 관리하는 타입"""
 
     original_content: str  # 원본 컨텐츠
+    context: str  # 앞부분 문맥 (스트리밍 필터의 이전 윈도우, 분석에만 사용)
     filtered_content: str  # 필터링된 컨텐츠
     is_safe: bool  # 안전 여부
     safety_score: float  # 안전도 점수 (0.0-1.0)
@@ -32,59 +68,129 @@ class FilterState(TypedDict):
     needs_replacement: bool  # 컨텐츠 대체 필요 여부
     analysis_result: Dict[str, Any]  # LLM 분석 결과
     error_message: str  # 오류 메시지
+    rewrite_method: str  # 대체 방식 (local: 로컬 재작성, llm: LLM 대체)
+    speculative_replacement: Optional[asyncio.Task]  # 분석과 병렬로 선행 생성 중인 대체 컨텐츠
+    speculative_categories: List[str]  # 선행 생성에 사용한 경량 모델 위험 카테고리 (고성능 판정과 다르면 폐기)
+    skip_fast_tier: bool  # 사전 분류 위험 판정 - 경량 모델 1차 분석 없이 고성능 모델로 분석
 
 
 class ContentFilter:
     """LangGraph 기반 컨텐츠 필터링 시스템"""
 
-    def __init__(self, user=None, langfuse_manager=None):
-        self.llm_client = LLMClient(user=user, langfuse_manager=langfuse_manager)
+    def __init__(self, user=None, langfuse_manager=None, pool: Optional[LLMProviderPool] = None):
+        # 필터링 전용 풀의 모델 사용: 고성능 모델(재분석/대체/재검토) + 경량 모델(1차 분석)
+        pool = pool or filter_llm_pool
+        self.llm_client = LLMClient(
+            user=user,
+            langfuse_manager=langfuse_manager,
+            provider_type=settings.FILTER_LLM_PROVIDER or None,
+            model=settings.FILTER_LLM_MODEL,
+            pool=pool,
+        )
+        self.fast_llm_client = (
+            LLMClient(
+                user=user,
+                langfuse_manager=langfuse_manager,
+                provider_type=settings.FILTER_LLM_PROVIDER or None,
+                model=settings.FILTER_LLM_FAST_MODEL,
+                pool=pool,
+            )
+            if settings.FILTER_LLM_FAST_MODEL
+            else None
+        )
+        self.escalation_band = settings.FILTER_ESCALATION_BAND
+        # 경량 모델 점수가 임계값 바로 아래면 고성능 모델 재분석과 병렬로 대체 컨텐츠 선행 생성
+        self.speculative_replacement = settings.FILTER_SPECULATIVE_REPLACEMENT_ENABLED
+        self.speculative_band = settings.FILTER_SPECULATIVE_BAND
+        self.tier_metrics = filter_tier_metrics
+        # 분석/재검토 응답을 provider 네이티브 구조화 출력으로 요청 (False면 자유 형식 텍스트 + JSON 추출)
+        self.structured_output = settings.FILTER_STRUCTURED_OUTPUT_ENABLED
+        self.parse_metrics = filter_parse_metrics
+        # 문구 단위 위반은 LLM 대체/재검토 전에 로컬 재작성 시도 (None이면 항상 LLM 대체)
+        self.local_rewriter = local_rewriter if settings.FILTER_LOCAL_REWRITE_ENABLED else None
         self.safety_threshold = SAFETY_THRESHOLDS.get(settings.FILTER_SAFETY_LEVEL, SAFETY_THRESHOLDS["strict"])
         self.max_retries = settings.FILTER_MAX_RETRIES
-        self.graph = self._build_graph()
-
-    def _build_graph(self) -> StateGraph:
+        # 위험 표현이 있는 컨텐츠는 고성능 모델로 바로 분석 (None이면 항상 경량 모델부터 분석)
+        self.preclassifier = safety_preclassifier if settings.FILTER_PRECLASSIFIER_ENABLED else None
+        # 동일 컨텐츠의 최종 판정 재사용 (None이면 캐시 미사용)
+        self.verdict_cache = filter_verdict_cache
+        # 그래프는 프로세스 전역에서 한 번만 컴파일, 요청별 의존성은 실행 config로 전달
+        self.graph = compiled_graph_registry.get_or_compile(graph_key(type(self)), self._build_graph)
+
+    # 필터링 FSM 정의 (LangGraph 그래프와 네이티브 실행기가 공유)
+    START_NODE = "analyze"
+    NODES = {
+        "analyze": "_analyze_content",
+        "filter": "_apply_filter",
+        "replace": "_replace_content",
+        "recheck": "_recheck_content",
+        "approve": "_approve_content",
+        "reject": "_reject_content",
+    }
+    ROUTES = {
+        "analyze": ("_route_after_analysis", {"safe": "approve", "unsafe": "filter", "error": "reject"}),
+        "filter": ("_route_after_filter", {"replace": "replace", "reject": "reject", "retry": "analyze"}),
+        "replace": ("_route_after_replace", {"recheck": "recheck", "approve": "approve", "error": "reject"}),
+        "recheck": ("_route_after_recheck", {"approve": "approve", "retry": "replace", "reject": "reject"}),
+    }
+    END_NODES = ("approve", "reject")
+    RECURSION_LIMIT = 50  # 기본 25에서 50으로 증가 (무한루프 방지)
+
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """필터링 workflow 그래프 구성"""
         workflow = StateGraph(FilterState)
 
-        # 노드들 추가
-        workflow.add_node("analyze", self._analyze_content)
-        workflow.add_node("filter", self._apply_filter)
-        workflow.add_node("replace", self._replace_content)
-        workflow.add_node("recheck", self._recheck_content)
-        workflow.add_node("approve", self._approve_content)
-        workflow.add_node("reject", self._reject_content)
+        # 노드들 추가 (실행 시 config의 ContentFilter 인스턴스 메서드로 위임)
+        for node, method_name in cls.NODES.items():
+            workflow.add_node(node, graph_node(method_name))
 
         # 시작점 연결
-        workflow.add_edge(START, "analyze")
+        workflow.add_edge(START, cls.START_NODE)
 
         # 조건부 엣지들 설정
-        workflow.add_conditional_edges(
-            "analyze", self._route_after_analysis, {"safe": "approve", "unsafe": "filter", "error": "reject"}
-        )
-
-        workflow.add_conditional_edges(
-            "filter", self._route_after_filter, {"replace": "replace", "reject": "reject", "retry": "analyze"}
-        )
-
-        workflow.add_conditional_edges(
-            "replace", self._route_after_replace, {"recheck": "recheck", "approve": "approve", "error": "reject"}
-        )
-
-        workflow.add_conditional_edges(
-            "recheck", self._route_after_recheck, {"approve": "approve", "retry": "replace", "reject": "reject"}
-        )
+        for node, (route_name, targets) in cls.ROUTES.items():
+            workflow.add_conditional_edges(node, graph_route(route_name), targets)
 
         # 최종 노드들을 END로 연결
-        workflow.add_edge("approve", END)
-        workflow.add_edge("reject", END)
+        for node in cls.END_NODES:
+            workflow.add_edge(node, END)
 
         return workflow.compile()
 
-    async def process(self, content: str, safety_level: str = None) -> FilterState:
-        """컨텐츠 필터링 메인 프로세스"""
+    async def _run_native(self, state: FilterState) -> FilterState:
+        """
+        LangGraph 없이 FSM 직접 실행 (그래프와 동일한 노드/라우팅 메서드 사용)
+
+        - 상태 객체 하나를 노드들이 그대로 수정
+        - 라우팅 메서드에는 LangGraph와 같이 상태 사본 전달 (라우팅 중 수정은 반영되지 않음)
+        - 실행 노드 수가 RECURSION_LIMIT에 도달하면 LangGraph와 같은 GraphRecursionError 발생
+        """
+        node = self.START_NODE
+        for _ in range(self.RECURSION_LIMIT):
+            result = getattr(self, self.NODES[node])(state)
+            if inspect.isawaitable(result):
+                result = await result
+            state = result
+
+            if node in self.END_NODES:
+                return state
+            route_name, targets = self.ROUTES[node]
+            node = targets[getattr(self, route_name)(dict(state))]
+
+        raise GraphRecursionError(
+            create_error_message(
+                message=f"Recursion limit of {self.RECURSION_LIMIT} reached without hitting a stop condition. "
+                "You can increase the limit by setting the `recursion_limit` config key.",
+                error_code=ErrorCode.GRAPH_RECURSION_LIMIT,
+            )
+        )
+
+    async def process(self, content: str, safety_level: str = None, context: str = "") -> FilterState:
+        """컨텐츠 필터링 메인 프로세스 (context: 판정 대상이 아닌 앞부분 문맥)"""
         initial_state = FilterState(
             original_content=content,
+            context=context,
             filtered_content="",
             is_safe=False,
             safety_score=0.0,
@@ -95,13 +201,61 @@ class ContentFilter:
             needs_replacement=False,
             analysis_result={},
             error_message="",
+            rewrite_method="",
+            speculative_replacement=None,
+            speculative_categories=[],
+            skip_fast_tier=False,
         )
 
+        # 사전 분류: 분석 티어 선택에만 사용 (사전에 없는 위험 표현이 있을 수 있으므로 LLM 분석은 항상 수행)
+        if self.preclassifier:
+            classification = self.preclassifier.classify(content)
+            initial_state["skip_fast_tier"] = classification.needs_strong_tier
+            logger.info(f"사전 분류 {classification.verdict} 판정: {classification.matched_phrases}")
+
+        # 판정 캐시 조회
+        cache_key = self._verdict_cache_key(content, initial_state["safety_level"], context) if self.verdict_cache else None
+        cached = self.verdict_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.info(f"필터링 판정 캐시 히트: is_safe={cached['is_safe']}, score={cached['safety_score']}")
+            initial_state.update(
+                {
+                    # 원본 통과 판정은 현재 컨텐츠 그대로 사용 (공백 차이 보존)
+                    "filtered_content": content if cached["passthrough"] else cached["filtered_content"],
+                    "is_safe": cached["is_safe"],
+                    "safety_score": cached["safety_score"],
+                    "filter_reason": cached["filter_reason"],
+                    "risk_categories": cached["risk_categories"],
+                    "analysis_result": {"cached": True},
+                }
+            )
+            return initial_state
+
+        speculations_token = _pending_speculations.set(set())
         try:
-            # 그래프 실행 (recursion_limit 설정으로 무한루프 방지)
-            config = {"recursion_limit": 50}  # 기본 25에서 50으로 증가
-            result = await self.graph.ainvoke(initial_state, config=config)
+            if settings.FILTER_NATIVE_EXECUTOR_ENABLED:
+                result = await self._run_native(initial_state)
+            else:
+                # 그래프 실행 (recursion_limit 설정으로 무한루프 방지)
+                config = runner_config(self, {"recursion_limit": self.RECURSION_LIMIT})
+                result = await self.graph.ainvoke(initial_state, config=config)
+            # 사용되지 않은 선행 대체 생성 정리
+            self._discard_speculation(result)
             logger.info(f"필터링 완료: is_safe={result['is_safe']}, score={result['safety_score']}")
+
+            # 오류 없이 끝난 판정만 캐시 (일시적 LLM 오류 결과는 재사용하지 않음)
+            if cache_key and not result.get("error_message"):
+                self.verdict_cache.set(
+                    cache_key,
+                    {
+                        "passthrough": result["filtered_content"] == content,
+                        "filtered_content": result["filtered_content"],
+                        "is_safe": result["is_safe"],
+                        "safety_score": result["safety_score"],
+                        "filter_reason": result["filter_reason"],
+                        "risk_categories": result["risk_categories"],
+                    },
+                )
             return result
 
         except Exception as e:
@@ -109,6 +263,7 @@ class ContentFilter:
             # 디버그: 에러 발생 시 기본값으로 안전한 응답 생성
             return {
                 "original_content": initial_state["original_content"],
+                "context": initial_state["context"],
                 "filtered_content": "죄송합니다. 현재 답변을 제공할 수 없습니다.",
                 "is_safe": False,
                 "safety_score": 0.0,
@@ -119,10 +274,25 @@ class ContentFilter:
                 "needs_replacement": False,
                 "analysis_result": {},
                 "error_message": str(e),
+                "rewrite_method": "",
+                "speculative_replacement": None,
+                "speculative_categories": [],
+                "skip_fast_tier": initial_state["skip_fast_tier"],
             }
-
-    async def _analyze_content(self, state: FilterState) -> FilterState:
-        """컨텐츠 안전성 분석"""
+        finally:
+            # 취소/오류로 그래프 상태와 함께 사라진 선행 생성까지 정리
+            self._cancel_pending_speculations()
+            _pending_speculations.reset(speculations_token)
+
+    def _verdict_cache_key(self, content: str, safety_level: str, context: str = "") -> str:
+        """판정 캐시 키 (정규화된 컨텐츠 해시, 안전 수준, 프롬프트 버전, 문맥이 있으면 문맥 해시)"""
+        content_hash = hashlib.sha256(normalize_text(content).encode("utf-8")).hexdigest()
+        if not context:
+            return self.verdict_cache.make_key(content_hash, safety_level, FILTER_PROMPT_VERSION)
+        return self.verdict_cache.make_key(content_hash, safety_level, FILTER_PROMPT_VERSION, hash_text(normalize_text(context)))
+
+    async def _analyze_content(self, state: FilterState, speculate: bool = True) -> FilterState:
+        """컨텐츠 안전성 분석 (speculate: 경계 점수일 때 대체 컨텐츠 선행 생성 허용, 분석 전용 호출은 False)"""
         try:
             # 디버그: 현재 재시도 상태 로깅 (재시도 카운트는 라우팅에서 관리)
             current_retry = state.get("retry_count", 0)
@@ -133,31 +303,30 @@ class ContentFilter:
 
             # LLM에게 안전성 분석 요청
             prompt = SAFETY_ANALYSIS_PROMPT.format(content=state["original_content"])
+            if state.get("context"):
+                prompt = SAFETY_ANALYSIS_CONTEXT_PROMPT.format(context=state["context"]) + prompt
             messages = [{"role": "user", "content": prompt}]
 
-            response = await self.llm_client.chat(messages)
+            threshold = SAFETY_THRESHOLDS.get(state.get("safety_level"), self.safety_threshold)
+            analysis = await self._tiered_analysis(
+                messages, threshold, state if speculate else None, skip_fast_tier=state.get("skip_fast_tier", False)
+            )
 
-            # JSON 파싱
-            try:
-                analysis = json.loads(response)
-            except json.JSONDecodeError:
-                # JSON 파싱 실패시 텍스트에서 추출 시도
-                analysis = self._extract_json_from_text(response)
-
-                # 디버그: JSON 파싱 실패시 즉시 에러 처리로 라우팅되도록 설정
-                if "parsing_error" in analysis.get("risk_categories", []):
-                    logger.error("JSON 파싱 실패 - 에러 처리로 라우팅")
-                    state.update(
-                        {
-                            "analysis_result": analysis,
-                            "is_safe": False,
-                            "safety_score": 0.0,
-                            "filter_reason": analysis.get("filter_reason", "JSON 파싱 실패"),
-                            "risk_categories": analysis.get("risk_categories", ["parsing_error"]),
-                            "error_message": "JSON 파싱 실패",
-                        }
-                    )
-                    return state
+            # 디버그: JSON 파싱 실패시 즉시 에러 처리로 라우팅되도록 설정
+            if "parsing_error" in analysis.get("risk_categories", []):
+                logger.error("JSON 파싱 실패 - 에러 처리로 라우팅")
+                state.update(
+                    {
+                        "analysis_result": analysis,
+                        "is_safe": False,
+                        "safety_score": 0.0,
+                        "filter_reason": analysis.get("filter_reason", "JSON 파싱 실패"),
+                        "risk_categories": analysis.get("risk_categories", ["parsing_error"]),
+                        "error_message": "JSON 파싱 실패",
+                    }
+                )
+                self._discard_speculation(state)
+                return state
 
             # 결과 업데이트
             state.update(
@@ -171,13 +340,143 @@ class ContentFilter:
             )
 
             logger.info(f"분석 완료: safety_score={state['safety_score']}")
+
+            # 대체가 필요 없는 판정(통과/완전 차단)이거나 선행 생성과 위험 카테고리가 다르면 즉시 취소
+            if (
+                state["safety_score"] >= self.safety_threshold
+                or state["safety_score"] < 0.3
+                or set(state["risk_categories"]) != set(state.get("speculative_categories") or [])
+            ):
+                self._discard_speculation(state)
             return state
 
         except Exception as e:
             logger.error(f"컨텐츠 분석 오류: {e}")
             state.update({"error_message": f"분석 오류: {str(e)}", "is_safe": False})
+            self._discard_speculation(state)
             return state
 
+    async def _tiered_analysis(
+        self,
+        messages: List[Dict[str, str]],
+        threshold: float,
+        state: Optional[FilterState] = None,
+        skip_fast_tier: bool = False,
+    ) -> Dict[str, Any]:
+        """경량 모델로 1차 분석, 실패하거나 점수가 임계값 근처면 고성능 모델로 재분석 (skip_fast_tier면 고성능 모델만)"""
+        if self.fast_llm_client is None or skip_fast_tier:
+            return await self._request_json(self.llm_client, TIER_STRONG, messages, SafetyAnalysisOutput)
+
+        analysis = None
+        try:
+            analysis = await self._request_json(self.fast_llm_client, TIER_FAST, messages, SafetyAnalysisOutput)
+            escalate = needs_escalation(analysis, threshold, self.escalation_band)
+        except Exception as e:
+            logger.warning(f"경량 모델 분석 실패 - 고성능 모델로 전환: {e}")
+            escalate = True
+
+        self.tier_metrics.record_analysis(escalate)
+        if not escalate:
+            return analysis
+
+        if state is not None:
+            self._start_speculation(state, analysis, threshold)
+        logger.info("경량 모델 점수가 불확실 구간 - 고성능 모델로 재분석")
+        return await self._request_json(self.llm_client, TIER_STRONG, messages, SafetyAnalysisOutput)
+
+    def _start_speculation(self, state: FilterState, analysis: Optional[Dict[str, Any]], threshold: float) -> None:
+        """
+        경량 모델 점수가 임계값 바로 아래(threshold - speculative_band 이상)면 대체 컨텐츠 선행 생성 시작
+
+        고성능 모델이 위험으로 확정하면 대체 단계에서 결과를 그대로 사용하고 (재검토로 검증),
+        안전으로 판정하면 취소합니다. 로컬 재작성으로 해결될 카테고리는 선행 생성하지 않습니다.
+        """
+        if not self.speculative_replacement or analysis is None or state.get("speculative_replacement"):
+            return
+        try:
+            score = float(analysis["safety_score"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if not threshold - self.speculative_band <= score < threshold:
+            return
+
+        risk_categories = analysis.get("risk_categories", [])
+        if self.local_rewriter and risk_categories and set(risk_categories) <= LOCAL_REWRITE_CATEGORIES:
+            return
+
+        logger.info(f"경계 점수({score}) - 대체 컨텐츠 선행 생성 시작")
+        self.tier_metrics.record_speculation("started")
+        task = asyncio.create_task(
+            self._generate_replacement(state["original_content"], risk_categories, analysis.get("filter_reason", ""))
+        )
+        state["speculative_replacement"] = task
+        state["speculative_categories"] = list(risk_categories)
+        pending = _pending_speculations.get()
+        if pending is not None:
+            pending.add(task)
+
+    def _discard_speculation(self, state: FilterState) -> None:
+        """사용되지 않은 선행 대체 생성 취소"""
+        task = self._pop_speculation(state)
+        if task is not None:
+            self._cancel_speculation(task)
+
+    def _pop_speculation(self, state: FilterState) -> Optional[asyncio.Task]:
+        """상태에서 선행 생성 작업을 꺼내 정리 대상에서 제외"""
+        task = state.get("speculative_replacement")
+        if task is None:
+            return None
+        state["speculative_replacement"] = None
+        state["speculative_categories"] = []
+        pending = _pending_speculations.get()
+        if pending is not None:
+            pending.discard(task)
+        return task
+
+    def _cancel_speculation(self, task: asyncio.Task) -> None:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()  # 미확인 예외 경고 방지
+        self.tier_metrics.record_speculation("cancelled")
+
+    def _cancel_pending_speculations(self) -> None:
+        """현재 process 호출에서 사용/취소되지 않고 남은 선행 생성 취소"""
+        pending = _pending_speculations.get()
+        while pending:
+            self._cancel_speculation(pending.pop())
+
+    async def _request_json(self, llm_client, tier: str, messages: List[Dict[str, str]], schema: type) -> Dict[str, Any]:
+        """
+        JSON 응답 요청
+
+        구조화 출력 모드는 스키마를 모델에 직접 전달하고 Pydantic으로 검증하며,
+        텍스트 모드는 자유 형식 응답에서 JSON을 추출합니다.
+        어느 모드든 파싱 실패 시 parsing_error 기본값을 반환합니다.
+        """
+        if self.structured_output:
+            try:
+                output = await timed_chat(llm_client, tier, messages, self.tier_metrics, schema=schema)
+            except (OutputParserException, ValidationError) as e:
+                logger.warning(f"구조화 출력 검증 실패: {e}")
+                self.parse_metrics.record(MODE_STRUCTURED, schema.__name__, failed=True)
+                return self._extract_json_from_text("")
+            # 모델이 도구 호출 없이 응답하면 None
+            self.parse_metrics.record(MODE_STRUCTURED, schema.__name__, failed=output is None)
+            return output.model_dump() if output is not None else self._extract_json_from_text("")
+
+        response = await timed_chat(llm_client, tier, messages, self.tier_metrics)
+        try:
+            result = json.loads(response)
+        except json.JSONDecodeError:
+            # JSON 파싱 실패시 텍스트에서 추출 시도
+            result = self._extract_json_from_text(response)
+        if not isinstance(result, dict):
+            result = self._extract_json_from_text("")
+        failed = "parsing_error" in result.get("risk_categories", [])
+        self.parse_metrics.record(MODE_TEXT, schema.__name__, failed=failed)
+        return result
+
     async def _apply_filter(self, state: FilterState) -> FilterState:
         """필터링 적용 로직"""
         logger.info("필터링 적용 중...")
@@ -200,23 +499,25 @@ class ContentFilter:
         return state
 
     async def _replace_content(self, state: FilterState) -> FilterState:
-        """위험한 컨텐츠를 안전한 대체 컨텐츠로 교체"""
-        try:
-            logger.info("대체 컨텐츠 생성 중...")
-
-            prompt = CONTENT_REPLACEMENT_PROMPT.format(
-                original_content=state["original_content"],
-                risk_categories=", ".join(state["risk_categories"]),
-                filter_reason=state["filter_reason"],
-            )
+        """위험한 컨텐츠를 안전한 대체 컨텐츠로 교체 (로컬 재작성 우선)"""
+        if self.local_rewriter and not state.get("rewrite_method") and self._rewrite_locally(state):
+            self._discard_speculation(state)
+            return state
 
-            messages = [{"role": "user", "content": prompt}]
-            replacement = await self.llm_client.chat(messages)
+        try:
+            replacement = await self._take_speculation(state)
+            if replacement is None:
+                logger.info("대체 컨텐츠 생성 중...")
+                replacement = await self._generate_replacement(
+                    state["original_content"], state["risk_categories"], state["filter_reason"]
+                )
 
             # 면책 조항 추가
             replacement_with_disclaimer = replacement + DISCLAIMER_TEMPLATE
 
-            state.update({"filtered_content": replacement_with_disclaimer, "needs_replacement": False})
+            state.update(
+                {"filtered_content": replacement_with_disclaimer, "needs_replacement": False, "rewrite_method": "llm"}
+            )
 
             logger.info("대체 컨텐츠 생성 완료")
             return state
@@ -226,6 +527,59 @@ class ContentFilter:
             state["error_message"] = f"대체 컨텐츠 생성 실패: {str(e)}"
             return state
 
+    async def _generate_replacement(self, content: str, risk_categories: List[str], filter_reason: str) -> str:
+        """LLM 대체 컨텐츠 생성 (면책 조항 제외)"""
+        prompt = CONTENT_REPLACEMENT_PROMPT.format(
+            original_content=content,
+            risk_categories=", ".join(risk_categories),
+            filter_reason=filter_reason,
+        )
+        messages = [{"role": "user", "content": prompt}]
+        return await timed_chat(self.llm_client, TIER_STRONG, messages, self.tier_metrics)
+
+    async def _take_speculation(self, state: FilterState) -> Optional[str]:
+        """선행 생성된 대체 컨텐츠 사용 (없거나 실패하면 None)"""
+        task = self._pop_speculation(state)
+        if task is None:
+            return None
+        try:
+            replacement = await task
+        except Exception as e:
+            logger.warning(f"선행 대체 생성 실패 - 다시 생성: {e}")
+            self.tier_metrics.record_speculation("failed")
+            return None
+        logger.info("선행 생성된 대체 컨텐츠 사용")
+        self.tier_metrics.record_speculation("used")
+        return replacement
+
+    def _rewrite_locally(self, state: FilterState) -> bool:
+        """
+        대체 표현 사전 + 면책 조항으로 로컬 재작성 (성공 시 LLM 대체 생성만 생략, 재검토는 그대로 수행)
+
+        - 위험 카테고리가 모두 문구 단위로 해결 가능해야 함 (리스크 경고 누락 외에는 대체된 표현 필요)
+        - 재작성 결과에 위험/애매한 표현이 남아있지 않아야 함 (사전 분류기로 재검사)
+        - 승인 여부와 안전 점수는 재검토 결과를 사용 (재검토에서 거부되면 LLM 대체로 재시도)
+        """
+        categories = set(state.get("risk_categories") or [])
+        if not categories or not categories <= LOCAL_REWRITE_CATEGORIES:
+            return False
+
+        result = self.local_rewriter.rewrite(state["original_content"])
+        if categories - {"missing_risk_warning"} and not result.replacements:
+            return False
+        if safety_preclassifier.inspect(result.content).verdict != VERDICT_SAFE:
+            return False
+
+        logger.info(f"로컬 재작성 완료 - LLM 대체 생략, 재검토 진행: {result.replacements}")
+        state.update(
+            {
+                "filtered_content": result.content + DISCLAIMER_TEMPLATE,
+                "needs_replacement": False,
+                "rewrite_method": "local",
+            }
+        )
+        return True
+
     async def _recheck_content(self, state: FilterState) -> FilterState:
         """대체된 컨텐츠의 안전성 재검토"""
         try:
@@ -234,12 +588,7 @@ class ContentFilter:
             prompt = SAFETY_RECHECK_PROMPT.format(modified_content=state["filtered_content"])
 
             messages = [{"role": "user", "content": prompt}]
-            response = await self.llm_client.chat(messages)
-
-            try:
-                recheck_result = json.loads(response)
-            except json.JSONDecodeError:
-                recheck_result = self._extract_json_from_text(response)
+            recheck_result = await self._request_json(self.llm_client, TIER_STRONG, messages, SafetyRecheckOutput)
 
             state.update(
                 {
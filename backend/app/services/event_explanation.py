@@ -0,0 +1,88 @@
+"""
+이벤트 설명 생성 - /chatbot/event/explain 실시간 생성과 ETL 사전 생성에서 공통 사용
+"""
+import logging
+from typing import List, Optional
+
+from app.constants import UserLevel
+from app.core.config import settings
+from app.core.prompts import EVENT_EXPLAIN_PROMPTS
+from app.models.events import Events
+from app.services.response_cache import hash_text
+
+logger = logging.getLogger(__name__)
+
+# 사전 생성 대상 레벨
+EXPLAIN_LEVELS = (UserLevel.BEGINNER, UserLevel.INTERMEDIATE, UserLevel.ADVANCED)
+
+
+def get_explain_prompt(level: UserLevel) -> str:
+    """레벨별 이벤트 설명 시스템 프롬프트"""
+    return EVENT_EXPLAIN_PROMPTS.get(level, EVENT_EXPLAIN_PROMPTS[UserLevel.BEGINNER])
+
+
+def explain_prompt_hash(level: UserLevel) -> str:
+    """프롬프트 버전 해시 (프롬프트 변경 시 사전 생성/캐시 무효화)"""
+    return hash_text(get_explain_prompt(level))
+
+
+def resolve_safety_level(safety_level: Optional[str]) -> str:
+    """요청 안전 수준 (없으면 기본 설정값)"""
+    return safety_level or settings.FILTER_SAFETY_LEVEL
+
+
+def viewer_levels(event_level: Optional[UserLevel]) -> List[UserLevel]:
+    """이벤트를 볼 수 있는 사용자 레벨 (crud_events.get_events_by_level 규칙과 동일)"""
+    if event_level == UserLevel.ADVANCED:
+        return [UserLevel.ADVANCED]
+    if event_level == UserLevel.INTERMEDIATE:
+        return [UserLevel.INTERMEDIATE, UserLevel.ADVANCED]
+    return list(EXPLAIN_LEVELS)
+
+
+def build_explain_messages(event: Events, level: UserLevel) -> List[dict]:
+    """이벤트 정보를 포맷팅하여 LLM 메시지 구성"""
+    event_context = f"""이벤트 정보:
+- 제목: {event.title}
+- 설명: {event.description}
+- 날짜: {event.date}
+- 영향도: {event.impact}
+- 출처: {event.source}
+- Release ID: {event.release_id}
+
+위 경제 지표/이벤트에 대해 설명해주세요."""
+
+    return [
+        {"role": "system", "content": get_explain_prompt(level)},
+        {"role": "user", "content": event_context},
+    ]
+
+
+async def generate_filtered_explanation(
+    event: Events, level: UserLevel, safety_level: str, llm_client
+) -> Optional[str]:
+    """
+    이벤트 설명 생성 후 필터링 한 번 적용 (사전 생성용)
+
+    Args:
+        event: 이벤트
+        level: 사용자 레벨
+        safety_level: 안전 수준
+        llm_client: LLMClient
+
+    Returns:
+        필터링된 설명 (LLM 호출 또는 필터링 자체가 실패하면 저장하지 않도록 None)
+    """
+    try:
+        content = await llm_client.chat(build_explain_messages(event, level))
+    except Exception as e:
+        logger.error(f"❌ 사전 생성 설명 LLM 호출 실패: event_id={event.id}, level={level} - {e}")
+        return None
+
+    filter_result = await llm_client.filter_service.filter_response(content, safety_level)
+    if filter_result.get("error"):
+        logger.warning(f"⚠️ 사전 생성 설명 필터링 오류로 저장 생략: event_id={event.id}, level={level}")
+        return None
+    if filter_result["filtered"]:
+        logger.info(f"⚠️ 사전 생성 설명 필터링됨: event_id={event.id}, level={level}")
+    return filter_result["content"]
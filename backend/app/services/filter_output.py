@@ -0,0 +1,84 @@
+"""
+필터 분석/재검토 응답 스키마 - provider 네이티브 구조화 출력(tool calling) + Pydantic 검증
+
+자유 형식 텍스트 응답의 JSON 파싱 실패(코드 블록, 설명 문장, 잘린 응답 등)는
+분석 실패로 처리되어 재시도 루프를 유발하므로, 스키마를 모델에 직접 전달하여 형식을 강제합니다.
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+# 출력 모드
+MODE_STRUCTURED = "structured"
+MODE_TEXT = "text"
+
+
+class SafetyAnalysisOutput(BaseModel):
+    """SAFETY_ANALYSIS_PROMPT 응답 스키마"""
+
+    is_safe: bool = Field(description="컨텐츠가 안전한지 여부")
+    safety_score: float = Field(ge=0.0, le=1.0, description="0.0~1.0 사이의 안전 점수")
+    risk_categories: List[str] = Field(default_factory=list, description="위험 카테고리 목록")
+    filter_reason: str = Field(default="", description="필터링 이유 상세 설명")
+    suggested_alternative: Optional[str] = Field(default=None, description="대안 표현 제안 (선택사항)")
+
+
+class SafetyBatchVerdict(SafetyAnalysisOutput):
+    """SAFETY_BATCH_ANALYSIS_PROMPT 컨텐츠별 판정"""
+
+    id: str = Field(description="컨텐츠 ID")
+
+
+class SafetyBatchAnalysisOutput(BaseModel):
+    """SAFETY_BATCH_ANALYSIS_PROMPT 응답 스키마"""
+
+    verdicts: List[SafetyBatchVerdict] = Field(default_factory=list, description="컨텐츠별 판정 목록")
+
+
+class SafetyRecheckOutput(BaseModel):
+    """SAFETY_RECHECK_PROMPT 응답 스키마"""
+
+    is_approved: bool = Field(description="수정된 컨텐츠 승인 여부")
+    final_safety_score: float = Field(ge=0.0, le=1.0, description="0.0~1.0 사이의 최종 안전 점수")
+    remaining_issues: List[str] = Field(default_factory=list, description="남은 문제점 목록")
+    approval_reason: str = Field(default="", description="승인/거부 이유")
+
+
+class FilterParseMetrics:
+    """출력 모드/스키마별 응답 파싱 실패 집계 (프로세스 전역)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """통계 초기화 (개발/테스트용)"""
+        with self._lock:
+            self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, mode: str, schema: str, failed: bool) -> None:
+        """응답 파싱 1건 기록"""
+        with self._lock:
+            counts = self._counts.setdefault(f"{mode}:{schema}", {"calls": 0, "parse_failures": 0})
+            counts["calls"] += 1
+            counts["parse_failures"] += int(failed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """모드/스키마별 파싱 실패율 (FILTER_STRUCTURED_OUTPUT 전환 전후 값을 비교)"""
+        with self._lock:
+            modes: Dict[str, Dict[str, Any]] = {}
+            for key, counts in self._counts.items():
+                mode, schema = key.split(":", 1)
+                stats = modes.setdefault(mode, {"calls": 0, "parse_failures": 0, "schemas": {}})
+                stats["calls"] += counts["calls"]
+                stats["parse_failures"] += counts["parse_failures"]
+                stats["schemas"][schema] = dict(counts)
+
+        for stats in modes.values():
+            stats["failure_rate"] = round(stats["parse_failures"] / stats["calls"], 4) if stats["calls"] else 0.0
+        return {"modes": modes}
+
+
+# 전역 파싱 통계
+filter_parse_metrics = FilterParseMetrics()
@@ -1,20 +1,36 @@
+import asyncio
+import hashlib
+import json
 import time
-from typing import Dict, Any
+from typing import AsyncGenerator, AsyncIterator, Dict, Any, List, Optional, Sequence
 from fastapi.logger import logger
-from .content_filter import ContentFilter
+from .content_filter import ERROR_RISK_CATEGORIES, ContentFilter
+from .filter_output import SafetyBatchAnalysisOutput, filter_parse_metrics
+from .filter_tiers import TIER_STRONG, filter_tier_metrics
+from .response_cache import filter_verdict_cache, hash_text
+from .safety_classifier import normalize_text, safety_preclassifier
+from .stream_filter import StreamingContentFilter
 from app.core.config import settings
+from app.core.llm import LLMProviderPool, filter_llm_pool
 from app.core.filter_logger import filter_logger_instance, log_filter_performance
+from app.core.filter_prompts import SAFETY_BATCH_ANALYSIS_PROMPT
+
+# 일괄 분석 프롬프트 버전 (프롬프트 변경 시 분석 캐시 무효화)
+BATCH_PROMPT_VERSION = hash_text(SAFETY_BATCH_ANALYSIS_PROMPT)
 
 
 class FilterService:
     """컨텐츠 필터링 서비스 - 비즈니스 로직 래퍼"""
 
-    def __init__(self, user=None, langfuse_manager=None):
+    def __init__(self, user=None, langfuse_manager=None, pool: LLMProviderPool = None):
         self.user = user
         self.langfuse_manager = langfuse_manager
-        self.filter = ContentFilter(user=user, langfuse_manager=langfuse_manager)
+        # pool 미지정 시 필터링 전용 전역 풀 사용 (작업별 이벤트 루프에서는 작업 전용 풀 전달)
+        self.filter = ContentFilter(user=user, langfuse_manager=langfuse_manager, pool=pool)
         self.enabled = settings.FILTER_ENABLED
         self.filter_logger = filter_logger_instance
+        # 마지막 filter_response/filter_stream 호출에서 필터링 자체가 실패했는지 여부 (오류 응답 캐시/저장 방지용)
+        self.last_error = False
 
         logger.info(f"FilterService 초기화: enabled={self.enabled}, level={settings.FILTER_SAFETY_LEVEL}, user={user}, langfuse_manager={langfuse_manager}")
 
@@ -36,9 +52,11 @@ class FilterService:
                 "filter_reason": "필터링 이유",
                 "risk_categories": ["카테고리1", "카테고리2"],
                 "processing_time": 1.23,
-                "retry_count": 2
+                "retry_count": 2,
+                "error": 필터링 자체 실패 여부 (True면 content는 오류 안내 문구)
             }
         """
+        self.last_error = False
 
         # 요청 로깅
         self.filter_logger.log_filter_request(
@@ -56,6 +74,7 @@ class FilterService:
                 "risk_categories": [],
                 "processing_time": 0.0,
                 "retry_count": 0,
+                "error": False,
             }
 
             # 비활성화된 경우에도 로깅
@@ -73,6 +92,7 @@ class FilterService:
                 "risk_categories": ["empty_content"],
                 "processing_time": 0.0,
                 "retry_count": 0,
+                "error": False,
             }
 
             # 빈 컨텐츠도 로깅
@@ -98,7 +118,9 @@ class FilterService:
                 "risk_categories": result.get("risk_categories", []),
                 "processing_time": round(processing_time, 3),
                 "retry_count": result.get("retry_count", 0),
+                "error": bool(ERROR_RISK_CATEGORIES.intersection(result.get("risk_categories", []))),
             }
+            self.last_error = response["error"]
 
             logger.info(
                 f"필터링 완료: filtered={response['filtered']}, "
@@ -141,10 +163,73 @@ class FilterService:
                 "risk_categories": ["service_error"],
                 "processing_time": processing_time,
                 "retry_count": 0,
+                "error": True,
             }
+            self.last_error = True
 
             return error_result
 
+    async def filter_stream(
+        self, token_stream: AsyncIterator[str], safety_level: str = None, user_id: int = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        토큰 스트림 필터링 (문장/문단 윈도우 단위로 생성과 동시에 검사)
+
+        Args:
+            token_stream: LLM 토큰 스트림
+            safety_level: 안전 수준 (strict/moderate/permissive)
+            user_id: 사용자 ID (로깅용)
+
+        Yields:
+            안전성이 확인된(또는 대체된) 청크 (필터링 실패 여부는 종료 후 last_error로 확인)
+        """
+        self.last_error = False
+
+        # 필터링이 비활성화된 경우 그대로 전달
+        if not self.enabled:
+            async for token in token_stream:
+                yield token
+            return
+
+        stream_filter = StreamingContentFilter(self.filter, safety_level=safety_level)
+        total_length = 0
+
+        try:
+            async for chunk in stream_filter.filter(token_stream):
+                total_length += len(chunk)
+                yield chunk
+
+        except Exception as e:
+            logger.error(f"스트리밍 필터링 오류: {e}")
+            self.filter_logger.log_filter_error(
+                error=e,
+                content_length=total_length,
+                user_id=user_id,
+                context={"safety_level": safety_level, "mode": "stream"},
+            )
+            self.last_error = True
+            yield "죄송합니다. 현재 서비스 처리 중 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
+            return
+
+        stats = stream_filter.stats
+        self.last_error = stats.errors > 0
+        self.filter_logger.log_filter_request(
+            content_length=total_length, user_id=user_id, safety_level=safety_level or settings.FILTER_SAFETY_LEVEL
+        )
+        self.filter_logger.log_filter_result(
+            {
+                "filtered": bool(stats.replaced or stats.rejected),
+                "safety_score": stats.min_safety_score,
+                "risk_categories": stats.risk_categories,
+            },
+            stats.processing_time,
+            user_id,
+        )
+        logger.info(
+            f"스트리밍 필터링 완료: windows={stats.windows}, replaced={stats.replaced}, "
+            f"rejected={stats.rejected}, first_chunk={stats.first_chunk_time}"
+        )
+
     async def check_safety_only(self, content: str, user_id: int = None) -> Dict[str, Any]:
         """
         컨텐츠의 안전성만 검사 (필터링 없이)
@@ -173,6 +258,7 @@ class FilterService:
 
             state = FilterState(
                 original_content=content,
+                context="",
                 filtered_content="",
                 is_safe=False,
                 safety_score=0.0,
@@ -183,10 +269,14 @@ class FilterService:
                 needs_replacement=False,
                 analysis_result={},
                 error_message="",
+                rewrite_method="",
+                speculative_replacement=None,
+                speculative_categories=[],
+                skip_fast_tier=False,
             )
 
             # 분석만 실행
-            result = await self.filter._analyze_content(state)
+            result = await self.filter._analyze_content(state, speculate=False)
 
             processing_time = time.time() - start_time
 
@@ -229,6 +319,133 @@ class FilterService:
                 "processing_time": 0.0,
             }
 
+    async def check_safety_batch(self, contents: Sequence[str], user_id: int = None) -> List[Dict[str, Any]]:
+        """
+        여러 컨텐츠의 안전성 일괄 검사 (필터링 없이)
+
+        - 중복 컨텐츠는 한 번만 분석
+        - 판정 캐시에 있는 컨텐츠(이전 일괄 분석, 원본 그대로 승인된 필터링 판정)는 LLM 호출 없이 재사용
+        - FILTER_BATCH_ITEMS_PER_PROMPT개씩 하나의 프롬프트로 묶어 판정 (구조화 출력/텍스트 모드는 단건 분석과 동일)
+        - 묶음 호출은 FILTER_BATCH_MAX_CONCURRENCY개까지 동시 실행
+        - 일괄 응답에서 빠진 컨텐츠는 단건 검사로 재시도
+
+        Returns:
+            입력 순서와 같은 순서의 안전성 분석 결과 목록
+        """
+        unique_contents = list(dict.fromkeys(contents))  # 중복 제거 (순서 유지)
+
+        self.filter_logger.log_filter_request(
+            content_length=sum(len(content) for content in unique_contents), user_id=user_id, safety_level="analysis_only"
+        )
+
+        if not self.enabled:
+            safe = {"is_safe": True, "safety_score": 1.0, "risk_categories": [], "filter_reason": "", "analysis_only": True}
+            return [dict(safe) for _ in contents]
+
+        start_time = time.time()
+        verdicts: Dict[str, Dict[str, Any]] = {}
+        for content in unique_contents:
+            cached = self._get_cached_analysis(content)
+            if cached is not None:
+                verdicts[content] = cached
+        uncached = [content for content in unique_contents if content not in verdicts]
+
+        batch_size = max(1, settings.FILTER_BATCH_ITEMS_PER_PROMPT)
+        semaphore = asyncio.Semaphore(settings.FILTER_BATCH_MAX_CONCURRENCY)
+        chunks = [uncached[i : i + batch_size] for i in range(0, len(uncached), batch_size)]
+
+        async def analyze_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            async with semaphore:
+                return await self._analyze_batch(chunk)
+
+        for chunk_verdicts in await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks)):
+            for content, verdict in chunk_verdicts.items():
+                verdicts[content] = verdict
+                self._set_cached_analysis(content, verdict)
+
+        # 일괄 응답에서 빠진 컨텐츠는 단건 검사
+        missing = [content for content in unique_contents if content not in verdicts]
+        if missing:
+            logger.warning(f"일괄 안전성 검사 응답 누락 {len(missing)}건 - 단건 검사로 재시도")
+
+            async def check_single(content: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.check_safety_only(content, user_id)
+
+            for content, verdict in zip(missing, await asyncio.gather(*(check_single(c) for c in missing))):
+                verdicts[content] = verdict
+
+        logger.info(
+            f"일괄 안전성 검사 완료: {len(contents)}건 (고유 {len(unique_contents)}건, "
+            f"캐시 {len(unique_contents) - len(uncached)}건, 묶음 {len(chunks)}개, "
+            f"단건 재시도 {len(missing)}건, {time.time() - start_time:.3f}초)"
+        )
+        return [dict(verdicts[content]) for content in contents]
+
+    def _analysis_cache_key(self, content: str) -> str:
+        """일괄 분석 결과 캐시 키 (정규화된 컨텐츠 해시, 안전 수준, 일괄 프롬프트 버전)"""
+        content_hash = hashlib.sha256(normalize_text(content).encode("utf-8")).hexdigest()
+        return self.filter.verdict_cache.make_key(
+            "analysis", content_hash, settings.FILTER_SAFETY_LEVEL, BATCH_PROMPT_VERSION
+        )
+
+    def _get_cached_analysis(self, content: str) -> Optional[Dict[str, Any]]:
+        """캐시된 분석 결과 (이전 일괄 분석 또는 원본 그대로 승인된 필터링 판정)"""
+        cache = self.filter.verdict_cache
+        if cache is None:
+            return None
+
+        cached = cache.get(self._analysis_cache_key(content))
+        if cached is not None:
+            return dict(cached)
+
+        # 필터링 판정은 원본이 그대로 통과한 경우만 원본 컨텐츠의 분석 결과로 사용 가능
+        verdict = cache.get(self.filter._verdict_cache_key(content, settings.FILTER_SAFETY_LEVEL))
+        if verdict is not None and verdict["passthrough"]:
+            return {
+                "is_safe": verdict["is_safe"],
+                "safety_score": verdict["safety_score"],
+                "risk_categories": list(verdict["risk_categories"]),
+                "filter_reason": verdict["filter_reason"],
+                "analysis_only": True,
+            }
+        return None
+
+    def _set_cached_analysis(self, content: str, verdict: Dict[str, Any]) -> None:
+        if self.filter.verdict_cache is not None:
+            self.filter.verdict_cache.set(self._analysis_cache_key(content), verdict)
+
+    async def _analyze_batch(self, chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        """컨텐츠 묶음 하나를 LLM 호출 한 번으로 분석 (실패 시 빈 결과 → 단건 재시도)"""
+        items = {f"c{i}": content for i, content in enumerate(chunk)}
+        prompt = SAFETY_BATCH_ANALYSIS_PROMPT.format(items=json.dumps(items, ensure_ascii=False, indent=2))
+        messages = [{"role": "user", "content": prompt}]
+
+        try:
+            analysis = await self.filter._request_json(
+                self.filter.llm_client, TIER_STRONG, messages, SafetyBatchAnalysisOutput
+            )
+        except Exception as e:
+            logger.error(f"일괄 안전성 검사 실패 ({len(chunk)}건): {e}")
+            return {}
+
+        verdicts = {}
+        for verdict in analysis.get("verdicts") or []:
+            if not isinstance(verdict, dict) or verdict.get("id") not in items:
+                continue
+            try:
+                safety_score = float(verdict.get("safety_score", 0.0))
+            except (TypeError, ValueError):
+                continue
+            verdicts[items[verdict["id"]]] = {
+                "is_safe": bool(verdict.get("is_safe", False)),
+                "safety_score": safety_score,
+                "risk_categories": list(verdict.get("risk_categories") or []),
+                "filter_reason": verdict.get("filter_reason", ""),
+                "analysis_only": True,
+            }
+        return verdicts
+
     def get_filter_stats(self) -> Dict[str, Any]:
         """필터링 시스템 상태 정보 반환"""
         base_stats = {
@@ -236,13 +453,28 @@ class FilterService:
             "safety_level": settings.FILTER_SAFETY_LEVEL,
             "max_retries": settings.FILTER_MAX_RETRIES,
             "filter_model": settings.FILTER_LLM_MODEL,
+            "filter_fast_model": settings.FILTER_LLM_FAST_MODEL or None,
             "filter_provider": settings.FILTER_LLM_PROVIDER or "default",
         }
 
         # 실시간 메트릭 추가
         runtime_metrics = self.filter_logger.get_metrics_summary()
 
-        return {**base_stats, "runtime_metrics": runtime_metrics}
+        # 사전 분류기 통계 (LLM 분석 생략 비율 포함)
+        preclassifier_stats = {"enabled": settings.FILTER_PRECLASSIFIER_ENABLED, **safety_preclassifier.get_stats()}
+
+        return {
+            **base_stats,
+            "runtime_metrics": runtime_metrics,
+            "preclassifier": preclassifier_stats,
+            "verdict_cache": filter_verdict_cache.get_stats(),
+            "model_tiers": filter_tier_metrics.get_stats(),
+            "llm_pool": filter_llm_pool.get_stats(),
+            "output_parsing": {
+                "structured_output": settings.FILTER_STRUCTURED_OUTPUT_ENABLED,
+                **filter_parse_metrics.get_stats(),
+            },
+        }
 
     def log_performance_summary(self):
         """성능 요약 로깅 (주기적 호출용)"""
@@ -251,3 +483,4 @@ class FilterService:
     def reset_metrics(self):
         """메트릭 초기화 (개발/테스트용)"""
         self.filter_logger.reset_metrics()
+
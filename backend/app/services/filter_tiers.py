@@ -0,0 +1,115 @@
+"""
+컨텐츠 필터링 모델 티어링 - 경량 모델로 1차 분석 후 임계값 근처 점수만 고성능 모델로 재분석
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+# 모델 티어
+TIER_FAST = "fast"
+TIER_STRONG = "strong"
+
+
+def needs_escalation(analysis: Dict[str, Any], threshold: float, band: float) -> bool:
+    """
+    경량 모델 분석 결과를 고성능 모델로 재분석해야 하는지 판단
+
+    - 파싱 실패 또는 점수 누락
+    - 점수가 임계값 ± band 범위 안 (판정이 뒤집힐 수 있는 불확실 구간)
+    """
+    if "parsing_error" in analysis.get("risk_categories", []):
+        return True
+    try:
+        score = float(analysis["safety_score"])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return abs(score - threshold) <= band
+
+
+class FilterTierMetrics:
+    """티어별 호출 수, 지연 시간, 추정 비용 집계 (프로세스 전역)"""
+
+    def __init__(self, cost_per_1k_chars: Optional[Dict[str, float]] = None):
+        self.cost_per_1k_chars = settings.FILTER_TIER_COST_PER_1K_CHARS if cost_per_1k_chars is None else cost_per_1k_chars
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """통계 초기화 (개발/테스트용)"""
+        with self._lock:
+            self._tiers: Dict[str, Dict[str, float]] = {}
+            self.analyses = 0
+            self.escalations = 0
+            self.speculations = {"started": 0, "used": 0, "cancelled": 0, "failed": 0}
+
+    def record_call(
+        self, tier: str, latency: float, messages: List[Dict[str, str]], response: str = "", failed: bool = False
+    ) -> None:
+        """LLM 호출 1건 기록 (비용은 입출력 문자 수 기준 추정)"""
+        chars = sum(len(message.get("content", "")) for message in messages)
+        chars += len(response) if isinstance(response, str) else 0
+        cost = chars / 1000 * self.cost_per_1k_chars.get(tier, 0.0)
+        with self._lock:
+            stats = self._tiers.setdefault(tier, {"calls": 0, "failures": 0, "total_latency": 0.0, "estimated_cost": 0.0})
+            stats["calls"] += 1
+            stats["failures"] += int(failed)
+            stats["total_latency"] += latency
+            stats["estimated_cost"] += cost
+
+    def record_analysis(self, escalated: bool) -> None:
+        """티어링된 안전성 분석 1건 기록"""
+        with self._lock:
+            self.analyses += 1
+            self.escalations += int(escalated)
+
+    def record_speculation(self, outcome: str) -> None:
+        """대체 컨텐츠 선행 생성 1건 기록 (started, used, cancelled, failed)"""
+        with self._lock:
+            self.speculations[outcome] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """티어별 통계 반환"""
+        with self._lock:
+            tiers = {
+                tier: {
+                    "calls": int(stats["calls"]),
+                    "failures": int(stats["failures"]),
+                    "avg_latency": round(stats["total_latency"] / stats["calls"], 3) if stats["calls"] else 0.0,
+                    "estimated_cost": round(stats["estimated_cost"], 6),
+                }
+                for tier, stats in self._tiers.items()
+            }
+            return {
+                "fast_model": settings.FILTER_LLM_FAST_MODEL or None,
+                "strong_model": settings.FILTER_LLM_MODEL,
+                "escalation_band": settings.FILTER_ESCALATION_BAND,
+                "analyses": self.analyses,
+                "escalations": self.escalations,
+                "escalation_rate": round(self.escalations / self.analyses, 4) if self.analyses else 0.0,
+                "tiers": tiers,
+                "speculative_replacements": dict(self.speculations),
+            }
+
+
+async def timed_chat(
+    llm_client, tier: str, messages: List[Dict[str, str]], metrics: "FilterTierMetrics", schema: Optional[type] = None
+):
+    """티어 LLM 호출 + 지연 시간/비용 기록 (schema 지정 시 구조화 출력으로 Pydantic 모델 반환)"""
+    start_time = time.perf_counter()
+    try:
+        if schema is None:
+            response = await llm_client.chat(messages)
+        else:
+            response = await llm_client.chat_structured(messages, schema)
+    except Exception:
+        metrics.record_call(tier, time.perf_counter() - start_time, messages, failed=True)
+        raise
+    output = response if schema is None or response is None else response.model_dump_json()
+    metrics.record_call(tier, time.perf_counter() - start_time, messages, output)
+    return response
+
+
+# 전역 티어 통계
+filter_tier_metrics = FilterTierMetrics()
@@ -0,0 +1,89 @@
+"""
+컴파일된 LangGraph 레지스트리 - 그래프 토폴로지를 워커당 한 번만 컴파일하여 재사용
+"""
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Dict
+
+from langchain_core.runnables import RunnableConfig
+
+logger = logging.getLogger(__name__)
+
+# 요청별 의존성(LLM 클라이언트, Langfuse 매니저, 사용자)을 가진 객체를 config에 담을 때 사용하는 키
+GRAPH_RUNNER_KEY = "graph_runner"
+
+
+class CompiledGraphRegistry:
+    """컴파일된 그래프 저장소 (프로세스 전역)
+
+    그래프 노드는 요청별 객체의 메서드를 직접 바인딩하지 않고, 실행 시점에
+    config["configurable"][GRAPH_RUNNER_KEY]로 전달된 객체에 위임합니다.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compile(self, key: str, builder: Callable[[], Any]) -> Any:
+        """key에 해당하는 컴파일된 그래프 반환 (없으면 builder로 컴파일 후 저장)"""
+        graph = self._graphs.get(key)
+        if graph is not None:
+            return graph
+
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                graph = builder()
+                self._graphs[key] = graph
+                logger.info(f"그래프 컴파일 완료: {key}")
+        return graph
+
+    def clear(self) -> None:
+        """저장된 그래프 초기화 (개발/테스트용)"""
+        with self._lock:
+            self._graphs.clear()
+
+    def keys(self) -> list[str]:
+        return list(self._graphs.keys())
+
+
+def graph_key(cls: type) -> str:
+    """클래스별 그래프 토폴로지 키"""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def runner_config(runner: Any, config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """그래프 실행 config에 요청별 runner 객체 추가"""
+    config = dict(config or {})
+    config["configurable"] = {**config.get("configurable", {}), GRAPH_RUNNER_KEY: runner}
+    return config
+
+
+def graph_node(method_name: str) -> Callable:
+    """config로 전달된 runner의 메서드를 실행하는 노드 생성"""
+
+    async def node(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        runner = config["configurable"][GRAPH_RUNNER_KEY]
+        result = getattr(runner, method_name)(state)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    node.__name__ = method_name.lstrip("_")
+    return node
+
+
+def graph_route(method_name: str) -> Callable:
+    """config로 전달된 runner의 라우팅 메서드를 호출하는 조건부 엣지 함수 생성"""
+
+    def route(state: Dict[str, Any], config: RunnableConfig) -> str:
+        runner = config["configurable"][GRAPH_RUNNER_KEY]
+        return getattr(runner, method_name)(state)
+
+    route.__name__ = method_name.lstrip("_")
+    return route
+
+
+# 전역 그래프 레지스트리 인스턴스
+compiled_graph_registry = CompiledGraphRegistry()
@@ -0,0 +1,322 @@
+"""
+대화 이력 토큰 예산 관리
+
+- 메시지별 토큰 수를 로컬 토크나이저(tiktoken)로 계산 (사용 불가 시 글자 종류 기반 보수적 추정)
+- 이력이 HISTORY_MAX_TOKENS 이하면 그대로 사용
+- 초과하면 최근 HISTORY_KEEP_TURNS 턴은 원문 유지, 그 이전 대화는 세션별 누적 요약으로 대체
+  요약은 세션별로 캐시되며 새로 밀려난 대화만 기존 요약에 합쳐 갱신 (전체 재요약 없음, 예산 초과 시에만 LLM 호출)
+- 요약 갱신은 세션당 하나만 실행하고 호출자가 시간 초과로 취소되어도 끝까지 실행해 저장 (다음 요청에서 사용)
+- cap_request: 최종 요청(시스템 프롬프트 + 이력 + 질문)이 HISTORY_MAX_REQUEST_TOKENS를 넘지 않도록 강제
+"""
+import asyncio
+import functools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.response_cache import ResponseCache, create_cache_backend, hash_text
+
+# tiktoken 임포트 (선택적)
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_OVERHEAD_TOKENS = 4  # 메시지별 역할/구분자 토큰 (chat 포맷 기준 근사)
+
+SUMMARY_SYSTEM_PROMPT = (
+    "당신은 금융 교육 챗봇의 대화 요약 담당입니다. 기존 요약과 새 대화를 합쳐 하나의 요약으로 갱신하세요.\n"
+    "- 이후 답변에 필요한 사실, 사용자의 관심 종목/지표/이벤트, 사용자가 이해한 내용과 남은 질문을 유지\n"
+    "- 이미 제공한 설명은 핵심만 남기고 인사/반복 표현은 제거\n"
+    "- {max_tokens}토큰 이내의 한국어 문단으로 작성하고 요약만 출력"
+)
+
+
+class TokenCounter:
+    """메시지 토큰 수 계산 (같은 내용은 캐시, 인코딩은 첫 사용 시 로드)"""
+
+    def __init__(self, encoding_name: Optional[str] = None, cache_size: int = 4096):
+        self.encoding_name = encoding_name or settings.HISTORY_TOKENIZER_ENCODING
+        self._encoding = None
+        self._encoding_loaded = False
+        self._lock = threading.Lock()
+        self.count = functools.lru_cache(maxsize=cache_size)(self._count)
+
+    def _get_encoding(self):
+        """tiktoken 인코딩 로드 (실패 시 추정치 사용, 재시도하지 않음)"""
+        if not self._encoding_loaded:
+            with self._lock:
+                if not self._encoding_loaded:
+                    if TIKTOKEN_AVAILABLE:
+                        try:
+                            self._encoding = tiktoken.get_encoding(self.encoding_name)
+                        except Exception as e:
+                            logger.warning(f"⚠️ tiktoken 인코딩 로드 실패 - 추정치 사용: {e}")
+                    self._encoding_loaded = True
+        return self._encoding
+
+    def _count(self, text: str) -> int:
+        if not text:
+            return 0
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        # 추정: 영문/숫자는 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰 (실제보다 크게 잡음)
+        ascii_chars = len(text.encode("ascii", "ignore"))
+        return (len(text) - ascii_chars) + (ascii_chars + 3) // 4
+
+    def count_message(self, message: Dict[str, str]) -> int:
+        return self.count(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """앞부분부터 max_tokens 이내로 자르기"""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+        # 추정치 기준 이진 탐색
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._count(text[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+
+@dataclass
+class CompactedHistory:
+    """압축된 대화 이력 (summary: 오래된 대화 요약, messages: 원문 유지 대화)"""
+
+    summary: Optional[str]
+    messages: List[Dict[str, str]]
+    original_tokens: int
+    tokens: int
+    summarized_messages: int = 0  # 요약으로 대체된 메시지 수
+
+
+class HistoryCompactor:
+    """세션별 누적 요약 기반 대화 이력 압축기"""
+
+    def __init__(
+        self,
+        counter: Optional[TokenCounter] = None,
+        cache: Optional[ResponseCache] = None,
+        llm_client=None,
+        max_history_tokens: Optional[int] = None,
+        keep_turns: Optional[int] = None,
+        summary_max_tokens: Optional[int] = None,
+        max_request_tokens: Optional[int] = None,
+    ):
+        self.counter = counter or TokenCounter()
+        self.cache = cache or ResponseCache(
+            namespace="history_summary",
+            backend=create_cache_backend(settings.HISTORY_SUMMARY_CACHE_MAX_SIZE, prefix="history_summary"),
+            ttl=settings.HISTORY_SUMMARY_CACHE_TTL,
+        )
+        self._llm_client = llm_client
+        self.max_history_tokens = max_history_tokens or settings.HISTORY_MAX_TOKENS
+        self.keep_turns = settings.HISTORY_KEEP_TURNS if keep_turns is None else keep_turns
+        self.summary_max_tokens = summary_max_tokens or settings.HISTORY_SUMMARY_MAX_TOKENS
+        self.max_request_tokens = max_request_tokens or settings.HISTORY_MAX_REQUEST_TOKENS
+        self._lock = threading.Lock()
+        self._refreshes: Dict[str, asyncio.Future] = {}  # 세션별 진행 중인 요약 갱신
+        self.reset_stats()
+
+    @property
+    def llm_client(self):
+        """요약용 LLMClient 지연 생성 (순환 참조 방지)"""
+        if self._llm_client is None:
+            from app.utils.llm_client import LLMClient
+
+            self._llm_client = LLMClient(
+                provider_type=settings.HISTORY_SUMMARY_PROVIDER or None, model=settings.HISTORY_SUMMARY_MODEL
+            )
+        return self._llm_client
+
+    def reset_stats(self) -> None:
+        """통계 초기화 (개발/테스트용)"""
+        with self._lock:
+            self.counts = {"requests": 0, "compacted": 0, "summary_updates": 0, "summary_failures": 0, "trimmed": 0}
+
+    def _record(self, event: str) -> None:
+        with self._lock:
+            self.counts[event] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.counts, "cache": self.cache.get_stats()}
+
+    @staticmethod
+    def _fingerprint(messages: List[Dict[str, str]]) -> str:
+        """요약에 포함된 대화 식별 (클라이언트가 이력을 바꾸면 캐시 무효화)"""
+        return hash_text("\n".join(f"{m.get('role')}:{m.get('content')}" for m in messages), length=32)
+
+    def _load_summary(self, session_id: Optional[str], history: List[Dict[str, str]]) -> Tuple[Optional[str], int]:
+        """현재 이력에 유효한 캐시 요약과 요약된 메시지 수"""
+        if not session_id:
+            return None, 0
+        state = self.cache.get(self.cache.make_key(session_id))
+        if not state or state["covered"] > len(history):
+            return None, 0
+        if state["fingerprint"] != self._fingerprint(history[: state["covered"]]):
+            return None, 0
+        return state["summary"], state["covered"]
+
+    def _save_summary(self, session_id: str, history: List[Dict[str, str]], summary: str, covered: int) -> None:
+        self.cache.set(
+            self.cache.make_key(session_id),
+            {"summary": summary, "covered": covered, "fingerprint": self._fingerprint(history[:covered])},
+        )
+
+    def _fit(
+        self, summary: Optional[str], messages: List[Dict[str, str]], counts: List[int], budget: int
+    ) -> Tuple[Optional[str], List[Dict[str, str]], int]:
+        """예산 초과 시 오래된 메시지부터 제외 (마지막 턴은 유지, 그래도 초과하면 요약 축소)"""
+        summary_tokens = self.counter.count(summary) if summary else 0
+        start, total = 0, sum(counts)
+        while start < len(messages) - 2 and summary_tokens + total > budget:
+            total -= counts[start]
+            start += 1
+        if start:
+            self._record("trimmed")
+        if summary and summary_tokens + total > budget:
+            summary = self.counter.truncate(summary, max(budget - total, 0)) or None
+            summary_tokens = self.counter.count(summary) if summary else 0
+        return summary, messages[start:], summary_tokens + total
+
+    def _compose(
+        self, history: List[Dict[str, str]], counts: List[int], summary: Optional[str], covered: int
+    ) -> CompactedHistory:
+        summary, messages, tokens = self._fit(summary, history[covered:], counts[covered:], self.max_history_tokens)
+        return CompactedHistory(
+            summary=summary,
+            messages=messages,
+            original_tokens=sum(counts),
+            tokens=tokens,
+            summarized_messages=len(history) - len(messages),
+        )
+
+    def compact_cached(self, session_id: Optional[str], history: List[Dict[str, str]]) -> CompactedHistory:
+        """LLM 호출 없이 캐시된 요약 + 예산 안의 최근 대화로 구성 (요약 갱신 시간 초과 시 대체값)"""
+        counts = [self.counter.count_message(message) for message in history]
+        if sum(counts) <= self.max_history_tokens:
+            return CompactedHistory(None, history, sum(counts), sum(counts))
+        summary, covered = self._load_summary(session_id, history)
+        return self._compose(history, counts, summary, covered)
+
+    async def compact(self, session_id: Optional[str], history: List[Dict[str, str]]) -> CompactedHistory:
+        """
+        토큰 예산에 맞게 대화 이력 압축
+
+        요약되지 않은 대화까지 예산 안이면 캐시된 요약을 그대로 사용하고,
+        예산을 넘을 때만 최근 keep_turns 턴 이전의 새 대화를 기존 요약에 합쳐 갱신합니다.
+        """
+        self._record("requests")
+        counts = [self.counter.count_message(message) for message in history]
+        if sum(counts) <= self.max_history_tokens:
+            return CompactedHistory(None, history, sum(counts), sum(counts))
+
+        self._record("compacted")
+        summary, covered = self._load_summary(session_id, history)
+        summary_tokens = self.counter.count(summary) if summary else 0
+        keep_start = max(len(history) - self.keep_turns * 2, 0)
+
+        if session_id and keep_start > covered and summary_tokens + sum(counts[covered:]) > self.max_history_tokens:
+            refresh = self._refreshes.get(session_id)
+            if refresh is None or refresh.done():
+                refresh = asyncio.ensure_future(self._refresh_summary(session_id, history, summary, covered, keep_start))
+                self._refreshes[session_id] = refresh
+                refresh.add_done_callback(functools.partial(self._forget_refresh, session_id))
+            # 이미 진행 중인 갱신이 있으면 함께 대기 (세션당 LLM 호출 1회), 취소되어도 갱신은 계속 진행
+            await asyncio.shield(refresh)
+            summary, covered = self._load_summary(session_id, history)
+
+        return self._compose(history, counts, summary, covered)
+
+    async def _refresh_summary(
+        self,
+        session_id: str,
+        history: List[Dict[str, str]],
+        summary: Optional[str],
+        covered: int,
+        keep_start: int,
+    ) -> None:
+        """covered~keep_start 대화를 기존 요약에 합쳐 저장 (실패 시 기존 요약 유지)"""
+        try:
+            summary = await self._summarize(summary, history[covered:keep_start])
+            self._save_summary(session_id, history, summary, keep_start)
+            self._record("summary_updates")
+        except Exception as e:
+            # 요약 실패 시 기존 요약 유지, 예산을 넘는 오래된 대화는 제외
+            logger.warning(f"⚠️ 대화 요약 갱신 실패 (session={session_id}): {e}")
+            self._record("summary_failures")
+
+    def _forget_refresh(self, session_id: str, refresh: asyncio.Future) -> None:
+        if self._refreshes.get(session_id) is refresh:
+            del self._refreshes[session_id]
+
+    async def _summarize(self, summary: Optional[str], messages: List[Dict[str, str]]) -> str:
+        """기존 요약에 새 대화를 합쳐 갱신한 요약 반환"""
+        # 요약 입력도 요청 상한을 넘지 않도록 제한 (가장 오래된 대화부터 생략)
+        lines = [f"{'User' if message['role'] == 'user' else 'Assistant'}: {message['content']}" for message in messages]
+        budget = self.max_request_tokens - self.summary_max_tokens * 2
+        start, total = 0, sum(self.counter.count(line) for line in lines)
+        while start < len(lines) - 1 and total > budget:
+            total -= self.counter.count(lines[start])
+            start += 1
+        dialogue = self.counter.truncate("\n".join(lines[start:]), budget)
+
+        result = await self.llm_client.chat(
+            [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT.format(max_tokens=self.summary_max_tokens)},
+                {"role": "user", "content": f"[기존 요약]\n{summary or '없음'}\n\n[새 대화]\n{dialogue}"},
+            ]
+        )
+        return self.counter.truncate(result.strip(), self.summary_max_tokens)
+
+    def cap_request(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        요청 전체 토큰 상한 강제 (messages: 시스템 프롬프트, 이력..., 질문 순서)
+
+        초과 시 이력을 오래된 것부터 제외하고, 그래도 초과하면 시스템 프롬프트 뒷부분(기억/검색 결과)과
+        질문 순서로 잘라냅니다.
+        """
+        counts = [self.counter.count_message(message) for message in messages]
+        total = sum(counts)
+        if total <= self.max_request_tokens:
+            return messages
+
+        logger.warning(f"⚠️ 요청 토큰 상한 초과: {total} > {self.max_request_tokens}")
+        head = messages[:1] if len(messages) > 1 and messages[0]["role"] == "system" else []
+        middle, tail = list(messages[len(head) : -1]), messages[-1:]
+        middle_counts = counts[len(head) : -1]
+        while middle and total > self.max_request_tokens:
+            total -= middle_counts.pop(0)
+            middle.pop(0)
+
+        capped = head + middle + tail
+        for index in sorted({0, len(capped) - 1}):
+            if total <= self.max_request_tokens:
+                break
+            message = capped[index]
+            message_tokens = self.counter.count_message(message)
+            allowed = max(message_tokens - (total - self.max_request_tokens), 0) - MESSAGE_OVERHEAD_TOKENS
+            capped[index] = {**message, "content": self.counter.truncate(message["content"], allowed)}
+            total -= message_tokens - self.counter.count_message(capped[index])
+        return capped
+
+
+# 전역 대화 이력 압축기
+history_compactor = HistoryCompactor()
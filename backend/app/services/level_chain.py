@@ -1,23 +1,30 @@
+import asyncio
+import inspect
 import logging
-from typing import TypedDict
+from contextvars import ContextVar
+from typing import AsyncGenerator, Callable, Optional, TypedDict
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 
 from app.utils.llm_client import LLMClient
 from app.constants import UserLevel
+from app.core.config import settings
 from app.core.prompts import SYSTEM_PROMPTS, SEARCH_DECISION_PROMPT
+from app.services.graph_registry import compiled_graph_registry, graph_key, graph_node, graph_route, runner_config
+from app.services.history_compaction import history_compactor
 from app.services.simple_search import search_web_with_agent
 
-# Langfuse observe 데코레이터 임포트
-try:
-    from langfuse import observe
-
-    LANGFUSE_OBSERVE_AVAILABLE = True
-except ImportError:
-    LANGFUSE_OBSERVE_AVAILABLE = False
-    observe = None
+# Langfuse 추적 데코레이터 (샘플링 적용)
+from app.core.tracing import LANGFUSE_OBSERVE_AVAILABLE, traced
 
 logger = logging.getLogger(__name__)
 
+# 일부 토큰이 전달된 뒤 생성이 실패했을 때 이어서 보내는 안내 (잘린 응답임을 명시)
+STREAM_INTERRUPTED_MESSAGE = "\n\n[응답 생성 중 오류가 발생하여 답변이 중단되었습니다. 다시 시도해주세요.]"
+
+# 직접 실행(fast path) 스트리밍 시 generate_response 노드가 토큰을 전달할 writer
+_token_writer: ContextVar[Optional[Callable[[dict], None]]] = ContextVar("level_chain_token_writer", default=None)
+
 
 class LevelChainState(TypedDict):
     """레벨별 체인 상태 - 순수 레벨별 로직"""
@@ -26,11 +33,13 @@ class LevelChainState(TypedDict):
     user_query: str
     conversation_history: list[dict[str, str]]
     memory_context: str
+    history_summary: str  # 예산을 넘어 요약으로 대체된 이전 대화
     final_response: str
 
     # 레벨별 전처리 상태
     needs_search: bool
     search_results: str
+    search_prefetched: bool  # 검색 판단/결과가 요청 전 단계에서 미리 준비된 경우
     tools_used: list[str]
     processing_step: str
     error_message: str
@@ -39,20 +48,25 @@ class LevelChainState(TypedDict):
 class BaseLevelChain:
     """레벨별 LLM 체인 - LLMClient 활용으로 Langfuse 추적 포함"""
 
+    # 분기 없는 직선 그래프의 노드 메서드 순서 (설정 시 그래프 없이 직접 실행 가능)
+    LINEAR_STEPS: tuple[str, ...] = ()
+
     def __init__(self, user_level: UserLevel, user=None, langfuse_manager=None, recursion_limit=30):
         self.llm_client = LLMClient(user=user, langfuse_manager=langfuse_manager)
         self.user_level = user_level
         self.user = user
         self.langfuse_manager = langfuse_manager
-        self.graph = self._build_graph()
-        self.config = {"recursion_limit": recursion_limit}
+        # 그래프는 프로세스 전역에서 한 번만 컴파일, 요청별 의존성은 실행 config로 전달
+        self.graph = compiled_graph_registry.get_or_compile(graph_key(type(self)), self._build_graph)
+        self.config = runner_config(self, {"recursion_limit": recursion_limit})
 
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """기본 더미 그래프 - 각 레벨에서 오버라이드하여 사용"""
         workflow = StateGraph(LevelChainState)
 
         # 🎯 간단한 더미 노드 - 실제로는 각 레벨에서 구현
-        workflow.add_node("dummy_response", self._dummy_response)
+        workflow.add_node("dummy_response", graph_node("_dummy_response"))
         workflow.add_edge(START, "dummy_response")
         workflow.add_edge("dummy_response", END)
 
@@ -101,18 +115,22 @@ class BaseLevelChain:
         """분석 후 라우팅"""
         if state.get("error_message"):
             return "response"  # 오류 시 기본 응답
+        elif state.get("search_prefetched"):
+            return "response"  # 검색 결과가 이미 준비됨
         elif state["needs_search"]:
             return "search"
         else:
             return "response"
 
-    @observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
+    @traced("level_chain_process")
     async def process(
         self,
         user_level: UserLevel,
         user_query: str,
         conversation_history: list[dict[str, str]] = None,
         memory_context: str = None,
+        prefetched_search: dict = None,
+        history_summary: str = None,
     ) -> LevelChainState:
         """레벨별 체인 처리 - Langfuse 추적 포함"""
 
@@ -128,23 +146,16 @@ class BaseLevelChain:
                     "service": "level_chain",
                 },
             )
-        initial_state = LevelChainState(
-            user_level=user_level,
-            user_query=user_query,
-            conversation_history=conversation_history or [],
-            memory_context=memory_context or "",
-            final_response="",
-            needs_search=False,
-            search_results="",
-            tools_used=[],
-            processing_step="시작",
-            error_message="",
+        initial_state = self._build_initial_state(
+            user_level, user_query, conversation_history, memory_context, prefetched_search, history_summary
         )
 
         try:
-            # 그래프 실행
-
-            result = await self.graph.ainvoke(initial_state, config=self.config)
+            # 그래프 실행 (직선 그래프는 직접 실행)
+            if self._use_fast_path():
+                result = await self._run_linear(initial_state)
+            else:
+                result = await self.graph.ainvoke(initial_state, config=self.config)
 
             # Langfuse 결과 업데이트 (LLMClient 패턴과 동일)
             if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
@@ -169,12 +180,167 @@ class BaseLevelChain:
                 "processing_step": "오류",
             }
 
+    @traced("level_chain_stream")
+    async def astream(
+        self,
+        user_level: UserLevel,
+        user_query: str,
+        conversation_history: list[dict[str, str]] = None,
+        memory_context: str = None,
+        prefetched_search: dict = None,
+        history_summary: str = None,
+    ) -> AsyncGenerator[str, None]:
+        """레벨별 체인 스트리밍 처리 - generate_response 노드의 토큰을 즉시 전달"""
+
+        if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
+            self.langfuse_manager.update_current_trace(
+                name="level_chain_stream",
+                input_data={
+                    "user_level": user_level.value,
+                    "query_length": len(user_query),
+                    "has_memory": bool(memory_context),
+                    "history_count": len(conversation_history or []),
+                    "service": "level_chain",
+                },
+            )
+        initial_state = self._build_initial_state(
+            user_level, user_query, conversation_history, memory_context, prefetched_search, history_summary
+        )
+
+        result = initial_state
+        token_sent = False
+        try:
+            # custom 모드: 노드에서 보낸 토큰, values 모드: 노드 실행 후 상태
+            if self._use_fast_path():
+                events = self._stream_linear(initial_state)
+            else:
+                events = self.graph.astream(initial_state, config=self.config, stream_mode=["custom", "values"])
+
+            async for mode, chunk in events:
+                if mode == "custom":
+                    if not isinstance(chunk, dict):
+                        continue
+                    if chunk.get("error"):
+                        # 부분 응답 이후 생성 실패: 중단 안내 전달 후 종료
+                        token_sent = True
+                        yield chunk["error"]
+                        continue
+                    token = chunk.get("token")
+                    if token:
+                        token_sent = True
+                        yield token
+                else:
+                    result = chunk
+
+        except Exception as e:
+            logger.error(f"레벨별 체인 스트리밍 오류: {e}")
+            result = {
+                **result,
+                "final_response": "죄송합니다. 현재 답변을 제공할 수 없습니다.",
+                "error_message": str(e),
+                "processing_step": "오류",
+            }
+
+        # 토큰이 하나도 전달되지 않은 경우 (오류/기본 응답) 최종 응답을 한 번에 전송
+        if not token_sent and result.get("final_response"):
+            yield result["final_response"]
+
+        if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
+            self.langfuse_manager.update_current_trace(
+                output_data={
+                    "status": "completed" if not result.get("error_message") else "error",
+                    "tools_used": result.get("tools_used", []),
+                    "response_length": len(result.get("final_response", "")),
+                }
+            )
+
+        logger.info(f"레벨별 체인 스트리밍 완료: level={user_level.value}, tools={result.get('tools_used', [])}")
+
+    def _use_fast_path(self) -> bool:
+        """직선 그래프 직접 실행 여부"""
+        return bool(self.LINEAR_STEPS) and settings.LEVEL_CHAIN_FAST_PATH_ENABLED
+
+    async def _run_linear(self, state: LevelChainState) -> LevelChainState:
+        """직선 그래프를 LangGraph 없이 순서대로 실행 (그래프와 동일한 노드 메서드 사용)"""
+        for step in self.LINEAR_STEPS:
+            result = getattr(self, step)(state)
+            if inspect.isawaitable(result):
+                result = await result
+            state = result
+        return state
+
+    async def _stream_linear(self, state: LevelChainState) -> AsyncGenerator[tuple[str, dict], None]:
+        """직접 실행 스트리밍 - graph.astream(stream_mode=["custom", "values"])과 같은 형태로 전달"""
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _run() -> LevelChainState:
+            _token_writer.set(queue.put_nowait)
+            try:
+                return await self._run_linear(state)
+            finally:
+                queue.put_nowait(None)
+
+        task = asyncio.create_task(_run())
+        try:
+            while (chunk := await queue.get()) is not None:
+                yield "custom", chunk
+            yield "values", await task
+        finally:
+            if not task.done():
+                task.cancel()
+
+    @staticmethod
+    def _get_token_writer() -> Callable[[dict], None]:
+        """현재 실행 방식에 맞는 토큰 writer 반환 (스트리밍이 아니면 무시)"""
+        writer = _token_writer.get()
+        if writer:
+            return writer
+        try:
+            return get_stream_writer()
+        except RuntimeError:
+            return lambda chunk: None
+
+    @staticmethod
+    def _build_initial_state(
+        user_level: UserLevel,
+        user_query: str,
+        conversation_history: list[dict[str, str]] = None,
+        memory_context: str = None,
+        prefetched_search: dict = None,
+        history_summary: str = None,
+    ) -> LevelChainState:
+        """그래프 초기 상태 생성 (prefetched_search: prefetch_search() 결과)"""
+        state = LevelChainState(
+            user_level=user_level,
+            user_query=user_query,
+            conversation_history=conversation_history or [],
+            memory_context=memory_context or "",
+            history_summary=history_summary or "",
+            final_response="",
+            needs_search=False,
+            search_results="",
+            search_prefetched=False,
+            tools_used=[],
+            processing_step="시작",
+            error_message="",
+        )
+        if prefetched_search:
+            state.update(
+                needs_search=prefetched_search.get("needs_search", False),
+                search_results=prefetched_search.get("search_results", ""),
+                search_prefetched=True,
+                tools_used=list(prefetched_search.get("tools_used", [])),
+            )
+        return state
+
     def _get_system_prompt(self) -> str:
         # 레벨별 시스템 프롬프트 반환
         return SYSTEM_PROMPTS.get(self.user_level, "")
 
     async def _generate_response(self, state: LevelChainState) -> LevelChainState:
         """LLM 응답 - 기존 LLMClient 기능 그대로 활용"""
+        writer = self._get_token_writer()
+        response = ""
         try:
             state["processing_step"] = "LLM 응답 생성"
 
@@ -185,6 +351,10 @@ class BaseLevelChain:
             if state["memory_context"]:
                 system_prompt += f"\n\n[이전 대화 기억]\n{state['memory_context']}"
 
+            # 예산을 넘어 요약된 이전 대화
+            if state.get("history_summary"):
+                system_prompt += f"\n\n[이전 대화 요약]\n{state['history_summary']}"
+
             # 🔍 실전러의 경우 검색 결과 추가 (AdvancedLevelChain에서만 해당)
             if hasattr(self, "user_level") and self.user_level == UserLevel.ADVANCED and state.get("search_results"):
                 system_prompt += f"\n\n[실시간 시장 정보 및 최신 데이터]\n{state['search_results']}"
@@ -196,9 +366,12 @@ class BaseLevelChain:
             messages = [{"role": "system", "content": system_prompt}]
             messages.extend(state["conversation_history"])
             messages.append({"role": "user", "content": state["user_query"]})
+            messages = history_compactor.cap_request(messages)
 
-            # 🎯 LLMClient 직접 활용 - Langfuse 추적 자동 포함!
-            response = await self.llm_client.chat(messages)
+            # 🎯 LLMClient 스트리밍 활용 - 토큰 단위로 custom 스트림에 전달 (astream 사용 시)
+            async for token in self.llm_client.stream_chat(messages):
+                response += token
+                writer({"token": token})
 
             state["final_response"] = response
             return state
@@ -206,11 +379,20 @@ class BaseLevelChain:
         except Exception as e:
             logger.error(f"응답 생성 실패: {e}")
             state["error_message"] = f"응답 생성 실패: {str(e)}"
-            state["final_response"] = "죄송합니다. 현재 답변을 제공할 수 없습니다."
+            if response:
+                # 이미 일부 토큰이 전달된 경우: 응답이 잘렸음을 오류 이벤트로 알림 (조용히 끝나지 않도록)
+                writer({"error": STREAM_INTERRUPTED_MESSAGE})
+                state["final_response"] = response + STREAM_INTERRUPTED_MESSAGE
+            else:
+                state["final_response"] = "죄송합니다. 현재 답변을 제공할 수 없습니다."
             return state
 
     async def _analyze_query(self, state: LevelChainState) -> LevelChainState:
         """AI를 통한 웹 검색 필요성 판단"""
+        if state.get("search_prefetched"):
+            # 요청 전 단계에서 이미 판단/검색 완료
+            return state
+
         try:
             logger.info("AI 기반 쿼리 분석")
             state["processing_step"] = "AI 쿼리 분석"
@@ -243,13 +425,16 @@ class BaseLevelChain:
 class BeginnerLevelChain(BaseLevelChain):
     """🔰 주린이 전용 체인 - 기존 LLM 체인 역할 대체"""
 
-    def _build_graph(self) -> StateGraph:
+    LINEAR_STEPS = ("_generate_response", "_finalize_response")
+
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """주린이용 최단 워크플로우 - 복잡한 분석 없이 바로 LLM 응답"""
         workflow = StateGraph(LevelChainState)
 
         # 🎯 간단한 직선 플로우 - 분석이나 검색 없이 바로 LLM 호출
-        workflow.add_node("generate_response", self._generate_response)
-        workflow.add_node("finalize", self._finalize_response)
+        workflow.add_node("generate_response", graph_node("_generate_response"))
+        workflow.add_node("finalize", graph_node("_finalize_response"))
 
         # 직선 연결: START → LLM 응답 → 최종화 → END
         workflow.add_edge(START, "generate_response")
@@ -262,13 +447,16 @@ class BeginnerLevelChain(BaseLevelChain):
 class IntermediateLevelChain(BaseLevelChain):
     """📈 관심러 전용 체인"""
 
-    def _build_graph(self) -> StateGraph:
+    LINEAR_STEPS = ("_generate_response", "_finalize_response")
+
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         # TODO 주린이 전용 체인과 차별화 필요
         workflow = StateGraph(LevelChainState)
 
         # 📈 간단한 직선 플로우 - 검색 없이 기본 LLM 응답만
-        workflow.add_node("generate_response", self._generate_response)
-        workflow.add_node("finalize", self._finalize_response)
+        workflow.add_node("generate_response", graph_node("_generate_response"))
+        workflow.add_node("finalize", graph_node("_finalize_response"))
 
         # 직선 연결: START → LLM 응답 → 최종화 → END
         workflow.add_edge(START, "generate_response")
@@ -281,15 +469,16 @@ class IntermediateLevelChain(BaseLevelChain):
 class AdvancedLevelChain(BaseLevelChain):
     """🎯 실전러 전용 체인 - 웹 검색 기능 포함"""
 
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """실전러용 고급 워크플로우 - 검색 키워드 감지 시 웹 검색 수행"""
         workflow = StateGraph(LevelChainState)
 
         # 🎯 실전러 전용 노드들
-        workflow.add_node("analyze_query", self._analyze_query)
-        workflow.add_node("web_search", self._web_search)
-        workflow.add_node("generate_response", self._generate_response)
-        workflow.add_node("finalize", self._finalize_response)
+        workflow.add_node("analyze_query", graph_node("_analyze_query"))
+        workflow.add_node("web_search", graph_node("_web_search"))
+        workflow.add_node("generate_response", graph_node("_generate_response"))
+        workflow.add_node("finalize", graph_node("_finalize_response"))
 
         # 플로우 구성: 분석 → 조건부 검색 → LLM 응답
         workflow.add_edge(START, "analyze_query")
@@ -297,7 +486,7 @@ class AdvancedLevelChain(BaseLevelChain):
         # 실전러 전용 라우팅
         workflow.add_conditional_edges(
             "analyze_query",
-            self._route_analysis,
+            graph_route("_route_analysis"),
             {"search": "web_search", "response": "generate_response"},
         )
 
@@ -308,6 +497,19 @@ class AdvancedLevelChain(BaseLevelChain):
 
         return workflow.compile()
 
+    async def prefetch_search(self, user_query: str) -> dict:
+        """검색 필요성 판단 및 웹 검색을 그래프 실행 전에 미리 수행 (다른 준비 단계와 동시 실행용)"""
+        state = self._build_initial_state(self.user_level, user_query)
+        state = await self._analyze_query(state)
+        if self._route_analysis(state) == "search":
+            state = await self._web_search(state)
+
+        return {
+            "needs_search": state["needs_search"],
+            "search_results": state["search_results"],
+            "tools_used": state["tools_used"],
+        }
+
 
 class LevelChainService:
     """레벨별 LLM 체인 서비스"""
@@ -328,13 +530,15 @@ class LevelChainService:
         else:
             raise NotImplementedError
 
-    @observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
+    @traced("level_chain_run")
     async def run(
         self,
         user_level: UserLevel,
         user_query: str,
         conversation_history: list[dict[str, str]] = None,
         memory_context: str = None,
+        prefetched_search: dict = None,
+        history_summary: str = None,
     ) -> str:
         """
         레벨별 체인 실행
@@ -360,6 +564,8 @@ class LevelChainService:
                 user_query=user_query,
                 conversation_history=conversation_history,
                 memory_context=memory_context,
+                prefetched_search=prefetched_search,
+                history_summary=history_summary,
             )
 
             final_response = result.get("final_response", "응답 생성 실패")
@@ -370,3 +576,42 @@ class LevelChainService:
         except Exception as e:
             logger.error(f"레벨별 체인 서비스 오류: {e}")
             return f"죄송합니다. 오류가 발생했습니다: {str(e)}"
+
+    async def stream(
+        self,
+        user_level: UserLevel,
+        user_query: str,
+        conversation_history: list[dict[str, str]] = None,
+        memory_context: str = None,
+        prefetched_search: dict = None,
+        history_summary: str = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        레벨별 체인 스트리밍 실행 (토큰 단위)
+        """
+        # 빈 쿼리 체크
+        if not user_query or not user_query.strip():
+            yield "죄송합니다. 유효한 질문을 입력해주세요."
+            return
+
+        level_chain = self.get_chain(user_level)
+
+        logger.info(f"레벨별 체인 스트리밍 시작: level={user_level.value}")
+        async for token in level_chain.astream(
+            user_level=user_level,
+            user_query=user_query,
+            conversation_history=conversation_history,
+            memory_context=memory_context,
+            prefetched_search=prefetched_search,
+            history_summary=history_summary,
+        ):
+            yield token
+
+    async def prefetch_search(self, user_level: UserLevel, user_query: str) -> dict | None:
+        """
+        검색을 사용하는 레벨(실전러)의 검색 판단/결과를 미리 준비 (그 외 레벨은 None)
+        """
+        level_chain = self.get_chain(user_level)
+        if not isinstance(level_chain, AdvancedLevelChain) or not user_query or not user_query.strip():
+            return None
+        return await level_chain.prefetch_search(user_query)
@@ -0,0 +1,65 @@
+"""
+로컬 재작성 - SAFE_ALTERNATIVES 대체 표현으로 문구 단위 위반을 LLM 없이 수정
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.core.filter_prompts import SAFE_ALTERNATIVES
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 표현 경계 - 앞은 단어 시작, 뒤는 단어 끝 또는 조사 뒤 단어 끝 ("무조건적인"의 "무조건"은 대체하지 않음)
+_BOUNDARY_BEFORE = r"(?<!\w)"
+_BOUNDARY_AFTER = r"(?=$|\W|(?:을|를|이|가|은|는|도|만|의|과|와|으로|로)(?:$|\W))"
+
+
+@dataclass
+class RewriteResult:
+    """로컬 재작성 결과"""
+
+    content: str
+    replacements: List[str] = field(default_factory=list)  # 대체된 원문 표현
+
+
+class LocalRewriter:
+    """대체 표현 사전 기반 재작성기 (띄어쓰기 차이 무시, 긴 표현 우선, 단어 중간 매칭 제외)"""
+
+    def __init__(self, alternatives: Optional[Dict[str, str]] = None):
+        alternatives = SAFE_ALTERNATIVES if alternatives is None else alternatives
+        # 공백 제거한 표현 → 대체 표현
+        self._alternatives = {_compact(phrase): replacement for phrase, replacement in alternatives.items()}
+        phrases = sorted(self._alternatives, key=len, reverse=True)
+        self._pattern = (
+            re.compile(
+                _BOUNDARY_BEFORE
+                + "(?:"
+                + "|".join(r"\s*".join(map(re.escape, phrase)) for phrase in phrases)
+                + ")"
+                + _BOUNDARY_AFTER,
+                re.IGNORECASE,
+            )
+            if phrases
+            else None
+        )
+
+    def rewrite(self, content: str) -> RewriteResult:
+        """대체 표현 적용"""
+        if self._pattern is None:
+            return RewriteResult(content=content)
+
+        replacements = []
+
+        def replace(match: re.Match) -> str:
+            replacements.append(match.group(0))
+            return self._alternatives[_compact(match.group(0))]
+
+        return RewriteResult(content=self._pattern.sub(replace, content), replacements=replacements)
+
+
+def _compact(text: str) -> str:
+    return _WHITESPACE_PATTERN.sub("", text).lower()
+
+
+# 전역 로컬 재작성기 인스턴스
+local_rewriter = LocalRewriter()
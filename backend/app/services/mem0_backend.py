@@ -0,0 +1,79 @@
+"""
+mem0 동기 SDK(MemoryClient/Memory)를 이벤트 루프를 막지 않고 호출하기 위한 비동기 어댑터
+"""
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMemoryBackend:
+    """
+    mem0 SDK 호출을 전용 스레드 풀에서 실행
+
+    - 스레드 수(max_concurrency)로 동시 호출 수 제한, 초과 호출은 풀 대기열에서 대기
+    - 호출별 제한 시간 초과 시 asyncio.TimeoutError 발생 (실행 중인 SDK 호출은 스레드에서 마저 완료됨)
+    """
+
+    def __init__(
+        self,
+        memory: Any,
+        max_concurrency: int = 8,
+        read_timeout: float = 5.0,
+        write_timeout: float = 30.0,
+        name: str = "mem0",
+    ):
+        self.memory = memory
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=name)
+
+    async def _call(self, method_name: str, timeout: float, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        func = functools.partial(getattr(self.memory, method_name), *args, **kwargs)
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, func), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ mem0 {method_name} 시간 초과 ({timeout}초)")
+            raise
+
+    async def add(self, *args, **kwargs) -> Any:
+        """메모리 추가 (mem0 LLM 추출 포함)"""
+        return await self._call("add", self.write_timeout, *args, **kwargs)
+
+    async def search(self, *args, **kwargs) -> Any:
+        return await self._call("search", self.read_timeout, *args, **kwargs)
+
+    async def get_all(self, *args, **kwargs) -> Any:
+        return await self._call("get_all", self.read_timeout, *args, **kwargs)
+
+    async def update(self, *args, **kwargs) -> Any:
+        return await self._call("update", self.write_timeout, *args, **kwargs)
+
+    async def delete(self, *args, **kwargs) -> Any:
+        return await self._call("delete", self.write_timeout, *args, **kwargs)
+
+    async def delete_all(self, *args, **kwargs) -> Any:
+        return await self._call("delete_all", self.write_timeout, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=False)
+
+
+def create_memory_backend(memory: Any, name: str = "mem0") -> AsyncMemoryBackend | None:
+    """설정값으로 비동기 어댑터 생성 (mem0 초기화 실패 시 None)"""
+    if memory is None:
+        return None
+    return AsyncMemoryBackend(
+        memory,
+        max_concurrency=settings.MEM0_MAX_CONCURRENCY,
+        read_timeout=settings.MEM0_READ_TIMEOUT,
+        write_timeout=settings.MEM0_WRITE_TIMEOUT,
+        name=name,
+    )
@@ -4,6 +4,7 @@ from datetime import datetime
 from mem0 import MemoryClient
 
 from app.core.config import settings
+from app.services.mem0_backend import create_memory_backend
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,9 @@ class Mem0Client:
             logger.error(f"❌ mem0 서비스 초기화 실패: {e}")
             self.memory = None
 
+        # 동기 SDK 호출을 스레드 풀에서 실행하는 비동기 어댑터
+        self.backend = create_memory_backend(self.memory, name="mem0_client")
+
     async def add_conversation_message(
         self, user_id: str, messages: list[dict], session_id: str | None
     ) -> dict[str, Any]:
@@ -41,7 +45,7 @@ class Mem0Client:
         try:
             # mem0에 메시지 추가
             metadata = {"session_id": session_id, "timestamp": datetime.now().isoformat()}
-            result = self.memory.add(messages, user_id=user_id, metadata=metadata)
+            result = await self.backend.add(messages, user_id=user_id, metadata=metadata)
 
             logger.debug(f"📝 mem0에 {len(messages)}개 메시지 추가")
             return {"success": True, "result": result}
@@ -68,7 +72,7 @@ class Mem0Client:
         try:
             filters = {"AND": [{"user_id": user_id}]}
             limit = settings.MEM0_RELEVANT_MEMORY_LIMIT
-            memories = self.memory.search(query=query, filters=filters, top_k=limit, version="v2")  #  v1 - Deprecated
+            memories = await self.backend.search(query=query, filters=filters, top_k=limit, version="v2")  #  v1 - Deprecated
 
             logger.debug(f"🔍 mem0 검색 완료: {len(memories)}개 메모리 발견")
             return memories
@@ -96,7 +100,7 @@ class Mem0Client:
             filters = {"AND": [{"user_id": user_id}]}
             if session_id:
                 filters["AND"].append({"metadata": {"session_id": session_id}})
-            memories = self.memory.get_all(filters=filters, version="v2")  #  v1 - Deprecated
+            memories = await self.backend.get_all(filters=filters, version="v2")  #  v1 - Deprecated
             logger.debug(f"📋 사용자 {user_id}의 총 {len(memories)}개 메모리 조회")
             return memories
 
@@ -121,7 +125,7 @@ class Mem0Client:
             return {"success": False, "error": "mem0 not initialized"}
 
         try:
-            result = self.memory.update(memory_id=memory_id, text=new_content)
+            result = await self.backend.update(memory_id=memory_id, text=new_content)
 
             logger.debug(f"🔄 메모리 업데이트 완료: {memory_id}")
             return {"success": True, "result": result}
@@ -145,7 +149,7 @@ class Mem0Client:
             return {"success": False, "error": "mem0 not initialized"}
 
         try:
-            result = self.memory.delete(memory_id=memory_id)
+            result = await self.backend.delete(memory_id=memory_id)
             logger.debug(f"🗑️ 메모리 삭제 완료: {memory_id}")
             return {"success": True, "result": result}
 
@@ -168,7 +172,7 @@ class Mem0Client:
             return {"success": False, "error": "mem0 not initialized"}
 
         try:
-            self.memory.delete_all(user_id=user_id)
+            await self.backend.delete_all(user_id=user_id)
 
             logger.info(f"🔄 사용자 {user_id}의 메모리 초기화 완료")
             return {"success": True, "message": f"사용자 {user_id}의 메모리가 초기화되었습니다."}
@@ -5,6 +5,7 @@ from datetime import datetime
 from mem0 import Memory
 
 from app.core.config import settings
+from app.services.mem0_backend import create_memory_backend
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,9 @@ class Mem0Service:
             logger.error(f"❌ mem0 서비스 초기화 실패: {e}")
             self.memory = None
 
+        # 동기 SDK 호출을 스레드 풀에서 실행하는 비동기 어댑터
+        self.backend = create_memory_backend(self.memory, name="mem0_service")
+
     async def add_conversation_message(
         self, user_id: str, messages: list[dict], session_id: str | None = None
     ) -> dict[str, Any]:
@@ -69,7 +73,7 @@ class Mem0Service:
             metadata = {"timestamp": datetime.now().isoformat(), "session_id": session_id}
 
             # mem0에 메시지 추가
-            result = self.memory.add(messages, user_id=user_id, metadata=metadata)
+            result = await self.backend.add(messages, user_id=user_id, metadata=metadata)
 
             logger.debug(f"📝 mem0에 {len(messages)}개 메시지 추가: {messages[0].get('content')[:50] if messages else ''}...")
             return {"success": True, "result": result}
@@ -95,7 +99,7 @@ class Mem0Service:
 
         try:
             limit = settings.MEM0_RELEVANT_MEMORY_LIMIT
-            res = self.memory.search(query, user_id=user_id, limit=limit)
+            res = await self.backend.search(query, user_id=user_id, limit=limit)
             memories = res.get("results", [])
 
             logger.debug(f"🔍 mem0 검색 완료: {len(memories)}개 메모리 발견")
@@ -120,7 +124,7 @@ class Mem0Service:
             return []
 
         try:
-            res = self.memory.get_all(user_id=user_id)
+            res = await self.backend.get_all(user_id=user_id)
             memories = res.get("results", [])
             logger.debug(f"📋 사용자 {user_id}의 총 {len(memories)}개 메모리 조회")
             return memories
@@ -146,7 +150,7 @@ class Mem0Service:
             return {"success": False, "error": "mem0 not initialized"}
 
         try:
-            result = self.memory.update(memory_id=memory_id, data=new_content)
+            result = await self.backend.update(memory_id=memory_id, data=new_content)
 
             logger.debug(f"🔄 메모리 업데이트 완료: {memory_id}")
             return {"success": True, "result": result}
@@ -170,7 +174,7 @@ class Mem0Service:
             return {"success": False, "error": "mem0 not initialized"}
 
         try:
-            result = self.memory.delete(memory_id=memory_id)
+            result = await self.backend.delete(memory_id=memory_id)
             logger.debug(f"🗑️ 메모리 삭제 완료: {memory_id}")
             return {"success": True, "result": result}
 
@@ -0,0 +1,106 @@
+"""
+응답 생성 전 단계(세션 조회, 메모리 검색, 검색 필요성 판단)를 동시에 실행하는 모듈
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ClientDisconnectedError(Exception):
+    """응답 생성 전 단계 실행 중 클라이언트 연결이 끊긴 경우"""
+
+
+@dataclass
+class PreGenerationStage:
+    """응답 생성 전 단계 정의"""
+
+    name: str  # 단계 이름 (결과 dict의 키)
+    run: Callable[[], Awaitable[Any]]  # 실행할 코루틴 함수
+    timeout: float  # 단계별 제한 시간 (초)
+    required: bool = False  # 필수 단계 여부 (실패 시 예외 전파)
+    default: Any = None  # 선택 단계 실패/시간 초과 시 사용할 값
+    default_factory: Optional[Callable[[], Any]] = None  # 기본값 계산 비용이 클 때 실패/시간 초과 시에만 호출 (default 대신)
+
+
+async def run_pre_generation_stages(
+    stages: List[PreGenerationStage],
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    poll_interval: float = 0.1,
+) -> Dict[str, Any]:
+    """
+    응답 생성 전 단계들을 동시에 실행
+
+    - 각 단계는 자신의 제한 시간 안에서만 실행되며, 선택 단계는 실패/시간 초과 시 default 값 사용
+    - 필수 단계가 실패하면 나머지 단계를 취소하고 예외를 전파
+    - 클라이언트 연결이 끊기면 모든 단계를 취소하고 ClientDisconnectedError 발생
+
+    Returns:
+        {단계 이름: 결과}
+    """
+    start_time = time.time()
+    tasks = {
+        asyncio.create_task(_run_stage(stage), name=f"pre_generation:{stage.name}"): stage for stage in stages
+    }
+    watcher = asyncio.create_task(_watch_disconnect(is_disconnected, poll_interval)) if is_disconnected else None
+    results: Dict[str, Any] = {}
+
+    try:
+        pending = set(tasks)
+        while pending:
+            wait_for = pending | ({watcher} if watcher else set())
+            done, _ = await asyncio.wait(wait_for, return_when=asyncio.FIRST_COMPLETED)
+
+            if watcher in done and watcher.result():
+                logger.info("클라이언트 연결 종료 - 응답 생성 전 단계 취소")
+                raise ClientDisconnectedError()
+
+            for task in done & pending:
+                pending.discard(task)
+                stage = tasks[task]
+                results[stage.name] = task.result()
+
+        logger.debug(f"응답 생성 전 단계 완료: {list(results)} ({time.time() - start_time:.3f}초)")
+        return results
+
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if watcher and not watcher.done():
+            watcher.cancel()
+
+
+async def _run_stage(stage: PreGenerationStage) -> Any:
+    """단계 하나를 제한 시간 안에서 실행"""
+    start_time = time.time()
+    try:
+        result = await asyncio.wait_for(stage.run(), timeout=stage.timeout)
+        logger.debug(f"단계 완료: {stage.name} ({time.time() - start_time:.3f}초)")
+        return result
+
+    except asyncio.TimeoutError:
+        if stage.required:
+            raise
+        logger.warning(f"⚠️ 단계 시간 초과 ({stage.timeout}초): {stage.name} - 기본값 사용")
+        return _default(stage)
+
+    except Exception as e:
+        if stage.required:
+            raise
+        logger.warning(f"⚠️ 단계 실패: {stage.name} - {e}")
+        return _default(stage)
+
+
+def _default(stage: PreGenerationStage) -> Any:
+    return stage.default_factory() if stage.default_factory is not None else stage.default
+
+
+async def _watch_disconnect(is_disconnected: Callable[[], Awaitable[bool]], poll_interval: float) -> bool:
+    """클라이언트 연결 종료 감시"""
+    while not await is_disconnected():
+        await asyncio.sleep(poll_interval)
+    return True
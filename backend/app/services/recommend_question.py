@@ -0,0 +1,143 @@
+"""
+추천 질문 생성 - 캐시 적용 단건 생성과 여러 이벤트/레벨 일괄 생성
+"""
+import json
+import logging
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.constants import UserLevel
+from app.core.config import settings
+from app.core.prompts import get_recommend_question_batch_prompt, get_recommend_question_prompt
+from app.services.response_cache import recommend_question_cache
+
+logger = logging.getLogger(__name__)
+
+# 일괄 생성 기본 대상 레벨
+RECOMMEND_LEVELS = (UserLevel.BEGINNER, UserLevel.INTERMEDIATE, UserLevel.ADVANCED)
+
+JSON_BLOCK_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def recommend_cache_key(level: UserLevel, event_description: str, question_count: int, string_length: int) -> str:
+    return recommend_question_cache.make_key(UserLevel(level).value, event_description, question_count, string_length)
+
+
+def postprocess_questions(questions: Sequence[str], question_count: int, string_length: int) -> List[str]:
+    """질문 정리 - 빈 줄 제거, 길이 제한 적용, 요청 개수만큼 반환"""
+    filtered_questions = []
+    for question in (q.strip() for q in questions):
+        if not question:
+            continue
+        if len(question) <= string_length:
+            filtered_questions.append(question)
+        else:
+            # 길이 초과 시 자르기
+            truncated = question[: string_length - 1]
+            if not truncated.endswith("?"):
+                truncated += "?"
+            filtered_questions.append(truncated)
+            logger.debug(f"질문 길이 초과로 자름: {question} → {truncated}")
+
+    # 요청된 개수만큼만 반환
+    return filtered_questions[:question_count]
+
+
+async def generate_recommend_questions(
+    llm_client, level: UserLevel, event_description: str, question_count: int = 3, string_length: int = 15
+) -> List[str]:
+    """
+    추천 질문 생성 (같은 레벨/이벤트 설명/개수/길이 조합은 캐시 사용)
+
+    Returns:
+        추천 질문 목록 (LLM 응답이 비어있으면 빈 리스트)
+    """
+    cache_key = recommend_cache_key(level, event_description, question_count, string_length)
+    cached = recommend_question_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("📦 추천 질문 캐시 사용")
+        return cached
+
+    prompt = get_recommend_question_prompt(
+        level=level, event_description=event_description, question_count=question_count, string_length=string_length
+    )
+    # system 메시지와 user 메시지를 모두 포함
+    messages = [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": "위 이벤트에 대한 추천 질문을 생성해주세요."},
+    ]
+    response = await llm_client.chat(messages=messages)
+    if not response:
+        logger.warning("LLM 응답이 비어있음")
+        return []
+
+    # 생성된 질문들을 줄바꿈으로 분리
+    questions = postprocess_questions(response.strip().split("\n"), question_count, string_length)
+    if questions:
+        recommend_question_cache.set(cache_key, questions)
+    return questions
+
+
+def _parse_batch_response(response: str) -> dict:
+    """JSON 응답 파싱 (코드 블록 등 앞뒤 텍스트 제거)"""
+    match = JSON_BLOCK_PATTERN.search(response or "")
+    if not match:
+        raise ValueError("JSON 응답을 찾을 수 없습니다")
+    return json.loads(match.group(0))
+
+
+async def generate_recommend_questions_batch(
+    llm_client,
+    event_descriptions: Sequence[str],
+    levels: Optional[Sequence[UserLevel]] = None,
+    question_count: int = 3,
+    string_length: int = 15,
+) -> Dict[Tuple[str, UserLevel], List[str]]:
+    """
+    여러 이벤트 x 레벨의 추천 질문을 구조화된 LLM 호출로 일괄 생성하여 캐시 채우기
+
+    캐시에 없는 조합만 RECOMMEND_BATCH_MAX_EVENTS개 이벤트 단위로 한 번씩 호출합니다.
+
+    Returns:
+        {(이벤트 설명, 레벨): 추천 질문 목록} (생성 실패한 조합은 제외)
+    """
+    levels = [UserLevel(level) for level in (levels or RECOMMEND_LEVELS)]
+    results: Dict[Tuple[str, UserLevel], List[str]] = {}
+    missing: List[str] = []
+
+    for description in dict.fromkeys(event_descriptions):  # 중복 제거 (순서 유지)
+        for level in levels:
+            cached = recommend_question_cache.get(recommend_cache_key(level, description, question_count, string_length))
+            if cached is not None:
+                results[(description, level)] = cached
+            elif description not in missing:
+                missing.append(description)
+
+    batch_size = settings.RECOMMEND_BATCH_MAX_EVENTS
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start : start + batch_size]
+        events = {f"e{i}": description for i, description in enumerate(chunk)}
+        prompt = get_recommend_question_batch_prompt(events, levels, question_count, string_length)
+
+        try:
+            response = await llm_client.chat(messages=[{"role": "user", "content": prompt}])
+            parsed = _parse_batch_response(response)
+        except Exception as e:
+            logger.error(f"❌ 추천 질문 일괄 생성 실패 ({len(chunk)}개 이벤트): {e}")
+            continue
+
+        for event_id, description in events.items():
+            per_level = parsed.get(event_id) or {}
+            for level in levels:
+                raw_questions = per_level.get(level.value)
+                if not isinstance(raw_questions, list):
+                    continue
+                questions = postprocess_questions([str(q) for q in raw_questions], question_count, string_length)
+                if questions:
+                    results[(description, level)] = questions
+                    recommend_question_cache.set(
+                        recommend_cache_key(level, description, question_count, string_length), questions
+                    )
+
+    logger.info(f"추천 질문 일괄 생성 완료: {len(results)}개 조합 (LLM 호출 대상 이벤트 {len(missing)}개)")
+    return results
@@ -0,0 +1,226 @@
+"""
+LLM 응답 캐시 - 입력이 고정된 생성 결과(이벤트 설명, 추천 질문 등)를 재사용
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+
+# Redis 클라이언트 임포트 (선택적)
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+def hash_text(text: str, length: int = 16) -> str:
+    """프롬프트 등 긴 문자열의 짧은 해시 (프롬프트 버전 식별용)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:length]
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """값 저장 (ttl: 초)"""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """값 삭제"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 삭제"""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 캐시 (워커 간 공유)
+
+    get/set(ex=)/delete/scan_iter를 지원하는 클라이언트면 사용 가능 (테스트에서는 가짜 클라이언트 주입)
+    LRU 제거는 Redis의 maxmemory-policy(allkeys-lru) 설정을 따름
+    """
+
+    def __init__(self, client: Any = None, url: str = None, prefix: str = "llm_cache"):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis 패키지가 설치되지 않았습니다")
+            client = redis.Redis.from_url(url or settings.REDIS_URL)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self.client.set(self._key(key), json.dumps(value, ensure_ascii=False), ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._key(key))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self._key("*")):
+            self.client.delete(key)
+
+
+class ResponseCache:
+    """
+    네임스페이스별 응답 캐시
+
+    캐시 저장소 오류는 캐시 미스로 처리하여 응답 생성을 막지 않음
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend, ttl: int = 3600, enabled: bool = True):
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, *parts: Any) -> str:
+        """키 구성 요소를 해시하여 캐시 키 생성"""
+        raw = json.dumps([str(part) for part in parts], ensure_ascii=False)
+        return f"{self.namespace}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 조회 실패 ({self.namespace}): {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int = None) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(key, value, ttl or self.ttl)
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 저장 실패 ({self.namespace}): {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 삭제 실패 ({self.namespace}): {e}")
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+def create_cache_backend(max_size: int, prefix: str) -> CacheBackend:
+    """RESPONSE_CACHE_BACKEND 설정에 따라 캐시 저장소 생성 (Redis 사용 불가 시 메모리 캐시)"""
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        try:
+            return RedisCacheBackend(prefix=prefix)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis 캐시 사용 불가 - 메모리 캐시 사용: {e}")
+    return InMemoryCacheBackend(max_size=max_size)
+
+
+# 이벤트 설명 캐시
+event_explain_cache = ResponseCache(
+    namespace="event_explain",
+    backend=create_cache_backend(settings.EXPLAIN_CACHE_MAX_SIZE, prefix="event_explain"),
+    ttl=settings.EXPLAIN_CACHE_TTL,
+    enabled=settings.EXPLAIN_CACHE_ENABLED,
+)
+
+# 추천 질문 캐시
+recommend_question_cache = ResponseCache(
+    namespace="recommend_question",
+    backend=create_cache_backend(settings.RECOMMEND_CACHE_MAX_SIZE, prefix="recommend_question"),
+    ttl=settings.RECOMMEND_CACHE_TTL,
+    enabled=settings.RECOMMEND_CACHE_ENABLED,
+)
+
+# 컨텐츠 필터링 판정 캐시
+filter_verdict_cache = ResponseCache(
+    namespace="filter_verdict",
+    backend=create_cache_backend(settings.FILTER_VERDICT_CACHE_MAX_SIZE, prefix="filter_verdict"),
+    ttl=settings.FILTER_VERDICT_CACHE_TTL,
+    enabled=settings.FILTER_VERDICT_CACHE_ENABLED,
+)
@@ -0,0 +1,195 @@
+"""
+LLM 안전성 분석 앞단의 사전 분류기
+
+위험/애매한 표현 사전을 Aho-Corasick 오토마톤으로 컴파일하여 컨텐츠를 한 번의 순회로 검사합니다.
+사전은 위험 표현을 모두 포함할 수 없으므로 판정 결과는 LLM 분석 티어 선택에만 사용합니다.
+위험 표현이 있으면 경량 모델 1차 분석 없이 고성능 모델로 바로 분석하고,
+그 외 컨텐츠는 기존과 같이 경량 모델부터 분석합니다 (사전 미매칭 컨텐츠도 자동 승인하지 않음).
+"""
+import logging
+import re
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.filter_prompts import AMBIGUOUS_PHRASE_LEXICON, RISK_CATEGORIES, RISK_PHRASE_LEXICON, SAFE_ALTERNATIVES
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 판정 결과
+VERDICT_SAFE = "safe"
+VERDICT_RISKY = "risky"
+VERDICT_AMBIGUOUS = "ambiguous"
+
+# SAFE_ALTERNATIVES 표현의 기본 카테고리 (대체 표현 사전은 카테고리 정보가 없음)
+DEFAULT_ALTERNATIVE_CATEGORY = "excessive_confidence"
+
+
+def normalize_text(text: str) -> str:
+    """
+    매칭용 텍스트 정규화
+
+    - NFKC 정규화 (전각 문자, 호환 자모 통일)
+    - 소문자 변환
+    - 공백 제거 (한국어 띄어쓰기 차이 무시: "팔아야 합니다" == "팔아야합니다")
+    """
+    return _WHITESPACE_PATTERN.sub("", unicodedata.normalize("NFKC", text).lower())
+
+
+class AhoCorasickAutomaton:
+    """다중 패턴 문자열 검색 오토마톤 (패턴 수와 무관하게 텍스트 길이에 비례하는 검색 시간)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self.patterns: List[str] = []
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str) -> None:
+        """패턴을 트라이에 추가"""
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _build_failure_links(self) -> None:
+        """BFS로 실패 링크 구성 (실패 노드의 출력도 병합)"""
+        queue = deque(self._goto[0].values())  # 루트 자식의 실패 링크는 루트
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def search(self, text: str) -> List[Tuple[int, str]]:
+        """
+        텍스트에서 모든 패턴 검색
+
+        Returns:
+            [(패턴 끝 위치, 패턴)] - 겹치는 매칭 포함
+        """
+        matches = []
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for index in self._output[node]:
+                matches.append((position, self.patterns[index]))
+        return matches
+
+
+@dataclass
+class PreClassification:
+    """사전 분류 결과"""
+
+    verdict: str  # safe, risky, ambiguous
+    matched_phrases: List[str] = field(default_factory=list)
+    risk_categories: List[str] = field(default_factory=list)
+
+    @property
+    def needs_strong_tier(self) -> bool:
+        """경량 모델 1차 분석을 건너뛰고 고성능 모델로 바로 분석해야 하는지 여부"""
+        return self.verdict == VERDICT_RISKY
+
+
+class SafetyPreClassifier:
+    """위험/애매한 표현 사전 기반 사전 분류기"""
+
+    def __init__(
+        self,
+        risk_lexicon: Optional[Dict[str, List[str]]] = None,
+        ambiguous_phrases: Optional[Iterable[str]] = None,
+        alternatives: Optional[Dict[str, str]] = None,
+    ):
+        risk_lexicon = RISK_PHRASE_LEXICON if risk_lexicon is None else risk_lexicon
+        ambiguous_phrases = AMBIGUOUS_PHRASE_LEXICON if ambiguous_phrases is None else ambiguous_phrases
+        alternatives = SAFE_ALTERNATIVES if alternatives is None else alternatives
+
+        # 정규화된 패턴 → 카테고리 (애매한 표현은 None)
+        self._categories: Dict[str, Optional[str]] = {}
+        for category, phrases in risk_lexicon.items():
+            if category not in RISK_CATEGORIES:
+                logger.warning(f"⚠️ 알 수 없는 위험 카테고리: {category}")
+            for phrase in phrases:
+                self._categories.setdefault(normalize_text(phrase), category)
+        for phrase in alternatives:
+            self._categories.setdefault(normalize_text(phrase), DEFAULT_ALTERNATIVE_CATEGORY)
+        for phrase in ambiguous_phrases:
+            self._categories.setdefault(normalize_text(phrase), None)
+
+        self.automaton = AhoCorasickAutomaton(self._categories)
+
+        self.total = 0
+        self.counts = {VERDICT_SAFE: 0, VERDICT_RISKY: 0, VERDICT_AMBIGUOUS: 0}
+
+    def classify(self, content: str) -> PreClassification:
+        """컨텐츠 사전 분류 (위험 표현 → risky, 투자 행위 용어만 → ambiguous, 없음 → safe) + 통계 기록"""
+        result = self.inspect(content)
+        self.total += 1
+        self.counts[result.verdict] += 1
+        return result
+
+    def inspect(self, content: str) -> PreClassification:
+        """통계 기록 없이 분류 (로컬 재작성 결과 재검사용)"""
+        matched = []
+        categories = []
+        for _, pattern in self.automaton.search(normalize_text(content)):
+            if pattern in matched:
+                continue
+            matched.append(pattern)
+            category = self._categories[pattern]
+            if category and category not in categories:
+                categories.append(category)
+
+        if categories:
+            verdict = VERDICT_RISKY
+        elif matched:
+            verdict = VERDICT_AMBIGUOUS
+        else:
+            verdict = VERDICT_SAFE
+
+        return PreClassification(verdict=verdict, matched_phrases=matched, risk_categories=categories)
+
+    def get_stats(self) -> Dict[str, float]:
+        """사전 분류 통계 (strong_tier_rate: 경량 모델을 건너뛰고 고성능 모델로 보낸 비율)"""
+        return {
+            "patterns": len(self.automaton.patterns),
+            "total": self.total,
+            "safe": self.counts[VERDICT_SAFE],
+            "risky": self.counts[VERDICT_RISKY],
+            "ambiguous": self.counts[VERDICT_AMBIGUOUS],
+            "strong_tier_rate": round(self.counts[VERDICT_RISKY] / self.total, 4) if self.total else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """통계 초기화"""
+        self.total = 0
+        self.counts = {verdict: 0 for verdict in self.counts}
+
+
+# 전역 사전 분류기 인스턴스 (설정의 추가 표현 포함)
+safety_preclassifier = SafetyPreClassifier(
+    ambiguous_phrases=[*AMBIGUOUS_PHRASE_LEXICON, *settings.FILTER_PRECLASSIFIER_EXTRA_PHRASES]
+)
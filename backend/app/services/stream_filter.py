@@ -0,0 +1,205 @@
+"""
+스트리밍 컨텐츠 필터 - 토큰 스트림을 문장/문단 단위 윈도우로 나누어 생성과 동시에 검사
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, AsyncIterator, Dict, Any, List, Optional
+
+from app.core.config import settings
+from app.core.filter_prompts import DISCLAIMER_TEMPLATE
+from .content_filter import ERROR_RISK_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# 문장 종결 부호 뒤 공백 또는 문단 구분(빈 줄)을 윈도우 경계로 사용
+WINDOW_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?。])\s+|\n{2,}")
+
+
+class SentenceWindowBuffer:
+    """토큰을 모아 문장/문단 단위 윈도우로 잘라내는 버퍼"""
+
+    def __init__(self, min_chars: int, max_chars: int):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+
+    def feed(self, token: str) -> List[str]:
+        """토큰을 추가하고 완성된 윈도우 목록을 반환"""
+        self._buffer += token
+        windows = []
+
+        while True:
+            window = self._cut_window()
+            if window is None:
+                break
+            windows.append(window)
+
+        return windows
+
+    def flush(self) -> Optional[str]:
+        """남은 버퍼를 마지막 윈도우로 반환"""
+        window, self._buffer = self._buffer, ""
+        return window if window.strip() else None
+
+    def _cut_window(self) -> Optional[str]:
+        # 최소 길이 이상이 되는 첫 경계에서 자르기
+        for match in WINDOW_BOUNDARY_PATTERN.finditer(self._buffer):
+            if match.end() >= self.min_chars:
+                return self._split_at(match.end())
+
+        # 경계 없이 최대 길이를 넘으면 마지막 공백 기준으로 강제 분할
+        if len(self._buffer) >= self.max_chars:
+            cut = self._buffer.rfind(" ", 0, self.max_chars)
+            return self._split_at(cut + 1 if cut > 0 else self.max_chars)
+
+        return None
+
+    def _split_at(self, position: int) -> str:
+        window, self._buffer = self._buffer[:position], self._buffer[position:]
+        return window
+
+
+@dataclass
+class WindowResult:
+    """윈도우 단위 필터링 결과"""
+
+    text: str  # 분석 대상 본문 (앞뒤 공백 제외)
+    trailing: str  # 원본의 뒤쪽 공백 (출력 시 복원)
+    state: Dict[str, Any]  # ContentFilter.process 결과
+
+
+@dataclass
+class StreamFilterStats:
+    """스트리밍 필터 통계"""
+
+    windows: int = 0
+    replaced: int = 0
+    rejected: int = 0
+    errors: int = 0  # 필터링 자체가 실패한 윈도우 수
+    retry_count: int = 0
+    min_safety_score: float = 1.0
+    risk_categories: List[str] = field(default_factory=list)
+    first_chunk_time: Optional[float] = None
+    processing_time: float = 0.0
+
+
+class StreamingContentFilter:
+    """토큰 스트림에 대해 윈도우 단위로 ContentFilter를 실행하는 스트리밍 필터
+
+    - 안전한 윈도우는 분석이 끝나는 즉시 (순서를 지켜) 그대로 전달
+    - 위험한 윈도우는 대체 컨텐츠로 교체하고, 교체가 있었던 경우 마지막에 면책 조항을 한 번 추가
+    - 차단된 윈도우가 나오면 안내 문구만 전달하고 종료 (남은 분석 취소, 토큰 스트림 종료, 이후 전송 없음)
+    - 윈도우 경계에 걸친 표현도 판정되도록 이전 윈도우 원문을 분석 문맥으로 함께 전달 (판정 대상은 현재 윈도우만)
+    """
+
+    def __init__(
+        self,
+        content_filter,
+        safety_level: str = None,
+        min_chars: int = None,
+        max_chars: int = None,
+        max_concurrency: int = None,
+    ):
+        self.content_filter = content_filter
+        self.safety_level = safety_level
+        self.min_chars = min_chars or settings.FILTER_STREAM_WINDOW_MIN_CHARS
+        self.max_chars = max_chars or settings.FILTER_STREAM_WINDOW_MAX_CHARS
+        self.max_concurrency = max_concurrency or settings.FILTER_STREAM_MAX_CONCURRENCY
+        self.stats = StreamFilterStats()
+
+    async def filter(self, token_stream: AsyncIterator[str]) -> AsyncGenerator[str, None]:
+        """토큰 스트림을 필터링하여 안전한 청크를 순서대로 전달"""
+        start_time = time.time()
+        buffer = SentenceWindowBuffer(self.min_chars, self.max_chars)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending: deque[asyncio.Task] = deque()
+        previous = ""
+
+        try:
+            async for token in token_stream:
+                for window in buffer.feed(token):
+                    pending.append(asyncio.create_task(self._check_window(window, previous, semaphore)))
+                    previous = window
+
+                # 앞쪽부터 분석이 끝난 윈도우를 즉시 전달
+                while pending and pending[0].done():
+                    for chunk in self._release(pending.popleft().result(), start_time):
+                        yield chunk
+                    if self.stats.rejected:
+                        return
+
+            tail = buffer.flush()
+            if tail:
+                pending.append(asyncio.create_task(self._check_window(tail, previous, semaphore)))
+
+            # 생성 종료 후 남은 윈도우를 순서대로 대기
+            while pending:
+                result = await pending.popleft()
+                for chunk in self._release(result, start_time):
+                    yield chunk
+                if self.stats.rejected:
+                    return
+
+            if self.stats.replaced:
+                yield DISCLAIMER_TEMPLATE
+
+        finally:
+            # 차단/중단 시 남은 윈도우 분석을 취소하고 LLM 토큰 생성 종료
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            aclose = getattr(token_stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            self.stats.processing_time = time.time() - start_time
+
+    async def _check_window(self, window: str, previous: str, semaphore: asyncio.Semaphore) -> WindowResult:
+        """윈도우 하나를 ContentFilter로 분석 (previous: 이전 윈도우 원문, 문맥으로만 사용)"""
+        text = window.rstrip()
+        trailing = window[len(text):]
+
+        if not text.strip():
+            return WindowResult(text=text, trailing=trailing, state={"is_safe": True, "filtered_content": text})
+
+        async with semaphore:
+            state = await self.content_filter.process(text, self.safety_level, context=previous.strip())
+
+        return WindowResult(text=text, trailing=trailing, state=state)
+
+    def _release(self, result: WindowResult, start_time: float) -> List[str]:
+        """윈도우 분석 결과를 전송할 청크로 변환"""
+        state = result.state
+        stats = self.stats
+        stats.windows += 1
+        stats.retry_count += state.get("retry_count", 0)
+        stats.min_safety_score = min(stats.min_safety_score, state.get("safety_score", 1.0))
+        for category in state.get("risk_categories", []):
+            if category not in stats.risk_categories:
+                stats.risk_categories.append(category)
+        if ERROR_RISK_CATEGORIES.intersection(state.get("risk_categories", [])):
+            stats.errors += 1
+
+        filtered_content = state.get("filtered_content") or result.text
+
+        if not state.get("is_safe", False):
+            # 차단된 윈도우 - 안내 문구만 전달하고 스트림 종료 (filter()에서 처리)
+            stats.rejected += 1
+            logger.warning(f"스트리밍 윈도우 차단: {state.get('filter_reason', '')}")
+            chunks = [filtered_content + result.trailing]
+
+        elif filtered_content != result.text:
+            # 대체된 윈도우 - 면책 조항은 스트림 마지막에 한 번만 추가
+            stats.replaced += 1
+            chunks = [filtered_content.replace(DISCLAIMER_TEMPLATE, "").rstrip() + result.trailing]
+
+        else:
+            chunks = [result.text + result.trailing]
+
+        if stats.first_chunk_time is None:
+            stats.first_chunk_time = time.time() - start_time
+
+        return chunks
@@ -0,0 +1,278 @@
+"""
+응답 전송 후 부수 작업(세션 메시지 카운트, mem0 대화 저장)을 모아서 백그라운드로 처리하는 write-behind 큐
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.database import db
+from app.crud.crud_chat import crud_chat_sessions
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MessageCountIncrement:
+    """세션 메시지 카운트 증가 작업"""
+
+    session_id: str
+    count: int
+    attempts: int = 0
+
+
+@dataclass
+class MemoryIngestion:
+    """mem0 대화 저장 작업"""
+
+    provider: Any  # mem0_client 또는 mem0_service
+    user_id: str
+    messages: List[dict]
+    session_id: Optional[str]
+    attempts: int = 0
+
+
+@dataclass
+class WriteBehindStats:
+    """write-behind 처리 통계"""
+
+    enqueued: int = 0
+    processed: int = 0
+    retried: int = 0
+    dropped: int = 0
+    inline: int = 0  # 큐를 거치지 않고 즉시 처리된 작업 수
+    batches: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class WriteBehindQueue:
+    """
+    프로세스 내 write-behind 큐
+
+    - 세션별 메시지 카운트 증가는 합산하여 한 트랜잭션으로 커밋
+    - mem0 대화 저장은 사용자/세션별로 묶어 한 번의 add 호출로 처리
+    - 실패한 작업은 지수 백오프 후 max_retries까지 다시 큐에 넣고, 종료 시 남은 작업을 모두 처리
+    - mem0 대화 저장은 add 호출이 멱등하지 않아 (부분 처리 시 메모리 중복) 재시도하지 않고 폐기
+    - 재시도 시 큐가 가득 차 있으면 작업을 폐기하고 통계에 기록
+    - 드레이너가 실행 중이 아니면 (테스트, 워커 등) 호출 시점에 바로 처리
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        flush_interval: float = 0.5,
+        max_retries: int = 3,
+        max_queue_size: int = 1000,
+        retry_backoff: float = 0.5,
+        session_factory: Callable[[], Any] = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.max_queue_size = max_queue_size
+        self.retry_backoff = retry_backoff
+        self._session_factory = session_factory or (lambda: db.session)
+        self._queue: Optional[asyncio.Queue] = None
+        self._drainer: Optional[asyncio.Task] = None
+        self.stats = WriteBehindStats()
+
+    @property
+    def running(self) -> bool:
+        return self._drainer is not None and not self._drainer.done()
+
+    def start(self) -> None:
+        """백그라운드 드레이너 시작 (이벤트 루프 안에서 호출)"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._drainer = asyncio.create_task(self._drain_loop(), name="write_behind_drainer")
+        logger.info("✅ write-behind 큐 시작")
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """드레이너 중지 후 남은 작업 처리"""
+        if not self.running:
+            return
+
+        drainer, self._drainer = self._drainer, None
+        drainer.cancel()
+        try:
+            await drainer
+        except asyncio.CancelledError:
+            pass
+
+        remaining = self._take_all()
+        if remaining:
+            logger.info(f"write-behind 종료 전 남은 작업 처리: {len(remaining)}개")
+            try:
+                await asyncio.wait_for(self._flush_until_done(remaining), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error("❌ write-behind 종료 시간 초과 - 미처리 작업 유실")
+        logger.info("write-behind 큐 종료")
+
+    async def enqueue_message_count(self, session_id: str, count: int) -> None:
+        """세션 메시지 카운트 증가 예약"""
+        await self._enqueue(MessageCountIncrement(session_id=session_id, count=count))
+
+    async def enqueue_memory(
+        self, provider: Any, user_id: str, messages: List[dict], session_id: Optional[str]
+    ) -> None:
+        """mem0 대화 저장 예약"""
+        await self._enqueue(
+            MemoryIngestion(provider=provider, user_id=user_id, messages=messages, session_id=session_id)
+        )
+
+    async def _enqueue(self, item) -> None:
+        if settings.WRITE_BEHIND_ENABLED and self.running:
+            try:
+                self._queue.put_nowait(item)
+                self.stats.enqueued += 1
+                return
+            except asyncio.QueueFull:
+                logger.warning("⚠️ write-behind 큐 가득 참 - 즉시 처리")
+
+        self.stats.inline += 1
+        await self._flush_until_done([item])
+
+    async def _drain_loop(self) -> None:
+        """배치 단위로 큐를 비우는 백그라운드 루프"""
+        while True:
+            batch = [await self._queue.get()]
+            # flush_interval 동안 추가 작업을 모아 한 번에 처리
+            await asyncio.sleep(self.flush_interval)
+            batch.extend(self._take_all(limit=self.batch_size - 1))
+
+            try:
+                failed = await self._flush(batch)
+            except Exception as e:
+                logger.error(f"❌ write-behind 배치 처리 오류: {e}")
+                failed = batch
+
+            retry = self._retryable(failed)
+            if retry:
+                await self._backoff(retry)
+                self._requeue(retry)
+
+    def _requeue(self, items: list) -> None:
+        """재시도 작업을 큐에 다시 넣기 (큐가 가득 차면 폐기)"""
+        for item in items:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.stats.dropped += 1
+                self._record_error(f"write-behind 큐 가득 참 - 재시도 작업 폐기: {type(item).__name__}")
+
+    async def _backoff(self, items: list) -> None:
+        """재시도 전 대기 (시도 횟수에 따른 지수 백오프)"""
+        attempts = max(item.attempts for item in items)
+        await asyncio.sleep(self.retry_backoff * (2 ** (attempts - 1)))
+
+    def _take_all(self, limit: int = None) -> list:
+        items = []
+        while self._queue is not None and not self._queue.empty() and (limit is None or len(items) < limit):
+            items.append(self._queue.get_nowait())
+        return items
+
+    async def _flush_until_done(self, items: list) -> None:
+        """재시도 한도까지 바로 처리 (큐를 거치지 않는 경로)"""
+        while items:
+            try:
+                failed = await self._flush(items)
+            except Exception as e:
+                logger.error(f"❌ write-behind 처리 오류: {e}")
+                failed = items
+            items = self._retryable(failed)
+            if items:
+                await self._backoff(items)
+
+    def _retryable(self, failed: list) -> list:
+        retry = []
+        for item in failed:
+            item.attempts += 1
+            if isinstance(item, MemoryIngestion):
+                # mem0 add는 멱등하지 않으므로 재시도하지 않음 (중복 메모리 방지)
+                self.stats.dropped += 1
+                logger.error("❌ mem0 대화 저장 실패 - 중복 방지를 위해 재시도 없이 폐기")
+            elif item.attempts > self.max_retries:
+                self.stats.dropped += 1
+                logger.error(f"❌ write-behind 작업 재시도 한도 초과 - 폐기: {type(item).__name__}")
+            else:
+                self.stats.retried += 1
+                retry.append(item)
+        return retry
+
+    async def _flush(self, batch: list) -> list:
+        """배치 처리 후 실패한 작업 목록 반환"""
+        self.stats.batches += 1
+        counts = [item for item in batch if isinstance(item, MessageCountIncrement)]
+        memories = [item for item in batch if isinstance(item, MemoryIngestion)]
+
+        failed = []
+        if counts:
+            failed += await self._flush_message_counts(counts)
+        if memories:
+            failed += await self._flush_memories(memories)
+
+        self.stats.processed += len(batch) - len(failed)
+        return failed
+
+    async def _flush_message_counts(self, items: List[MessageCountIncrement]) -> list:
+        """세션별로 합산하여 한 트랜잭션으로 커밋"""
+        totals: Dict[str, int] = defaultdict(int)
+        for item in items:
+            totals[item.session_id] += item.count
+
+        def _commit():
+            with self._session_factory() as session:
+                try:
+                    for session_id, count in totals.items():
+                        crud_chat_sessions.increment_message_count(session=session, session_id=session_id, count=count)
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+
+        try:
+            await asyncio.to_thread(_commit)
+            logger.debug(f"📝 세션 메시지 카운트 반영: {len(totals)}개 세션")
+            return []
+        except Exception as e:
+            self._record_error(f"세션 메시지 카운트 반영 실패: {e}")
+            return items
+
+    async def _flush_memories(self, items: List[MemoryIngestion]) -> list:
+        """사용자/세션별로 메시지를 묶어 mem0에 저장"""
+        groups: Dict[tuple, List[MemoryIngestion]] = defaultdict(list)
+        for item in items:
+            groups[(id(item.provider), item.user_id, item.session_id)].append(item)
+
+        failed = []
+        for group in groups.values():
+            first = group[0]
+            messages = [message for item in group for message in item.messages]
+            try:
+                result = await first.provider.add_conversation_message(
+                    user_id=first.user_id, messages=messages, session_id=first.session_id
+                )
+                if isinstance(result, dict) and result.get("success") is False:
+                    raise RuntimeError(result.get("error"))
+                logger.debug(f"🧠 mem0에 대화 내용 저장 완료: {len(messages)}개 메시지")
+            except Exception as e:
+                self._record_error(f"mem0 대화 저장 실패: {e}")
+                failed += group
+        return failed
+
+    def _record_error(self, message: str) -> None:
+        logger.warning(f"⚠️ {message}")
+        self.stats.errors = (self.stats.errors + [message])[-20:]
+
+
+# 전역 write-behind 큐 인스턴스
+write_behind_queue = WriteBehindQueue(
+    batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+    flush_interval=settings.WRITE_BEHIND_FLUSH_INTERVAL,
+    max_retries=settings.WRITE_BEHIND_MAX_RETRIES,
+    max_queue_size=settings.WRITE_BEHIND_MAX_QUEUE_SIZE,
+    retry_backoff=settings.WRITE_BEHIND_RETRY_BACKOFF,
+)
@@ -2,30 +2,42 @@
 """LLM Client - OpenAI 및 Anthropic API 추상화"""
 
 import logging
-from typing import AsyncGenerator, Dict, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional, Type
 
 from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
 
-from app.core.llm import LLMFactory, LangfuseManager
+from app.core.config import settings
+from app.core.llm import LLMFactory, LLMProviderPool, LangfuseManager, llm_provider_pool
 from app.core.langfuse_factory import LangfuseFactory
+from app.core.llm_router import HedgedLLMRouter, is_pool_failure
 
-# Langfuse observe 데코레이터 임포트
-try:
-    from langfuse import observe
-    LANGFUSE_OBSERVE_AVAILABLE = True
-except ImportError:
-    LANGFUSE_OBSERVE_AVAILABLE = False
-    observe = None
+# Langfuse 추적 데코레이터 (샘플링 적용)
+from app.core.structured_logging import PayloadSummary, attach_log_sink
+from app.core.tracing import LANGFUSE_OBSERVE_AVAILABLE, traced
 
-logger = logging.getLogger(__name__)
+logger = attach_log_sink(logging.getLogger(__name__), "LLM")
+
+# 스트리밍 실패 시 사용자에게 전달하는 안내 메시지
+STREAM_ERROR_MESSAGE = "죄송합니다. 현재 응답을 생성할 수 없습니다. 잠시 후 다시 시도해주세요."
 
 
 class LLMClient:
     """Simple abstraction over OpenAI and Anthropic chat APIs."""
 
-    def __init__(self, user=None, langfuse_manager: Optional[LangfuseManager] = None) -> None:
-        # core 모듈의 LLMFactory 사용 - 공통 로직 재사용
-        self.llm = LLMFactory.create_llm()
+    def __init__(
+        self,
+        user=None,
+        langfuse_manager: Optional[LangfuseManager] = None,
+        provider_type: Optional[str] = None,
+        model: Optional[str] = None,
+        pool: Optional[LLMProviderPool] = None,
+    ) -> None:
+        # core 모듈의 LLMFactory 사용 - 공통 로직 재사용 (provider/model 미지정 시 ACTIVE_LLM_* 설정)
+        self.pool = pool or llm_provider_pool
+        self.llm = LLMFactory.create_llm(provider_type, model, pool=self.pool)
+        # 채팅 풀 모델은 대체 프로바이더 장애 전환/헤징 적용 (필터링 전용 풀은 자체 티어 폴백/재시도 사용)
+        self.router = HedgedLLMRouter.from_settings(self.llm, self.pool) if self.pool is llm_provider_pool else None
         # Langfuse Manager 초기화 (의존성 주입 또는 기본 생성)
         self.langfuse_manager = langfuse_manager or LangfuseFactory.create_app_manager(user)
         # user 정보 저장
@@ -38,11 +50,24 @@ class LLMClient:
         """FilterService 지연 로드"""
         if self._filter_service is None:
             from app.services.filter_service import FilterService
-            self._filter_service = FilterService(user=self.user, langfuse_manager=self.langfuse_manager)
+            # 전역 풀이 아닌 전용 풀을 쓰는 클라이언트는 필터링 모델도 같은 풀에서 생성
+            filter_pool = None if self.pool is llm_provider_pool else self.pool
+            self._filter_service = FilterService(
+                user=self.user, langfuse_manager=self.langfuse_manager, pool=filter_pool
+            )
         return self._filter_service
 
-    def _create_chain(self, messages: List[Dict[str, str]]):
-        """Chain 생성 공통 로직 (DRY 원칙 준수)"""
+    def _report_result(self, error: Optional[BaseException] = None) -> None:
+        """풀 인스턴스 상태 기록 (연속 실패 시 교체, 라우터 사용 시에는 라우터가 실제 호출한 경로별로 기록)"""
+        if self.router is not None:
+            return
+        if error is not None and is_pool_failure(error):
+            self.pool.report_failure(self.llm)
+        else:
+            self.pool.report_success(self.llm)
+
+    def _create_chain(self, messages: List[Dict[str, str]], llm=None):
+        """Chain 생성 공통 로직 (DRY 원칙 준수, llm 미지정 시 라우터 또는 기본 LLM)"""
         # Langfuse input 추적을 위해 템플릿 변수 방식 사용
         if len(messages) == 1:
             # 단일 메시지인 경우
@@ -52,7 +77,7 @@ class LLMClient:
             prompt = ChatPromptTemplate.from_template(
                 "Previous conversation:\n{conversation_history}\n\nUser: {user_input}"
             )
-        return prompt | self.llm
+        return prompt | (llm or self.router or self.llm)
 
     def _prepare_input_data(self, messages: List[Dict[str, str]]) -> Dict[str, str]:
         """메시지를 Langfuse input 형태로 변환"""
@@ -78,9 +103,24 @@ class LLMClient:
             conversation_history = "\n".join(history_parts)
             return {"conversation_history": conversation_history, "user_input": user_input}
 
-    @observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
+    def _log_call_start(self, method: str, messages: List[Dict[str, str]], input_data: Dict[str, str]) -> None:
+        """
+        호출 시작 로깅 (대화 이력 전체 대신 길이/해시/미리보기만 DEBUG로 기록)
+
+        포맷팅은 로그가 실제로 기록될 때만 수행되고, 출력은 공용 로그 싱크의 백그라운드 스레드에서 처리됩니다.
+        """
+        logger.info(
+            "🚀 %s 시작 | 메시지: %d개 | 사용자: %s | 세션: %s",
+            method,
+            len(messages),
+            self.langfuse_manager.user_id,
+            self.langfuse_manager.session_id,
+        )
+        logger.debug("📝 %s 입력 | %s", method, PayloadSummary(input_data))
+
+    @traced("llm_stream_chat")
     async def stream_chat_observed(self, messages: List[Dict[str, str]]) -> AsyncGenerator[str, None]:
-        """@observe() 데코레이터를 사용한 스트리밍 채팅"""
+        """@traced() 데코레이터(샘플링된 observe)를 사용한 스트리밍 채팅"""
         if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
             # trace 메타데이터 설정
             self.langfuse_manager.update_current_trace(
@@ -92,9 +132,7 @@ class LLMClient:
         input_data = self._prepare_input_data(messages)
         config = self.langfuse_manager.get_callback_config()
 
-        print(f"🚀 Backend stream_chat_observed 시작: {len(messages)}개 메시지")
-        print(f"📝 Input data: {input_data}")
-        print(f"👤 User ID: {self.langfuse_manager.user_id}, Session ID: {self.langfuse_manager.session_id}")
+        self._log_call_start("stream_chat_observed", messages, input_data)
 
         async for chunk in chain.astream(input_data, config=config):
             if chunk.content:
@@ -103,10 +141,20 @@ class LLMClient:
         if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
             self.langfuse_manager.update_current_trace(output_data={"status": "completed"})
 
-        print(f"📊 Backend stream_chat_observed 완료 - Langfuse 추적됨")
+        logger.info("📊 %s 완료", "stream_chat_observed")
 
     async def stream_chat(self, messages: List[Dict[str, str]]) -> AsyncGenerator[str, None]:
         """Yield assistant message chunks using LCEL."""
+        try:
+            async for chunk in self._stream_chat(messages):
+                yield chunk
+        except Exception as e:
+            self._report_result(e)
+            raise
+        self._report_result()
+
+    async def _stream_chat(self, messages: List[Dict[str, str]]) -> AsyncGenerator[str, None]:
+        """스트리밍 채팅 실행 (observe 사용 여부에 따라 분기)"""
         # @observe() 데코레이터가 사용 가능한 경우 새로운 메서드 사용
         if LANGFUSE_OBSERVE_AVAILABLE:
             async for chunk in self.stream_chat_observed(messages):
@@ -118,15 +166,13 @@ class LLMClient:
         input_data = self._prepare_input_data(messages)
         config = self.langfuse_manager.get_callback_config()
 
-        print(f"🚀 Backend stream_chat 시작: {len(messages)}개 메시지")
-        print(f"📝 Input data: {input_data}")
-        print(f"👤 User ID: {self.langfuse_manager.user_id}, Session ID: {self.langfuse_manager.session_id}")
+        self._log_call_start("stream_chat", messages, input_data)
 
         async for chunk in chain.astream(input_data, config=config):
             if chunk.content:
                 yield chunk.content
 
-        print(f"📊 Backend stream_chat 완료 - Langfuse 추적됨")
+        logger.info("📊 %s 완료", "stream_chat")
 
     async def stream_chat_with_filter(
         self, messages: List[Dict[str, str]], safety_level: str = None, chunk_size: int = 50
@@ -137,14 +183,20 @@ class LLMClient:
         Args:
             messages: 대화 메시지들
             safety_level: 안전 수준 (strict/moderate/permissive)
-            chunk_size: 스트리밍 청크 크기
+            chunk_size: 스트리밍 청크 크기 (FILTER_STREAMING_ENABLED=False인 경우)
         """
         try:
-            print(f"🛡️ 필터링 적용된 스트리밍 시작: {len(messages)}개 메시지")
+            logger.info("🛡️ 필터링 적용된 스트리밍 시작 | 메시지: %d개", len(messages))
+
+            # 스트리밍 필터 모드: 생성과 동시에 윈도우 단위로 검사하여 전달
+            if settings.FILTER_STREAMING_ENABLED:
+                async for chunk in self.filter_service.filter_stream(self.stream_chat(messages), safety_level):
+                    yield chunk
+                return
 
             # 1. 전체 응답 생성
             full_response = await self.chat(messages)
-            print(f"📝 원본 응답 생성 완료: {len(full_response)}글자")
+            logger.info("📝 원본 응답 생성 완료 | 길이: %d자", len(full_response))
 
             # 2. 필터링 적용
             filter_result = await self.filter_service.filter_response(full_response, safety_level)
@@ -153,28 +205,28 @@ class LLMClient:
 
             # 3. 필터링 결과 로깅
             if filter_result["filtered"]:
-                print(
-                    f"⚠️ 컨텐츠 필터링됨: score={filter_result['safety_score']}, " f"reason={filter_result['filter_reason']}"
+                logger.warning(
+                    "⚠️ 컨텐츠 필터링됨 | 안전도: %s | 사유: %s", filter_result["safety_score"], filter_result["filter_reason"]
                 )
             else:
-                print(f"✅ 컨텐츠 안전 확인: score={filter_result['safety_score']}")
+                logger.info("✅ 컨텐츠 안전 확인 | 안전도: %s", filter_result["safety_score"])
 
             # 4. 필터링된 컨텐츠를 청크 단위로 스트리밍
             for i in range(0, len(filtered_content), chunk_size):
                 chunk = filtered_content[i : i + chunk_size]
                 yield chunk
 
-            print(f"🎯 필터링된 스트리밍 완료: {len(filtered_content)}글자 전송")
+            logger.info("🎯 필터링된 스트리밍 완료 | 전송: %d자", len(filtered_content))
 
         except Exception as e:
-            print(f"❌ 필터링된 스트리밍 오류: {e}")
+            logger.error("❌ 필터링된 스트리밍 오류: %s", e)
+            self.filter_service.last_error = True
             # 오류 발생시 안전한 메시지 반환
-            error_message = "죄송합니다. 현재 응답을 생성할 수 없습니다. 잠시 후 다시 시도해주세요."
-            yield error_message
+            yield STREAM_ERROR_MESSAGE
 
-    @observe() if LANGFUSE_OBSERVE_AVAILABLE else lambda func: func
+    @traced("llm_chat")
     async def chat_observed(self, messages: List[Dict[str, str]]) -> str:
-        """@observe() 데코레이터를 사용한 채팅"""
+        """@traced() 데코레이터(샘플링된 observe)를 사용한 채팅"""
         if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
             # trace 메타데이터 설정
             self.langfuse_manager.update_current_trace(
@@ -186,21 +238,29 @@ class LLMClient:
         input_data = self._prepare_input_data(messages)
         config = self.langfuse_manager.get_callback_config()
 
-        print(f"🚀 Backend chat_observed 시작: {len(messages)}개 메시지")
-        print(f"📝 Input data: {input_data}")
-        print(f"👤 User ID: {self.langfuse_manager.user_id}, Session ID: {self.langfuse_manager.session_id}")
+        self._log_call_start("chat_observed", messages, input_data)
 
         result = await chain.ainvoke(input_data, config=config)
 
         if LANGFUSE_OBSERVE_AVAILABLE and self.langfuse_manager:
             self.langfuse_manager.update_current_trace(output_data={"status": "completed"})
 
-        print(f"📊 Backend chat_observed 완료 - Langfuse 추적됨")
+        logger.info("📊 %s 완료", "chat_observed")
 
         return result.content if hasattr(result, "content") else str(result)
 
     async def chat(self, messages: List[Dict[str, str]]) -> str:
         """Return full assistant message."""
+        try:
+            result = await self._chat(messages)
+        except Exception as e:
+            self._report_result(e)
+            raise
+        self._report_result()
+        return result
+
+    async def _chat(self, messages: List[Dict[str, str]]) -> str:
+        """채팅 실행 (observe 사용 여부에 따라 분기)"""
         # @observe() 데코레이터가 사용 가능한 경우 새로운 메서드 사용
         if LANGFUSE_OBSERVE_AVAILABLE:
             return await self.chat_observed(messages)
@@ -210,16 +270,36 @@ class LLMClient:
         input_data = self._prepare_input_data(messages)
         config = self.langfuse_manager.get_callback_config()
 
-        print(f"🚀 Backend chat 시작: {len(messages)}개 메시지")
-        print(f"📝 Input data: {input_data}")
-        print(f"👤 User ID: {self.langfuse_manager.user_id}, Session ID: {self.langfuse_manager.session_id}")
+        self._log_call_start("chat", messages, input_data)
 
         result = await chain.ainvoke(input_data, config=config)
 
-        print(f"📊 Backend chat 완료 - Langfuse 추적됨")
+        logger.info("📊 %s 완료", "chat")
 
         return result.content if hasattr(result, "content") else str(result)
 
+    async def chat_structured(self, messages: List[Dict[str, str]], schema: Type[BaseModel]) -> BaseModel:
+        """
+        구조화 출력 채팅 - provider 네이티브 tool calling으로 schema 형태의 응답을 받아 Pydantic 검증
+        (라우터가 있으면 chat과 같이 장애 전환/헤징 적용)
+
+        Raises:
+            OutputParserException, ValidationError: 응답이 schema와 맞지 않는 경우
+        """
+        structured_llm = (self.router or self.llm).with_structured_output(schema, method="function_calling")
+        chain = self._create_chain(messages, structured_llm)
+        input_data = self._prepare_input_data(messages)
+        config = self.langfuse_manager.get_callback_config()
+
+        try:
+            result = await chain.ainvoke(input_data, config=config)
+        except Exception as e:
+            # 응답 형식 오류(OutputParserException, ValidationError)는 인스턴스 실패로 집계하지 않음
+            self._report_result(e)
+            raise
+        self._report_result()
+        return result
+
     async def check_content_safety(self, content: str) -> Dict[str, any]:
         """
         컨텐츠 안전성만 검사 (필터링 없이)
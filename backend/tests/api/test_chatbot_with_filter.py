@@ -84,6 +84,7 @@ class TestChatbotWithFilter:
             "impact": "HIGH",
             "source": "FRED",
             "release_id": "CPILFESL",
+            "updated_at": "2024-01-01 00:00:00",
         }
         mock_get_event.return_value = type("Event", (), mock_event)
 
@@ -106,6 +107,47 @@ class TestChatbotWithFilter:
         content = response.text
         assert "소비자물가지수는 경제의 중요한 지표입니다." in content
 
+    @patch("app.crud.crud_events.crud_events.get")
+    @patch("app.api.v1.chatbot.LLMClient")
+    def test_explain_event_uses_cache(
+        self, mock_llm_client, mock_get_event, client, session, mock_firebase_token, auth_headers
+    ):
+        """같은 이벤트 설명 재요청 시 캐시된 설명을 전송해야 함"""
+        from app.services.response_cache import event_explain_cache
+
+        event_explain_cache.backend.clear()
+
+        # Given: 사용자 및 이벤트
+        uid = mock_firebase_token.return_value.get("uid")
+        crud_users.create(session, obj_in=UsersCreate(uid=uid, name="test-name", email="test-email"))
+        session.commit()
+
+        mock_event = {
+            "id": 2,
+            "title": "고용보고서",
+            "description": "비농업 고용 변동",
+            "date": "2024-02-02",
+            "impact": "HIGH",
+            "source": "FRED",
+            "release_id": "PAYEMS",
+            "updated_at": "2024-01-01 00:00:00",
+        }
+        mock_get_event.return_value = type("Event", (), mock_event)
+
+        mock_llm_instance = mock_llm_client.return_value
+        mock_llm_instance.stream_chat_with_filter = MagicMock()
+        mock_llm_instance.stream_chat_with_filter.return_value.__aiter__.return_value = ["고용보고서는 ", "중요합니다."]
+
+        request_data = {"id": 2, "safety_level": "strict"}
+
+        # When: 같은 이벤트 설명 두 번 요청
+        first = client.post("/api/v1/chatbot/event/explain?use_filter=true", json=request_data, headers=auth_headers)
+        second = client.post("/api/v1/chatbot/event/explain?use_filter=true", json=request_data, headers=auth_headers)
+
+        # Then: 두 번째 요청은 LLM 호출 없이 같은 설명 전송
+        assert first.text == second.text == "고용보고서는 중요합니다."
+        mock_llm_instance.stream_chat_with_filter.assert_called_once()
+
     @patch("app.services.filter_service.FilterService.check_safety_only")
     @patch("app.utils.llm_client.LLMFactory.create_llm")
     def test_safety_check_endpoint(
@@ -143,6 +185,53 @@ class TestChatbotWithFilter:
         assert result["analysis_only"] is True
         assert mock_llm.call_count > 0
 
+    @patch("app.services.filter_service.FilterService.check_safety_batch")
+    @patch("app.utils.llm_client.LLMFactory.create_llm")
+    def test_safety_check_batch_endpoint(
+        self, mock_llm, mock_safety_batch, client, session, mock_firebase_token, auth_headers
+    ):
+        """컨텐츠 안전성 일괄 검사 API 테스트"""
+        # Given: 사용자 생성
+        uid = mock_firebase_token.return_value.get("uid")
+        crud_users.create(session, obj_in=UsersCreate(uid=uid, name="test-name", email="test-email"))
+        session.commit()
+
+        safe = {"is_safe": True, "safety_score": 0.95, "risk_categories": [], "filter_reason": "", "analysis_only": True}
+        unsafe = {
+            "is_safe": False,
+            "safety_score": 0.3,
+            "risk_categories": ["investment_advice"],
+            "filter_reason": "투자 권유",
+            "analysis_only": True,
+        }
+        mock_safety_batch.return_value = [safe, unsafe, safe]
+
+        request_data = {"contents": ["금리 설명", "지금 사세요!", "금리 설명"]}
+
+        # When: API 호출
+        response = client.post("/api/v1/chatbot/safety/check/batch", json=request_data, headers=auth_headers)
+
+        # Then: 요청 순서대로 결과 반환
+        assert response.status_code == status.HTTP_200_OK
+
+        result = response.json()
+        assert [item["is_safe"] for item in result["results"]] == [True, False, True]
+        assert result["total_count"] == 3
+        assert result["unique_count"] == 2
+
+    def test_safety_check_batch_limit(self, client, session, mock_firebase_token, auth_headers):
+        """일괄 검사 최대 건수 초과 테스트"""
+        uid = mock_firebase_token.return_value.get("uid")
+        crud_users.create(session, obj_in=UsersCreate(uid=uid, name="test-name", email="test-email"))
+        session.commit()
+
+        with patch("app.api.v1.chatbot.settings.FILTER_BATCH_MAX_CONTENTS", 2):
+            response = client.post(
+                "/api/v1/chatbot/safety/check/batch", json={"contents": ["a", "b", "c"]}, headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     @patch("app.utils.llm_client.LLMFactory.create_llm")
     def test_filter_status_endpoint(self, mock_llm, client, session, mock_firebase_token, auth_headers):
         """필터링 시스템 상태 조회 API 테스트"""
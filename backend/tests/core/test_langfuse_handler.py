@@ -0,0 +1,57 @@
+"""
+공유 Langfuse CallbackHandler 테스트
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.core.langfuse_factory import LangfuseFactory
+from app.core.llm import get_shared_langfuse_handler, reset_shared_langfuse_handler
+
+
+@pytest.fixture
+def handler_class():
+    """키가 설정된 환경에서 CallbackHandler 생성 횟수 추적"""
+    handler_class = MagicMock(side_effect=lambda: object())
+    reset_shared_langfuse_handler()
+    with patch("app.core.llm.LANGFUSE_AVAILABLE", True), patch("app.core.llm.CallbackHandler", handler_class), patch(
+        "app.core.llm.settings.LANGFUSE_PUBLIC_KEY", "pk-test"
+    ), patch("app.core.llm.settings.LANGFUSE_SECRET_KEY", "sk-test"), patch.dict("os.environ"):
+        yield handler_class
+    reset_shared_langfuse_handler()
+
+
+class TestSharedLangfuseHandler:
+    """요청별 LangfuseManager가 프로세스 전역 handler를 공유하는지 테스트"""
+
+    def test_managers_share_one_handler(self, handler_class):
+        first = LangfuseFactory.create_app_manager(session_id="s1")
+        second = LangfuseFactory.create_background_manager()
+
+        assert handler_class.call_count == 1
+        assert first.handler is second.handler is get_shared_langfuse_handler()
+
+    def test_request_metadata_goes_through_callback_config(self, handler_class):
+        user = MagicMock(uid="user-1", email="a@b.c", name="홍길동")
+        first = LangfuseFactory.create_app_manager(user=user, session_id="s1").get_callback_config()
+        second = LangfuseFactory.create_app_manager(session_id="s2").get_callback_config({"step": "filter"})
+
+        assert first["callbacks"] == second["callbacks"]
+        assert first["metadata"] == {
+            "service": "backend_chatbot",
+            "langfuse_session_id": "s1",
+            "langfuse_user_id": "user-1",
+        }
+        assert second["metadata"] == {"service": "backend_chatbot", "langfuse_session_id": "s2", "step": "filter"}
+
+    def test_missing_keys_are_resolved_once(self):
+        reset_shared_langfuse_handler()
+        handler_class = MagicMock()
+        with patch("app.core.llm.LANGFUSE_AVAILABLE", True), patch("app.core.llm.CallbackHandler", handler_class), patch(
+            "app.core.llm.settings.LANGFUSE_PUBLIC_KEY", ""
+        ):
+            managers = [LangfuseFactory.create_app_manager() for _ in range(3)]
+        reset_shared_langfuse_handler()
+
+        handler_class.assert_not_called()
+        assert all(manager.handler is None for manager in managers)
+        assert managers[0].get_callback_config() == {}
@@ -0,0 +1,153 @@
+"""
+LLM 인스턴스 풀 테스트
+"""
+import pytest
+from unittest.mock import patch
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+from app.core.llm import LLMFactory, LLMProviderPool
+from app.utils.llm_client import LLMClient
+
+
+class TestLLMProviderPool:
+    """LLMProviderPool 테스트"""
+
+    def test_same_key_reuses_instance(self):
+        pool = LLMProviderPool(max_size=4)
+        key = LLMProviderPool.make_key("OpenAIProvider", "gpt-4o", 0, {"timeout": 10})
+
+        first = pool.get_or_create(key, object)
+        second = pool.get_or_create(key, object)
+
+        assert first is second
+        assert pool.get_stats()["hits"] == 1
+        assert pool.get_stats()["misses"] == 1
+
+    def test_kwargs_order_does_not_change_key(self):
+        first = LLMProviderPool.make_key("OpenAIProvider", "gpt-4o", 0, {"a": 1, "b": 2})
+        second = LLMProviderPool.make_key("OpenAIProvider", "gpt-4o", 0, {"b": 2, "a": 1})
+        other = LLMProviderPool.make_key("OpenAIProvider", "gpt-4o", 0.5, {"a": 1, "b": 2})
+
+        assert first == second
+        assert first != other
+
+    def test_max_size_evicts_least_recently_used(self):
+        pool = LLMProviderPool(max_size=2)
+        key_a, key_b, key_c = (LLMProviderPool.make_key("p", model, 0, {}) for model in ("a", "b", "c"))
+
+        llm_a = pool.get_or_create(key_a, object)
+        pool.get_or_create(key_b, object)
+        pool.get_or_create(key_a, object)  # a를 최근 사용으로 갱신
+        pool.get_or_create(key_c, object)  # b 제거
+
+        assert pool.get_or_create(key_a, object) is llm_a
+        assert pool.get_stats()["size"] == 2
+        assert pool.get_stats()["evictions"] == 1
+
+    def test_consecutive_failures_evict_instance(self):
+        pool = LLMProviderPool(max_size=4, max_failures=2)
+        key = LLMProviderPool.make_key("p", "m", 0, {})
+        llm = pool.get_or_create(key, object)
+
+        pool.report_failure(llm)
+        pool.report_success(llm)  # 성공 시 연속 실패 초기화
+        pool.report_failure(llm)
+        assert pool.get_or_create(key, object) is llm
+
+        pool.report_failure(llm)
+        assert pool.get_or_create(key, object) is not llm
+
+    def test_unknown_instance_is_ignored(self):
+        pool = LLMProviderPool()
+
+        pool.report_failure(object())
+        pool.report_success(object())
+
+        assert pool.get_stats()["size"] == 0
+
+
+class TestLLMFactoryPooling:
+    """LLMFactory 풀 연동 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clean_pool(self):
+        LLMFactory.pool.clear()
+        yield
+        LLMFactory.pool.clear()
+
+    def test_create_llm_returns_shared_instance(self):
+        with patch("app.core.llm.OpenAIProvider.create_llm", side_effect=lambda: object()):
+            first = LLMFactory.create_llm("openai", "gpt-4o-mini")
+            second = LLMFactory.create_llm("openai", "gpt-4o-mini")
+            other = LLMFactory.create_llm("openai", "gpt-4o-mini", temperature=0.7)
+
+        assert first is second
+        assert first is not other
+
+    def test_pool_disabled_creates_new_instance(self):
+        with patch("app.core.llm.OpenAIProvider.create_llm", side_effect=lambda: object()), patch(
+            "app.core.llm.settings.LLM_POOL_ENABLED", False
+        ):
+            assert LLMFactory.create_llm("openai", "gpt-4o-mini") is not LLMFactory.create_llm("openai", "gpt-4o-mini")
+
+    @pytest.mark.asyncio
+    async def test_llm_client_reports_failures(self):
+        with patch("app.core.llm.OpenAIProvider.create_llm", side_effect=lambda: object()), patch(
+            "app.utils.llm_client.LangfuseFactory"
+        ):
+            client = LLMClient()
+
+        with patch.object(LLMClient, "_chat", side_effect=Exception("503")), patch.object(
+            LLMFactory.pool, "report_failure"
+        ) as report_failure:
+            with pytest.raises(Exception):
+                await client.chat([{"role": "user", "content": "질문"}])
+
+        report_failure.assert_called_once_with(client.llm)
+
+    @pytest.mark.asyncio
+    async def test_llm_client_leaves_reporting_to_router(self):
+        """라우터 사용 시 기본 인스턴스가 아닌 실제 호출 경로별로 라우터가 기록해야 함"""
+        with patch("app.core.llm.OpenAIProvider.create_llm", side_effect=lambda: object()), patch(
+            "app.utils.llm_client.LangfuseFactory"
+        ):
+            client = LLMClient()
+        client.router = object()
+
+        with patch.object(LLMClient, "_chat", side_effect=Exception("503")), patch.object(
+            LLMFactory.pool, "report_failure"
+        ) as report_failure:
+            with pytest.raises(Exception):
+                await client.chat([{"role": "user", "content": "질문"}])
+
+        report_failure.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_structured_parse_error_is_not_pool_failure(self):
+        """응답 형식 오류는 인스턴스 실패로 집계하지 않아야 함 (전송 오류만 집계)"""
+
+        def _invalid(_):
+            raise OutputParserException("schema 불일치")
+
+        class FakeStructuredLLM:
+            def with_structured_output(self, schema, **kwargs):
+                return RunnableLambda(_invalid)
+
+        class Output(BaseModel):
+            value: int
+
+        with patch("app.core.llm.OpenAIProvider.create_llm", side_effect=FakeStructuredLLM), patch(
+            "app.utils.llm_client.LangfuseFactory"
+        ):
+            client = LLMClient()
+        client.router = None
+        client.langfuse_manager.get_callback_config.return_value = {}
+
+        with patch.object(LLMFactory.pool, "report_failure") as report_failure:
+            with pytest.raises(OutputParserException):
+                await client.chat_structured([{"role": "user", "content": "질문"}], Output)
+
+        report_failure.assert_not_called()
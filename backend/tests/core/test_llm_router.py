@@ -0,0 +1,270 @@
+"""
+LLM 프로바이더 장애 전환/헤징 라우터 테스트 (로컬 가짜 프로바이더 2개 사용)
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.core.llm_router import (
+    HedgedLLMRouter,
+    LLMRoute,
+    ProviderLatencyTracker,
+    RouterMetrics,
+    is_retryable_error,
+)
+
+
+class FakeStatusError(Exception):
+    """프로바이더 SDK의 상태 코드 오류 대용"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class FakeProvider:
+    """지연/오류를 설정할 수 있는 가짜 채팅 모델"""
+
+    def __init__(self, name: str, latency: float = 0.0, error: Exception = None):
+        self.name = name
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+        self.closed = 0
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return AIMessage(content=f"{self.name} 응답")
+
+    def with_structured_output(self, schema, **kwargs):
+        return FakeProvider(f"{self.name}:{schema}", self.latency, self.error)
+
+    async def astream(self, input, config=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+            if self.error:
+                raise self.error
+            for part in (self.name, " 스트림", " 응답"):
+                yield AIMessageChunk(content=part)
+        finally:
+            self.closed += 1
+
+
+class FakePool:
+    """report_success/report_failure 호출 기록용 풀"""
+
+    def __init__(self):
+        self.reports = []
+
+    def report_success(self, llm):
+        self.reports.append((llm.name, "success"))
+
+    def report_failure(self, llm):
+        self.reports.append((llm.name, "failure"))
+
+
+@pytest.fixture(autouse=True)
+def hedge_settings():
+    with patch("app.core.llm_router.settings.LLM_HEDGE_DEFAULT_DELAY", 0.05), patch(
+        "app.core.llm_router.settings.LLM_HEDGE_MIN_DELAY", 0.01
+    ), patch("app.core.llm_router.settings.LLM_LATENCY_MIN_SAMPLES", 5):
+        yield
+
+
+def _router(primary: FakeProvider, alternate: FakeProvider, pool: FakePool = None, **kwargs) -> HedgedLLMRouter:
+    return HedgedLLMRouter(
+        LLMRoute("openai/primary", primary, pool),
+        LLMRoute("anthropic/alternate", alternate, pool),
+        tracker=ProviderLatencyTracker(window=50),
+        metrics=RouterMetrics(),
+        **kwargs,
+    )
+
+
+async def _collect(stream) -> str:
+    return "".join([chunk.content async for chunk in stream])
+
+
+class TestRetryableError:
+    """전환 대상 오류 판별 테스트"""
+
+    def test_status_codes(self):
+        assert is_retryable_error(FakeStatusError(429))
+        assert is_retryable_error(FakeStatusError(503))
+        assert not is_retryable_error(FakeStatusError(400))
+        assert not is_retryable_error(ValueError("bad input"))
+
+    def test_connection_errors(self):
+        assert is_retryable_error(ConnectionError("reset"))
+        assert is_retryable_error(asyncio.TimeoutError())
+
+
+class TestHedgedInvoke:
+    """ainvoke 헤징/장애 전환 테스트"""
+
+    def test_fast_primary_is_not_hedged(self):
+        primary, alternate = FakeProvider("primary"), FakeProvider("alternate")
+        router = _router(primary, alternate)
+
+        assert asyncio.run(router.ainvoke("질문")).content == "primary 응답"
+        assert alternate.calls == 0
+        assert router.metrics.get_stats()["hedged"] == 0
+
+    def test_slow_primary_is_hedged(self):
+        primary, alternate = FakeProvider("primary", latency=1.0), FakeProvider("alternate")
+        router = _router(primary, alternate)
+
+        assert asyncio.run(router.ainvoke("질문")).content == "alternate 응답"
+        assert primary.cancelled == 1
+        assert router.metrics.get_stats()["hedge_wins"] == 1
+
+    def test_hedged_primary_can_still_win(self):
+        primary, alternate = FakeProvider("primary", latency=0.08), FakeProvider("alternate", latency=1.0)
+        router = _router(primary, alternate)
+
+        assert asyncio.run(router.ainvoke("질문")).content == "primary 응답"
+        assert alternate.cancelled == 1
+        assert router.metrics.get_stats()["hedge_wins"] == 0
+
+    def test_hedging_disabled(self):
+        primary, alternate = FakeProvider("primary", latency=0.08), FakeProvider("alternate")
+        router = _router(primary, alternate, hedge_enabled=False)
+
+        assert asyncio.run(router.ainvoke("질문")).content == "primary 응답"
+        assert alternate.calls == 0
+
+    @pytest.mark.parametrize("status_code", [429, 500, 503])
+    def test_failover_on_retryable_status(self, status_code):
+        primary = FakeProvider("primary", error=FakeStatusError(status_code))
+        alternate = FakeProvider("alternate")
+        router = _router(primary, alternate)
+
+        assert asyncio.run(router.ainvoke("질문")).content == "alternate 응답"
+        assert router.metrics.get_stats()["failovers"] == 1
+
+    def test_client_error_is_not_failed_over(self):
+        primary, alternate = FakeProvider("primary", error=FakeStatusError(400)), FakeProvider("alternate")
+        router = _router(primary, alternate)
+
+        with pytest.raises(FakeStatusError):
+            asyncio.run(router.ainvoke("질문"))
+        assert alternate.calls == 0
+
+    def test_both_fail_raises_primary_error(self):
+        primary = FakeProvider("primary", latency=0.08, error=FakeStatusError(503))
+        alternate = FakeProvider("alternate", error=FakeStatusError(529))
+        router = _router(primary, alternate)
+
+        with pytest.raises(FakeStatusError) as exc_info:
+            asyncio.run(router.ainvoke("질문"))
+        assert exc_info.value.status_code == 503
+
+    def test_hedge_delay_follows_observed_latency(self):
+        router = _router(FakeProvider("primary"), FakeProvider("alternate"))
+        assert router.hedge_delay("invoke") == 0.05  # 표본 부족: 기본값
+
+        for latency in (0.1, 0.2, 0.3, 0.4, 2.0):
+            router.tracker.record("openai/primary", "invoke", latency)
+
+        assert router.hedge_delay("invoke") == 2.0
+        assert router.hedge_delay("first_chunk") == 0.05
+
+
+    def test_structured_output_keeps_failover(self):
+        pool = FakePool()
+        primary = FakeProvider("primary", error=FakeStatusError(503))
+        router = _router(primary, FakeProvider("alternate"), pool)
+        structured = router.with_structured_output("Schema", method="function_calling")
+
+        assert asyncio.run(structured.ainvoke("질문")).content == "alternate:Schema 응답"
+        assert structured.primary.name == "openai/primary"
+        assert structured.tracker is router.tracker and structured.metrics is router.metrics
+        assert router.metrics.get_stats()["failovers"] == 1
+        # 구조화 출력 래퍼가 아닌 원본 풀 인스턴스로 기록
+        assert pool.reports == [("primary", "failure"), ("alternate", "success")]
+
+    def test_results_are_reported_per_route(self):
+        pool = FakePool()
+        router = _router(FakeProvider("primary", error=FakeStatusError(503)), FakeProvider("alternate"), pool)
+
+        asyncio.run(router.ainvoke("질문"))
+
+        assert pool.reports == [("primary", "failure"), ("alternate", "success")]
+
+    def test_hedge_loser_is_not_reported(self):
+        pool = FakePool()
+        router = _router(FakeProvider("primary", latency=1.0), FakeProvider("alternate"), pool)
+
+        asyncio.run(router.ainvoke("질문"))
+
+        assert pool.reports == [("alternate", "success")]
+
+    def test_cancelled_primary_latency_is_recorded(self):
+        """헤지에서 져서 취소된 기본 프로바이더 호출도 경과 시간(하한값)을 표본에 남겨야 함"""
+        router = _router(FakeProvider("primary", latency=1.0), FakeProvider("alternate", latency=0.05))
+
+        asyncio.run(router.ainvoke("질문"))
+
+        stats = router.tracker.get_stats()
+        assert stats["openai/primary:invoke"]["samples"] == 1
+        assert stats["openai/primary:invoke"]["p50"] >= 0.1  # 헤지 지연 + 대체 응답 시간 이상
+
+
+class TestHedgedStream:
+    """astream 헤징/장애 전환 테스트"""
+
+    def test_slow_first_chunk_is_hedged(self):
+        primary, alternate = FakeProvider("primary", latency=1.0), FakeProvider("alternate")
+        router = _router(primary, alternate)
+
+        assert asyncio.run(_collect(router.astream("질문"))) == "alternate 스트림 응답"
+        assert primary.closed == alternate.closed == 1
+        assert router.metrics.get_stats()["hedge_wins"] == 1
+
+    def test_failover_before_first_chunk(self):
+        primary = FakeProvider("primary", error=FakeStatusError(429))
+        alternate = FakeProvider("alternate")
+        router = _router(primary, alternate)
+
+        assert asyncio.run(_collect(router.astream("질문"))) == "alternate 스트림 응답"
+        assert router.metrics.get_stats()["failovers"] == 1
+
+    def test_stream_results_are_reported_per_route(self):
+        pool = FakePool()
+        router = _router(FakeProvider("primary", error=FakeStatusError(429)), FakeProvider("alternate"), pool)
+
+        asyncio.run(_collect(router.astream("질문")))
+
+        assert pool.reports == [("primary", "failure"), ("alternate", "success")]
+
+    def test_cancelled_first_chunk_latency_is_recorded(self):
+        router = _router(FakeProvider("primary", latency=1.0), FakeProvider("alternate"))
+
+        asyncio.run(_collect(router.astream("질문")))
+
+        assert router.tracker.get_stats()["openai/primary:first_chunk"]["samples"] == 1
+
+
+class TestRouterInChain:
+    """prompt | router 체인에서 LLM 대신 사용"""
+
+    def test_chain_invoke_and_stream(self):
+        primary, alternate = FakeProvider("primary", error=FakeStatusError(503)), FakeProvider("alternate")
+        chain = ChatPromptTemplate.from_template("{user_input}") | _router(primary, alternate)
+
+        async def run():
+            return (await chain.ainvoke({"user_input": "질문"})).content, await _collect(chain.astream({"user_input": "질문"}))
+
+        assert asyncio.run(run()) == ("alternate 응답", "alternate 스트림 응답")
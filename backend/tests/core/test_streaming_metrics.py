@@ -0,0 +1,102 @@
+"""
+고정 메모리 스트리밍 메트릭 테스트
+"""
+import random
+
+import pytest
+
+from app.core.filter_logger import FilterLogger
+from app.core.streaming_metrics import LinearHistogram, LogHistogram, WindowedCounter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestHistograms:
+    """StreamingHistogram 테스트"""
+
+    def test_log_histogram_percentiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(0, 1) for _ in range(20000))
+        histogram = LogHistogram(min_value=0.001, max_value=600.0, relative_error=0.01)
+        for value in values:
+            histogram.record(value)
+
+        for q in (50, 90, 99):
+            exact = values[int(q / 100 * (len(values) - 1))]
+            assert histogram.percentile(q) == pytest.approx(exact, rel=0.02)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+        assert histogram.max == values[-1]
+
+    def test_linear_histogram_percentiles(self):
+        histogram = LinearHistogram(min_value=0.0, max_value=1.0)
+        for i in range(101):
+            histogram.record(i / 100)
+
+        assert histogram.percentiles() == {
+            "p50": pytest.approx(0.5, abs=0.01),
+            "p90": pytest.approx(0.9, abs=0.01),
+            "p99": pytest.approx(0.99, abs=0.01),
+        }
+
+    def test_out_of_range_values_are_clamped(self):
+        histogram = LogHistogram(min_value=0.001, max_value=1.0)
+        histogram.record(0.0)
+        histogram.record(50.0)
+
+        assert histogram.percentile(0) == 0.0
+        assert histogram.percentile(100) == 50.0
+
+    def test_empty_histogram(self):
+        histogram = LinearHistogram(0.0, 1.0)
+
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean == 0.0
+
+
+class TestWindowedCounter:
+    """WindowedCounter 테스트"""
+
+    def test_old_events_leave_window(self):
+        clock = FakeClock()
+        counter = WindowedCounter(window_seconds=60, slots=6, clock=clock)
+
+        counter.add(3)
+        clock.now += 30
+        counter.add(2)
+        assert counter.total() == 5
+        assert counter.rate() == pytest.approx(5 / 60)
+
+        clock.now += 40  # 첫 기록은 윈도우 밖
+        assert counter.total() == 2
+
+        clock.now += 600  # 재사용 전 슬롯도 제외
+        assert counter.total() == 0
+
+
+class TestFilterLoggerMetrics:
+    """FilterLogger 메트릭 요약 테스트"""
+
+    def test_memory_is_bounded_and_summary_has_percentiles(self):
+        filter_logger = FilterLogger()
+        buckets = len(filter_logger.metrics["processing_times"]._buckets)
+
+        for i in range(5000):
+            filter_logger.log_filter_request(10)
+            filter_logger.log_filter_result({"filtered": i % 10 == 0, "safety_score": 0.9}, 0.1 + i % 10 * 0.01)
+
+        summary = filter_logger.get_metrics_summary()
+
+        assert len(filter_logger.metrics["processing_times"]._buckets) == buckets
+        assert summary["total_requests"] == 5000
+        assert summary["filter_rate"] == pytest.approx(10.0)
+        assert summary["max_processing_time"] == pytest.approx(0.19)
+        assert summary["processing_time_percentiles"]["p50"] == pytest.approx(0.145, rel=0.05)
+        assert summary["safety_score_percentiles"]["p1"] == pytest.approx(0.9, abs=0.01)
+        assert summary["window"]["requests"] == 5000
+        assert summary["window"]["filter_rate"] == pytest.approx(10.0)
@@ -0,0 +1,92 @@
+"""
+구조화 로깅 유틸리티 테스트
+"""
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+from app.core import structured_logging
+from app.core.structured_logging import PayloadSummary, SamplingFilter, attach_log_sink
+
+
+def _record(level: int) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+
+class TestPayloadSummary:
+    """PayloadSummary 테스트"""
+
+    def test_long_payload_is_truncated_with_hash(self):
+        summary = str(PayloadSummary({"conversation_history": "가" * 1000}, preview_chars=20))
+
+        assert summary.startswith("1028자, sha256=")
+        assert summary.endswith("…")
+        assert "가" * 21 not in summary
+
+    def test_same_payload_same_hash(self):
+        assert str(PayloadSummary("abc")) == str(PayloadSummary("abc"))
+        assert str(PayloadSummary("abc")) != str(PayloadSummary("abd"))
+
+    def test_formatted_only_when_emitted(self):
+        logger = logging.getLogger("test_structured_logging.lazy")
+        logger.setLevel(logging.INFO)
+
+        with patch.object(PayloadSummary, "__str__", side_effect=AssertionError("formatted")):
+            logger.debug("payload %s", PayloadSummary("x" * 10000))
+
+
+class TestSamplingFilter:
+    """SamplingFilter 테스트"""
+
+    def test_samples_info_but_keeps_warnings(self):
+        rolls = iter([0.9, 0.1])
+        sampling_filter = SamplingFilter(0.5, rng=lambda: next(rolls))
+
+        assert sampling_filter.filter(_record(logging.INFO)) is False
+        assert sampling_filter.filter(_record(logging.INFO)) is True
+        assert sampling_filter.filter(_record(logging.ERROR)) is True
+
+    def test_zero_rate_drops_all_info(self):
+        assert SamplingFilter(0.0).filter(_record(logging.INFO)) is False
+
+
+class TestAttachLogSink:
+    """attach_log_sink 테스트"""
+
+    def test_logs_go_through_shared_queue(self):
+        with patch.object(logging.getLogger(), "handlers", []):
+            first = attach_log_sink(logging.getLogger("test_structured_logging.first"), "FIRST")
+            second = attach_log_sink(logging.getLogger("test_structured_logging.second"), "SECOND")
+
+        first_handler, second_handler = first.handlers[0], second.handlers[0]
+        assert isinstance(first_handler, QueueHandler)
+        assert first_handler.queue is second_handler.queue
+        assert first.propagate is True
+        assert first.level == logging.NOTSET
+
+    def test_configured_root_is_followed(self):
+        """루트 로깅 설정이 있으면 핸들러 추가 없이 전파하고 앱이 정한 레벨을 유지해야 함"""
+        logger = logging.getLogger("test_structured_logging.root_configured")
+        logger.setLevel(logging.WARNING)
+
+        with patch.object(logging.getLogger(), "handlers", [logging.NullHandler()]):
+            attach_log_sink(logger, "TEST", level=logging.INFO)
+
+        assert logger.handlers == []
+        assert logger.propagate is True
+        assert logger.level == logging.WARNING
+
+    def test_existing_handlers_are_kept(self):
+        logger = logging.getLogger("test_structured_logging.configured")
+        handler = logging.NullHandler()
+        logger.addHandler(handler)
+
+        assert attach_log_sink(logger, "TEST").handlers == [handler]
+
+    def test_per_logger_sample_rate(self):
+        with patch.object(structured_logging.settings, "LOG_SAMPLE_RATES", {"test_structured_logging.sampled": 0.1}):
+            sampled = attach_log_sink(logging.getLogger("test_structured_logging.sampled"), "TEST")
+            unsampled = attach_log_sink(logging.getLogger("test_structured_logging.unsampled"), "TEST")
+
+        assert [f.rate for f in sampled.filters] == [0.1]
+        assert unsampled.filters == []
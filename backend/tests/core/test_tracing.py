@@ -0,0 +1,152 @@
+"""
+Langfuse 추적 샘플링 테스트
+"""
+import asyncio
+import contextvars
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.core import tracing
+from app.core.llm import LangfuseManager
+from app.core.tracing import TraceSampler, is_trace_sampled, traced
+
+
+def _in_new_request(func, *args):
+    """새 요청 컨텍스트(샘플링 결정 없음)에서 실행"""
+    return contextvars.Context().run(func, *args)
+
+
+@pytest.fixture
+def observe_calls():
+    """observe()로 감싼 함수의 실행 횟수 추적"""
+    calls = []
+
+    def fake_observe():
+        def decorator(func):
+            async def observed(*args, **kwargs):
+                calls.append(func.__name__)
+                return await func(*args, **kwargs)
+
+            return observed
+
+        return decorator
+
+    with patch("app.core.tracing.LANGFUSE_OBSERVE_AVAILABLE", True), patch("app.core.tracing.observe", fake_observe):
+        yield calls
+
+
+def _sampler(rates, **kwargs) -> TraceSampler:
+    return TraceSampler(default_rate=1.0, route_rates=rates, slow_seconds=kwargs.pop("slow_seconds", 10.0), **kwargs)
+
+
+class TestTraceSampler:
+    """TraceSampler 테스트"""
+
+    def test_decision_is_fixed_per_request(self):
+        rolls = iter([0.9, 0.1])
+        sampler = _sampler({"conversation": 0.5}, rng=lambda: next(rolls))
+
+        def request():
+            return [sampler.decide("conversation"), sampler.decide("llm_chat"), sampler.decide("conversation")]
+
+        assert _in_new_request(request) == [False, False, False]  # 첫 결정이 하위 호출에 적용
+        assert _in_new_request(request) == [True, True, True]
+        assert sampler.get_stats()["sample_ratio"] == 0.5
+
+    def test_route_rates(self):
+        sampler = _sampler({"conversation": 0.0})
+
+        assert _in_new_request(sampler.decide, "conversation") is False
+        assert _in_new_request(sampler.decide, "explain_event") is True
+
+    def test_fast_successful_unsampled_call_is_not_recorded(self):
+        sampler = _sampler({})
+        client = MagicMock()
+        with patch("app.core.tracing.get_client", return_value=client):
+            sampler.record_unsampled("conversation", 0.1)
+            sampler.record_unsampled("conversation", 12.0)
+            sampler.record_unsampled("conversation", 0.1, ValueError("boom"))
+
+        levels = [call.kwargs["level"] for call in client.create_event.call_args_list]
+        assert levels == ["WARNING", "ERROR"]
+        assert sampler.get_stats()["forced_slow"] == sampler.get_stats()["forced_errors"] == 1
+
+
+class TestTraced:
+    """traced 데코레이터 테스트"""
+
+    def test_unsampled_request_skips_observe(self, observe_calls):
+        with patch.object(tracing, "trace_sampler", _sampler({"dropped": 0.0})):
+
+            @traced("dropped")
+            async def handler():
+                return await child()
+
+            @traced("child")
+            async def child():
+                return "ok"
+
+            assert _in_new_request(asyncio.run, handler()) == "ok"
+
+        assert observe_calls == []
+
+    def test_sampled_request_uses_observe(self, observe_calls):
+        with patch.object(tracing, "trace_sampler", _sampler({})):
+
+            @traced("kept")
+            async def handler():
+                return "ok"
+
+            assert _in_new_request(asyncio.run, handler()) == "ok"
+
+        assert observe_calls == ["handler"]
+
+    def test_unsampled_error_is_forced(self, observe_calls):
+        sampler = _sampler({"dropped": 0.0})
+        with patch.object(tracing, "trace_sampler", sampler), patch("app.core.tracing.get_client") as get_client:
+
+            @traced("dropped")
+            async def stream():
+                yield "a"
+                raise ValueError("boom")
+
+            async def consume():
+                return [chunk async for chunk in stream()]
+
+            with pytest.raises(ValueError):
+                _in_new_request(asyncio.run, consume())
+
+        assert sampler.get_stats()["forced_errors"] == 1
+        assert get_client().create_event.call_args.kwargs["name"] == "dropped"
+
+    def test_nested_unsampled_calls_record_once(self, observe_calls):
+        sampler = _sampler({"dropped": 0.0}, slow_seconds=0.0)
+        with patch.object(tracing, "trace_sampler", sampler), patch("app.core.tracing.get_client") as get_client:
+
+            @traced("dropped")
+            async def handler():
+                return await chain()
+
+            @traced("level_chain_run")
+            async def chain():
+                return llm_chat()
+
+            @traced("llm_chat")
+            def llm_chat():
+                return "ok"
+
+            assert _in_new_request(asyncio.run, handler()) == "ok"
+
+        assert sampler.get_stats()["forced_slow"] == 1  # 가장 바깥 호출만 기록
+        assert get_client().create_event.call_args.kwargs["name"] == "dropped"
+
+    def test_unsampled_request_has_no_callbacks(self):
+        manager = LangfuseManager.__new__(LangfuseManager)
+        manager.service_name, manager.user_id, manager.session_id = "test", "user", "session"
+        manager.handler = object()
+
+        with patch.object(tracing, "trace_sampler", _sampler({"dropped": 0.0})):
+            config = _in_new_request(lambda: (is_trace_sampled("dropped"), manager.get_callback_config())[1])
+
+        assert config == {}
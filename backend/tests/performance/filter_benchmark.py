@@ -0,0 +1,245 @@
+"""
+컨텐츠 필터 오프라인 벤치마크 하네스
+
+실제 FilterService/ContentFilter(그래프, 사전 분류기, 티어링, 로컬 재작성 포함)를
+지연 시간과 판정이 스크립트된 가짜 LLM으로 실행하여 네트워크 없이 필터 변경 전후를 비교합니다.
+
+    PYTHONPATH=. python tests/performance/filter_benchmark.py
+"""
+import asyncio
+import json
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+from unittest.mock import patch
+
+from app.core.filter_prompts import SAFETY_THRESHOLDS
+from app.core.streaming_metrics import LogHistogram
+from app.services.content_filter import ContentFilter
+from app.services.filter_service import FilterService
+
+# LLM 호출 단계
+STAGE_ANALYZE = "analyze"
+STAGE_REPLACE = "replace"
+STAGE_RECHECK = "recheck"
+
+
+@dataclass
+class ReplayCase:
+    """리플레이 코퍼스 항목 (모델별 스크립트된 판정)"""
+
+    content: str
+    strong_score: float  # 고성능 모델 분석 점수
+    fast_score: Optional[float] = None  # 경량 모델 분석 점수 (None이면 strong_score와 동일)
+    risk_categories: List[str] = field(default_factory=list)
+    recheck_score: float = 0.9  # 대체 컨텐츠 재검토 점수
+
+
+# 기본 리플레이 코퍼스 (통과, 사전 분류 생략, 경계 점수, 대체, 로컬 재작성, 차단)
+REPLAY_CORPUS = [
+    ReplayCase("기준금리는 중앙은행이 정하는 정책 금리입니다.", 0.95),
+    ReplayCase("소비자물가지수는 물가 변동을 측정하는 지표입니다.", 0.95),
+    ReplayCase("고용지표 발표 후 시장 변동성이 커질 수 있습니다.", 0.95),
+    ReplayCase("레버리지 상품은 변동성이 커서 주의가 필요합니다.", 0.9),
+    ReplayCase("실적 발표 시즌에는 종목별 변동이 큽니다.", 0.95, fast_score=0.88),
+    ReplayCase("이 종목은 목표가까지 오를 수 있습니다.", 0.8, fast_score=0.8, risk_categories=["investment_advice"]),
+    ReplayCase("지금 이 종목 사세요.", 0.6, risk_categories=["investment_advice"]),
+    ReplayCase("금리가 내려가면 무조건 채권 가격이 오릅니다.", 0.6, risk_categories=["excessive_confidence"]),
+    ReplayCase("내부자 정보에 따르면 다음 주 급등합니다.", 0.5, risk_categories=["unverified_information"]),
+    ReplayCase("대출받아 전 재산을 한 종목에 넣으세요.", 0.2, risk_categories=["legal_liability"]),
+]
+
+
+class FakeLLM:
+    """
+    스크립트된 가짜 LLM 클라이언트 (LLMClient.chat / chat_structured 대체)
+
+    프롬프트로 단계(분석/대체/재검토)와 코퍼스 항목을 찾아 정해진 응답을 고정 지연 후 반환합니다.
+    """
+
+    def __init__(self, corpus: Sequence[ReplayCase], tier: str, latency: Optional[Dict[str, float]] = None):
+        self.tier = tier
+        self.latency = latency or {}
+        # 긴 컨텐츠부터 매칭 (다른 컨텐츠를 포함하는 컨텐츠 우선)
+        self._cases = sorted(corpus, key=lambda case: len(case.content), reverse=True)
+        self._replacements = {self.replacement_for(case): case for case in corpus}
+        self.calls: Counter = Counter()
+
+    @staticmethod
+    def replacement_for(case: ReplayCase) -> str:
+        return f"[대체 {zlib.crc32(case.content.encode()):08x}] 관련 정보를 안내드리며, 투자 판단은 신중히 하시기 바랍니다."
+
+    async def chat(self, messages: List[Dict[str, str]]) -> str:
+        stage, payload = await self._respond(messages[0]["content"])
+        return payload if stage == STAGE_REPLACE else json.dumps(payload, ensure_ascii=False)
+
+    async def chat_structured(self, messages: List[Dict[str, str]], schema: type):
+        _, payload = await self._respond(messages[0]["content"])
+        return schema(**payload)
+
+    async def _respond(self, prompt: str):
+        if "대체 컨텐츠:" in prompt:
+            stage = STAGE_REPLACE
+        elif "최종 검토" in prompt:
+            stage = STAGE_RECHECK
+        else:
+            stage = STAGE_ANALYZE
+
+        self.calls[stage] += 1
+        await asyncio.sleep(self.latency.get(stage, 0.0))
+
+        if stage == STAGE_RECHECK:
+            case = next((case for text, case in self._replacements.items() if text in prompt), None)
+            score = case.recheck_score if case else 0.0
+            return stage, {"is_approved": score >= 0.85, "final_safety_score": score}
+
+        case = next(case for case in self._cases if case.content in prompt)
+        if stage == STAGE_REPLACE:
+            return stage, self.replacement_for(case)
+
+        score = case.strong_score if self.tier == "strong" or case.fast_score is None else case.fast_score
+        return stage, {
+            "is_safe": score >= SAFETY_THRESHOLDS["strict"],
+            "safety_score": score,
+            "risk_categories": case.risk_categories,
+            "filter_reason": "스크립트된 판정" if case.risk_categories else "",
+        }
+
+
+@dataclass
+class BenchmarkRun:
+    """동시성 수준별 실행 결과"""
+
+    concurrency: int
+    requests: int
+    wall_time: float
+    llm_calls: Dict[str, Dict[str, int]]
+    node_latency: Dict[str, Dict[str, float]]  # 노드별 호출 수와 지연 시간 (ms)
+    retries: int
+    filtered: int
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def llm_calls_per_request(self) -> float:
+        total = sum(sum(stages.values()) for stages in self.llm_calls.values())
+        return total / self.requests if self.requests else 0.0
+
+
+class FilterBenchmark:
+    """실제 FilterService를 가짜 LLM으로 실행하는 벤치마크"""
+
+    def __init__(
+        self,
+        corpus: Sequence[ReplayCase] = REPLAY_CORPUS,
+        strong_latency: Optional[Dict[str, float]] = None,
+        fast_latency: Optional[Dict[str, float]] = None,
+        tiered: bool = True,
+        verdict_cache: bool = False,
+    ):
+        self.corpus = list(corpus)
+        self.strong_latency = strong_latency or {STAGE_ANALYZE: 0.02, STAGE_REPLACE: 0.04, STAGE_RECHECK: 0.02}
+        self.fast_latency = fast_latency or {STAGE_ANALYZE: 0.005}
+        self.tiered = tiered
+        self.verdict_cache = verdict_cache
+
+    def _make_service(self) -> FilterService:
+        with patch("app.services.content_filter.LLMClient"):
+            service = FilterService()
+        content_filter = service.filter
+        content_filter.llm_client = FakeLLM(self.corpus, "strong", self.strong_latency)
+        content_filter.fast_llm_client = FakeLLM(self.corpus, "fast", self.fast_latency) if self.tiered else None
+        if not self.verdict_cache:
+            content_filter.verdict_cache = None
+        return service
+
+    @staticmethod
+    def _instrument(content_filter: ContentFilter) -> Dict[str, LogHistogram]:
+        """노드 메서드를 인스턴스 속성으로 감싸 노드별 지연 시간 측정 (그래프/네이티브 실행기 공통)"""
+        histograms = {}
+        for node, method_name in ContentFilter.NODES.items():
+            histograms[node] = LogHistogram(min_value=1e-6, max_value=60.0)
+            setattr(content_filter, method_name, _timed(getattr(content_filter, method_name), histograms[node]))
+        return histograms
+
+    async def run(self, concurrency: int, repeat: int = 1) -> BenchmarkRun:
+        """코퍼스를 repeat번 반복하여 최대 concurrency개씩 동시 처리"""
+        service = self._make_service()
+        histograms = self._instrument(service.filter)
+        semaphore = asyncio.Semaphore(concurrency)
+        contents = [case.content for case in self.corpus] * repeat
+
+        async def filter_one(content: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await service.filter_response(content)
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(filter_one(content) for content in contents))
+        wall_time = time.perf_counter() - start_time
+
+        clients = {"strong": service.filter.llm_client, "fast": service.filter.fast_llm_client}
+        return BenchmarkRun(
+            concurrency=concurrency,
+            requests=len(contents),
+            wall_time=wall_time,
+            llm_calls={tier: dict(client.calls) for tier, client in clients.items() if client is not None},
+            node_latency={
+                node: {
+                    "calls": histogram.count,
+                    "avg_ms": histogram.mean * 1000,
+                    **{name: value * 1000 for name, value in histogram.percentiles().items()},
+                }
+                for node, histogram in histograms.items()
+                if histogram.count
+            },
+            # 라우팅 중 증가시킨 retry_count는 상태에 반영되지 않으므로 반복 분석 횟수도 함께 집계
+            retries=sum(result.get("retry_count", 0) for result in results)
+            + max(histograms["analyze"].count - len(contents), 0),
+            filtered=sum(result["filtered"] for result in results),
+        )
+
+
+def _timed(method, histogram: LogHistogram):
+    """노드 실행 시간을 히스토그램에 기록하는 래퍼"""
+
+    async def timed_node(state, *args, **kwargs):
+        start_time = time.perf_counter()
+        result = method(state, *args, **kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        histogram.record(time.perf_counter() - start_time)
+        return result
+
+    return timed_node
+
+
+def format_report(runs: Sequence[BenchmarkRun]) -> str:
+    """벤치마크 결과 출력용 문자열"""
+    lines = ["📊 필터 오프라인 벤치마크"]
+    for run in runs:
+        lines.append(
+            f"  동시성 {run.concurrency:>3} | 요청 {run.requests} | 처리량 {run.throughput:.1f} req/s | "
+            f"요청당 LLM 호출 {run.llm_calls_per_request:.2f} | 재시도 {run.retries} | 필터링 {run.filtered} | "
+            f"LLM 호출 {run.llm_calls}"
+        )
+        for node, stats in run.node_latency.items():
+            lines.append(
+                f"    노드 {node:<8} | 호출 {stats['calls']:>4} | 평균 {stats['avg_ms']:.2f}ms | "
+                f"p50 {stats['p50']:.2f}ms | p90 {stats['p90']:.2f}ms | p99 {stats['p99']:.2f}ms"
+            )
+    return "\n".join(lines)
+
+
+async def run_benchmark(concurrency_levels: Sequence[int] = (1, 4, 16), repeat: int = 2) -> List[BenchmarkRun]:
+    benchmark = FilterBenchmark()
+    runs = [await benchmark.run(concurrency, repeat) for concurrency in concurrency_levels]
+    print(format_report(runs))
+    return runs
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
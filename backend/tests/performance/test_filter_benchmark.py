@@ -0,0 +1,28 @@
+"""
+컨텐츠 필터 오프라인 벤치마크 (가짜 LLM으로 실제 FilterService 실행)
+"""
+import asyncio
+
+from filter_benchmark import REPLAY_CORPUS, STAGE_ANALYZE, STAGE_RECHECK, STAGE_REPLACE, FilterBenchmark, format_report
+
+CONCURRENCY_LEVELS = (1, 4, 16)
+
+
+class TestFilterBenchmark:
+    """리플레이 코퍼스 벤치마크"""
+
+    def test_replay_corpus(self):
+        benchmark = FilterBenchmark(
+            strong_latency={STAGE_ANALYZE: 0.004, STAGE_REPLACE: 0.008, STAGE_RECHECK: 0.004},
+            fast_latency={STAGE_ANALYZE: 0.001},
+        )
+        runs = [asyncio.run(benchmark.run(concurrency, repeat=2)) for concurrency in CONCURRENCY_LEVELS]
+
+        print(format_report(runs))
+
+        # 스크립트된 판정이므로 동시성과 무관하게 같은 호출 패턴
+        assert all(run.requests == len(REPLAY_CORPUS) * 2 for run in runs)
+        assert len({str(run.llm_calls) for run in runs}) == 1
+        assert len({run.filtered for run in runs}) == 1
+        assert {"analyze", "filter", "approve"} <= set(runs[0].node_latency)
+        assert runs[-1].throughput > runs[0].throughput
@@ -0,0 +1,43 @@
+"""
+그래프 레지스트리 요청당 준비 비용 벤치마크
+"""
+import time
+from unittest.mock import patch
+
+from app.constants import UserLevel
+from app.services.content_filter import ContentFilter
+from app.services.graph_registry import compiled_graph_registry
+from app.services.level_chain import LevelChainService
+
+REQUEST_COUNT = 30
+
+
+def _setup_request():
+    """대화 요청 1건에 필요한 체인/필터 객체 생성 (LLM 호출 없음)"""
+    LevelChainService().get_chain(UserLevel.ADVANCED)
+    ContentFilter()
+
+
+def _measure(clear_registry: bool) -> float:
+    start_time = time.perf_counter()
+    for _ in range(REQUEST_COUNT):
+        if clear_registry:
+            # 매 요청마다 그래프를 새로 컴파일하던 기존 동작 재현
+            compiled_graph_registry.clear()
+        _setup_request()
+    return (time.perf_counter() - start_time) / REQUEST_COUNT
+
+
+class TestGraphRegistryPerformance:
+    """그래프 컴파일 재사용 성능 테스트"""
+
+    def test_per_request_setup_cost(self):
+        with patch("app.services.content_filter.LLMClient"), patch("app.services.level_chain.LLMClient"):
+            before = _measure(clear_registry=True)
+            _setup_request()  # 레지스트리 워밍업
+            after = _measure(clear_registry=False)
+
+        print(f"📊 요청당 준비 비용 - 매번 컴파일: {before * 1000:.3f}ms, 레지스트리: {after * 1000:.3f}ms")
+        print(f"📊 개선 배수: {before / max(after, 1e-9):.1f}x")
+
+        assert after < before
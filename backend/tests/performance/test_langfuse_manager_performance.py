@@ -0,0 +1,47 @@
+"""
+요청당 LangfuseManager 설정 비용 벤치마크 (요청마다 handler 생성 vs 공유 handler)
+"""
+import time
+from unittest.mock import patch
+
+from app.core import llm
+from app.core.langfuse_factory import LangfuseFactory
+from app.core.llm import reset_shared_langfuse_handler
+
+REQUEST_COUNT = 200
+
+
+class _StandInHandler:
+    """langfuse langchain 통합이 설치되지 않은 환경용 handler (생성 비용 제외, 환경변수/로깅 비용만 측정)"""
+
+
+def _measure(per_request_handler: bool) -> float:
+    reset_shared_langfuse_handler()
+    start_time = time.perf_counter()
+    for i in range(REQUEST_COUNT):
+        if per_request_handler:
+            reset_shared_langfuse_handler()  # 기존 동작: 요청마다 환경변수 설정 + handler 생성
+        manager = LangfuseFactory.create_app_manager(session_id=f"session-{i}")
+        manager.get_callback_config()
+    elapsed = (time.perf_counter() - start_time) / REQUEST_COUNT
+    reset_shared_langfuse_handler()
+    return elapsed
+
+
+class TestLangfuseManagerPerformance:
+    """요청당 Langfuse 설정 비용 비교"""
+
+    def test_shared_handler_setup_cost(self):
+        handler_class = llm.CallbackHandler if llm.LANGFUSE_AVAILABLE else _StandInHandler
+        with patch("app.core.llm.LANGFUSE_AVAILABLE", True), patch("app.core.llm.CallbackHandler", handler_class), patch(
+            "app.core.llm.settings.LANGFUSE_PUBLIC_KEY", "pk-lf-benchmark"
+        ), patch("app.core.llm.settings.LANGFUSE_SECRET_KEY", "sk-lf-benchmark"), patch(
+            "app.core.llm.settings.LANGFUSE_HOST", "http://127.0.0.1:9"
+        ), patch.dict("os.environ"):
+            before = _measure(per_request_handler=True)
+            after = _measure(per_request_handler=False)
+
+        print(f"📊 요청당 Langfuse 설정 비용 ({handler_class.__name__}) - 요청마다 생성: {before * 1e6:.1f}µs, 공유: {after * 1e6:.1f}µs")
+        print(f"📊 개선 배수: {before / max(after, 1e-9):.1f}x")
+
+        assert after < before
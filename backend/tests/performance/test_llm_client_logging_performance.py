@@ -0,0 +1,82 @@
+"""
+LLMClient 호출당 로깅 비용 벤치마크 (20턴 대화 이력: 기존 print vs 큐 싱크 구조화 로깅)
+"""
+import contextlib
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.utils import llm_client
+from app.utils.llm_client import LLMClient
+
+CALL_COUNT = 500
+TURN_COUNT = 20
+
+
+def _history() -> list:
+    messages = []
+    for turn in range(TURN_COUNT):
+        messages.append({"role": "user", "content": f"{turn}번째 질문입니다. 다음 FOMC 일정과 금리 전망을 알려주세요. " * 3})
+        messages.append({"role": "assistant", "content": f"{turn}번째 답변입니다. 시장은 금리 동결을 예상하고 있습니다. " * 8})
+    messages.append({"role": "user", "content": "마지막 질문입니다."})
+    return messages
+
+
+def _client() -> LLMClient:
+    client = LLMClient.__new__(LLMClient)
+    client.langfuse_manager = SimpleNamespace(user_id="user-1", session_id="session-1")
+    return client
+
+
+def _legacy_log(client: LLMClient, messages: list, input_data: dict) -> None:
+    """기존 동작: 대화 이력 전체를 stdout으로 동기 출력"""
+    print(f"🚀 Backend chat_observed 시작: {len(messages)}개 메시지")
+    print(f"📝 Input data: {input_data}")
+    print(f"👤 User ID: {client.langfuse_manager.user_id}, Session ID: {client.langfuse_manager.session_id}")
+
+
+def _measure(log_call, *args) -> float:
+    start_time = time.perf_counter()
+    for _ in range(CALL_COUNT):
+        log_call(*args)
+    return (time.perf_counter() - start_time) / CALL_COUNT
+
+
+class TestLLMClientLoggingPerformance:
+    """호출 스레드(이벤트 루프)가 부담하는 로깅 비용"""
+
+    def test_logging_overhead_for_long_history(self, tmp_path):
+        client = _client()
+        messages = _history()
+        input_data = client._prepare_input_data(messages)
+
+        with open(tmp_path / "stdout.log", "w") as stdout_file, contextlib.redirect_stdout(stdout_file):
+            legacy = _measure(_legacy_log, client, messages, input_data)
+
+        # 출력 대상만 임시 파일로 바꾼 공용 싱크와 같은 구성 (큐 + 출력 스레드)
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(asctime)s - [LLM] - %(levelname)s - %(message)s"))
+        output_handler = logging.FileHandler(tmp_path / "queue.log")
+        listener = QueueListener(log_queue, output_handler)
+        listener.start()
+        try:
+            with patch.object(llm_client.logger, "handlers", [queue_handler]):
+                info = _measure(client._log_call_start, "chat_observed", messages, input_data)
+                llm_client.logger.setLevel(logging.DEBUG)
+                debug = _measure(client._log_call_start, "chat_observed", messages, input_data)
+        finally:
+            llm_client.logger.setLevel(logging.INFO)
+            listener.stop()
+            output_handler.close()
+
+        payload_chars = len(str(input_data))
+        print(
+            f"📊 호출당 로깅 비용 ({TURN_COUNT}턴, {payload_chars}자) - 기존 print: {legacy * 1e6:.1f}µs, "
+            f"INFO: {info * 1e6:.1f}µs, DEBUG(요약 포함): {debug * 1e6:.1f}µs"
+        )
+        assert (tmp_path / "queue.log").stat().st_size < (tmp_path / "stdout.log").stat().st_size
+        assert info < legacy
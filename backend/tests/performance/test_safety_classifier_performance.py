@@ -0,0 +1,41 @@
+"""
+안전성 사전 분류기 처리 시간 및 고성능 모델 직행 비율 벤치마크
+"""
+import time
+
+from app.services.safety_classifier import SafetyPreClassifier
+
+# 챗봇 응답 윈도우 샘플 (일반 설명 위주, 일부 위험/애매한 표현 포함)
+SAMPLE_RESPONSES = [
+    "CPI는 소비자물가지수로, 가계가 구입하는 상품과 서비스의 가격 변동을 측정합니다.",
+    "FOMC는 미국 연방준비제도의 통화정책을 결정하는 회의로, 연 8회 열립니다.",
+    "금리가 오르면 일반적으로 채권 가격은 하락하는 경향이 있습니다.",
+    "고용지표는 경기 흐름을 판단하는 데 참고할 수 있는 자료입니다.",
+    "환율 변동은 수출입 기업의 실적에 영향을 줄 수 있습니다.",
+    "실업률 발표 이후 시장 변동성이 커질 수 있으니 유의하시기 바랍니다.",
+    "GDP 성장률은 전 분기 대비 또는 전년 동기 대비로 발표됩니다.",
+    "외국인 매수세가 이어지며 지수가 상승했습니다.",
+    "이 종목은 지금 당장 사세요! 확실한 수익을 보장합니다.",
+    "내부자 정보에 따르면 다음 주에 무조건 오릅니다.",
+]
+ROUNDS = 200
+
+
+class TestSafetyClassifierPerformance:
+    """사전 분류기 성능 테스트"""
+
+    def test_classification_latency_and_strong_tier_rate(self):
+        classifier = SafetyPreClassifier()
+
+        start_time = time.perf_counter()
+        for _ in range(ROUNDS):
+            for response in SAMPLE_RESPONSES:
+                classifier.classify(response)
+        per_item = (time.perf_counter() - start_time) / (ROUNDS * len(SAMPLE_RESPONSES))
+
+        stats = classifier.get_stats()
+        print(f"📊 사전 분류 처리 시간: {per_item * 1_000_000:.1f}µs/건 (패턴 {stats['patterns']}개)")
+        print(f"📊 고성능 모델 직행 비율: {stats['strong_tier_rate']:.0%} ({stats['risky']}/{stats['total']})")
+
+        assert stats["strong_tier_rate"] == 0.2
+        assert per_item < 0.001  # 1ms 이내 (LLM 호출 대비 수천 배 빠름)
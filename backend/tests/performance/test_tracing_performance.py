@@ -0,0 +1,51 @@
+"""
+추적 샘플링 오버헤드 벤치마크 (원본 호출 vs 샘플링되지 않은 @traced vs 샘플링된 @traced)
+"""
+import asyncio
+import contextvars
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core import tracing
+from app.core.tracing import TraceSampler, traced
+
+CALL_COUNT = 2000
+
+
+async def _handler() -> str:
+    return "ok"
+
+
+def _measure(func, rate: float) -> float:
+    """요청마다 새 컨텍스트에서 호출하여 호출당 평균 시간 측정"""
+    sampler = TraceSampler(default_rate=rate, route_rates={}, slow_seconds=10.0)
+
+    async def run_all():
+        for _ in range(CALL_COUNT):
+            await asyncio.get_running_loop().create_task(func(), context=contextvars.Context())
+
+    with patch.object(tracing, "trace_sampler", sampler):
+        start_time = time.perf_counter()
+        asyncio.run(run_all())
+        return (time.perf_counter() - start_time) / CALL_COUNT
+
+
+class TestTracingPerformance:
+    """샘플링되지 않은 요청의 추적 비용"""
+
+    @pytest.mark.skipif(not tracing.LANGFUSE_OBSERVE_AVAILABLE, reason="langfuse 미설치")
+    def test_unsampled_overhead(self):
+        traced_handler = traced("benchmark")(_handler)
+
+        raw = _measure(_handler, rate=1.0)
+        unsampled = _measure(traced_handler, rate=0.0)
+        sampled = _measure(traced_handler, rate=1.0)
+
+        print(
+            f"📊 호출당 시간 - 원본: {raw * 1e6:.1f}µs, 샘플링 제외: {unsampled * 1e6:.1f}µs, "
+            f"샘플링: {sampled * 1e6:.1f}µs"
+        )
+
+        assert unsampled < sampled
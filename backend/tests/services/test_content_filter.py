@@ -5,7 +5,7 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 
-from app.services.content_filter import ContentFilter, FilterState
+from app.services.content_filter import FilterState
 from app.services.filter_service import FilterService
 
 
@@ -13,12 +13,9 @@ class TestContentFilter:
     """ContentFilter 클래스 테스트"""
 
     @pytest.fixture
-    def content_filter(self):
-        """ContentFilter 인스턴스 생성"""
-        with patch("app.services.content_filter.LLMClient") as mock_llm_client:
-            filter_instance = ContentFilter()
-            filter_instance.llm_client = mock_llm_client
-            return filter_instance
+    def content_filter(self, bare_content_filter):
+        """ContentFilter 인스턴스 생성 (LLM 분석 경로만 사용)"""
+        return bare_content_filter
 
     @pytest.fixture
     def mock_llm_response_safe(self):
@@ -163,6 +160,111 @@ class TestContentFilter:
         assert result["retry_count"] >= 0
         # 오류 처리로 인해 안전하지 않음으로 처리될 수 있음
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "삼성전자 주식은 지금 사는 게 좋습니다. 다음 주에 두 배로 오를 겁니다.",
+            "테슬라 주식 사두면 돈 법니다",
+            "비트코인에 전부 넣으세요",
+            "This stock will double next week, load up now.",
+        ],
+    )
+    async def test_preclassifier_never_auto_approves(self, content_filter, mock_llm_response_unsafe, content):
+        """사전에 없는 위험 표현도 LLM 분석을 거쳐야 함 (사전 미매칭으로 승인하지 않음)"""
+        from app.services.safety_classifier import SafetyPreClassifier
+
+        content_filter.preclassifier = SafetyPreClassifier()
+        content_filter.local_rewriter = None
+        content_filter.llm_client.chat = AsyncMock(
+            side_effect=[
+                mock_llm_response_unsafe,
+                "투자에 대한 정보를 제공드립니다.",
+                '{"is_approved": true, "final_safety_score": 0.9}',
+            ]
+        )
+
+        result = await content_filter.process(content)
+
+        assert content_filter.preclassifier.inspect(content).needs_strong_tier is False
+        assert content_filter.llm_client.chat.await_count >= 1
+        assert result["filtered_content"] != content
+        assert result["safety_score"] < 1.0
+
+    @pytest.mark.asyncio
+    async def test_preclassified_risky_content_skips_fast_tier(self, content_filter, mock_llm_response_safe):
+        """사전 분류 위험 판정 시 경량 모델 없이 고성능 모델로 분석"""
+        from app.services.safety_classifier import SafetyPreClassifier
+
+        content_filter.preclassifier = SafetyPreClassifier()
+        content_filter.fast_llm_client = MagicMock()
+        content_filter.fast_llm_client.chat = AsyncMock(return_value=mock_llm_response_safe)
+        content_filter.llm_client.chat = AsyncMock(return_value=mock_llm_response_safe)
+
+        await content_filter.process("이 종목은 지금 당장 사세요!")
+
+        content_filter.fast_llm_client.chat.assert_not_called()
+        content_filter.llm_client.chat.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_preclassified_clean_content_uses_fast_tier(self, content_filter, mock_llm_response_safe):
+        """사전 미매칭 컨텐츠도 경량 모델 분석을 거쳐야 함"""
+        from app.services.safety_classifier import SafetyPreClassifier
+
+        content_filter.preclassifier = SafetyPreClassifier()
+        content_filter.fast_llm_client = MagicMock()
+        content_filter.fast_llm_client.chat = AsyncMock(return_value=mock_llm_response_safe)
+        content_filter.llm_client.chat = AsyncMock(return_value=mock_llm_response_safe)
+
+        result = await content_filter.process("CPI는 소비자물가지수로, 물가 변동을 측정하는 경제 지표입니다.")
+
+        content_filter.fast_llm_client.chat.assert_called_once()
+        assert "preclassified" not in result["analysis_result"]
+
+    @pytest.mark.asyncio
+    async def test_verdict_cache_reuses_final_result(self, content_filter, mock_llm_response_unsafe):
+        """동일 컨텐츠의 최종 판정 재사용 테스트"""
+        from app.services.response_cache import InMemoryCacheBackend, ResponseCache
+
+        content_filter.verdict_cache = ResponseCache("test_filter_verdict", InMemoryCacheBackend(max_size=8))
+        content_filter.llm_client.chat = AsyncMock(
+            side_effect=[
+                mock_llm_response_unsafe,
+                "투자에 대한 정보를 제공드립니다.",
+                '{"is_approved": true, "final_safety_score": 0.9}',
+            ]
+        )
+
+        # When: 공백만 다른 동일 컨텐츠를 두 번 필터링
+        first = await content_filter.process("이 주식을 지금 사세요!  확실한 수익을 보장합니다!")
+        second = await content_filter.process("이 주식을 지금 사세요! 확실한 수익을 보장합니다!")
+
+        # Then: 두 번째는 LLM 호출 없이 대체 컨텐츠 재사용
+        assert content_filter.llm_client.chat.await_count == 3
+        assert second["filtered_content"] == first["filtered_content"]
+        assert second["risk_categories"] == first["risk_categories"]
+        assert second["analysis_result"] == {"cached": True}
+        assert content_filter.verdict_cache.get_stats()["hits"] == 1
+
+        # 안전 수준이 다르면 별도 판정
+        content_filter.llm_client.chat = AsyncMock(side_effect=Exception("LLM 오류"))
+        await content_filter.process("이 주식을 지금 사세요! 확실한 수익을 보장합니다!", safety_level="permissive")
+        content_filter.llm_client.chat.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_verdict_cache_skips_error_results(self, content_filter):
+        """오류로 끝난 판정은 캐시하지 않음"""
+        from app.services.response_cache import InMemoryCacheBackend, ResponseCache
+
+        content_filter.verdict_cache = ResponseCache("test_filter_verdict", InMemoryCacheBackend(max_size=8))
+        content_filter.llm_client.chat = AsyncMock(side_effect=Exception("LLM 오류"))
+
+        await content_filter.process("테스트 컨텐츠")
+        await content_filter.process("테스트 컨텐츠")
+
+        assert content_filter.llm_client.chat.await_count == 2
+        assert content_filter.verdict_cache.get_stats()["hits"] == 0
+
     def test_extract_json_from_text(self, content_filter):
         """텍스트에서 JSON 추출 테스트"""
         # Given: JSON이 포함된 텍스트
@@ -275,3 +377,4 @@ class TestFilterService:
         assert "safety_level" in stats
         assert "max_retries" in stats
         assert "filter_model" in stats
+        assert {"hits", "misses", "hit_rate"} <= set(stats["verdict_cache"])
@@ -0,0 +1,86 @@
+"""
+이벤트 설명 생성 공통 로직 테스트
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.constants import UserLevel
+from app.services.event_explanation import (
+    build_explain_messages,
+    explain_prompt_hash,
+    generate_filtered_explanation,
+    viewer_levels,
+)
+
+
+@pytest.fixture
+def event():
+    return SimpleNamespace(
+        id=1,
+        title="소비자물가지수",
+        description="월별 소비자물가 변동률",
+        date="2024-01-15",
+        impact="HIGH",
+        source="FRED",
+        release_id="CPILFESL",
+        level=UserLevel.BEGINNER,
+    )
+
+
+class TestEventExplanation:
+    """이벤트 설명 생성 테스트"""
+
+    def test_viewer_levels_follow_calendar_visibility(self):
+        """이벤트를 볼 수 있는 레벨만 사전 생성 대상이어야 함"""
+        assert viewer_levels(UserLevel.BEGINNER) == [UserLevel.BEGINNER, UserLevel.INTERMEDIATE, UserLevel.ADVANCED]
+        assert viewer_levels(UserLevel.INTERMEDIATE) == [UserLevel.INTERMEDIATE, UserLevel.ADVANCED]
+        assert viewer_levels(UserLevel.ADVANCED) == [UserLevel.ADVANCED]
+
+    def test_prompt_hash_differs_per_level(self):
+        assert explain_prompt_hash(UserLevel.BEGINNER) != explain_prompt_hash(UserLevel.ADVANCED)
+        assert explain_prompt_hash(UserLevel.BEGINNER) == explain_prompt_hash(UserLevel.BEGINNER)
+
+    def test_messages_include_event_info(self, event):
+        messages = build_explain_messages(event, UserLevel.BEGINNER)
+
+        assert messages[0]["role"] == "system"
+        assert "소비자물가지수" in messages[1]["content"]
+        assert "CPILFESL" in messages[1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_generate_applies_filter_once(self, event):
+        """생성된 설명에 필터링이 한 번 적용되어야 함"""
+        llm_client = MagicMock()
+        llm_client.chat = AsyncMock(return_value="원본 설명")
+        llm_client.filter_service.filter_response = AsyncMock(return_value={"content": "필터링된 설명", "filtered": True})
+
+        content = await generate_filtered_explanation(event, UserLevel.BEGINNER, "strict", llm_client)
+
+        assert content == "필터링된 설명"
+        llm_client.filter_service.filter_response.assert_awaited_once_with("원본 설명", "strict")
+
+    @pytest.mark.asyncio
+    async def test_filter_error_is_not_returned(self, event):
+        """필터링 자체가 실패하면 오류 문구를 저장하지 않도록 None을 반환해야 함"""
+        llm_client = MagicMock()
+        llm_client.chat = AsyncMock(return_value="원본 설명")
+        llm_client.filter_service.filter_response = AsyncMock(
+            return_value={
+                "content": "죄송합니다. 현재 서비스 처리 중 문제가 발생했습니다.",
+                "filtered": True,
+                "risk_categories": ["service_error"],
+                "error": True,
+            }
+        )
+
+        assert await generate_filtered_explanation(event, UserLevel.BEGINNER, "strict", llm_client) is None
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_is_not_returned(self, event):
+        llm_client = MagicMock()
+        llm_client.chat = AsyncMock(side_effect=Exception("LLM 오류"))
+        llm_client.filter_service.filter_response = AsyncMock()
+
+        assert await generate_filtered_explanation(event, UserLevel.BEGINNER, "strict", llm_client) is None
+        llm_client.filter_service.filter_response.assert_not_awaited()
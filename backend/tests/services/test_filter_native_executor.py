@@ -0,0 +1,69 @@
+"""
+필터링 FSM 네이티브 실행기 테스트 - LangGraph 실행 결과와 동일해야 함
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.content_filter import ContentFilter
+
+SAFE = '{"is_safe": true, "safety_score": 0.95, "risk_categories": [], "filter_reason": ""}'
+BORDERLINE = '{"is_safe": false, "safety_score": 0.6, "risk_categories": ["investment_advice"], "filter_reason": "권유"}'
+DANGEROUS = '{"is_safe": false, "safety_score": 0.1, "risk_categories": ["market_manipulation"]}'
+REPLACEMENT = "투자 정보를 제공드립니다."
+APPROVED = '{"is_approved": true, "final_safety_score": 0.9}'
+NOT_APPROVED = '{"is_approved": false, "final_safety_score": 0.5}'
+
+SCENARIOS = {
+    "safe": [SAFE],
+    "replaced": [BORDERLINE, REPLACEMENT, APPROVED],
+    "replaced_after_recheck_retry": [BORDERLINE, REPLACEMENT, NOT_APPROVED, REPLACEMENT, APPROVED],
+    "dangerous_retry_loop": [DANGEROUS],
+    "parsing_error": ["JSON이 아닌 응답"],
+    "llm_error": [Exception("LLM 오류")],
+}
+
+
+def _script(content_filter: ContentFilter, responses: list) -> ContentFilter:
+    """응답 순서대로 답하는 LLM 설정 (마지막 응답 반복)"""
+    content_filter.max_retries = 1
+    calls = iter(range(1000))
+
+    async def chat(messages):
+        response = responses[min(next(calls), len(responses) - 1)]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    content_filter.llm_client.chat = AsyncMock(side_effect=chat)
+    return content_filter
+
+
+async def _run(content_filter: ContentFilter, responses: list, native: bool):
+    _script(content_filter, responses)
+    with patch("app.services.content_filter.settings.FILTER_NATIVE_EXECUTOR_ENABLED", native):
+        result = await content_filter.process("테스트 컨텐츠")
+    return result, content_filter.llm_client.chat.await_count
+
+
+class TestNativeExecutor:
+    """네이티브 실행기와 LangGraph 실행 결과 비교"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("scenario", list(SCENARIOS))
+    async def test_matches_langgraph(self, bare_content_filter, scenario):
+        graph_result, graph_calls = await _run(bare_content_filter, SCENARIOS[scenario], native=False)
+        native_result, native_calls = await _run(bare_content_filter, SCENARIOS[scenario], native=True)
+
+        assert dict(native_result) == dict(graph_result)
+        assert native_calls == graph_calls
+
+    @pytest.mark.asyncio
+    async def test_native_executor_skips_langgraph(self, bare_content_filter):
+        content_filter = _script(bare_content_filter, [SAFE])
+        content_filter.graph = MagicMock()
+
+        with patch("app.services.content_filter.settings.FILTER_NATIVE_EXECUTOR_ENABLED", True):
+            result = await content_filter.process("테스트 컨텐츠")
+
+        assert result["is_safe"] is True
+        content_filter.graph.ainvoke.assert_not_called()
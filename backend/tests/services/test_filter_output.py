@@ -0,0 +1,135 @@
+"""
+필터 구조화 출력 테스트 - 기록된 자유 형식 응답 코퍼스로 텍스트/구조화 모드 파싱 실패 비교
+"""
+import pytest
+from pydantic import ValidationError
+from unittest.mock import AsyncMock
+
+from app.services.filter_output import (
+    MODE_STRUCTURED,
+    MODE_TEXT,
+    FilterParseMetrics,
+    SafetyAnalysisOutput,
+    SafetyRecheckOutput,
+)
+
+ANALYSIS = {"is_safe": False, "safety_score": 0.4, "risk_categories": ["investment_advice"], "filter_reason": "권유"}
+
+# 분석 프롬프트에 대해 실제 모델이 돌려준 형태의 자유 형식 응답
+RECORDED_ANALYSIS_RESPONSES = [
+    '{"is_safe": false, "safety_score": 0.4, "risk_categories": ["investment_advice"], "filter_reason": "권유"}',
+    '```json\n{"is_safe": false, "safety_score": 0.4, "risk_categories": ["investment_advice"], "filter_reason": "권유"}\n```',
+    '분석 결과입니다:\n{"is_safe": false, "safety_score": 0.4, "risk_categories": ["investment_advice"], "filter_reason": "권유"}',
+    "{'is_safe': False, 'safety_score': 0.4, 'risk_categories': ['investment_advice'], 'filter_reason': '권유'}",
+    '{"is_safe": false, "safety_score": 0.4, "risk_categories": ["investment_advice"], "filter_reason": "권유",}',
+    '{"is_safe": false, "safety_score": 0.4, "risk_categories": ["investment_advice"], "filter_reason": "권유 표현이',
+    '{"is_safe": false, "safety_score": 0.4, "risk_categories": ["investment_advice"]} 참고: {예시} 형식',
+    "이 컨텐츠는 투자 권유에 해당하여 안전 점수는 0.4입니다.",
+]
+
+
+class TestSchemas:
+    """응답 스키마 검증 테스트"""
+
+    def test_analysis_defaults(self):
+        output = SafetyAnalysisOutput(is_safe=True, safety_score=0.9)
+
+        assert output.model_dump() == {
+            "is_safe": True,
+            "safety_score": 0.9,
+            "risk_categories": [],
+            "filter_reason": "",
+            "suggested_alternative": None,
+        }
+
+    def test_score_out_of_range_rejected(self):
+        with pytest.raises(ValidationError):
+            SafetyAnalysisOutput(is_safe=True, safety_score=1.5)
+        with pytest.raises(ValidationError):
+            SafetyRecheckOutput(is_approved=True, final_safety_score=-0.1)
+
+
+class TestParseMetrics:
+    """FilterParseMetrics 테스트"""
+
+    def test_failure_rate_per_mode(self):
+        metrics = FilterParseMetrics()
+        for failed in [True, False, True, False]:
+            metrics.record(MODE_TEXT, "SafetyAnalysisOutput", failed)
+        for _ in range(10):
+            metrics.record(MODE_STRUCTURED, "SafetyAnalysisOutput", False)
+
+        stats = metrics.get_stats()
+
+        assert stats["modes"][MODE_TEXT]["failure_rate"] == 0.5
+        assert stats["modes"][MODE_STRUCTURED]["parse_failures"] == 0
+        assert stats["modes"][MODE_STRUCTURED]["schemas"]["SafetyAnalysisOutput"]["calls"] == 10
+
+
+class TestContentFilterStructuredOutput:
+    """ContentFilter 구조화 출력 모드 테스트"""
+
+    @pytest.fixture
+    def content_filter(self, bare_content_filter):
+        return bare_content_filter
+
+    @pytest.mark.asyncio
+    async def test_recorded_corpus_parse_failures(self, content_filter):
+        """같은 응답 코퍼스에서 텍스트 모드는 파싱 실패가 발생하고 구조화 모드는 발생하지 않아야 함"""
+        messages = [{"role": "user", "content": "분석"}]
+
+        content_filter.structured_output = False
+        content_filter.llm_client.chat = AsyncMock(side_effect=RECORDED_ANALYSIS_RESPONSES)
+        text_results = [
+            await content_filter._request_json(content_filter.llm_client, "strong", messages, SafetyAnalysisOutput)
+            for _ in RECORDED_ANALYSIS_RESPONSES
+        ]
+
+        content_filter.structured_output = True
+        content_filter.llm_client.chat_structured = AsyncMock(return_value=SafetyAnalysisOutput(**ANALYSIS))
+        structured_results = [
+            await content_filter._request_json(content_filter.llm_client, "strong", messages, SafetyAnalysisOutput)
+            for _ in RECORDED_ANALYSIS_RESPONSES
+        ]
+
+        stats = content_filter.parse_metrics.get_stats()
+        text_failures = sum("parsing_error" in result["risk_categories"] for result in text_results)
+        assert text_failures == stats["modes"][MODE_TEXT]["parse_failures"] == 5
+        assert stats["modes"][MODE_STRUCTURED]["parse_failures"] == 0
+        assert all(result["safety_score"] == 0.4 for result in structured_results)
+
+    @pytest.mark.asyncio
+    async def test_structured_process_uses_schemas(self, content_filter):
+        content_filter.structured_output = True
+        content_filter.llm_client.chat_structured = AsyncMock(
+            side_effect=[
+                SafetyAnalysisOutput(**ANALYSIS),
+                SafetyRecheckOutput(is_approved=True, final_safety_score=0.9),
+            ]
+        )
+        content_filter.llm_client.chat = AsyncMock(return_value="정보 제공 위주의 대체 컨텐츠입니다.")
+
+        result = await content_filter.process("이 종목 지금 사세요")
+
+        schemas = [call.args[1] for call in content_filter.llm_client.chat_structured.await_args_list]
+        assert schemas == [SafetyAnalysisOutput, SafetyRecheckOutput]
+        assert content_filter.llm_client.chat.await_count == 1  # 대체 생성만 자유 형식
+        assert result["is_safe"] is True
+        assert result["safety_score"] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_validation_failure_routes_to_parsing_error(self, content_filter):
+        content_filter.structured_output = True
+
+        def invalid(*args):
+            return SafetyAnalysisOutput(is_safe=True, safety_score=2.0)
+
+        content_filter.llm_client.chat_structured = AsyncMock(side_effect=invalid)
+
+        state = await content_filter._analyze_content(
+            {"original_content": "내용", "safety_level": "strict", "retry_count": 0}
+        )
+
+        assert state["error_message"] == "JSON 파싱 실패"
+        assert state["risk_categories"] == ["parsing_error"]
+        assert content_filter.parse_metrics.get_stats()["modes"][MODE_STRUCTURED]["parse_failures"] == 1
@@ -0,0 +1,148 @@
+"""
+경계 점수 대체 컨텐츠 선행 생성 테스트
+"""
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.filter_prompts import DISCLAIMER_TEMPLATE
+
+REPLACEMENT = "정보 제공 위주의 대체 컨텐츠입니다."
+
+
+def _analysis(score: float, risk_categories=("investment_advice",)) -> str:
+    return json.dumps(
+        {"is_safe": score >= 0.85, "safety_score": score, "risk_categories": list(risk_categories), "filter_reason": "권유"}
+    )
+
+
+class FakeStrongModel:
+    """고성능 모델 - 분석은 release 전까지 대기, 대체/재검토는 즉시 응답"""
+
+    def __init__(self, strong_score: float, risk_categories=("investment_advice",), release_on_replace: bool = True):
+        self.strong_score = strong_score
+        self.risk_categories = risk_categories
+        self.release_on_replace = release_on_replace
+        self.release = asyncio.Event()
+        self.calls = []
+        self.replacement_cancelled = False
+
+    async def chat(self, messages):
+        prompt = messages[0]["content"]
+        if "안전성을 평가하는 전문가" in prompt:
+            self.calls.append("analyze")
+            await self.release.wait()
+            return _analysis(self.strong_score, self.risk_categories)
+        if "대체 컨텐츠:" in prompt:
+            self.calls.append("replace")
+            # 분석이 끝날 수 있도록 대체 생성 시작 시점에 분석 응답 허용
+            if self.release_on_replace:
+                self.release.set()
+            try:
+                await asyncio.sleep(0.01)
+            except asyncio.CancelledError:
+                self.replacement_cancelled = True
+                raise
+            return REPLACEMENT
+        self.calls.append("recheck")
+        return '{"is_approved": true, "final_safety_score": 0.9}'
+
+
+class TestSpeculativeReplacement:
+    """ContentFilter 대체 컨텐츠 선행 생성 테스트"""
+
+    @pytest.fixture
+    def content_filter(self, bare_content_filter):
+        bare_content_filter.speculative_replacement = True
+        bare_content_filter.speculative_band = 0.1
+        bare_content_filter.fast_llm_client = MagicMock()
+        bare_content_filter.fast_llm_client.chat = AsyncMock(return_value=_analysis(0.8))
+        return bare_content_filter
+
+    @pytest.mark.asyncio
+    async def test_borderline_unsafe_uses_speculative_replacement(self, content_filter):
+        strong = FakeStrongModel(strong_score=0.75)
+        content_filter.llm_client = strong
+
+        result = await content_filter.process("이 종목 지금 사세요")
+
+        # 대체 생성이 고성능 분석 완료 전에 시작되고 한 번만 실행됨
+        assert strong.calls == ["analyze", "replace", "recheck"]
+        assert result["filtered_content"] == REPLACEMENT + DISCLAIMER_TEMPLATE
+        assert result["is_safe"] is True
+        assert result["speculative_replacement"] is None
+        speculations = content_filter.tier_metrics.get_stats()["speculative_replacements"]
+        assert speculations["started"] == speculations["used"] == 1
+
+    @pytest.mark.asyncio
+    async def test_borderline_safe_cancels_speculation(self, content_filter):
+        strong = FakeStrongModel(strong_score=0.95)
+        content_filter.llm_client = strong
+
+        result = await content_filter.process("이 종목 지금 사세요")
+        await asyncio.sleep(0)
+
+        assert result["filtered_content"] == "이 종목 지금 사세요"
+        assert strong.replacement_cancelled is True
+        assert "recheck" not in strong.calls
+        assert content_filter.tier_metrics.get_stats()["speculative_replacements"]["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_strong_categories_discard_speculation(self, content_filter):
+        """고성능 모델의 위험 카테고리가 경량 모델과 다르면 선행 생성을 버리고 다시 생성해야 함"""
+        strong = FakeStrongModel(strong_score=0.75, risk_categories=["investment_advice", "market_manipulation"])
+        content_filter.llm_client = strong
+
+        result = await content_filter.process("이 종목 지금 사세요")
+
+        assert strong.calls == ["analyze", "replace", "replace", "recheck"]
+        assert strong.replacement_cancelled is True
+        assert result["filtered_content"] == REPLACEMENT + DISCLAIMER_TEMPLATE
+        speculations = content_filter.tier_metrics.get_stats()["speculative_replacements"]
+        assert speculations["cancelled"] == 1 and speculations["used"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("native_executor", [True, False], ids=["native", "graph"])
+    async def test_cancelled_process_discards_speculation(self, content_filter, native_executor):
+        """process가 취소되어도 선행 생성 작업이 남지 않아야 함"""
+        strong = FakeStrongModel(strong_score=0.75, release_on_replace=False)
+        content_filter.llm_client = strong
+
+        with patch("app.services.content_filter.settings.FILTER_NATIVE_EXECUTOR_ENABLED", native_executor):
+            task = asyncio.create_task(content_filter.process("이 종목 지금 사세요"))
+            while "replace" not in strong.calls:
+                await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert strong.replacement_cancelled is True
+        assert content_filter.tier_metrics.get_stats()["speculative_replacements"]["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_score_outside_speculative_band_waits_for_analysis(self, content_filter):
+        content_filter.fast_llm_client.chat = AsyncMock(return_value=_analysis(0.9))  # 임계값 위 불확실 구간
+        strong = FakeStrongModel(strong_score=0.75)
+        strong.release.set()
+        content_filter.llm_client = strong
+
+        await content_filter.process("이 종목 지금 사세요")
+
+        assert strong.calls == ["analyze", "replace", "recheck"]
+        assert content_filter.tier_metrics.get_stats()["speculative_replacements"]["started"] == 0
+
+    @pytest.mark.asyncio
+    async def test_analysis_only_does_not_speculate(self, content_filter):
+        strong = FakeStrongModel(strong_score=0.75)
+        strong.release.set()
+        content_filter.llm_client = strong
+
+        state = await content_filter._analyze_content(
+            {"original_content": "이 종목 지금 사세요", "safety_level": "strict", "retry_count": 0}, speculate=False
+        )
+
+        assert strong.calls == ["analyze"]
+        assert state.get("speculative_replacement") is None
@@ -0,0 +1,112 @@
+"""
+컨텐츠 필터링 모델 티어링 테스트
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.llm import filter_llm_pool, llm_provider_pool
+from app.services.content_filter import ContentFilter
+from app.services.filter_tiers import FilterTierMetrics, TIER_FAST, TIER_STRONG, needs_escalation
+
+
+def _analysis(score: float) -> str:
+    return f'{{"is_safe": {"true" if score >= 0.85 else "false"}, "safety_score": {score}, "risk_categories": []}}'
+
+
+class TestNeedsEscalation:
+    """needs_escalation 테스트"""
+
+    def test_score_inside_band_escalates(self):
+        assert needs_escalation({"safety_score": 0.8}, threshold=0.85, band=0.1) is True
+        assert needs_escalation({"safety_score": 0.95}, threshold=0.85, band=0.1) is True
+
+    def test_score_outside_band_does_not_escalate(self):
+        assert needs_escalation({"safety_score": 0.99}, threshold=0.85, band=0.1) is False
+        assert needs_escalation({"safety_score": 0.2}, threshold=0.85, band=0.1) is False
+
+    def test_parse_failure_escalates(self):
+        assert needs_escalation({"risk_categories": ["parsing_error"], "safety_score": 0.0}, 0.85, 0.1) is True
+        assert needs_escalation({}, 0.85, 0.1) is True
+
+
+class TestTieredAnalysis:
+    """ContentFilter 티어링 분석 테스트"""
+
+    @pytest.fixture
+    def content_filter(self, bare_content_filter):
+        bare_content_filter.fast_llm_client = MagicMock()
+        bare_content_filter.tier_metrics = FilterTierMetrics(cost_per_1k_chars={TIER_FAST: 0.001, TIER_STRONG: 0.1})
+        return bare_content_filter
+
+    def test_filter_clients_use_filter_settings_and_pool(self):
+        with patch("app.services.content_filter.LLMClient") as mock_llm_client, patch(
+            "app.services.content_filter.settings.FILTER_LLM_MODEL", "strong-model"
+        ), patch("app.services.content_filter.settings.FILTER_LLM_FAST_MODEL", "fast-model"):
+            ContentFilter()
+
+        models = [call.kwargs["model"] for call in mock_llm_client.call_args_list]
+        pools = {id(call.kwargs["pool"]) for call in mock_llm_client.call_args_list}
+        assert models == ["strong-model", "fast-model"]
+        assert pools == {id(filter_llm_pool)}
+        assert filter_llm_pool is not llm_provider_pool
+
+    def test_filter_provider_does_not_follow_active_provider(self):
+        """필터링 모델명은 OpenAI 모델이므로 기본 프로바이더가 바뀌어도 openai로 생성되어야 함"""
+        with patch("app.services.content_filter.LLMClient") as mock_llm_client, patch(
+            "app.core.config.settings.ACTIVE_LLM_PROVIDER", "anthropic"
+        ):
+            ContentFilter()
+
+        assert {call.kwargs["provider_type"] for call in mock_llm_client.call_args_list} == {"openai"}
+
+    @pytest.mark.asyncio
+    async def test_confident_fast_result_is_used(self, content_filter):
+        content_filter.fast_llm_client.chat = AsyncMock(return_value=_analysis(0.99))
+        content_filter.llm_client.chat = AsyncMock()
+
+        result = await content_filter.process("경제 지표 설명")
+
+        assert result["is_safe"] is True
+        content_filter.llm_client.chat.assert_not_called()
+        stats = content_filter.tier_metrics.get_stats()
+        assert stats["escalations"] == 0
+        assert stats["tiers"][TIER_FAST]["calls"] == 1
+        assert stats["tiers"][TIER_FAST]["estimated_cost"] > 0
+
+    @pytest.mark.asyncio
+    async def test_uncertain_fast_result_escalates(self, content_filter):
+        content_filter.fast_llm_client.chat = AsyncMock(return_value=_analysis(0.8))
+        content_filter.llm_client.chat = AsyncMock(return_value=_analysis(0.95))
+
+        result = await content_filter.process("경계선 컨텐츠")
+
+        assert result["is_safe"] is True
+        assert result["safety_score"] == 0.95
+        stats = content_filter.tier_metrics.get_stats()
+        assert stats["escalations"] == 1
+        assert stats["escalation_rate"] == 1.0
+        assert stats["tiers"][TIER_STRONG]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_failure_falls_back_to_strong(self, content_filter):
+        content_filter.fast_llm_client.chat = AsyncMock(side_effect=Exception("timeout"))
+        content_filter.llm_client.chat = AsyncMock(return_value=_analysis(0.99))
+
+        result = await content_filter.process("경제 지표 설명")
+
+        assert result["is_safe"] is True
+        stats = content_filter.tier_metrics.get_stats()
+        assert stats["tiers"][TIER_FAST]["failures"] == 1
+        assert stats["tiers"][TIER_STRONG]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_band_uses_requested_safety_level(self, content_filter):
+        # permissive 임계값(0.55)에서 0.8은 불확실 구간 밖
+        content_filter.fast_llm_client.chat = AsyncMock(return_value=_analysis(0.8))
+        content_filter.llm_client.chat = AsyncMock()
+
+        await content_filter._analyze_content(
+            {"original_content": "설명", "safety_level": "permissive", "retry_count": 0}
+        )
+
+        content_filter.llm_client.chat.assert_not_called()
@@ -0,0 +1,69 @@
+"""
+컴파일된 그래프 레지스트리 테스트
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.constants import UserLevel
+from app.services.content_filter import ContentFilter
+from app.services.graph_registry import CompiledGraphRegistry
+from app.services.level_chain import AdvancedLevelChain, BeginnerLevelChain, IntermediateLevelChain
+
+
+class TestCompiledGraphRegistry:
+    """CompiledGraphRegistry 테스트"""
+
+    def test_builder_called_once_per_key(self):
+        registry = CompiledGraphRegistry()
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return object()
+
+        first = registry.get_or_compile("graph", builder)
+        second = registry.get_or_compile("graph", builder)
+
+        assert first is second
+        assert len(calls) == 1
+        assert registry.keys() == ["graph"]
+
+    def test_graph_shared_between_instances(self):
+        with patch("app.services.content_filter.LLMClient"), patch("app.services.level_chain.LLMClient"):
+            assert ContentFilter().graph is ContentFilter().graph
+            assert BeginnerLevelChain(UserLevel.BEGINNER).graph is BeginnerLevelChain(UserLevel.BEGINNER).graph
+            # 레벨별 토폴로지는 각각 별도로 컴파일
+            assert BeginnerLevelChain(UserLevel.BEGINNER).graph is not AdvancedLevelChain(UserLevel.ADVANCED).graph
+            assert IntermediateLevelChain(UserLevel.INTERMEDIATE).graph is not BeginnerLevelChain(
+                UserLevel.BEGINNER
+            ).graph
+
+    @pytest.mark.asyncio
+    async def test_shared_graph_uses_per_request_dependencies(self):
+        """같은 그래프를 공유해도 각 요청의 LLM 클라이언트가 사용되어야 함"""
+        with patch("app.services.content_filter.LLMClient"), patch(
+            "app.services.content_filter.settings.FILTER_PRECLASSIFIER_ENABLED", False
+        ), patch("app.services.content_filter.settings.FILTER_LLM_FAST_MODEL", ""):
+            safe_filter = ContentFilter()
+            unsafe_filter = ContentFilter()
+
+        safe_filter.llm_client = MagicMock()
+        unsafe_filter.llm_client = MagicMock()
+        safe_filter.verdict_cache = unsafe_filter.verdict_cache = None
+        safe_filter.structured_output = unsafe_filter.structured_output = False
+        safe_filter.llm_client.chat = AsyncMock(
+            return_value='{"is_safe": true, "safety_score": 0.95, "risk_categories": [], "filter_reason": ""}'
+        )
+        unsafe_filter.max_retries = 0
+        unsafe_filter.llm_client.chat = AsyncMock(
+            return_value='{"is_safe": false, "safety_score": 0.1, "risk_categories": ["investment_advice"]}'
+        )
+
+        safe_result = await safe_filter.process("안전한 설명")
+        unsafe_result = await unsafe_filter.process("위험한 권유")
+
+        assert safe_filter.graph is unsafe_filter.graph
+        assert safe_result["is_safe"] is True
+        assert unsafe_result["is_safe"] is False
+        assert safe_filter.llm_client.chat.await_count == 1
+        assert unsafe_filter.llm_client.chat.await_count == 1
@@ -0,0 +1,211 @@
+"""
+대화 이력 토큰 예산 관리 테스트
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.history_compaction import MESSAGE_OVERHEAD_TOKENS, HistoryCompactor, TokenCounter
+from app.services.response_cache import InMemoryCacheBackend, ResponseCache
+
+MESSAGE_TOKENS = 100 + MESSAGE_OVERHEAD_TOKENS
+
+
+class CharTokenCounter(TokenCounter):
+    """1글자 = 1토큰 (토크나이저 없이 결정적인 테스트용)"""
+
+    def _get_encoding(self):
+        return None
+
+    def _count(self, text: str) -> int:
+        return len(text or "")
+
+
+def _history(count: int, offset: int = 0) -> list:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"{i:02d}" + "가" * 98}
+        for i in range(offset, offset + count)
+    ]
+
+
+@pytest.fixture
+def llm_client():
+    client = MagicMock()
+    client.chat = AsyncMock(return_value="누적 요약")
+    return client
+
+
+@pytest.fixture
+def compactor(llm_client):
+    return HistoryCompactor(
+        counter=CharTokenCounter(),
+        cache=ResponseCache("history_summary_test", InMemoryCacheBackend()),
+        llm_client=llm_client,
+        max_history_tokens=500,
+        keep_turns=1,
+        summary_max_tokens=50,
+        max_request_tokens=2000,
+    )
+
+
+def _summarized_dialogue(llm_client, call_index: int = -1) -> str:
+    return llm_client.chat.call_args_list[call_index].args[0][1]["content"]
+
+
+class TestTokenCounter:
+    """TokenCounter 추정치 테스트"""
+
+    def test_estimate_without_tokenizer(self):
+        counter = TokenCounter()
+        counter._encoding_loaded = True  # 인코딩 없음: 추정치 사용
+
+        assert counter.count("금리 전망") == 4 + 1  # 한글 4자 + 공백 1자(ASCII 4자당 1토큰)
+        assert counter.count("a" * 40) == 10
+        assert counter.count_message({"role": "user", "content": ""}) == MESSAGE_OVERHEAD_TOKENS
+
+    def test_truncate(self):
+        counter = CharTokenCounter()
+
+        assert counter.truncate("가나다라마", 3) == "가나다"
+        assert counter.truncate("가나", 3) == "가나"
+        assert counter.truncate("가나", 0) == ""
+
+
+class TestHistoryCompactor:
+    """세션별 누적 요약 테스트"""
+
+    def test_history_within_budget_is_unchanged(self, compactor, llm_client):
+        history = _history(4)
+        result = asyncio.run(compactor.compact("session", history))
+
+        assert result.summary is None
+        assert result.messages == history
+        llm_client.chat.assert_not_called()
+
+    def test_older_turns_are_summarized(self, compactor, llm_client):
+        history = _history(10)
+        result = asyncio.run(compactor.compact("session", history))
+
+        assert result.summary == "누적 요약"
+        assert result.messages == history[-2:]  # 최근 1턴 원문 유지
+        assert result.summarized_messages == 8
+        assert result.original_tokens == 10 * MESSAGE_TOKENS
+        assert result.tokens <= 500
+        assert "User: 00" in _summarized_dialogue(llm_client) and "Assistant: 07" in _summarized_dialogue(llm_client)
+
+    def test_summary_is_updated_incrementally(self, compactor, llm_client):
+        asyncio.run(compactor.compact("session", _history(10)))
+
+        # 요약 이후 대화가 예산 안이면 LLM 호출 없이 캐시된 요약 사용
+        result = asyncio.run(compactor.compact("session", _history(12)))
+        assert llm_client.chat.call_count == 1
+        assert result.summary == "누적 요약"
+        assert result.messages == _history(4, offset=8)
+
+        # 예산을 넘으면 새로 밀려난 대화만 기존 요약에 합침
+        llm_client.chat.return_value = "갱신된 요약"
+        result = asyncio.run(compactor.compact("session", _history(14)))
+        dialogue = _summarized_dialogue(llm_client)
+        assert llm_client.chat.call_count == 2
+        assert "[기존 요약]\n누적 요약" in dialogue
+        assert "User: 08" in dialogue and "Assistant: 11" in dialogue and "User: 00" not in dialogue
+        assert result.summary == "갱신된 요약"
+        assert result.messages == _history(2, offset=12)
+
+    def test_edited_history_invalidates_summary(self, compactor, llm_client):
+        asyncio.run(compactor.compact("session", _history(10)))
+
+        edited = _history(12)
+        edited[0] = {"role": "user", "content": "수정된 질문" + "나" * 94}
+        asyncio.run(compactor.compact("session", edited))
+
+        assert llm_client.chat.call_count == 2
+        assert "[기존 요약]\n없음" in _summarized_dialogue(llm_client)
+        assert "User: 수정된 질문" in _summarized_dialogue(llm_client)
+
+    def test_sessions_are_isolated(self, compactor, llm_client):
+        asyncio.run(compactor.compact("session-a", _history(10)))
+        asyncio.run(compactor.compact("session-b", _history(10)))
+
+        assert llm_client.chat.call_count == 2
+
+    def test_summary_failure_keeps_budget(self, compactor, llm_client):
+        llm_client.chat.side_effect = Exception("LLM 오류")
+        result = asyncio.run(compactor.compact("session", _history(10)))
+
+        assert result.summary is None
+        assert result.messages == _history(4, offset=6)  # 예산 안의 최근 대화만 유지
+        assert result.tokens <= 500
+        assert compactor.get_stats()["summary_failures"] == 1
+
+    def test_summary_is_capped(self, compactor, llm_client):
+        llm_client.chat.return_value = "요" * 200
+        result = asyncio.run(compactor.compact("session", _history(10)))
+
+        assert result.summary == "요" * 50
+
+    def test_refresh_is_saved_after_caller_times_out(self, compactor, llm_client):
+        """호출자가 시간 초과로 취소되어도 요약 갱신은 끝까지 실행되어 저장되어야 함"""
+
+        async def _slow_summary(messages):
+            await asyncio.sleep(0.05)
+            return "늦은 요약"
+
+        llm_client.chat = AsyncMock(side_effect=_slow_summary)
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(compactor.compact("session", _history(10)), timeout=0.01)
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run())
+
+        assert compactor.compact_cached("session", _history(10)).summary == "늦은 요약"
+        assert compactor.get_stats()["summary_updates"] == 1
+
+    def test_concurrent_requests_share_refresh(self, compactor, llm_client):
+        """같은 세션의 동시 요청은 진행 중인 요약 갱신 하나를 함께 기다려야 함"""
+
+        async def run():
+            return await asyncio.gather(
+                compactor.compact("session", _history(10)), compactor.compact("session", _history(10))
+            )
+
+        results = asyncio.run(run())
+
+        assert llm_client.chat.call_count == 1
+        assert [result.summary for result in results] == ["누적 요약", "누적 요약"]
+
+    def test_compact_cached_never_calls_llm(self, compactor, llm_client):
+        result = compactor.compact_cached("session", _history(10))
+        assert result.summary is None and result.tokens <= 500
+
+        asyncio.run(compactor.compact("session", _history(10)))
+        result = compactor.compact_cached("session", _history(12))
+        assert result.summary == "누적 요약"
+        assert llm_client.chat.call_count == 1
+
+
+class TestCapRequest:
+    """요청 전체 토큰 상한 테스트"""
+
+    def test_drops_oldest_history_first(self, compactor):
+        messages = [{"role": "system", "content": "시" * 200}, *_history(20), {"role": "user", "content": "질문"}]
+        capped = compactor.cap_request(messages)
+
+        assert capped[0] == messages[0] and capped[-1] == messages[-1]
+        assert capped[1:-1] == messages[-1 - len(capped[1:-1]) : -1]
+        assert sum(compactor.counter.count_message(m) for m in capped) <= 2000
+
+    def test_truncates_system_prompt_when_history_is_not_enough(self, compactor):
+        messages = [{"role": "system", "content": "시" * 3000}, {"role": "user", "content": "질문"}]
+        capped = compactor.cap_request(messages)
+
+        assert capped[-1] == messages[-1]
+        assert sum(compactor.counter.count_message(m) for m in capped) <= 2000
+
+    def test_request_within_cap_is_unchanged(self, compactor):
+        messages = [{"role": "system", "content": "시스템"}, *_history(4), {"role": "user", "content": "질문"}]
+
+        assert compactor.cap_request(messages) is messages
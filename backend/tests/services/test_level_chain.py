@@ -0,0 +1,162 @@
+"""
+레벨별 체인 스트리밍 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.constants import UserLevel
+from app.services.level_chain import STREAM_INTERRUPTED_MESSAGE, AdvancedLevelChain, BeginnerLevelChain, LevelChainService
+
+
+def _token_stream(tokens):
+    """토큰을 순서대로 내보내는 가짜 stream_chat"""
+
+    async def _stream(messages):
+        for token in tokens:
+            yield token
+
+    return _stream
+
+
+class TestLevelChainStreaming:
+    """LevelChain 토큰 스트리밍 테스트"""
+
+    @pytest.fixture(params=[True, False], ids=["fast_path", "graph"])
+    def beginner_chain(self, request):
+        """BeginnerLevelChain 인스턴스 생성 (직접 실행 / LangGraph 실행)"""
+        with patch("app.services.level_chain.LLMClient") as mock_llm_client, patch(
+            "app.services.level_chain.settings.LEVEL_CHAIN_FAST_PATH_ENABLED", request.param
+        ):
+            chain = BeginnerLevelChain(user_level=UserLevel.BEGINNER)
+            chain.llm_client = mock_llm_client.return_value
+            yield chain
+
+    @pytest.mark.asyncio
+    async def test_astream_yields_generate_response_tokens(self, beginner_chain):
+        """generate_response 노드의 토큰이 순서대로 전달되어야 함"""
+        # Given: 토큰 단위 LLM 응답
+        beginner_chain.llm_client.stream_chat = _token_stream(["CPI는 ", "소비자물가", "지수입니다."])
+
+        # When: 스트리밍 처리
+        tokens = [token async for token in beginner_chain.astream(UserLevel.BEGINNER, "CPI가 뭐예요?")]
+
+        # Then: 토큰이 그대로 전달되어야 함
+        assert tokens == ["CPI는 ", "소비자물가", "지수입니다."]
+
+    @pytest.mark.asyncio
+    async def test_first_token_arrives_before_generation_finishes(self, beginner_chain):
+        """첫 토큰은 전체 생성 완료 전에 도착해야 함"""
+        # Given: 토큰마다 지연이 있고 완료 여부를 기록하는 LLM 응답
+        generation = {"finished": False}
+
+        async def _slow_stream(messages):
+            for token in ["첫 ", "번째 ", "응답"]:
+                await asyncio.sleep(0.01)
+                yield token
+            generation["finished"] = True
+
+        beginner_chain.llm_client.stream_chat = _slow_stream
+
+        # When: 첫 토큰 수신
+        stream = beginner_chain.astream(UserLevel.BEGINNER, "질문")
+        first_token = await stream.__anext__()
+
+        # Then: 생성이 끝나기 전에 첫 토큰이 도착
+        assert first_token == "첫 "
+        assert generation["finished"] is False
+        assert [token async for token in stream] == ["번째 ", "응답"]
+        assert generation["finished"] is True
+
+    @pytest.mark.asyncio
+    async def test_astream_falls_back_when_generation_fails(self, beginner_chain):
+        """LLM 오류 시 기본 응답이 전달되어야 함"""
+
+        # Given: 첫 토큰 전에 실패하는 LLM
+        async def _failing_stream(messages):
+            raise Exception("LLM 오류")
+            yield  # pragma: no cover
+
+        beginner_chain.llm_client.stream_chat = _failing_stream
+
+        # When: 스트리밍 처리
+        tokens = [token async for token in beginner_chain.astream(UserLevel.BEGINNER, "질문")]
+
+        # Then: 오류 안내 메시지 한 번만 전달
+        assert tokens == ["죄송합니다. 현재 답변을 제공할 수 없습니다."]
+
+    @pytest.mark.asyncio
+    async def test_astream_signals_interrupted_generation(self, beginner_chain):
+        """일부 토큰 전달 후 LLM 오류 시 중단 안내가 이어서 전달되어야 함"""
+
+        # Given: 토큰 일부를 보낸 뒤 실패하는 LLM
+        async def _interrupted_stream(messages):
+            yield "금리는 "
+            raise Exception("연결 끊김")
+
+        beginner_chain.llm_client.stream_chat = _interrupted_stream
+
+        # When: 스트리밍 처리
+        tokens = [token async for token in beginner_chain.astream(UserLevel.BEGINNER, "질문")]
+
+        # Then: 부분 응답 + 중단 안내 (기본 응답으로 덮어쓰지 않음)
+        assert tokens == ["금리는 ", STREAM_INTERRUPTED_MESSAGE]
+
+    @pytest.mark.asyncio
+    async def test_process_collects_full_response(self, beginner_chain):
+        """기존 process는 전체 응답을 반환해야 함"""
+        beginner_chain.llm_client.stream_chat = _token_stream(["안녕", "하세요"])
+
+        result = await beginner_chain.process(UserLevel.BEGINNER, "질문")
+
+        assert result["final_response"] == "안녕하세요"
+        assert result["processing_step"] == "완료"
+
+    @pytest.mark.asyncio
+    async def test_service_stream_rejects_empty_query(self):
+        """빈 쿼리는 안내 메시지만 전달해야 함"""
+        service = LevelChainService()
+
+        tokens = [token async for token in service.stream(UserLevel.BEGINNER, "  ")]
+
+        assert tokens == ["죄송합니다. 유효한 질문을 입력해주세요."]
+
+
+class TestPrefetchedSearch:
+    """실전러 검색 판단/결과 사전 준비 테스트"""
+
+    @pytest.fixture
+    def advanced_chain(self):
+        with patch("app.services.level_chain.LLMClient") as mock_llm_client:
+            chain = AdvancedLevelChain(user_level=UserLevel.ADVANCED)
+            chain.llm_client = mock_llm_client.return_value
+            yield chain
+
+    @pytest.mark.asyncio
+    async def test_prefetch_search_runs_analysis_and_search(self, advanced_chain):
+        """검색이 필요하면 검색 결과까지 미리 준비되어야 함"""
+        advanced_chain.llm_client.chat = AsyncMock(return_value="YES")
+
+        with patch("app.services.level_chain.search_web_with_agent", AsyncMock(return_value="검색 결과")):
+            prefetched = await advanced_chain.prefetch_search("오늘 나스닥 지수는?")
+
+        assert prefetched == {
+            "needs_search": True,
+            "search_results": "검색 결과",
+            "tools_used": ["ai_search_analysis", "web_search"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_prefetched_search_skips_analysis(self, advanced_chain):
+        """미리 준비된 검색 결과가 있으면 분석/검색 없이 응답을 생성해야 함"""
+        advanced_chain.llm_client.chat = AsyncMock(return_value="YES")
+        advanced_chain.llm_client.stream_chat = _token_stream(["나스닥은 ", "상승했습니다."])
+        prefetched = {"needs_search": True, "search_results": "검색 결과", "tools_used": ["web_search"]}
+
+        with patch("app.services.level_chain.search_web_with_agent", AsyncMock()) as search:
+            result = await advanced_chain.process(UserLevel.ADVANCED, "오늘 나스닥은?", prefetched_search=prefetched)
+
+        advanced_chain.llm_client.chat.assert_not_called()
+        search.assert_not_called()
+        assert result["final_response"] == "나스닥은 상승했습니다."
+        assert result["search_results"] == "검색 결과"
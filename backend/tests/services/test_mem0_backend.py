@@ -0,0 +1,78 @@
+"""
+mem0 비동기 어댑터 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.services.mem0_backend import AsyncMemoryBackend
+
+
+class _SlowMemory:
+    """네트워크 왕복을 흉내 내는 동기 mem0 SDK"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    def search(self, query, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        self.active -= 1
+        return {"results": [{"memory": query}]}
+
+
+class TestAsyncMemoryBackend:
+    """AsyncMemoryBackend 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slow_search_does_not_block_event_loop(self):
+        """느린 메모리 검색 중에도 다른 요청은 계속 처리되어야 함"""
+        backend = AsyncMemoryBackend(_SlowMemory(delay=0.3), max_concurrency=2)
+        served = []
+
+        async def _other_requests():
+            for i in range(5):
+                await asyncio.sleep(0.02)
+                served.append(time.perf_counter())
+
+        start_time = time.perf_counter()
+        search_task = asyncio.create_task(backend.search("CPI"))
+        await _other_requests()
+
+        # 검색이 끝나기 전에 다른 요청들이 모두 처리됨
+        assert not search_task.done()
+        assert served[-1] - start_time < 0.25
+        assert await search_task == {"results": [{"memory": "CPI"}]}
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self):
+        """제한 시간을 넘기면 TimeoutError가 발생해야 함"""
+        backend = AsyncMemoryBackend(_SlowMemory(delay=0.2), read_timeout=0.05)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await backend.search("CPI")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """동시 SDK 호출 수는 max_concurrency를 넘지 않아야 함"""
+        memory = _SlowMemory(delay=0.05)
+        backend = AsyncMemoryBackend(memory, max_concurrency=2)
+
+        await asyncio.gather(*(backend.search(f"q{i}") for i in range(6)))
+
+        assert memory.max_active <= 2
+
+    @pytest.mark.asyncio
+    async def test_service_returns_empty_on_timeout(self):
+        """Mem0Service 검색 시간 초과 시 빈 결과로 대체되어야 함"""
+        from app.services.mem0_service import Mem0Service
+
+        service = Mem0Service.__new__(Mem0Service)
+        service.memory = _SlowMemory(delay=0.2)
+        service.backend = AsyncMemoryBackend(service.memory, read_timeout=0.05)
+
+        assert await service.search_relevant_memories(user_id="u1", query="CPI") == []
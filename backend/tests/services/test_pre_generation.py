@@ -0,0 +1,134 @@
+"""
+응답 생성 전 단계 동시 실행 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.services.pre_generation import ClientDisconnectedError, PreGenerationStage, run_pre_generation_stages
+
+
+def _sleep_stage(name, delay, result=None, **kwargs):
+    """delay초 후 result를 반환하는 단계"""
+
+    async def _run():
+        await asyncio.sleep(delay)
+        return result if result is not None else name
+
+    return PreGenerationStage(name=name, run=_run, **kwargs)
+
+
+class TestPreGenerationStages:
+    """run_pre_generation_stages 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently(self):
+        """전체 소요 시간은 가장 느린 단계 기준이어야 함"""
+        stages = [
+            _sleep_stage("session", 0.1, timeout=1, required=True),
+            _sleep_stage("memory", 0.1, timeout=1),
+            _sleep_stage("search", 0.1, timeout=1),
+        ]
+
+        start_time = time.perf_counter()
+        results = await run_pre_generation_stages(stages)
+        elapsed = time.perf_counter() - start_time
+
+        assert results == {"session": "session", "memory": "memory", "search": "search"}
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_optional_stage_timeout_uses_default(self):
+        """선택 단계가 제한 시간을 넘기면 기본값을 사용해야 함"""
+        stages = [
+            _sleep_stage("session", 0, timeout=1, required=True),
+            _sleep_stage("memory", 1, timeout=0.05, default=None),
+        ]
+
+        results = await run_pre_generation_stages(stages)
+
+        assert results == {"session": "session", "memory": None}
+
+    @pytest.mark.asyncio
+    async def test_optional_stage_error_uses_default(self):
+        """선택 단계 오류는 기본값으로 대체되어야 함"""
+
+        async def _fail():
+            raise Exception("mem0 오류")
+
+        stages = [PreGenerationStage(name="memory", run=_fail, timeout=1, default="")]
+
+        assert await run_pre_generation_stages(stages) == {"memory": ""}
+
+    @pytest.mark.asyncio
+    async def test_default_factory_runs_only_on_fallback(self):
+        """default_factory는 단계가 실패/시간 초과한 경우에만 호출되어야 함"""
+        calls = []
+
+        def _factory():
+            calls.append(True)
+            return "캐시된 값"
+
+        results = await run_pre_generation_stages(
+            [
+                _sleep_stage("history", 0, timeout=1, default_factory=_factory),
+                _sleep_stage("memory", 1, timeout=0.05, default_factory=_factory),
+            ]
+        )
+
+        assert results == {"history": "history", "memory": "캐시된 값"}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_required_stage_failure_cancels_others(self):
+        """필수 단계 실패 시 예외가 전파되고 나머지 단계는 취소되어야 함"""
+        cancelled = asyncio.Event()
+
+        async def _fail():
+            raise ValueError("DB 오류")
+
+        async def _slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stages = [
+            PreGenerationStage(name="session", run=_fail, timeout=1, required=True),
+            PreGenerationStage(name="search", run=_slow, timeout=10),
+        ]
+
+        with pytest.raises(ValueError):
+            await run_pre_generation_stages(stages)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_client_disconnect_cancels_stages(self):
+        """클라이언트 연결 종료 시 모든 단계가 취소되어야 함"""
+        cancelled = asyncio.Event()
+        disconnected = {"value": False}
+
+        async def _slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def _is_disconnected():
+            return disconnected["value"]
+
+        async def _disconnect_later():
+            await asyncio.sleep(0.05)
+            disconnected["value"] = True
+
+        asyncio.create_task(_disconnect_later())
+        stages = [PreGenerationStage(name="search", run=_slow, timeout=10)]
+
+        with pytest.raises(ClientDisconnectedError):
+            await run_pre_generation_stages(stages, is_disconnected=_is_disconnected, poll_interval=0.01)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
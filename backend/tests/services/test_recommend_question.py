@@ -0,0 +1,109 @@
+"""
+추천 질문 캐시 및 일괄 생성 테스트
+"""
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.constants import UserLevel
+from app.services.recommend_question import (
+    generate_recommend_questions,
+    generate_recommend_questions_batch,
+    postprocess_questions,
+)
+from app.services.response_cache import recommend_question_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    recommend_question_cache.backend.clear()
+    yield
+    recommend_question_cache.backend.clear()
+
+
+@pytest.fixture
+def llm_client():
+    client = MagicMock()
+    client.chat = AsyncMock()
+    return client
+
+
+class TestRecommendQuestion:
+    """추천 질문 생성 테스트"""
+
+    def test_postprocess_truncates_and_limits(self):
+        questions = postprocess_questions(["CPI가 뭐예요?", "", "소비자물가지수 발표가 주식시장에 미치는 영향은?", "세번째?", "네번째?"], 3, 10)
+
+        assert questions == ["CPI가 뭐예요?", "소비자물가지수 발?", "세번째?"]
+
+    @pytest.mark.asyncio
+    async def test_same_request_uses_cache(self, llm_client):
+        """같은 레벨/이벤트 설명 요청은 LLM을 한 번만 호출해야 함"""
+        llm_client.chat.return_value = "CPI가 뭐예요?\n물가란?\n금리와 관계는?"
+
+        first = await generate_recommend_questions(llm_client, UserLevel.BEGINNER, "CPI 발표", 3, 15)
+        second = await generate_recommend_questions(llm_client, UserLevel.BEGINNER, "CPI 발표", 3, 15)
+        other_level = await generate_recommend_questions(llm_client, UserLevel.ADVANCED, "CPI 발표", 3, 15)
+
+        assert first == second == other_level == ["CPI가 뭐예요?", "물가란?", "금리와 관계는?"]
+        assert llm_client.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_response_is_not_cached(self, llm_client):
+        llm_client.chat.return_value = ""
+
+        assert await generate_recommend_questions(llm_client, UserLevel.BEGINNER, "CPI 발표") == []
+        assert await generate_recommend_questions(llm_client, UserLevel.BEGINNER, "CPI 발표") == []
+        assert llm_client.chat.await_count == 2
+
+
+class TestRecommendQuestionBatch:
+    """추천 질문 일괄 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_fills_cache_with_single_call(self, llm_client):
+        """여러 이벤트 x 레벨을 한 번의 호출로 생성하고 캐시에 저장해야 함"""
+        levels = [UserLevel.BEGINNER, UserLevel.ADVANCED]
+        llm_client.chat.return_value = "```json\n" + json.dumps(
+            {
+                "e0": {"BEGINNER": ["CPI가 뭐예요?"], "ADVANCED": ["CPI 시나리오?"]},
+                "e1": {"BEGINNER": ["고용이란?"], "ADVANCED": ["고용 포지셔닝?"]},
+            },
+            ensure_ascii=False,
+        ) + "\n```"
+
+        results = await generate_recommend_questions_batch(
+            llm_client, ["CPI 발표", "고용 보고서"], levels=levels, question_count=1, string_length=15
+        )
+
+        assert llm_client.chat.await_count == 1
+        assert results[("CPI 발표", UserLevel.ADVANCED)] == ["CPI 시나리오?"]
+        assert results[("고용 보고서", UserLevel.BEGINNER)] == ["고용이란?"]
+
+        # 이후 단건 요청은 캐시 사용
+        cached = await generate_recommend_questions(llm_client, UserLevel.BEGINNER, "CPI 발표", 1, 15)
+        assert cached == ["CPI가 뭐예요?"]
+        assert llm_client.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_cached_events(self, llm_client):
+        """이미 캐시된 이벤트는 다시 생성하지 않아야 함"""
+        llm_client.chat.return_value = json.dumps({"e0": {"BEGINNER": ["CPI가 뭐예요?"]}}, ensure_ascii=False)
+        await generate_recommend_questions_batch(llm_client, ["CPI 발표"], levels=[UserLevel.BEGINNER], question_count=1)
+
+        results = await generate_recommend_questions_batch(
+            llm_client, ["CPI 발표"], levels=[UserLevel.BEGINNER], question_count=1
+        )
+
+        assert llm_client.chat.await_count == 1
+        assert results == {("CPI 발표", UserLevel.BEGINNER): ["CPI가 뭐예요?"]}
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_returns_partial_results(self, llm_client):
+        """파싱 실패 시 해당 묶음만 제외해야 함"""
+        llm_client.chat.return_value = "질문을 생성할 수 없습니다"
+
+        results = await generate_recommend_questions_batch(llm_client, ["CPI 발표"], levels=[UserLevel.BEGINNER])
+
+        assert results == {}
@@ -0,0 +1,120 @@
+"""
+LLM 응답 캐시 테스트
+"""
+from unittest.mock import patch
+
+from app.services.response_cache import InMemoryCacheBackend, RedisCacheBackend, ResponseCache, hash_text
+
+
+class FakeRedis:
+    """get/set(ex=)/delete/scan_iter만 지원하는 가짜 Redis 클라이언트"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        value = self.store.get(key)
+        return value.encode("utf-8") if value is not None else None
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.store) if key.startswith(prefix)]
+
+
+class TestInMemoryCacheBackend:
+    """InMemoryCacheBackend 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        backend = InMemoryCacheBackend(max_size=2)
+        backend.set("a", "A", ttl=60)
+        backend.set("b", "B", ttl=60)
+        backend.get("a")  # a를 최근 사용으로 갱신
+        backend.set("c", "C", ttl=60)
+
+        assert backend.get("a") == "A"
+        assert backend.get("b") is None
+        assert backend.get("c") == "C"
+
+    def test_expired_item_is_removed(self):
+        backend = InMemoryCacheBackend()
+
+        with patch("app.services.response_cache.time.monotonic", return_value=100.0):
+            backend.set("a", "A", ttl=10)
+        with patch("app.services.response_cache.time.monotonic", return_value=111.0):
+            assert backend.get("a") is None
+        assert len(backend) == 0
+
+
+class TestRedisCacheBackend:
+    """RedisCacheBackend 테스트 (가짜 클라이언트)"""
+
+    def test_round_trip_with_ttl(self):
+        client = FakeRedis()
+        backend = RedisCacheBackend(client=client, prefix="test")
+
+        backend.set("key", "소비자물가지수는 중요합니다.", ttl=30)
+
+        assert backend.get("key") == "소비자물가지수는 중요합니다."
+        assert client.ttls["test:key"] == 30
+
+    def test_clear_only_removes_prefixed_keys(self):
+        client = FakeRedis()
+        client.set("other:key", '"x"')
+        backend = RedisCacheBackend(client=client, prefix="test")
+        backend.set("key", "value", ttl=30)
+
+        backend.clear()
+
+        assert list(client.store) == ["other:key"]
+
+
+class TestResponseCache:
+    """ResponseCache 테스트"""
+
+    def test_key_changes_with_prompt_and_updated_at(self):
+        cache = ResponseCache("explain", InMemoryCacheBackend())
+
+        key = cache.make_key(1, "BEGINNER", "strict", hash_text("프롬프트 v1"), "2024-01-01")
+
+        assert key == cache.make_key(1, "BEGINNER", "strict", hash_text("프롬프트 v1"), "2024-01-01")
+        assert key != cache.make_key(1, "BEGINNER", "strict", hash_text("프롬프트 v2"), "2024-01-01")
+        assert key != cache.make_key(1, "BEGINNER", "strict", hash_text("프롬프트 v1"), "2024-01-02")
+
+    def test_hit_and_miss_stats(self):
+        cache = ResponseCache("explain", InMemoryCacheBackend())
+        key = cache.make_key("event")
+
+        assert cache.get(key) is None
+        cache.set(key, "설명")
+        assert cache.get(key) == "설명"
+
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_backend_error_is_treated_as_miss(self):
+        class BrokenBackend(InMemoryCacheBackend):
+            def get(self, key):
+                raise ConnectionError("redis down")
+
+            def set(self, key, value, ttl):
+                raise ConnectionError("redis down")
+
+        cache = ResponseCache("explain", BrokenBackend())
+
+        cache.set("key", "설명")
+        assert cache.get("key") is None
+
+    def test_disabled_cache_never_hits(self):
+        cache = ResponseCache("explain", InMemoryCacheBackend(), enabled=False)
+
+        cache.set("key", "설명")
+
+        assert cache.get("key") is None
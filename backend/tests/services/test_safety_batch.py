@@ -0,0 +1,158 @@
+"""
+컨텐츠 안전성 일괄 검사 테스트
+"""
+import asyncio
+import json
+import re
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.filter_output import SafetyBatchAnalysisOutput
+from app.services.filter_service import FilterService
+from app.services.response_cache import InMemoryCacheBackend, ResponseCache
+
+
+def _verdict_list(prompt: str, skip: set = frozenset()) -> list:
+    """프롬프트의 컨텐츠 JSON을 읽어 '사세요'가 포함된 컨텐츠만 위험으로 판정"""
+    items = json.loads(re.search(r"\{.*?\n\}", prompt, re.DOTALL).group(0))
+    return [
+        {
+            "id": item_id,
+            "is_safe": "사세요" not in content,
+            "safety_score": 0.2 if "사세요" in content else 0.95,
+            "risk_categories": ["investment_advice"] if "사세요" in content else [],
+            "filter_reason": "",
+        }
+        for item_id, content in items.items()
+        if content not in skip
+    ]
+
+
+def _verdicts_for(prompt: str, skip: set = frozenset()) -> str:
+    """텍스트 모드 응답 (코드 블록으로 감싼 JSON)"""
+    verdicts = _verdict_list(prompt, skip)
+    return f"```json\n{json.dumps({'verdicts': verdicts}, ensure_ascii=False)}\n```"
+
+
+class TestSafetyBatch:
+    """FilterService.check_safety_batch 테스트"""
+
+    @pytest.fixture
+    def filter_service(self):
+        with patch("app.services.content_filter.LLMClient"):
+            service = FilterService()
+        service.filter.llm_client = MagicMock()
+        service.filter.structured_output = False
+        service.filter.verdict_cache = ResponseCache("test_safety_batch", InMemoryCacheBackend(max_size=32))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_results_follow_input_order_and_dedupe(self, filter_service):
+        prompts = []
+
+        async def chat(messages):
+            prompts.append(messages[0]["content"])
+            return _verdicts_for(messages[0]["content"])
+
+        filter_service.filter.llm_client.chat = AsyncMock(side_effect=chat)
+        contents = ["금리 설명", "지금 사세요", "물가 설명", "금리 설명", "지금 사세요"]
+
+        with patch("app.services.filter_service.settings.FILTER_BATCH_ITEMS_PER_PROMPT", 2):
+            results = await filter_service.check_safety_batch(contents)
+
+        assert [result["is_safe"] for result in results] == [True, False, True, True, False]
+        assert all(result["analysis_only"] for result in results)
+        assert len(prompts) == 2  # 고유 3건을 2건씩 묶음
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_concurrency_cap(self, filter_service):
+        running = 0
+        max_running = 0
+
+        async def chat(messages):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _verdicts_for(messages[0]["content"])
+
+        filter_service.filter.llm_client.chat = AsyncMock(side_effect=chat)
+
+        with patch("app.services.filter_service.settings.FILTER_BATCH_ITEMS_PER_PROMPT", 1), patch(
+            "app.services.filter_service.settings.FILTER_BATCH_MAX_CONCURRENCY", 2
+        ):
+            results = await filter_service.check_safety_batch([f"설명 {i}" for i in range(6)])
+
+        assert len(results) == 6
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_verdicts_fall_back_to_single_check(self, filter_service):
+        async def chat(messages):
+            return _verdicts_for(messages[0]["content"], skip={"물가 설명"})
+
+        filter_service.filter.llm_client.chat = AsyncMock(side_effect=chat)
+        single = {"is_safe": True, "safety_score": 0.9, "risk_categories": [], "filter_reason": "", "analysis_only": True}
+        filter_service.check_safety_only = AsyncMock(return_value=single)
+
+        results = await filter_service.check_safety_batch(["금리 설명", "물가 설명"])
+
+        filter_service.check_safety_only.assert_awaited_once_with("물가 설명", None)
+        assert results[1] == single
+
+    @pytest.mark.asyncio
+    async def test_filter_disabled_returns_safe(self, filter_service):
+        filter_service.enabled = False
+
+        results = await filter_service.check_safety_batch(["a", "b"])
+
+        assert [result["is_safe"] for result in results] == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_cached_verdicts_skip_llm(self, filter_service):
+        filter_service.filter.llm_client.chat = AsyncMock(side_effect=lambda messages: _verdicts_for(messages[0]["content"]))
+
+        first = await filter_service.check_safety_batch(["금리 설명", "지금 사세요"])
+        second = await filter_service.check_safety_batch(["지금 사세요", "금리 설명"])
+
+        assert filter_service.filter.llm_client.chat.await_count == 1
+        assert second == [first[1], first[0]]
+
+    @pytest.mark.asyncio
+    async def test_passthrough_filter_verdict_is_reused(self, filter_service):
+        from app.core.config import settings
+
+        cache = filter_service.filter.verdict_cache
+        cache.set(
+            filter_service.filter._verdict_cache_key("금리 설명", settings.FILTER_SAFETY_LEVEL),
+            {
+                "passthrough": True,
+                "filtered_content": "금리 설명",
+                "is_safe": True,
+                "safety_score": 0.97,
+                "filter_reason": "",
+                "risk_categories": [],
+            },
+        )
+        filter_service.filter.llm_client.chat = AsyncMock()
+
+        results = await filter_service.check_safety_batch(["금리 설명"])
+
+        filter_service.filter.llm_client.chat.assert_not_called()
+        assert results[0]["safety_score"] == 0.97
+
+    @pytest.mark.asyncio
+    async def test_structured_output_uses_batch_schema(self, filter_service):
+        filter_service.filter.structured_output = True
+
+        async def chat_structured(messages, schema):
+            return schema.model_validate({"verdicts": _verdict_list(messages[0]["content"])})
+
+        filter_service.filter.llm_client.chat_structured = AsyncMock(side_effect=chat_structured)
+
+        results = await filter_service.check_safety_batch(["금리 설명", "지금 사세요"])
+
+        assert filter_service.filter.llm_client.chat_structured.await_args.args[1] is SafetyBatchAnalysisOutput
+        assert [result["is_safe"] for result in results] == [True, False]
@@ -0,0 +1,87 @@
+"""
+안전성 사전 분류기 테스트
+"""
+from app.services.safety_classifier import (
+    AhoCorasickAutomaton,
+    SafetyPreClassifier,
+    VERDICT_AMBIGUOUS,
+    VERDICT_RISKY,
+    VERDICT_SAFE,
+    normalize_text,
+)
+
+
+class TestAhoCorasickAutomaton:
+    """AhoCorasickAutomaton 테스트"""
+
+    def test_finds_overlapping_patterns(self):
+        automaton = AhoCorasickAutomaton(["he", "she", "his", "hers"])
+
+        matches = automaton.search("ushers")
+
+        assert sorted(pattern for _, pattern in matches) == ["he", "hers", "she"]
+
+    def test_failure_links_across_korean_patterns(self):
+        automaton = AhoCorasickAutomaton(["매수", "수익보장", "익보", "매수익률"])
+
+        matches = automaton.search("매수익보장")
+
+        assert sorted(matches) == [(1, "매수"), (3, "익보"), (4, "수익보장")]
+
+    def test_no_patterns(self):
+        assert AhoCorasickAutomaton([]).search("아무 텍스트") == []
+
+
+class TestSafetyPreClassifier:
+    """SafetyPreClassifier 테스트"""
+
+    def test_normalize_text(self):
+        assert normalize_text("팔아야  합니다\nBUY") == "팔아야합니다buy"
+        assert normalize_text("１００％") == "100%"
+
+    def test_plain_explanation_is_safe(self):
+        classifier = SafetyPreClassifier()
+
+        result = classifier.classify("CPI는 소비자물가지수로, 물가 변동을 측정하는 경제 지표입니다.")
+
+        assert result.verdict == VERDICT_SAFE
+        assert result.needs_strong_tier is False
+        assert result.matched_phrases == []
+
+    def test_risky_phrases_report_categories(self):
+        classifier = SafetyPreClassifier()
+
+        result = classifier.classify("내부자 정보로 확실한 수익! 지금 당장 사 세요")
+
+        assert result.verdict == VERDICT_RISKY
+        assert result.needs_strong_tier is True
+        assert {"market_manipulation", "guaranteed_profit", "investment_advice"} <= set(result.risk_categories)
+
+    def test_safe_alternatives_keys_are_risky(self):
+        classifier = SafetyPreClassifier(risk_lexicon={}, ambiguous_phrases=[])
+
+        result = classifier.classify("무조건 오릅니다")
+
+        assert result.verdict == VERDICT_RISKY
+        assert result.matched_phrases == ["무조건"]
+
+    def test_trading_terms_are_ambiguous(self):
+        classifier = SafetyPreClassifier(risk_lexicon={}, alternatives={}, ambiguous_phrases=["매수", "Target Price"])
+
+        assert classifier.classify("외국인 매수세가 이어졌습니다").verdict == VERDICT_AMBIGUOUS
+        assert classifier.classify("analysts raised the target  price").verdict == VERDICT_AMBIGUOUS
+
+    def test_stats_report_strong_tier_rate(self):
+        classifier = SafetyPreClassifier()
+
+        classifier.classify("금리는 중앙은행이 결정합니다.")
+        classifier.classify("확실한 수익을 보장합니다.")
+
+        stats = classifier.get_stats()
+        assert stats["total"] == 2
+        assert stats["safe"] == 1
+        assert stats["risky"] == 1
+        assert stats["strong_tier_rate"] == 0.5
+
+        classifier.reset_stats()
+        assert classifier.get_stats()["total"] == 0
@@ -0,0 +1,251 @@
+"""
+스트리밍 컨텐츠 필터 테스트
+"""
+import asyncio
+import json
+import re
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.filter_prompts import DISCLAIMER_TEMPLATE
+from app.services.filter_service import FilterService
+from app.services.stream_filter import SentenceWindowBuffer, StreamingContentFilter
+
+
+async def _tokens(tokens, delay: float = 0.0):
+    """토큰 스트림 생성"""
+    for token in tokens:
+        if delay:
+            await asyncio.sleep(delay)
+        yield token
+
+
+def _safe_state(content: str) -> dict:
+    return {"is_safe": True, "safety_score": 0.95, "filtered_content": content, "risk_categories": []}
+
+
+class FakeContentFilter:
+    """'사세요'는 대체, '내부자'는 차단, '장애'는 필터링 오류를 내는 ContentFilter 대역"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def process(self, content: str, safety_level: str = None, context: str = "") -> dict:
+        self.calls.append(content)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if "장애" in content:
+            return {
+                "is_safe": False,
+                "safety_score": 0.0,
+                "filtered_content": "죄송합니다. 현재 답변을 제공할 수 없습니다.",
+                "risk_categories": ["system_error"],
+            }
+        if "내부자" in content:
+            return {
+                "is_safe": False,
+                "safety_score": 0.1,
+                "filtered_content": "죄송합니다. 해당 질문에 대한 답변을 제공할 수 없습니다.",
+                "risk_categories": ["market_manipulation"],
+            }
+        if "사세요" in content:
+            return {
+                "is_safe": True,
+                "safety_score": 0.9,
+                "filtered_content": "매수를 고려해보실 수 있습니다." + DISCLAIMER_TEMPLATE,
+                "risk_categories": ["investment_advice"],
+                "retry_count": 1,
+            }
+        return _safe_state(content)
+
+
+class TestSentenceWindowBuffer:
+    """문장 윈도우 버퍼 테스트"""
+
+    def test_cuts_at_sentence_boundary_after_min_chars(self):
+        buffer = SentenceWindowBuffer(min_chars=5, max_chars=100)
+
+        windows = buffer.feed("짧다. 이 문장은 조금 더 깁니다. 나머지")
+
+        assert windows == ["짧다. 이 문장은 조금 더 깁니다. "]
+        assert buffer.flush() == "나머지"
+
+    def test_paragraph_boundary(self):
+        buffer = SentenceWindowBuffer(min_chars=3, max_chars=100)
+
+        windows = buffer.feed("첫 문단 내용\n\n두 번째")
+
+        assert windows == ["첫 문단 내용\n\n"]
+
+    def test_forced_split_at_max_chars(self):
+        buffer = SentenceWindowBuffer(min_chars=5, max_chars=10)
+
+        windows = buffer.feed("가나다 라마바 사아자 차카타")
+
+        assert windows[0] == "가나다 라마바 "
+        assert "".join(windows) + (buffer.flush() or "") == "가나다 라마바 사아자 차카타"
+
+
+class TestStreamingContentFilter:
+    """StreamingContentFilter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_safe_stream_passes_through_unchanged(self):
+        text = "CPI는 소비자물가지수입니다. 물가 변화를 보여줍니다. 매월 발표됩니다."
+        stream_filter = StreamingContentFilter(FakeContentFilter(), min_chars=5, max_chars=200)
+
+        chunks = [chunk async for chunk in stream_filter.filter(_tokens(list(text)))]
+
+        assert "".join(chunks) == text
+        assert stream_filter.stats.windows == 3
+        assert stream_filter.stats.replaced == 0
+
+    @pytest.mark.asyncio
+    async def test_unsafe_window_replaced_and_disclaimer_appended_once(self):
+        text = "금리는 중요합니다. 지금 이 주식을 사세요. 환율도 봐야 합니다."
+        stream_filter = StreamingContentFilter(FakeContentFilter(), min_chars=5, max_chars=200)
+
+        chunks = [chunk async for chunk in stream_filter.filter(_tokens(re.findall(r"\S+\s*", text)))]
+        output = "".join(chunks)
+
+        assert "사세요" not in output
+        assert output.startswith("금리는 중요합니다. 매수를 고려해보실 수 있습니다. 환율도 봐야 합니다.")
+        assert output.count(DISCLAIMER_TEMPLATE) == 1
+        assert stream_filter.stats.replaced == 1
+        assert stream_filter.stats.risk_categories == ["investment_advice"]
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_at_first_rejected_window(self):
+        """차단된 윈도우 이후에는 안내 문구 외에 아무것도 전달하지 않고 생성을 종료해야 함"""
+        generation = {"closed": False}
+
+        async def _generation():
+            try:
+                for sentence in ["금리는 중요합니다. ", "내부자 정보입니다. ", "환율도 봐야 합니다. ", "또 내부자 정보입니다."]:
+                    yield sentence
+            finally:
+                generation["closed"] = True
+
+        stream_filter = StreamingContentFilter(FakeContentFilter(), min_chars=5, max_chars=200)
+
+        chunks = [chunk async for chunk in stream_filter.filter(_generation())]
+
+        assert chunks[0] == "금리는 중요합니다. "
+        assert chunks[-1].startswith("죄송합니다. 해당 질문에 대한 답변을 제공할 수 없습니다.")
+        assert len(chunks) == 2  # 이후 안전 윈도우/면책 조항 없음
+        assert stream_filter.stats.rejected == 1
+        assert generation["closed"] is True
+
+    @pytest.mark.asyncio
+    async def test_first_window_released_while_generation_continues(self):
+        """첫 안전 윈도우는 생성이 끝나기 전에 전달되어야 함"""
+        generation = {"finished": False}
+
+        async def _slow_tokens():
+            for token in ["첫 문장입니다. ", "둘째 ", "문장", "입니다. ", "셋째 ", "문장입니다."]:
+                await asyncio.sleep(0.01)
+                yield token
+            generation["finished"] = True
+
+        stream_filter = StreamingContentFilter(FakeContentFilter(), min_chars=5, max_chars=200)
+        stream = stream_filter.filter(_slow_tokens())
+
+        first_chunk = await stream.__anext__()
+
+        assert first_chunk == "첫 문장입니다. "
+        assert generation["finished"] is False
+        assert "".join([chunk async for chunk in stream]) == "둘째 문장입니다. 셋째 문장입니다."
+
+    @pytest.mark.asyncio
+    async def test_windows_analysed_concurrently_with_generation(self):
+        """윈도우 분석이 생성과 겹쳐 전체 시간이 순차 처리보다 짧아야 함"""
+        sentences = [f"{i}번째 설명 문장입니다. " for i in range(5)]
+        content_filter = FakeContentFilter(delay=0.05)
+        stream_filter = StreamingContentFilter(content_filter, min_chars=5, max_chars=200, max_concurrency=5)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        output = "".join([chunk async for chunk in stream_filter.filter(_tokens(sentences, delay=0.05))])
+        elapsed = loop.time() - start
+
+        assert output == "".join(sentences)
+        # 순차 처리(생성 0.25초 + 분석 0.25초)보다 빨라야 함
+        assert elapsed < 0.45
+
+
+class TestWindowBoundaryContext:
+    """윈도우 경계에 걸친 위험 표현 판정 테스트 (실제 ContentFilter + 프롬프트 기준으로 판정하는 LLM 대역)"""
+
+    @pytest.fixture
+    def content_filter(self, bare_content_filter):
+        async def _judge(messages):
+            # 종목 매수 조건과 수익 보장이 함께 보여야 위험으로 판정
+            prompt = messages[0]["content"]
+            unsafe = "삼성전자를 사면" in prompt and "두 배" in prompt
+            score = 0.1 if unsafe else 0.95
+            return json.dumps({"is_safe": not unsafe, "safety_score": score, "risk_categories": [], "filter_reason": ""})
+
+        bare_content_filter.llm_client.chat = AsyncMock(side_effect=_judge)
+        return bare_content_filter
+
+    @pytest.mark.asyncio
+    async def test_claim_spanning_windows_matches_full_verdict(self, content_filter):
+        """strict 수준에서 경계에 걸친 주장도 전체 컨텐츠 판정과 같은 결과여야 함"""
+        text = "지금 삼성전자를 사면 다음 달에는 확실히 주가가 두 배가 됩니다"
+        stream_filter = StreamingContentFilter(content_filter, safety_level="strict", min_chars=5, max_chars=20)
+
+        full = await content_filter.process(text, "strict")
+        chunks = [chunk async for chunk in stream_filter.filter(_tokens(re.findall(r"\S+\s*", text)))]
+
+        assert stream_filter.stats.windows == 2  # "...사면 다음 달에는 " | "확실히 주가가 두 배가 됩니다"
+        assert full["is_safe"] is False
+        assert stream_filter.stats.rejected == 1
+        assert "두 배" not in "".join(chunks)
+
+
+class TestFilterServiceStream:
+    """FilterService.filter_stream 테스트"""
+
+    @pytest.fixture
+    def filter_service(self):
+        with patch("app.services.filter_service.ContentFilter"):
+            service = FilterService()
+            service.filter = FakeContentFilter()
+            service.filter_logger = MagicMock()
+            return service
+
+    @pytest.mark.asyncio
+    async def test_disabled_filter_passes_tokens(self, filter_service):
+        filter_service.enabled = False
+
+        chunks = [chunk async for chunk in filter_service.filter_stream(_tokens(["사세요", "!"]))]
+
+        assert chunks == ["사세요", "!"]
+
+    @pytest.mark.asyncio
+    async def test_stream_result_logged_once(self, filter_service):
+        chunks = [chunk async for chunk in filter_service.filter_stream(_tokens(["안전한 설명입니다."]))]
+
+        assert "".join(chunks) == "안전한 설명입니다."
+        filter_service.filter_logger.log_filter_result.assert_called_once()
+        assert filter_service.last_error is False
+
+    @pytest.mark.asyncio
+    async def test_filter_error_is_flagged(self, filter_service):
+        """필터링 자체가 실패하면 오류 문구를 문자열 비교 없이 last_error로 알 수 있어야 함"""
+        chunks = [chunk async for chunk in filter_service.filter_stream(_tokens(["장애가 발생한 구간입니다."]))]
+
+        assert chunks == ["죄송합니다. 현재 답변을 제공할 수 없습니다."]
+        assert filter_service.last_error is True
+
+    @pytest.mark.asyncio
+    async def test_generation_error_is_flagged(self, filter_service):
+        async def _failing_tokens():
+            yield "안전한 설명입니다. "
+            raise RuntimeError("LLM 오류")
+
+        chunks = [chunk async for chunk in filter_service.filter_stream(_failing_tokens())]
+
+        assert chunks[-1].startswith("죄송합니다. 현재 서비스 처리 중 문제가 발생했습니다.")
+        assert filter_service.last_error is True
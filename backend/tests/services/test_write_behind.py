@@ -0,0 +1,139 @@
+"""
+write-behind 큐 테스트
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.write_behind import MessageCountIncrement, WriteBehindQueue
+
+
+@pytest.fixture
+def db_session():
+    """context manager로 사용되는 가짜 DB 세션"""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    return session
+
+
+@pytest.fixture
+def queue(db_session):
+    return WriteBehindQueue(
+        batch_size=10, flush_interval=0.01, max_retries=2, retry_backoff=0.01, session_factory=lambda: db_session
+    )
+
+
+class TestWriteBehindQueue:
+    """WriteBehindQueue 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_message_counts_are_merged_per_session(self, queue, db_session):
+        """같은 세션의 카운트 증가는 합산되어 한 번에 커밋되어야 함"""
+        with patch("app.services.write_behind.crud_chat_sessions") as crud:
+            queue.start()
+            await queue.enqueue_message_count("session-a", 2)
+            await queue.enqueue_message_count("session-a", 2)
+            await queue.enqueue_message_count("session-b", 2)
+            await queue.shutdown()
+
+        calls = {call.kwargs["session_id"]: call.kwargs["count"] for call in crud.increment_message_count.call_args_list}
+        assert calls == {"session-a": 4, "session-b": 2}
+        db_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_memories_are_batched_per_user_session(self, queue):
+        """같은 사용자/세션의 대화는 한 번의 mem0 호출로 저장되어야 함"""
+        provider = MagicMock()
+        provider.add_conversation_message = AsyncMock(return_value={"success": True})
+
+        queue.start()
+        await queue.enqueue_memory(provider, user_id="u1", messages=[{"role": "user", "content": "질문1"}], session_id="s1")
+        await queue.enqueue_memory(provider, user_id="u1", messages=[{"role": "user", "content": "질문2"}], session_id="s1")
+        await queue.shutdown()
+
+        provider.add_conversation_message.assert_awaited_once_with(
+            user_id="u1",
+            messages=[{"role": "user", "content": "질문1"}, {"role": "user", "content": "질문2"}],
+            session_id="s1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_items_are_retried(self, queue, db_session):
+        """실패한 작업은 다시 처리되어야 함"""
+        db_session.commit.side_effect = [Exception("DB 오류"), None]
+
+        with patch("app.services.write_behind.crud_chat_sessions"):
+            queue.start()
+            await queue.enqueue_message_count("session-a", 2)
+            await asyncio.sleep(0.1)
+            await queue.shutdown()
+
+        assert db_session.commit.call_count == 2
+        assert queue.stats.retried == 1
+        assert queue.stats.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_items_dropped_after_max_retries(self, queue, db_session):
+        """재시도 한도를 넘긴 작업은 폐기되어야 함"""
+        db_session.commit.side_effect = Exception("DB 오류")
+
+        with patch("app.services.write_behind.crud_chat_sessions"):
+            await queue.enqueue_message_count("session-a", 2)
+
+        assert db_session.commit.call_count == 3
+        assert queue.stats.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_ingestion_is_not_retried(self, queue):
+        """mem0 add는 멱등하지 않으므로 실패 시 재시도 없이 폐기되어야 함"""
+        provider = MagicMock()
+        provider.add_conversation_message = AsyncMock(side_effect=Exception("mem0 오류"))
+
+        await queue.enqueue_memory(provider, user_id="u1", messages=[], session_id="s1")
+
+        provider.add_conversation_message.assert_awaited_once()
+        assert queue.stats.retried == 0
+        assert queue.stats.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_requeue_drops_items_when_queue_is_full(self, db_session):
+        """재시도 시 큐가 가득 차 있으면 드레이너를 멈추지 않고 폐기해야 함"""
+        queue = WriteBehindQueue(max_queue_size=1, session_factory=lambda: db_session)
+        queue._queue = asyncio.Queue(maxsize=1)
+
+        queue._requeue([MessageCountIncrement("s1", 2), MessageCountIncrement("s2", 2)])
+
+        assert queue._queue.qsize() == 1
+        assert queue.stats.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_enqueue_does_not_wait_for_processing(self, queue):
+        """드레이너 실행 중에는 enqueue가 처리 완료를 기다리지 않아야 함"""
+        processed = asyncio.Event()
+
+        async def _slow_add(**kwargs):
+            await asyncio.sleep(0.05)
+            processed.set()
+            return {"success": True}
+
+        provider = MagicMock()
+        provider.add_conversation_message = _slow_add
+
+        queue.start()
+        await queue.enqueue_memory(provider, user_id="u1", messages=[], session_id="s1")
+        assert not processed.is_set()
+
+        await queue.shutdown()
+        assert processed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_runs_inline_when_not_started(self, queue):
+        """드레이너가 없으면 호출 시점에 바로 처리되어야 함"""
+        provider = MagicMock()
+        provider.add_conversation_message = AsyncMock(return_value={"success": True})
+
+        await queue.enqueue_memory(provider, user_id="u1", messages=[], session_id="s1")
+
+        provider.add_conversation_message.assert_awaited_once()
+        assert queue.stats.inline == 1
@@ -11,6 +11,7 @@ from app.core.database import db
 from .services.llm_service import LLMServiceFactory
 from .services.fred_service import FredService
 from .services.event_service import EventService, ProgressReporter
+from .services.explanation_service import EventExplanationService, default_pregeneration_range
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -44,6 +45,10 @@ app.conf.update(
 BATCH_SIZE = int(os.getenv('LLM_BATCH_SIZE', '10'))
 API_DELAY = float(os.getenv('LLM_API_DELAY', '0.5'))
 
+# 이벤트 설명 사전 생성 설정
+PREGENERATE_EXPLANATIONS = os.getenv('PREGENERATE_EXPLANATIONS', 'true').lower() == 'true'
+EXPLANATION_DAYS_AHEAD = int(os.getenv('EXPLANATION_DAYS_AHEAD', '14'))
+
 
 class DataCollectionOrchestrator:
     """데이터 수집 오케스트레이터 (Orchestrator Pattern + Dependency Injection)"""
@@ -262,9 +267,35 @@ def data_collection_task(start_date: str = None, end_date: str = None):
     # 태스크 파라미터로 전달된 날짜가 있으면 사용, 없으면 환경변수 사용
     if start_date and end_date:
         logger.info(f"태스크 파라미터에서 날짜 범위 가져옴: {start_date} ~ {end_date}")
-        return orchestrator.collect_and_process_data_with_dates(start_date, end_date)
+        result = orchestrator.collect_and_process_data_with_dates(start_date, end_date)
     else:
-        return orchestrator.collect_and_process_data()
+        result = orchestrator.collect_and_process_data()
+
+    # 저장된 이벤트의 레벨별 설명 사전 생성
+    if PREGENERATE_EXPLANATIONS:
+        pregenerate_event_explanations_task.delay()
+
+    return result
+
+
+@app.task
+def pregenerate_event_explanations_task(days_ahead: int = None):
+    """
+    다가오는 이벤트의 레벨별 설명 사전 생성
+    - 필터링을 한 번 적용한 설명을 event_explanations 테이블에 저장
+    - /chatbot/event/explain은 저장된 설명을 바로 전송하고, 없을 때만 실시간 생성
+    """
+    start_date, end_date = default_pregeneration_range(days_ahead or EXPLANATION_DAYS_AHEAD)
+    service = EventExplanationService(
+        progress_reporter=ProgressReporter(batch_size=BATCH_SIZE, api_delay=API_DELAY)
+    )
+    stats = service.pregenerate(start_date, end_date)
+
+    return (
+        f"이벤트 설명 사전 생성 완료. "
+        f"기간: {start_date} ~ {end_date}, "
+        f"저장: {stats.saved_count}개, 스킵: {stats.skipped_count}개, 실패: {stats.failed_count}개"
+    )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,133 @@
+"""
+이벤트 설명 사전 생성 서비스 - 다가오는 이벤트의 레벨별 설명을 미리 생성하여 저장
+"""
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import List, Optional
+
+from app.core.database import db
+from app.core.llm import LangfuseManager, LLMProviderPool
+from app.crud.crud_events import crud_event_explanations
+from app.models import Events
+from app.services.event_explanation import (
+    explain_prompt_hash,
+    generate_filtered_explanation,
+    resolve_safety_level,
+    viewer_levels,
+)
+from app.utils.llm_client import LLMClient
+from .event_service import ProcessingStats, ProgressReporter
+
+logger = logging.getLogger(__name__)
+
+
+class ExplanationRepository:
+    """이벤트 설명 저장소 (Repository Pattern)"""
+
+    def get_upcoming_event_ids(self, start_date: date, end_date: date) -> List[int]:
+        """기간 내 삭제되지 않은 이벤트 ID 목록"""
+        with db.session as session:
+            rows = (
+                session.query(Events.id)
+                .filter(Events.date.between(start_date, end_date), Events.dropped_at.is_(None))
+                .order_by(Events.date.asc())
+                .all()
+            )
+            return [row.id for row in rows]
+
+
+class EventExplanationService:
+    """이벤트 설명 사전 생성 서비스 (Orchestrator Pattern)"""
+
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        repository: Optional[ExplanationRepository] = None,
+        progress_reporter: Optional[ProgressReporter] = None,
+        safety_level: Optional[str] = None,
+    ):
+        # 미지정 시 작업(이벤트 루프)마다 전용 클라이언트 생성 - 전역 풀의 HTTP 커넥션은 닫힌 루프에 묶일 수 있음
+        self.llm_client = llm_client
+        self.repository = repository or ExplanationRepository()
+        self.progress_reporter = progress_reporter or ProgressReporter()
+        self.safety_level = resolve_safety_level(safety_level)
+
+    def pregenerate(self, start_date: date, end_date: date) -> ProcessingStats:
+        """기간 내 이벤트의 레벨별 설명 생성 (이미 최신 설명이 있으면 스킵)"""
+        # 작업 전체를 하나의 이벤트 루프에서 실행하고, LLM 클라이언트는 이 루프 안에서만 사용
+        return asyncio.run(self._pregenerate(start_date, end_date))
+
+    @staticmethod
+    def _create_task_llm_client() -> LLMClient:
+        """작업 전용 LLM 클라이언트 (전역 풀 대신 작업 전용 풀 사용 - 채팅/필터링 모델 모두 작업 종료 시 폐기)"""
+        return LLMClient(langfuse_manager=LangfuseManager.create_for_background(), pool=LLMProviderPool())
+
+    async def _pregenerate(self, start_date: date, end_date: date) -> ProcessingStats:
+        llm_client = self.llm_client or self._create_task_llm_client()
+        event_ids = self.repository.get_upcoming_event_ids(start_date, end_date)
+        stats = ProcessingStats(total_items=len(event_ids))
+        logger.info(f"이벤트 설명 사전 생성 시작: {len(event_ids)}개 이벤트 ({start_date} ~ {end_date})")
+
+        for idx, event_id in enumerate(event_ids, 1):
+            try:
+                await self._pregenerate_event(event_id, stats, llm_client)
+            except Exception as e:
+                logger.error(f"이벤트 설명 생성 중 오류 (event_id={event_id}): {e}")
+                stats.failed_count += 1
+
+            self.progress_reporter.report_progress(idx, stats.total_items, stats)
+
+        logger.info(
+            f"이벤트 설명 사전 생성 완료. 저장: {stats.saved_count}개, "
+            f"스킵: {stats.skipped_count}개, 실패: {stats.failed_count}개"
+        )
+        return stats
+
+    async def _pregenerate_event(self, event_id: int, stats: ProcessingStats, llm_client: LLMClient):
+        # 생성이 필요한 레벨만 조회하고 DB 세션은 LLM 호출 전에 반환
+        with db.session as session:
+            event = session.get(Events, event_id)
+            if event is None:
+                return
+
+            missing_levels = []
+            for level in viewer_levels(event.level):
+                if crud_event_explanations.get_current(
+                    session,
+                    event=event,
+                    level=level,
+                    safety_level=self.safety_level,
+                    prompt_hash=explain_prompt_hash(level),
+                ):
+                    stats.skipped_count += 1
+                else:
+                    missing_levels.append(level)
+
+        for level in missing_levels:
+            content = await generate_filtered_explanation(event, level, self.safety_level, llm_client)
+            if content is None:
+                # LLM/필터링 오류 문구는 저장하지 않음 (다음 실행에서 다시 생성)
+                stats.failed_count += 1
+                continue
+
+            # 생성 시작 시점의 event.updated_at으로 저장 - 생성 중 이벤트가 수정되면 다음 실행에서 다시 생성
+            with db.session as session:
+                crud_event_explanations.upsert(
+                    session,
+                    event=event,
+                    level=level,
+                    safety_level=self.safety_level,
+                    prompt_hash=explain_prompt_hash(level),
+                    content=content,
+                )
+                session.commit()
+            stats.saved_count += 1
+            logger.debug(f"이벤트 설명 저장: event_id={event_id}, level={level}")
+            await asyncio.sleep(self.progress_reporter.api_delay)
+
+
+def default_pregeneration_range(days_ahead: int) -> tuple[date, date]:
+    """오늘부터 days_ahead일 뒤까지"""
+    today = date.today()
+    return today, today + timedelta(days=days_ahead)
@@ -79,10 +79,26 @@ CREATE TABLE event_webhook (
     processed_at TIMESTAMP
 );
 
+-- 레벨별 이벤트 설명 사전 생성 테이블
+CREATE TABLE event_explanations (
+    id SERIAL PRIMARY KEY,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    dropped_at TIMESTAMP NULL,
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    level VARCHAR(20) NOT NULL,
+    safety_level VARCHAR(20) NOT NULL,
+    prompt_hash VARCHAR(32) NOT NULL,
+    content TEXT NOT NULL,
+    event_updated_at TIMESTAMP,
+    CONSTRAINT uq_event_explanations_event_level_prompt UNIQUE (event_id, level, safety_level, prompt_hash)
+);
+
 -- 인덱스 및 제약조건 추가 (필요시)
 CREATE INDEX idx_event_date ON events(date);
 CREATE INDEX idx_user_event_subscription_user_id ON user_event_subscription(user_id);
 CREATE INDEX idx_user_event_subscription_event_id ON user_event_subscription(event_id);
+CREATE INDEX ix_event_explanations_event_id ON event_explanations(event_id);
 
 
 -- 대화 세션 관리용 테이블